@@ -1,17 +1,15 @@
 import streamlit as st
 import speech_recognition as sr
-from gtts import gTTS
 import pygame
-import io
 import time
 import os
 import sys
 from dotenv import load_dotenv
 import logging
 from pyngrok import ngrok
-import ollama
 import uuid
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path for config import
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -19,7 +17,23 @@ import config
 
 from components.analyzer import analyze_sentiment, estimate_mbti
 from components.voice_recorder import VoiceRecorder
-from components.database import ConversationDB
+from components.audio_sources import create_audio_source
+from components.vad import EnergyVAD
+from components.audio_preprocess import AudioPreprocessor
+from components.audio_encoding import AudioEncoder
+from components.asr import BufferedRecognizer, create_recognizer
+from components.metrics import LatencyTracker
+from components.segmentation import SegmentedRecognizer
+from components.resilience import CircuitBreaker, CircuitOpenError, DeadlineExceeded
+from components.storage import create_conversation_store
+from components.turn_pipeline import TurnPipeline
+from components.llm import OllamaGenerator, OllamaService, SYSTEM_PROMPT, build_prompt, build_user_message
+from components.conversation import ConversationContext, summary_prompt
+from components.response_cache import ResponseCache, create_embedder
+from components.speech_pipeline import SpeechPipeline
+from components.tts import create_synthesizer
+from components.tts_cache import TTSCache
+from components.playback import PlaybackWorker, PygamePlayer, create_player
 
 # Logging setup with config
 logging.basicConfig(level=getattr(logging, config.LOG_LEVEL))
@@ -29,7 +43,124 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 
 # Initialize database
-db = ConversationDB()
+@st.cache_resource
+def get_database():
+    """Create the conversation store once per Streamlit worker process."""
+    db_options = dict(
+        compress_responses=config.DB_COMPRESS_RESPONSES,
+        compression=config.DB_COMPRESSION,
+        compress_min_length=config.DB_COMPRESS_MIN_LENGTH,
+        zstd_dict_path=config.DB_ZSTD_DICT_PATH
+    )
+    return create_conversation_store(
+        config.DATABASE_BACKEND,
+        config.DATABASE_PATH,
+        num_shards=config.DB_SHARDS,
+        **db_options
+    )
+
+db = get_database()
+
+@st.cache_resource
+def get_metrics():
+    """Latency metrics shared by all sessions of this worker process."""
+    return LatencyTracker()
+
+metrics = get_metrics() if config.LATENCY_METRICS_ENABLED else None
+
+@st.cache_resource
+def get_speech_backend():
+    """Create the ASR backend once (the local engine loads its model here)."""
+    backend = create_recognizer(
+        config.ASR_BACKEND,
+        language=config.ASR_LANGUAGE,
+        metrics=metrics,
+        local_model=config.ASR_LOCAL_MODEL,
+        stub_transcript=config.ASR_STUB_TRANSCRIPT,
+        stub_latency=config.ASR_STUB_LATENCY,
+        timeout=config.ASR_TIMEOUT
+    )
+    try:
+        backend.prewarm()
+    except Exception as e:
+        logger.error(f"ASR backend prewarm failed: {e}")
+    return backend
+
+speech_backend = get_speech_backend()
+
+@st.cache_resource
+def get_circuit_breakers():
+    """Deadlines and circuit breakers for the ASR and TTS services, shared by all sessions."""
+    options = dict(
+        failure_threshold=config.CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout=config.CIRCUIT_RESET_SECONDS,
+        metrics=metrics
+    )
+    return {
+        # 인식 실패(UnknownValueError)는 서비스가 응답한 것이므로 장애로 세지 않음
+        'asr': CircuitBreaker('asr', timeout=config.ASR_TIMEOUT,
+                              ignore=(sr.UnknownValueError,), **options),
+        'tts': CircuitBreaker('tts', timeout=config.TTS_TIMEOUT, **options)
+    }
+
+breakers = get_circuit_breakers()
+recognize_speech = breakers['asr'].wrap(speech_backend.recognize)
+
+@st.cache_resource
+def get_tts_backend():
+    """Create the TTS backend once; local engines are loaded here, not on the first reply."""
+    backend = create_synthesizer(
+        config.TTS_BACKEND,
+        language=config.TTS_LANGUAGE,
+        metrics=metrics,
+        timeout=config.TTS_TIMEOUT,
+        local_device=config.TTS_LOCAL_DEVICE,
+        local_speed=config.TTS_LOCAL_SPEED,
+        pool_size=config.TTS_POOL_SIZE,
+        stub_latency=config.TTS_STUB_LATENCY
+    )
+    try:
+        backend.prewarm()
+    except Exception as e:
+        logger.error(f"TTS backend prewarm failed: {e}")
+    return backend
+
+tts_backend = get_tts_backend()
+
+@st.cache_resource
+def get_tts_cache():
+    """Synthesized speech cache; the directory is shared by all worker processes."""
+    return TTSCache(
+        config.TTS_CACHE_DIR,
+        max_bytes=config.TTS_CACHE_MAX_MB * 1024 * 1024,
+        memory_bytes=config.TTS_CACHE_MEMORY_MB * 1024 * 1024,
+        extension=tts_backend.audio_format,
+        metrics=metrics
+    )
+
+tts_cache = get_tts_cache() if config.TTS_CACHE_ENABLED else None
+
+# 인식 서버로 보내는 오디오를 메모리에서 FLAC/Opus로 압축
+audio_encoder = None
+if config.ASR_AUDIO_CODEC:
+    audio_encoder = AudioEncoder(
+        config.ASR_AUDIO_CODEC,
+        level=config.ASR_AUDIO_LEVEL,
+        streaming=config.ASR_AUDIO_STREAMING,
+        verify=config.ASR_AUDIO_VERIFY,
+        metrics=metrics
+    )
+
+@st.cache_resource
+def get_segmenter():
+    """Shared pool for recognizing long recordings segment by segment."""
+    return SegmentedRecognizer(
+        recognize_speech,
+        max_workers=config.ASR_SEGMENT_WORKERS,
+        min_pause_ms=config.ASR_SEGMENT_MIN_PAUSE_MS,
+        max_segment_seconds=config.ASR_SEGMENT_MAX_SECONDS,
+        encoder=audio_encoder
+    )
 
 # Initialize session ID
 if "session_id" not in st.session_state:
@@ -49,7 +180,7 @@ else:
     st.info("🏠 로컬 전용 모드로 실행 중")
 
 # Initialize tools
-# pygame mixer 초기화 (macOS 호환성 개선)
+# pygame mixer 초기화 (macOS 호환성 개선, pygame 출력 및 soundfile이 없을 때 MP3 디코딩에 사용)
 try:
     pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=512)
     pygame.mixer.init()
@@ -58,37 +189,130 @@ except Exception as e:
     logger.error(f"Audio mixer initialization failed: {e}")
     st.warning("⚠️ 오디오 시스템 초기화 실패 - 음성 출력이 제한될 수 있습니다")
 
-recognizer = sr.Recognizer()
-recorder = VoiceRecorder(
-    sample_rate=config.VOICE_SAMPLE_RATE,
-    channels=config.VOICE_CHANNELS
-)
+def get_recorder():
+    """This session's recorder; its ring buffer and resampling filter are built once, not per rerun."""
+    if "recorder" not in st.session_state:
+        vad = None
+        if config.VAD_ENABLED:
+            # VAD는 변환된(녹음 버퍼에 저장되는) 샘플 레이트로 동작
+            vad = EnergyVAD(
+                config.VOICE_TARGET_SAMPLE_RATE or config.VOICE_SAMPLE_RATE,
+                threshold_ratio=config.VAD_THRESHOLD_RATIO,
+                min_rms=config.VAD_MIN_RMS,
+                silence_ms=config.VAD_SILENCE_MS,
+                max_duration=config.VAD_MAX_DURATION
+            )
+        st.session_state.recorder = VoiceRecorder(
+            sample_rate=config.VOICE_SAMPLE_RATE,
+            channels=config.VOICE_CHANNELS,
+            max_duration=config.VOICE_MAX_DURATION,
+            vad=vad,
+            target_sample_rate=config.VOICE_TARGET_SAMPLE_RATE,
+            source=create_audio_source(
+                config.VOICE_INPUT_SOURCE,
+                sample_rate=config.VOICE_SAMPLE_RATE,
+                channels=config.VOICE_CHANNELS,
+                path=config.VOICE_INPUT_FILE,
+                speed=config.VOICE_INPUT_SPEED
+            )
+        )
+    return st.session_state.recorder
+
+def get_speech_recognizer():
+    """This session's buffered recognizer, kept across reruns like the recorder."""
+    if "speech_recognizer" not in st.session_state:
+        preprocessor = None
+        if config.PREPROCESS_ENABLED:
+            preprocessor = AudioPreprocessor(
+                trim_db=config.PREPROCESS_TRIM_DB,
+                padding_ms=config.PREPROCESS_PADDING_MS,
+                noise_gate_db=config.PREPROCESS_NOISE_GATE_DB,
+                normalize=config.PREPROCESS_NORMALIZE,
+                target_db=config.PREPROCESS_TARGET_DB,
+                max_gain_db=config.PREPROCESS_MAX_GAIN_DB
+            )
+        # 녹음 중 오디오를 받아 두었다가 말이 끝나면 바로 인식 (쉼으로 끝난 구간은 녹음 중에 미리 인식)
+        st.session_state.speech_recognizer = BufferedRecognizer(
+            recognize_speech,
+            preprocessor=preprocessor,
+            segmenter=get_segmenter() if config.ASR_SEGMENT_LONG_CLIPS else None,
+            encoder=audio_encoder,
+            incremental=config.ASR_SEGMENT_INCREMENTAL
+        )
+    return st.session_state.speech_recognizer
+
+def synthesize_uncached(sentence):
+    """The TTS backend behind its circuit breaker; None if synthesis is unavailable."""
+    # 음성 생성 (시간 제한, 연속 실패 시 즉시 텍스트로 대체)
+    return breakers['tts'].call(
+        tts_backend.synthesize, sentence,
+        fallback=lambda error: logger.warning(f"Speech synthesis unavailable: {error}")
+    )
+
+def synthesize_sentence(sentence):
+    """Synthesize one sentence; None if TTS is unavailable (runs on the speech thread)."""
+    # 같은 문장(다시 재생, 인사말 등)은 캐시에서 바로 재생, 서비스 장애 중에도 동작
+    if tts_cache is not None:
+        audio = tts_cache.get_or_create(sentence, synthesize_uncached,
+                                         language=config.TTS_LANGUAGE, voice=tts_backend.voice)
+    else:
+        audio = synthesize_uncached(sentence)
+    # PCM 출력은 이전 문장이 재생되는 동안 미리 디코딩/변환
+    if audio is not None and hasattr(playback.player, 'prepare'):
+        audio = playback.player.prepare(audio)
+    return audio
+
+@st.cache_resource
+def get_playback_worker():
+    """The one thread per process that owns the speaker; Streamlit reruns never wait on it."""
+    try:
+        player = create_player(
+            config.AUDIO_OUTPUT,
+            device=config.AUDIO_OUTPUT_DEVICE,
+            cache_bytes=config.AUDIO_PCM_CACHE_MB * 1024 * 1024,
+            metrics=metrics
+        )
+    except RuntimeError as e:
+        logger.warning(f"PCM output unavailable, using pygame mixer: {e}")
+        player = PygamePlayer(metrics=metrics)
+    return PlaybackWorker(player, metrics=metrics)
+
+playback = get_playback_worker()
+
+def create_speech_pipeline():
+    """Start sentence-by-sentence speech output for one answer."""
+    # 합성된 문장은 바로 재생 대기열에 넣어 앞 문장이 끝나는 즉시 이어서 재생
+    return SpeechPipeline(
+        synthesize_sentence,
+        enqueue=playback.enqueue,
+        min_chars=config.TTS_MIN_SENTENCE_CHARS,
+        prefetch=config.TTS_PREFETCH_SENTENCES,
+        metrics=metrics
+    )
 
-# Parameters
-recognizer.pause_threshold = 1.5
+def stop_speech():
+    """Barge-in: silence the current answer and drop what is still queued."""
+    speech = st.session_state.pop("speech", None)
+    if speech is not None:
+        speech.cancel()
+    playback.stop()
 
-def play_speech(text):
-    """Convert text to speech and play it."""
+def play_speech(text, speech=None):
+    """Speak ``text`` (or finish a pipeline it was streamed into) in the background."""
     try:
         if not text.strip():
             return
             
-        # gTTS로 음성 생성
-        tts = gTTS(text=text, lang='ko', slow=False)
-        mp3_fp = io.BytesIO()
-        tts.write_to_fp(mp3_fp)
-        mp3_fp.seek(0)
-        
-        # pygame mixer로 재생
-        pygame.mixer.music.load(mp3_fp)
-        pygame.mixer.music.play()
-        
-        # 재생 완료까지 대기
-        while pygame.mixer.music.get_busy():
-            time.sleep(0.1)
-            
-        mp3_fp.close()
-        logger.info(f"Speech played successfully: {text[:50]}...")
+        if speech is None:
+            stop_speech()
+            speech = create_speech_pipeline()
+        if speech.fed_chars == 0:
+            speech.feed(text)
+        # 재생은 백그라운드에서 진행, 화면은 바로 응답 가능
+        speech.finish(wait=False)
+        st.session_state.speech = speech
+        if breakers['tts'].stats()['state'] == 'open':
+            st.warning("🔇 음성 합성 서비스에 연결할 수 없어 캐시된 문장만 재생됩니다")
         
     except Exception as e:
         logger.error(f"Speech playback error: {str(e)}")
@@ -103,27 +327,43 @@ def process_voice_input():
         status_placeholder = st.empty()
         progress_bar = st.progress(0)
         
+        # 사용자가 말을 시작하면 AI 음성 재생 중단 (barge-in)
+        stop_speech()
+        recorder = get_recorder()
+        speech_recognizer = get_speech_recognizer()
         recorder.start_recording()
-        status_placeholder.info("🎤 음성을 듣고 있습니다... (5초간)")
-        
-        # 프로그레스 바 애니메이션
-        for i in range(config.VOICE_DURATION):
-            time.sleep(1)
-            progress_bar.progress((i + 1) / config.VOICE_DURATION)
-        
-        wav_path = recorder.stop_recording()
+        if recorder.vad is not None:
+            limit = config.VAD_MAX_DURATION
+            status_placeholder.info("🎤 말씀하세요... (말을 멈추면 자동으로 종료됩니다)")
+        else:
+            limit = config.VOICE_DURATION
+            status_placeholder.info(f"🎤 음성을 듣고 있습니다... ({limit}초간)")
+            
+        # 녹음되는 대로 인식기에 전달 (VAD 종료 또는 최대 길이까지)
+        speech_recognizer.start(recorder.output_rate)
+        captured = 0.0
+        speech_announced = False
+        for chunk in recorder.stream_chunks(max_seconds=limit):
+            captured += len(chunk) / recorder.output_rate
+            progress_bar.progress(min(captured / limit, 1.0))
+            partial = speech_recognizer.accept_audio(chunk)
+            if partial:
+                status_placeholder.info(f"🗣️ {partial}")
+            elif recorder.speech_started.is_set() and not speech_announced:
+                speech_announced = True
+                status_placeholder.info("🗣️ 듣고 있어요... (말을 멈추면 자동으로 종료됩니다)")
+                
+        recorder.stop_recording()
         status_placeholder.info("🔄 음성을 처리하고 있습니다...")
         progress_bar.empty()
         
-        if not wav_path:
-            status_placeholder.error("❌ 녹음 파일을 생성할 수 없습니다.")
+        # 앞뒤 무음 제거/정규화 후 메모리에서 바로 인식 (임시 WAV 파일 없음)
+        # 긴 녹음은 쉼 구간에서 나눠 병렬로 인식
+        text = speech_recognizer.finish(segmented=captured >= config.ASR_SEGMENT_MIN_CLIP_SECONDS)
+        if not text:
+            status_placeholder.error("❌ 음성이 감지되지 않았습니다.")
             return None
-        
-        with sr.AudioFile(wav_path) as source:
-            audio = recognizer.record(source)
-        text = recognizer.recognize_google(audio, language='ko-KR')
-        
-        os.remove(wav_path)  # Clean up temporary file
+            
         status_placeholder.success(f"✅ 인식 완료: {text}")
         time.sleep(1)
         status_placeholder.empty()
@@ -134,34 +374,156 @@ def process_voice_input():
     except sr.RequestError as e:
         status_placeholder.error(f"❌ 음성 인식 서비스 오류: {str(e)}")
         return None
+    except (DeadlineExceeded, CircuitOpenError) as e:
+        logger.warning(f"Speech recognition unavailable: {e}")
+        status_placeholder.error("⏳ 음성 인식 서비스가 응답하지 않습니다. 텍스트 입력을 이용해 주세요.")
+        return None
     except Exception as e:
         status_placeholder.error(f"❌ 오류 발생: {str(e)}")
         return None
 
-def generate_response(text):
-    """Generate response using Ollama phi4:latest model."""
+llm_options = {
+    "max_tokens": config.MAX_TOKENS,
+    "temperature": config.TEMPERATURE,
+    "top_k": config.TOP_K,
+    "top_p": config.TOP_P,
+    "num_ctx": config.LLM_CONTEXT_WINDOW
+}
+
+@st.cache_resource
+def get_ollama_service():
+    """Pooled Ollama connections for the whole process; the model is loaded and kept warm here."""
+    service = OllamaService(
+        config.OLLAMA_MODEL,
+        host=config.OLLAMA_BASE_URL,
+        timeout=config.OLLAMA_TIMEOUT,
+        connect_timeout=config.OLLAMA_CONNECT_TIMEOUT,
+        max_connections=config.OLLAMA_MAX_CONNECTIONS,
+        keep_alive=config.OLLAMA_KEEP_ALIVE,
+        keep_warm_seconds=config.OLLAMA_KEEP_WARM_SECONDS,
+        options=llm_options,
+        metrics=metrics
+    )
+    # 모델 로딩은 백그라운드에서 진행, 첫 화면은 바로 표시
+    service.start(preload=config.OLLAMA_PRELOAD)
+    return service
+
+ollama_service = get_ollama_service()
+
+generator = OllamaGenerator(
+    config.OLLAMA_MODEL,
+    options=llm_options,
+    streaming=config.LLM_STREAMING,
+    client=ollama_service.client,
+    keep_alive=config.OLLAMA_KEEP_ALIVE,
+    metrics=metrics
+)
+
+# 대화 요약은 화면에 보이지 않으므로 스트리밍 없이, 응답 지연 통계와 따로 기록
+summary_generator = OllamaGenerator(
+    config.OLLAMA_MODEL,
+    options=llm_options,
+    streaming=False,
+    client=ollama_service.client,
+    keep_alive=config.OLLAMA_KEEP_ALIVE,
+    metrics=metrics,
+    metrics_name='llm.summary'
+)
+
+@st.cache_resource
+def get_response_cache():
+    """Answers shared by all sessions of this worker process for repeated first messages."""
+    return ResponseCache(
+        create_embedder(config.RESPONSE_CACHE_EMBEDDER, client=ollama_service.client,
+                        model=config.RESPONSE_CACHE_EMBED_MODEL),
+        threshold=config.RESPONSE_CACHE_THRESHOLD,
+        ttl_seconds=config.RESPONSE_CACHE_TTL_SECONDS,
+        max_entries=config.RESPONSE_CACHE_MAX_ENTRIES,
+        max_context_turns=config.RESPONSE_CACHE_MAX_CONTEXT_TURNS,
+        metrics=metrics
+    )
+
+response_cache = get_response_cache() if config.RESPONSE_CACHE_ENABLED else None
+
+def summarize_turns(previous, turns):
+    """Fold dropped turns into the running conversation summary."""
+    summary, _ = summary_generator.generate(summary_prompt(previous, turns))
+    return summary.strip()
+
+def get_conversation_context():
+    """This session's chat history for the model."""
+    if "llm_context" not in st.session_state:
+        st.session_state.llm_context = ConversationContext(
+            SYSTEM_PROMPT,
+            max_tokens=config.LLM_CONTEXT_MAX_TOKENS,
+            trim_to=config.LLM_CONTEXT_TRIM_TO,
+            summarize=summarize_turns if config.LLM_CONTEXT_SUMMARIZE else None
+        )
+    return st.session_state.llm_context
+
+def generate_response(text, sentiment=None, on_token=None):
+    """Generate response using Ollama phi4:latest model, streaming tokens to ``on_token``."""
     try:
-        sentiment = analyze_sentiment(text)
-        prompt = f"""당신은 ENFP 성격의 AI 어시스턴트입니다. 사용자의 감정은 {sentiment}입니다. 
-다음 질문에 한국어로 친근하고 공감적으로 답변해주세요: {text}
-항상 긍정적이고 열정적인 ENFP의 성격을 반영하여 답변하세요."""
-        
-        response = ollama.generate(
-            model=config.OLLAMA_MODEL,
-            prompt=prompt,
-            options={
-                "max_tokens": config.MAX_TOKENS,
-                "temperature": config.TEMPERATURE,
-                "top_k": config.TOP_K,
-                "top_p": config.TOP_P
-            }
-        )['response']
+        if sentiment is None:
+            sentiment = analyze_sentiment(text)
+        context = get_conversation_context() if config.LLM_MULTI_TURN else None
+        context_turns = len(context.turns) if context is not None else 0
+        # 이전과 같은 메시지면 생성하지 않고 저장된 응답 사용 (대화가 이어진 뒤에는 건너뜀)
+        start = time.perf_counter()
+        cached = None
+        if response_cache is not None:
+            cached = response_cache.lookup(text, sentiment, context_turns=context_turns)
+        if cached is not None:
+            response = cached
+            if on_token is not None:
+                on_token(response)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            stats = {'ttft_ms': elapsed_ms, 'total_ms': elapsed_ms, 'tokens': 0, 'tokens_per_sec': 0.0,
+                     'prompt_tokens': None, 'prompt_eval_ms': None, 'cached': True}
+            if context is not None:
+                context.add_turn(build_user_message(text, sentiment), response)
+        elif context is not None:
+            # 이전 턴까지는 Ollama KV 캐시를 재사용하고 새 질문만 처리
+            message = build_user_message(text, sentiment)
+            response, stats = generator.chat(context.messages(message), on_token=on_token)
+            if response:
+                context.add_turn(message, response)
+            stats['context'] = context.stats()
+        else:
+            response, stats = generator.generate(build_prompt(text, sentiment), on_token=on_token)
+        if cached is None and response_cache is not None:
+            response_cache.store(text, sentiment, response, context_turns=context_turns)
+        st.session_state.last_generation = stats
         return response
     except Exception as e:
         logger.error(f"Response generation error: {str(e)}")
         st.error(f"응답 생성 오류: {str(e)}")
         return "죄송합니다, 응답을 생성할 수 없습니다."
 
+def save_turn(session_id, text, response, sentiment, mbti):
+    """Store one turn (runs on a turn worker thread, so no st.session_state here)."""
+    db.save_conversation(
+        session_id=session_id,
+        user_input=text,
+        ai_response=response,
+        sentiment=sentiment,
+        mbti=mbti
+    )
+
+@st.cache_resource
+def get_turn_executor():
+    """Worker threads for turn stages that run alongside generation and speech."""
+    return ThreadPoolExecutor(max_workers=config.TURN_PIPELINE_WORKERS, thread_name_prefix="turn")
+
+turn_pipeline = TurnPipeline(
+    analyze_sentiment,
+    estimate_mbti,
+    generate=generate_response,
+    persist=save_turn,
+    executor=get_turn_executor(),
+    metrics=metrics
+)
+
 def main():
     """Main Streamlit application with database integration."""
     # 페이지 설정
@@ -213,6 +575,12 @@ def main():
     if "conversation" not in st.session_state:
         st.session_state.conversation = []
     
+    # 녹음 안내: VAD가 켜져 있으면 말을 멈출 때 자동 종료, 꺼져 있으면 고정 길이
+    if config.VAD_ENABLED:
+        recording_hint = f"말을 멈추면 녹음이 자동으로 끝납니다 (최대 {config.VAD_MAX_DURATION}초)"
+    else:
+        recording_hint = f"{config.VOICE_DURATION}초간 음성을 녹음합니다"
+        
     # 사이드바 설정
     with st.sidebar:
         st.header("🎛️ 설정 & 정보")
@@ -232,6 +600,16 @@ def main():
         # 세션 정보
         st.info(f"**세션 ID**: {st.session_state.session_id[:8]}...")
         
+        # 언어 모델 서버 상태 (유지 스레드의 마지막 확인 결과, 화면을 막지 않음)
+        health = ollama_service.last_health
+        if health is None:
+            st.caption(f"🧠 {config.OLLAMA_MODEL} 불러오는 중...")
+        elif not health['ok']:
+            st.caption(f"🧠 Ollama 서버 연결 안 됨 ({config.OLLAMA_BASE_URL})")
+        else:
+            state = "메모리에 로드됨" if health['loaded'] else "대기 중 (첫 응답 시 로드)"
+            st.caption(f"🧠 {config.OLLAMA_MODEL} {state} · {health['latency_ms']:.0f} ms")
+        
         # 대화 기록 내보내기
         if st.button("📄 대화 기록 내보내기", use_container_width=True):
             export_data = db.export_conversations(st.session_state.session_id, 'json')
@@ -255,10 +633,36 @@ def main():
                     dominant_sentiment = max(sentiment_dist.keys(), key=lambda x: sentiment_dist[x])
                     st.metric("주요 감정", dominant_sentiment)
         
+        # 지연 시간 통계
+        if metrics is not None and metrics.summaries():
+            with st.expander("⏱️ 지연 시간"):
+                for name, summary in metrics.summaries().items():
+                    st.caption(f"**{name}** · {summary['count']}회 · 평균 {summary['mean_ms']:.0f} ms "
+                               f"· p95 {summary['p95_ms']:.0f} ms · p99 {summary['p99_ms']:.0f} ms")
+                for name, breaker in breakers.items():
+                    stats = breaker.stats()
+                    st.caption(f"**{name}** 회로 {stats['state']} · 차단 {stats['trip_count']}회 "
+                               f"· 거부 {stats['rejected']}회 · 시간 초과 {stats['timeouts']}회")
+                if tts_cache is not None:
+                    stats = tts_cache.stats()
+                    st.caption(f"**tts 캐시** 적중률 {stats['hit_rate']:.0%} "
+                               f"(메모리 {stats['memory_hits']} · 디스크 {stats['disk_hits']} "
+                               f"· 미스 {stats['misses']}) · {stats['disk_bytes'] / 1024 / 1024:.1f} MB")
+                if response_cache is not None:
+                    stats = response_cache.stats()
+                    st.caption(f"**응답 캐시** 적중률 {stats['hit_rate']:.0%} "
+                               f"(동일 {stats['exact_hits']} · 유사 {stats['similar_hits']} "
+                               f"· 미스 {stats['misses']} · 건너뜀 {stats['bypassed']}) · {stats['entries']}개")
+                stats = tts_backend.stats()
+                if stats['rtf'] is not None:
+                    # 실시간 계수: 합성 시간 / 음성 길이 (1보다 작으면 재생보다 빠르게 합성)
+                    st.caption(f"**tts {tts_backend.name}** 실시간 계수 {stats['rtf']:.2f} "
+                               f"· {stats['calls']}회 · 음성 {stats['audio_seconds']:.0f}초")
+                    
         # 도움말
         st.header("❓ 사용법")
-        st.markdown("""
-        1. **음성 입력**: 🎤 버튼을 클릭하여 5초간 음성 녹음
+        st.markdown(f"""
+        1. **음성 입력**: 🎤 버튼을 클릭하면 {recording_hint}
         2. **텍스트 입력**: 아래 입력창에 직접 타이핑
         3. **MBTI 분석**: 🧠 버튼으로 성격 분석
         4. **음성 재생**: 🔊 버튼으로 AI 응답 듣기
@@ -284,7 +688,7 @@ def main():
             with st.container():
                 st.markdown('<div class="input-container">', unsafe_allow_html=True)
                 st.markdown("**🎤 음성으로 대화하세요**")
-                st.caption("버튼을 클릭하면 5초간 음성을 녹음합니다.")
+                st.caption(f"버튼을 클릭하면 {recording_hint}.")
                 
                 if st.button("🎤 음성 입력 시작", use_container_width=True, type="primary"):
                     user_input = process_voice_input()
@@ -317,7 +721,12 @@ def main():
         if st.button("🧠 MBTI 분석", use_container_width=True):
             if st.session_state.conversation:
                 last_user_input = next((msg for sender, msg in reversed(st.session_state.conversation) if sender == "User"), None)
-                if last_user_input:
+                last_turn = st.session_state.get("last_turn")
+                if last_user_input and last_turn and last_turn['text'] == last_user_input:
+                    # 이번 턴에서 이미 계산한 결과 재사용
+                    st.success(f"**추정된 MBTI**: {last_turn['mbti']}")
+                    st.info(f"**감정 상태**: {last_turn['sentiment']}")
+                elif last_user_input:
                     mbti = estimate_mbti(last_user_input)
                     sentiment = analyze_sentiment(last_user_input)
                     st.success(f"**추정된 MBTI**: {mbti}")
@@ -331,6 +740,7 @@ def main():
         if st.button("🚪 대화 종료", use_container_width=True):
             db.end_session(st.session_state.session_id)
             st.session_state.conversation = []
+            st.session_state.pop("llm_context", None)
             st.success("대화가 종료되었습니다.")
             time.sleep(1)
             st.rerun()
@@ -344,43 +754,78 @@ def main():
         
         # 대화 기록에 추가
         st.session_state.conversation.append(("User", user_input))
+        # 이전 응답 음성이 아직 재생 중이면 중단
+        stop_speech()
         
-        # 감정 분석 및 MBTI 추정
-        with st.spinner("� 생각하는 중..."):
-            sentiment = analyze_sentiment(user_input)
-            mbti = estimate_mbti(user_input)
-            response = generate_response(user_input)
-        
-        st.session_state.conversation.append(("AI", response))
+        # 생성되는 토큰을 바로 표시하고, 문장이 완성되는 대로 음성으로 재생
+        response_placeholder = st.empty()
+        streamed = []
+        speech = None
+        if st.session_state.enable_speech and config.TTS_SPEAK_WHILE_GENERATING:
+            speech = create_speech_pipeline()
         
-        # 데이터베이스에 저장
-        db.save_conversation(
-            session_id=st.session_state.session_id,
-            user_input=user_input,
-            ai_response=response,
-            sentiment=sentiment,
-            mbti=mbti
-        )
+        def show_tokens(piece):
+            streamed.append(piece)
+            response_placeholder.markdown(f"🤖 {''.join(streamed)}▌")
+            if speech is not None:
+                speech.feed(piece)
         
-        # 성공 메시지
-        st.success("✅ 응답이 생성되었습니다!")
+        def show_response(turn):
+            # 완성된 응답은 아래 대화 기록에 표시
+            response_placeholder.empty()
+            st.session_state.conversation.append(("AI", turn['response']))
+            # 성공 메시지
+            st.success("✅ 응답이 생성되었습니다!")
+            stats = st.session_state.pop("last_generation", None)
+            if stats and stats.get('cached'):
+                st.caption(f"💾 저장된 응답 재사용 · {stats['total_ms']:.1f} ms")
+            elif stats:
+                ttft = f"{stats['ttft_ms']:.0f} ms" if stats['ttft_ms'] is not None else "N/A"
+                st.caption(f"⚡ 첫 토큰 {ttft} · 전체 {stats['total_ms']:.0f} ms "
+                           f"· {stats['tokens']} 토큰 · {stats['tokens_per_sec']:.1f} 토큰/초")
+                if stats['prompt_tokens'] is not None:
+                    prefill = f"{stats['prompt_eval_ms']:.0f} ms" if stats['prompt_eval_ms'] is not None else "N/A"
+                    context = stats.get('context')
+                    history = f" · 대화 맥락 {context['turns']}턴 (약 {context['tokens']} 토큰)" if context else ""
+                    st.caption(f"📜 프롬프트 처리 {stats['prompt_tokens']} 토큰 · {prefill}{history}")
         
-        # 자동 음성 재생 (설정이 활성화된 경우)
-        if st.session_state.enable_speech:
+        def speak(response):
             try:
-                with st.spinner("🔊 음성 재생 중..."):
-                    play_speech(response)
+                play_speech(response, speech)
             except Exception as e:
                 st.error(f"음성 재생 오류: {str(e)}")
         
-        # 음성 재생 옵션
-        col_audio1, col_audio2 = st.columns([1, 3])
+        # 감정 분석은 한 번만 실행해 응답 생성에 전달, MBTI 추정과 DB 저장은 병행
+        with st.spinner("� 생각하는 중..."):
+            turn = turn_pipeline.run(
+                user_input,
+                session_id=st.session_state.session_id,
+                # 자동 음성 재생 (설정이 활성화된 경우)
+                speak=speak if st.session_state.enable_speech else None,
+                on_response=show_response,
+                on_token=show_tokens
+            )
+        if speech is not None and not turn['response']:
+            # 응답이 비어 재생 단계가 건너뛰어진 경우 음성 스레드 정리
+            speech.cancel()
+        st.session_state.last_turn = turn
+        
+    # 음성 재생 옵션 (재생은 백그라운드에서 진행되므로 재생 중에도 조작 가능)
+    last_turn = st.session_state.get("last_turn")
+    if last_turn and last_turn['response']:
+        col_audio1, col_audio2, col_audio3, _ = st.columns([1, 1, 1, 3])
         with col_audio1:
             if st.button("🔊 다시 재생"):
                 if st.session_state.enable_speech:
-                    play_speech(response)
+                    play_speech(last_turn['response'])
                 else:
                     st.warning("음성 출력이 비활성화되어 있습니다. 사이드바에서 활성화하세요.")
+        with col_audio2:
+            if st.button("⏭️ 건너뛰기"):
+                playback.skip()
+        with col_audio3:
+            if st.button("⏹️ 정지"):
+                stop_speech()
     
     # 대화 기록 표시
     st.header("📜 대화 기록")
@@ -405,5 +850,5 @@ def main():
         st.info("💡 대화를 시작해보세요! 음성 또는 텍스트로 입력할 수 있습니다.")
 
 if __name__ == "__main__":
-    main()
-    pygame.mixer.quit()
\ No newline at end of file
+    # pygame mixer는 재생 스레드가 계속 사용하므로 스크립트 실행마다 종료하지 않음
+    main()
\ No newline at end of file
@@ -13,6 +13,12 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import config
 
 from components.analyzer import analyze_sentiment, estimate_mbti
+from components.asr import create_recognizer
+from components.metrics import LatencyTracker
+from components.resilience import CircuitBreaker, CircuitOpenError, DeadlineExceeded
+from components.turn_pipeline import TurnPipeline
+from components.llm import OllamaGenerator, OllamaService, SYSTEM_PROMPT, build_prompt, build_user_message
+from components.conversation import ConversationContext, summary_prompt
 
 # Disable tokenizers parallelism
 os.environ["TOKENIZERS_PARALLELISM"] = "false"
@@ -25,6 +31,105 @@ load_dotenv()
 # Initialize tools
 recognizer = sr.Recognizer()
 recognizer.pause_threshold = 1.5
+metrics = LatencyTracker() if config.LATENCY_METRICS_ENABLED else None
+speech_backend = create_recognizer(
+    config.ASR_BACKEND,
+    language=config.ASR_LANGUAGE,
+    metrics=metrics,
+    local_model=config.ASR_LOCAL_MODEL,
+    stub_transcript=config.ASR_STUB_TRANSCRIPT,
+    stub_latency=config.ASR_STUB_LATENCY,
+    timeout=config.ASR_TIMEOUT
+)
+asr_breaker = CircuitBreaker(
+    'asr',
+    failure_threshold=config.CIRCUIT_FAILURE_THRESHOLD,
+    reset_timeout=config.CIRCUIT_RESET_SECONDS,
+    timeout=config.ASR_TIMEOUT,
+    metrics=metrics,
+    ignore=(sr.UnknownValueError,)
+)
+llm_options = {
+    "max_tokens": config.MAX_TOKENS,
+    "temperature": config.TEMPERATURE,
+    "top_k": config.TOP_K,
+    "top_p": config.TOP_P,
+    "num_ctx": config.LLM_CONTEXT_WINDOW
+}
+ollama_service = OllamaService(
+    config.OLLAMA_MODEL,
+    host=config.OLLAMA_BASE_URL,
+    timeout=config.OLLAMA_TIMEOUT,
+    connect_timeout=config.OLLAMA_CONNECT_TIMEOUT,
+    max_connections=config.OLLAMA_MAX_CONNECTIONS,
+    keep_alive=config.OLLAMA_KEEP_ALIVE,
+    keep_warm_seconds=config.OLLAMA_KEEP_WARM_SECONDS,
+    options=llm_options,
+    metrics=metrics
+)
+generator = OllamaGenerator(
+    config.OLLAMA_MODEL,
+    options=llm_options,
+    streaming=config.LLM_STREAMING,
+    client=ollama_service.client,
+    keep_alive=config.OLLAMA_KEEP_ALIVE,
+    metrics=metrics
+)
+
+def summarize_turns(previous, turns):
+    """Fold dropped turns into the running conversation summary."""
+    summary, _ = generator.generate(summary_prompt(previous, turns))
+    return summary.strip()
+
+# 대화 기록 (이전 턴은 Ollama KV 캐시를 재사용해 새 질문만 처리)
+conversation = ConversationContext(
+    SYSTEM_PROMPT,
+    max_tokens=config.LLM_CONTEXT_MAX_TOKENS,
+    trim_to=config.LLM_CONTEXT_TRIM_TO,
+    summarize=summarize_turns if config.LLM_CONTEXT_SUMMARIZE else None
+)
+
+def generate_response(text, sentiment, on_token=None):
+    """Generate the ENFP answer, printing tokens as they arrive."""
+    try:
+        print("🤖 AI: ", end="", flush=True)
+        if config.LLM_MULTI_TURN:
+            message = build_user_message(text, sentiment)
+            response, stats = generator.chat(conversation.messages(message), on_token=on_token)
+            if response:
+                conversation.add_turn(message, response)
+        else:
+            response, stats = generator.generate(build_prompt(text, sentiment), on_token=on_token)
+        print()
+        ttft = f"{stats['ttft_ms']:.0f} ms" if stats['ttft_ms'] is not None else "N/A"
+        print(f"⚡ 첫 토큰 {ttft}, {stats['tokens']} 토큰, {stats['tokens_per_sec']:.1f} 토큰/초")
+        if stats['prompt_tokens'] is not None:
+            prefill = f"{stats['prompt_eval_ms']:.0f} ms" if stats['prompt_eval_ms'] is not None else "N/A"
+            print(f"📜 프롬프트 처리 {stats['prompt_tokens']} 토큰 ({prefill}), "
+                  f"대화 맥락 {len(conversation.turns)}턴")
+        return response
+    except Exception as e:
+        print()
+        logger.error(f"Response generation error: {e}")
+        return "죄송합니다, 응답을 생성할 수 없습니다."
+
+def print_token(piece):
+    print(piece, end="", flush=True)
+
+# 감정 분석은 한 번만 실행해 응답 생성에 전달, MBTI 추정은 동시에 실행
+turn_pipeline = TurnPipeline(analyze_sentiment, estimate_mbti, generate=generate_response,
+                             metrics=metrics)
+
+def print_latency_summary():
+    """Print per-backend latency statistics collected in this session."""
+    if metrics is None:
+        return
+    for name, summary in metrics.summaries().items():
+        print(f"⏱️ {name}: {summary['count']}회, 평균 {summary['mean_ms']:.0f} ms, "
+              f"p95 {summary['p95_ms']:.0f} ms, p99 {summary['p99_ms']:.0f} ms")
+    stats = asr_breaker.stats()
+    print(f"🔌 asr 회로 {stats['state']}: 차단 {stats['trip_count']}회, "
+          f"시간 초과 {stats['timeouts']}회")
 
 def listen_and_respond():
     """Simple voice input and analysis."""
@@ -33,7 +138,7 @@ def listen_and_respond():
             print("🎙️ 듣는 중... (5초간)")
             audio = recognizer.listen(source, timeout=10, phrase_time_limit=5)
         
-        text = recognizer.recognize_google(audio, language='ko-KR')
+        text = asr_breaker.call(speech_backend.recognize, audio)
         print(f"👤 사용자: {text}")
         
         # 종료 체크
@@ -41,11 +146,10 @@ def listen_and_respond():
             return False
         
         # 분석
-        sentiment = analyze_sentiment(text)
-        mbti = estimate_mbti(text)
+        turn = turn_pipeline.run(text, on_token=print_token)
         
-        print(f"😊 감정: {sentiment}")
-        print(f"🧠 MBTI: {mbti}")
+        print(f"😊 감정: {turn['sentiment']}")
+        print(f"🧠 MBTI: {turn['mbti']}")
         
         return True
         
@@ -55,6 +159,9 @@ def listen_and_respond():
     except sr.RequestError as e:
         print(f"❌ 음성 인식 서비스 오류: {e}")
         return True
+    except (DeadlineExceeded, CircuitOpenError) as e:
+        print(f"⏳ 음성 인식 서비스가 응답하지 않습니다: {e}")
+        return True
     except Exception as e:
         print(f"❌ 오류: {e}")
         return True
@@ -62,11 +169,29 @@ def listen_and_respond():
 def main():
     """Simple main function."""
     print("🌟 ENFP AI 음성 분석기 🌟")
+    
+    # 로컬 인식 모델은 첫 질문의 인식 시간 제한 안에서 불러오지 않도록 미리 준비
+    try:
+        speech_backend.prewarm()
+    except Exception as e:
+        print(f"⚠️ 음성 인식 모델을 불러올 수 없습니다: {e}")
+        
+    # 첫 질문 전에 모델을 불러 두고, 대화 중에는 메모리에 유지
+    if config.OLLAMA_PRELOAD:
+        print(f"🧠 {config.OLLAMA_MODEL} 불러오는 중...")
+        seconds = ollama_service.preload()
+        if seconds is None:
+            print("⚠️ Ollama 서버에 연결할 수 없습니다. 응답 생성이 실패할 수 있습니다.")
+        else:
+            print(f"✅ 모델 준비 완료 ({seconds:.1f}초)")
+    ollama_service.start(preload=False)
     print("말씀하세요. '종료'라고 하면 끝납니다.\n")
     
     while True:
         input("Enter를 눌러 말하기... ")
         if not listen_and_respond():
+            print_latency_summary()
+            ollama_service.close()
             print("👋 안녕히 가세요!")
             break
 
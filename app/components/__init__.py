@@ -2,5 +2,9 @@
 from .analyzer import analyze_sentiment, estimate_mbti
 from .voice_recorder import VoiceRecorder
 from .database import ConversationDB
+from .sharded_database import ShardedConversationDB
+from .storage import ConversationStore, MemoryConversationDB, create_conversation_store
 
-__all__ = ['analyze_sentiment', 'estimate_mbti', 'VoiceRecorder', 'ConversationDB']
+__all__ = ['analyze_sentiment', 'estimate_mbti', 'VoiceRecorder', 'ConversationDB',
+           'ShardedConversationDB', 'ConversationStore', 'MemoryConversationDB',
+           'create_conversation_store']
@@ -0,0 +1,379 @@
+"""
+Speech recognition backends and the streaming interface fed while recording.
+"""
+import time
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, Iterable, Optional, Protocol
+
+import numpy as np
+
+from .audio_clip import AudioClip
+from .audio_preprocess import db_to_amplitude
+from .metrics import LatencyTracker
+
+logger = logging.getLogger(__name__)
+
+ASR_BACKENDS = ('google', 'local', 'stub')
+
+
+class RecognizerBackend(ABC):
+    """One-shot recognizer: ``recognize(audio_data) -> str`` for a ``speech_recognition.AudioData``.
+
+    Backends raise ``speech_recognition.UnknownValueError`` when nothing was
+    recognized, like ``recognize_google`` does. When a LatencyTracker is
+    given every call is recorded under ``asr.<name>``.
+    """
+    
+    name = 'base'
+    
+    def __init__(self, metrics: LatencyTracker = None):
+        self.metrics = metrics
+    
+    def recognize(self, audio) -> str:
+        if self.metrics is None:
+            return self._recognize(audio)
+        with self.metrics.track(f"asr.{self.name}"):
+            return self._recognize(audio)
+    
+    @abstractmethod
+    def _recognize(self, audio) -> str:
+        """Recognize one clip; the timing and metrics are handled by ``recognize``."""
+    
+    def prewarm(self):
+        """Load whatever the backend needs before the first request."""
+
+
+class GoogleRecognizer(RecognizerBackend):
+    """Google Web Speech API through speech_recognition (network round trip).
+
+    ``timeout`` sets the socket timeout of the request (``operation_timeout``);
+    ``endpoint`` overrides the API URL (a proxy or a local stand-in server).
+    """
+    
+    name = 'google'
+    
+    def __init__(self, language: str = 'ko-KR', recognizer=None, metrics: LatencyTracker = None,
+                 timeout: float = None, endpoint: str = None):
+        super().__init__(metrics)
+        import speech_recognition as sr
+        self.language = language
+        self.endpoint = endpoint
+        self.recognizer = recognizer or sr.Recognizer()
+        if timeout is not None:
+            self.recognizer.operation_timeout = timeout
+    
+    def _recognize(self, audio) -> str:
+        if self.endpoint:
+            return self.recognizer.recognize_google(audio, language=self.language,
+                                                    endpoint=self.endpoint)
+        return self.recognizer.recognize_google(audio, language=self.language)
+
+
+class LocalWhisperRecognizer(RecognizerBackend):
+    """Offline recognition with faster-whisper; the model is loaded once and reused.
+
+    ``speech_recognition.recognize_whisper`` reloads the model on every call,
+    so the model is kept here instead. Requires ``pip install faster-whisper``.
+    """
+    
+    name = 'local'
+    SAMPLE_RATE = 16000
+    
+    def __init__(self, model_size: str = 'small', language: str = 'ko-KR', device: str = 'cpu',
+                 compute_type: str = 'int8', beam_size: int = 1, metrics: LatencyTracker = None):
+        super().__init__(metrics)
+        self.model_size = model_size
+        self.language = language.split('-')[0]  # whisper takes "ko", not "ko-KR"
+        self.device = device
+        self.compute_type = compute_type
+        self.beam_size = beam_size
+        self._model = None
+        self._lock = threading.Lock()
+    
+    def load(self):
+        """Load the model (first call only) and return it."""
+        with self._lock:
+            if self._model is None:
+                # Imported lazily: it pulls in ctranslate2 and is only needed for this backend
+                try:
+                    from faster_whisper import WhisperModel
+                except ImportError as e:
+                    raise RuntimeError("faster-whisper is required for the local ASR backend") from e
+                start = time.perf_counter()
+                self._model = WhisperModel(self.model_size, device=self.device,
+                                           compute_type=self.compute_type)
+                logger.info(f"Loaded whisper model '{self.model_size}' "
+                            f"in {time.perf_counter() - start:.1f}s")
+            return self._model
+    
+    def prewarm(self):
+        # Loading takes seconds; on the first request it would run under the ASR deadline
+        self.load()
+    
+    def _recognize(self, audio) -> str:
+        import speech_recognition as sr
+        pcm = audio.get_raw_data(convert_rate=self.SAMPLE_RATE, convert_width=2)
+        samples = np.frombuffer(pcm, dtype='<i2').astype(np.float32) / 32768
+        segments, _ = self.load().transcribe(samples, language=self.language,
+                                             beam_size=self.beam_size)
+        text = ''.join(segment.text for segment in segments).strip()
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+
+
+class StubRecognizer(RecognizerBackend):
+    """Deterministic backend for benchmarks and load tests: fixed text after a fixed delay."""
+
+    name = 'stub'
+    
+    def __init__(self, transcript: str = "안녕하세요", latency: float = 0.0,
+                 metrics: LatencyTracker = None, latency_per_second: float = 0.0):
+        super().__init__(metrics)
+        self.transcript = transcript
+        self.latency = latency
+        # Extra delay per second of audio, like a server whose time grows with clip length
+        self.latency_per_second = latency_per_second
+        self.calls = 0
+    
+    def _recognize(self, audio) -> str:
+        seconds = len(audio.frame_data) / (audio.sample_rate * audio.sample_width)
+        delay = self.latency + self.latency_per_second * seconds
+        if delay:
+            time.sleep(delay)
+        self.calls += 1
+        return self.transcript
+
+
+def create_recognizer(backend: str = 'google', language: str = 'ko-KR',
+                      metrics: LatencyTracker = None, local_model: str = 'small',
+                      stub_transcript: str = "안녕하세요", stub_latency: float = 0.0,
+                      timeout: float = None) -> RecognizerBackend:
+    """Create the configured speech recognition backend."""
+    backend = (backend or 'google').lower()
+    if backend == 'google':
+        return GoogleRecognizer(language, metrics=metrics, timeout=timeout)
+    if backend == 'local':
+        return LocalWhisperRecognizer(local_model, language, metrics=metrics)
+    if backend == 'stub':
+        return StubRecognizer(stub_transcript, stub_latency, metrics=metrics)
+    raise ValueError(f"Unknown ASR backend: {backend} (expected one of {ASR_BACKENDS})")
+
+
+class StreamingRecognizer(Protocol):
+    """Recognizer that takes audio incrementally and reports partial hypotheses."""
+    
+    def start(self, sample_rate: int): ...
+    
+    def accept_audio(self, chunk: np.ndarray) -> Optional[str]: ...
+    
+    def finish(self) -> str: ...
+
+
+class BufferedRecognizer:
+    """Streaming adapter for one-shot recognizers such as ``recognize_google``.
+    
+    Chunks are collected while the user is still speaking, so when speech
+    ends the only work left is the optional preprocessing and one call to
+    ``recognize(audio_data)`` with a ``speech_recognition.AudioData``.
+    One-shot engines cannot take audio incrementally, so by default
+    ``accept_audio`` gives no partial hypotheses.
+    
+    With a SegmentedRecognizer, ``finish(segmented=True)`` instead splits
+    the clip at pauses and recognizes the pieces concurrently. With
+    ``incremental=True`` as well, the split happens during the recording:
+    once at least ``min_segment_seconds`` of audio is followed by a
+    ``min_pause_ms`` pause (more than ``silence_db`` below the loudest
+    chunk so far), that segment is recognized on the segmenter's pool
+    while the user keeps talking, ``accept_audio`` returns the text of the
+    segments recognized so far, and ``finish`` only waits for the last
+    segment. Utterances without such a pause are recognized in one call
+    as before.
+    
+    With an AudioEncoder the upload is compressed in-process; a streaming
+    encoder (only used without a preprocessor, which changes the samples at
+    the end) encodes the chunks as they arrive.
+    """
+    
+    def __init__(self, recognize: Callable, preprocessor=None, segmenter=None, encoder=None,
+                 incremental: bool = False, silence_db: float = 30.0):
+        self.recognize = recognize
+        self.preprocessor = preprocessor
+        self.segmenter = segmenter
+        self.encoder = encoder
+        self.incremental = incremental and segmenter is not None
+        self.silence_db = silence_db
+        self.sample_rate = None
+        self._chunks = []
+        self._stream = None
+        self._reset_segments()
+    
+    def _reset_segments(self):
+        # Chunks since the last cut, their trailing silence and the segments sent for recognition
+        self._pending = []
+        self._pending_frames = 0
+        self._silent_frames = 0
+        self._peak = 0.0
+        self._futures = []
+    
+    def start(self, sample_rate: int):
+        self.sample_rate = sample_rate
+        self._chunks = []
+        self._reset_segments()
+        if self._stream is not None:
+            self._stream.close()
+        self._stream = None
+        if self.encoder is not None and self.encoder.streaming and self.preprocessor is None:
+            self._stream = self.encoder.open_stream(sample_rate)
+    
+    def accept_audio(self, chunk: np.ndarray) -> Optional[str]:
+        self._chunks.append(chunk)
+        if self._stream is not None:
+            self._stream.write(chunk)
+        if not self.incremental or not len(chunk):
+            return None
+            
+        self._pending.append(chunk)
+        self._pending_frames += len(chunk)
+        level = float(np.sqrt(np.mean(np.square(chunk))))
+        self._peak = max(self._peak, level)
+        if level < self._peak * db_to_amplitude(-self.silence_db):
+            self._silent_frames += len(chunk)
+        else:
+            self._silent_frames = 0
+        min_pause = self.sample_rate * self.segmenter.min_pause_ms / 1000
+        min_segment = self.sample_rate * self.segmenter.min_segment_seconds
+        if self._silent_frames >= min_pause and self._pending_frames - self._silent_frames >= min_segment:
+            self._submit_pending()
+        return self.partial() or None
+    
+    def _submit_pending(self):
+        samples = np.concatenate(self._pending)
+        self._pending = []
+        self._pending_frames = 0
+        self._silent_frames = 0
+        clip = AudioClip(samples, self.sample_rate, samples.shape[1])
+        if self.preprocessor is not None:
+            clip, _ = self.preprocessor.process(clip)
+        if clip.num_frames:
+            self._futures.append(self.segmenter.submit(clip))
+    
+    def partial(self) -> str:
+        """Text of the leading segments already recognized (incremental mode)."""
+        texts = []
+        for future in self._futures:
+            if not future.done() or future.exception() is not None:
+                break
+            if future.result():
+                texts.append(future.result())
+        return ' '.join(texts)
+    
+    def finish(self, segmented: bool = False) -> str:
+        """Recognize everything received since start; empty string if there was no speech."""
+        if self._futures:
+            return self._finish_segments()
+            
+        if self._chunks:
+            samples = np.concatenate(self._chunks)
+        else:
+            samples = np.zeros((0, 1), dtype=np.float32)
+        self._chunks = []
+        self._reset_segments()
+        
+        clip = AudioClip(samples, self.sample_rate, samples.shape[1])
+        if self.preprocessor is not None:
+            clip, report = self.preprocessor.process(clip)
+            logger.info(f"Preprocessed clip: {report['original_duration']:.2f}s -> "
+                        f"{report['trimmed_duration']:.2f}s, gain {report['gain_db']:+.1f} dB "
+                        f"({report['elapsed_ms']:.1f} ms)")
+        stream, self._stream = self._stream, None
+        if not clip.num_frames:
+            if stream is not None:
+                stream.close()
+            return ""
+        if segmented and self.segmenter is not None:
+            if stream is not None:
+                stream.close()
+            return self.segmenter.transcribe(clip)
+        if stream is not None:
+            return self.recognize(stream.to_audio_data())
+        if self.encoder is not None:
+            return self.recognize(self.encoder.to_audio_data(clip))
+        return self.recognize(clip.to_audio_data())
+    
+    def _finish_segments(self) -> str:
+        """Recognize the last segment and join it to those recognized during the recording."""
+        import speech_recognition as sr
+        if self._pending_frames > self._silent_frames:
+            self._submit_pending()
+        futures = self._futures
+        self._chunks = []
+        self._reset_segments()
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            stream.close()
+            
+        texts = [text for text in (future.result() for future in futures) if text]
+        if not texts:
+            raise sr.UnknownValueError()
+        return ' '.join(texts)
+
+
+class FakeStreamingRecognizer:
+    """Deterministic offline recognizer for tests and benchmarks.
+    
+    Reveals the words of a fixed ``transcript`` as speech-level audio
+    arrives (``words_per_second``), so partial hypotheses grow during the
+    recording. ``processing_rtf`` simulates compute cost per second of audio
+    and ``finalize_seconds`` the extra work done when the stream ends.
+    """
+    
+    def __init__(self, transcript: str, words_per_second: float = 2.5, min_rms: float = 0.01,
+                 processing_rtf: float = 0.0, finalize_seconds: float = 0.0):
+        self.words = transcript.split()
+        self.words_per_second = words_per_second
+        self.min_rms = min_rms
+        self.processing_rtf = processing_rtf
+        self.finalize_seconds = finalize_seconds
+        self.sample_rate = None
+        self.speech_seconds = 0.0
+        self.chunks_received = 0
+    
+    def start(self, sample_rate: int):
+        self.sample_rate = sample_rate
+        self.speech_seconds = 0.0
+        self.chunks_received = 0
+    
+    def accept_audio(self, chunk: np.ndarray) -> Optional[str]:
+        self.chunks_received += 1
+        seconds = len(chunk) / self.sample_rate
+        if self.processing_rtf:
+            time.sleep(seconds * self.processing_rtf)
+        if len(chunk) and np.sqrt(np.mean(np.square(chunk))) > self.min_rms:
+            self.speech_seconds += seconds
+        return self.partial() or None
+    
+    def partial(self) -> str:
+        """Words recognized so far."""
+        count = int(self.speech_seconds * self.words_per_second)
+        return ' '.join(self.words[:count])
+    
+    def finish(self) -> str:
+        if self.finalize_seconds:
+            time.sleep(self.finalize_seconds)
+        return ' '.join(self.words) if self.speech_seconds > 0 else ""
+
+
+def transcribe_stream(chunks: Iterable[np.ndarray], recognizer: StreamingRecognizer,
+                      sample_rate: int, on_partial: Callable[[str], None] = None) -> str:
+    """Feed audio chunks to a recognizer as they arrive and return the final transcript."""
+    recognizer.start(sample_rate)
+    last_partial = None
+    for chunk in chunks:
+        partial = recognizer.accept_audio(chunk)
+        if partial and partial != last_partial and on_partial is not None:
+            on_partial(partial)
+        last_partial = partial or last_partial
+    return recognizer.finish()
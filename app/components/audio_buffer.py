@@ -0,0 +1,87 @@
+"""
+Preallocated ring buffer for handing audio from the capture callback to consumers
+"""
+import numpy as np
+
+
+class AudioRingBuffer:
+    """Single-producer / single-consumer ring buffer of audio frames.
+    
+    All memory is allocated up front so the real-time audio callback only
+    copies samples. The producer publishes data by advancing ``write_pos``
+    after the copy and the consumer frees space by advancing ``read_pos``;
+    each position has exactly one writer, so no lock is needed.
+    """
+    
+    def __init__(self, capacity_frames, channels=1, dtype=np.float32):
+        self.capacity = max(1, int(capacity_frames))
+        self.channels = channels
+        self._buffer = np.zeros((self.capacity, channels), dtype=dtype)
+        self.reset()
+    
+    def reset(self):
+        """Drop all data and clear the counters (not safe while capturing)."""
+        self.write_pos = 0  # total frames ever written
+        self.read_pos = 0  # total frames ever consumed
+        self.overrun_count = 0
+        self.dropped_frames = 0
+        self.underrun_count = 0
+    
+    @property
+    def available(self):
+        """Frames written but not yet consumed."""
+        return self.write_pos - self.read_pos
+    
+    @property
+    def free(self):
+        """Frames that can be written without dropping data."""
+        return self.capacity - self.available
+    
+    def write(self, block):
+        """Copy a block of frames in; frames that do not fit are dropped."""
+        block = block.reshape(len(block), -1)
+        count = min(len(block), self.free)
+        if count < len(block):
+            self.overrun_count += 1
+            self.dropped_frames += len(block) - count
+            
+        start = self.write_pos % self.capacity
+        first = min(count, self.capacity - start)
+        self._buffer[start:start + first] = block[:first]
+        if count > first:
+            self._buffer[:count - first] = block[first:count]
+            
+        # Publish only after the samples are in place
+        self.write_pos += count
+        return count
+    
+    def read(self, frames=None):
+        """Consume up to ``frames`` frames (all available if None) as a copy."""
+        available = self.available
+        if frames is None:
+            frames = available
+        elif frames > available:
+            self.underrun_count += 1
+            frames = available
+            
+        start = self.read_pos % self.capacity
+        first = min(frames, self.capacity - start)
+        if first == frames:
+            data = self._buffer[start:start + frames].copy()
+        else:
+            data = np.concatenate((self._buffer[start:], self._buffer[:frames - first]))
+            
+        self.read_pos += frames
+        return data
+    
+    def view(self):
+        """Everything captured since reset, zero-copy while the buffer has not wrapped."""
+        end = self.write_pos
+        if end <= self.capacity:
+            view = self._buffer[:end]
+            view.flags.writeable = False
+            return view
+            
+        # Only the most recent ``capacity`` frames survive a wrap
+        start = end % self.capacity
+        return np.concatenate((self._buffer[start:], self._buffer[:start]))
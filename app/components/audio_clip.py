@@ -0,0 +1,66 @@
+"""
+In-memory audio clip produced by the recorder and its PCM/WAV encoders
+"""
+import io
+import wave
+
+import numpy as np
+
+
+def float_to_pcm16(samples):
+    """Clip float samples to [-1, 1] and convert them to int16 in one pass."""
+    pcm = np.clip(samples, -1.0, 1.0)
+    pcm *= 32767
+    return pcm.astype(np.int16)
+
+
+class AudioClip:
+    """Captured mono or multi-channel float32 audio kept in memory."""
+
+    def __init__(self, samples, sample_rate, channels=1):
+        self.samples = samples.reshape(len(samples), channels)
+        self.sample_rate = sample_rate
+        self.channels = channels
+    
+    @property
+    def num_frames(self):
+        return len(self.samples)
+    
+    @property
+    def duration(self):
+        """Clip length in seconds."""
+        return self.num_frames / self.sample_rate if self.sample_rate else 0.0
+    
+    def to_pcm16_bytes(self):
+        """Interleaved 16-bit little-endian PCM."""
+        return float_to_pcm16(self.samples).astype('<i2', copy=False).tobytes()
+    
+    def to_wav_bytes(self):
+        """Encode the clip as a WAV file in memory."""
+        output = io.BytesIO()
+        self._write_wav(output)
+        return output.getvalue()
+    
+    def save_wav(self, path):
+        """Write the clip to a WAV file (debugging aid)."""
+        with open(path, 'wb') as f:
+            self._write_wav(f)
+        return path
+    
+    def _write_wav(self, fileobj):
+        with wave.open(fileobj, 'wb') as wf:
+            wf.setnchannels(self.channels)
+            wf.setsampwidth(2)  # 16-bit audio
+            wf.setframerate(self.sample_rate)
+            wf.writeframes(self.to_pcm16_bytes())
+    
+    def to_mono(self):
+        """Return a single-channel clip, averaging channels if needed."""
+        if self.channels == 1:
+            return self
+        return AudioClip(self.samples.mean(axis=1, dtype=np.float32), self.sample_rate, 1)
+    
+    def to_audio_data(self):
+        """Wrap the PCM in speech_recognition.AudioData without touching disk."""
+        import speech_recognition as sr
+        return sr.AudioData(self.to_mono().to_pcm16_bytes(), self.sample_rate, 2)
@@ -0,0 +1,255 @@
+"""
+In-memory FLAC/Opus encoding of captured clips for the recognition upload
+"""
+import io
+import time
+import logging
+import threading
+import subprocess
+
+import numpy as np
+import speech_recognition as sr
+
+from .audio_clip import AudioClip, float_to_pcm16
+from .metrics import LatencyTracker
+
+try:
+    import soundfile
+except ImportError:
+    soundfile = None
+
+logger = logging.getLogger(__name__)
+
+AUDIO_CODECS = ('flac', 'opus')
+OPUS_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)
+
+
+def opus_supported(sample_rate=16000):
+    """Whether Opus can be written here (soundfile with an Opus-enabled libsndfile)."""
+    if soundfile is None or sample_rate not in OPUS_SAMPLE_RATES:
+        return False
+    return 'OPUS' in soundfile.available_subtypes('OGG')
+
+
+def _flac_command(level, raw_rate=None):
+    from speech_recognition.audio import get_flac_converter
+    command = [get_flac_converter(), "--stdout", "--totally-silent", "--no-padding", f"-{level}"]
+    if raw_rate is not None:
+        command += ["--force-raw-format", "--endian=little", "--sign=signed",
+                    "--channels=1", "--bps=16", f"--sample-rate={raw_rate}"]
+    return command + ["-"]
+
+
+def encode_pcm16(pcm, sample_rate, codec='flac', level=5) -> bytes:
+    """Encode mono int16 samples; uses soundfile when installed, else the flac executable."""
+    if soundfile is not None:
+        output = io.BytesIO()
+        if codec == 'opus':
+            soundfile.write(output, pcm, sample_rate, format='OGG', subtype='OPUS',
+                            compression_level=level / 8)
+        else:
+            soundfile.write(output, pcm, sample_rate, format='FLAC', subtype='PCM_16',
+                            compression_level=level / 8)
+        return output.getvalue()
+    if codec == 'opus':
+        raise RuntimeError("soundfile is required for Opus encoding")
+    # Same encoder speech_recognition shells out to, but with raw input and our level
+    process = subprocess.run(_flac_command(level, sample_rate), input=pcm.astype('<i2').tobytes(),
+                             stdout=subprocess.PIPE, check=True)
+    return process.stdout
+
+
+def read_flac(data: bytes):
+    """Decode a FLAC file to int16 samples of shape (frames, channels) and its sample rate."""
+    if soundfile is not None:
+        return soundfile.read(io.BytesIO(data), dtype='int16', always_2d=True)
+    if data[:4] != b'fLaC':
+        raise ValueError("Not a FLAC stream")
+    # STREAMINFO follows the marker and its 4-byte block header
+    sample_rate = int.from_bytes(data[18:21], 'big') >> 4
+    channels = ((data[20] >> 1) & 0x07) + 1
+    bits = ((data[20] & 0x01) << 4 | data[21] >> 4) + 1
+    if bits != 16:
+        raise ValueError(f"Only 16-bit FLAC can be decoded without soundfile (got {bits}-bit)")
+    from speech_recognition.audio import get_flac_converter
+    process = subprocess.run([get_flac_converter(), "--decode", "--stdout", "--totally-silent",
+                              "--force-raw-format", "--endian=little", "--sign=signed", "-"],
+                             input=data, stdout=subprocess.PIPE, check=True)
+    return np.frombuffer(process.stdout, dtype='<i2').reshape(-1, channels), sample_rate
+
+
+def decode_flac(data: bytes) -> np.ndarray:
+    """Decode a FLAC payload back to mono int16 samples (first channel)."""
+    return read_flac(data)[0][:, 0]
+
+
+class EncodedAudioData(sr.AudioData):
+    """AudioData that carries a FLAC payload encoded in-process.
+
+    ``recognize_google`` asks for ``get_flac_data()``; returning the prepared
+    payload skips piping a WAV copy through the flac executable per request.
+    Other conversions fall back to the regular implementation.
+    """
+    
+    def __init__(self, frame_data, sample_rate, sample_width, flac_data):
+        super().__init__(frame_data, sample_rate, sample_width)
+        self.flac_data = flac_data
+    
+    def get_flac_data(self, convert_rate=None, convert_width=None):
+        if convert_rate in (None, self.sample_rate) and convert_width in (None, self.sample_width):
+            return self.flac_data
+        return super().get_flac_data(convert_rate, convert_width)
+
+
+class AudioEncoder:
+    """Compress captured clips before they are sent to recognition.
+
+    ``codec`` is 'flac' (lossless, what the Google API takes) or 'opus'
+    (lossy, smaller; needs soundfile with Opus support and falls back to
+    FLAC otherwise). ``level`` is the compression effort 0-8. With
+    ``verify`` every FLAC payload is decoded and compared with the input
+    samples. Each clip gets a report of bytes saved and encode time, also
+    recorded under ``encode.<codec>`` when a LatencyTracker is given.
+    """
+    
+    def __init__(self, codec='flac', level=5, streaming=False, verify=False,
+                 metrics: LatencyTracker = None):
+        if codec not in AUDIO_CODECS:
+            raise ValueError(f"Unknown audio codec: {codec} (expected one of {AUDIO_CODECS})")
+        self.codec = codec
+        self.level = int(np.clip(level, 0, 8))
+        self.streaming = streaming
+        self.verify = verify
+        self.metrics = metrics
+    
+    def codec_for(self, sample_rate):
+        """Codec actually used at this sample rate."""
+        if self.codec == 'opus' and not opus_supported(sample_rate):
+            return 'flac'
+        return self.codec
+    
+    def encode(self, clip: AudioClip):
+        """Return (payload, report) for a clip; the payload is mono."""
+        start = time.perf_counter()
+        clip = clip.to_mono()
+        pcm = float_to_pcm16(clip.samples[:, 0])
+        codec = self.codec_for(clip.sample_rate)
+        payload = encode_pcm16(pcm, clip.sample_rate, codec, self.level)
+        return payload, self._report(codec, pcm, payload, start)
+    
+    def to_audio_data(self, clip: AudioClip):
+        """AudioData for the recognizer with the FLAC payload attached.
+        
+        Opus payloads cannot be sent through speech_recognition, so only
+        FLAC is attached; on any encoding problem the plain PCM is used.
+        """
+        clip = clip.to_mono()
+        try:
+            if self.codec_for(clip.sample_rate) != 'flac':
+                return clip.to_audio_data()
+            payload, report = self.encode(clip)
+        except Exception as e:
+            logger.error(f"Audio encoding failed, sending PCM: {e}")
+            return clip.to_audio_data()
+        if report['verified'] is False:
+            return clip.to_audio_data()
+        return EncodedAudioData(clip.to_pcm16_bytes(), clip.sample_rate, 2, payload)
+    
+    def open_stream(self, sample_rate):
+        """Start encoding a recording chunk by chunk (FLAC)."""
+        return StreamingEncoder(self, sample_rate)
+    
+    def _report(self, codec, pcm, payload, start):
+        encode_seconds = time.perf_counter() - start
+        if self.metrics is not None:
+            self.metrics.record(f"encode.{codec}", encode_seconds)
+        verified = None
+        if self.verify and codec == 'flac':
+            verified = bool(np.array_equal(decode_flac(payload), pcm))
+            if not verified:
+                logger.error("FLAC payload does not decode to the captured samples")
+        raw_bytes = pcm.size * 2
+        return {
+            'codec': codec,
+            'raw_bytes': raw_bytes,
+            'encoded_bytes': len(payload),
+            'bytes_saved': raw_bytes - len(payload),
+            'ratio': len(payload) / raw_bytes if raw_bytes else 1.0,
+            'encode_ms': encode_seconds * 1000,
+            'verified': verified
+        }
+
+
+class StreamingEncoder:
+    """FLAC encoder fed while recording, so the payload is ready when speech ends.
+
+    With soundfile the frames are written to an in-memory FLAC file; without
+    it they are piped to a running flac process whose output is drained on a
+    background thread. ``finish()`` returns (payload, report) like
+    ``AudioEncoder.encode``; ``encode_ms`` is the time spent in ``write``
+    and ``finish`` only.
+    """
+    
+    def __init__(self, encoder: AudioEncoder, sample_rate):
+        self.encoder = encoder
+        self.sample_rate = sample_rate
+        self._pcm = []
+        self._busy_seconds = 0.0
+        self._output = io.BytesIO()
+        self._process = None
+        if soundfile is not None:
+            self._file = soundfile.SoundFile(self._output, 'w', sample_rate, 1, format='FLAC',
+                                             subtype='PCM_16', compression_level=encoder.level / 8)
+        else:
+            self._file = None
+            self._process = subprocess.Popen(_flac_command(encoder.level, sample_rate),
+                                             stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+            self._reader = threading.Thread(target=self._drain, daemon=True)
+            self._reader.start()
+    
+    def _drain(self):
+        for block in iter(lambda: self._process.stdout.read(65536), b''):
+            self._output.write(block)
+    
+    def write(self, chunk):
+        """Encode the next block of float samples (mono or multi-channel)."""
+        start = time.perf_counter()
+        chunk = np.asarray(chunk, dtype=np.float32)
+        if chunk.ndim == 2:
+            chunk = chunk.mean(axis=1) if chunk.shape[1] > 1 else chunk[:, 0]
+        pcm = float_to_pcm16(chunk)
+        self._pcm.append(pcm)
+        if self._file is not None:
+            self._file.write(pcm)
+        else:
+            self._process.stdin.write(pcm.astype('<i2').tobytes())
+        self._busy_seconds += time.perf_counter() - start
+    
+    def finish(self):
+        """Close the stream and return (payload, report)."""
+        start = time.perf_counter()
+        if self._file is not None:
+            self._file.close()
+        else:
+            self._process.stdin.close()
+            self._process.wait()
+            self._reader.join()
+        payload = self._output.getvalue()
+        pcm = np.concatenate(self._pcm) if self._pcm else np.zeros(0, dtype=np.int16)
+        return payload, self.encoder._report('flac', pcm, payload, start - self._busy_seconds)
+    
+    def close(self):
+        """Abandon the stream without producing a payload."""
+        if self._file is not None:
+            self._file.close()
+        elif self._process.poll() is None:
+            self._process.kill()
+            self._process.wait()
+    
+    def to_audio_data(self):
+        """Finish the stream and wrap the payload for the recognizer."""
+        payload, report = self.finish()
+        pcm = np.concatenate(self._pcm) if self._pcm else np.zeros(0, dtype=np.int16)
+        if report['verified'] is False:
+            return sr.AudioData(pcm.astype('<i2').tobytes(), self.sample_rate, 2)
+        return EncodedAudioData(pcm.astype('<i2').tobytes(), self.sample_rate, 2, payload)
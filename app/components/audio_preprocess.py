@@ -0,0 +1,120 @@
+"""
+Vectorized clean-up of captured clips before speech recognition
+"""
+import time
+
+import numpy as np
+
+from .audio_clip import AudioClip
+
+NORMALIZE_MODES = ('peak', 'rms')
+
+
+def db_to_amplitude(db):
+    return 10.0 ** (db / 20.0)
+
+
+def amplitude_to_db(amplitude):
+    return 20.0 * np.log10(max(amplitude, 1e-10))
+
+
+def frame_rms(samples, frame_length):
+    """RMS of consecutive frames; the last partial frame is zero-padded."""
+    count = -(-len(samples) // frame_length)
+    padded = np.zeros(count * frame_length, dtype=np.float32)
+    padded[:len(samples)] = samples
+    frames = padded.reshape(count, frame_length)
+    return np.sqrt(np.einsum('ij,ij->i', frames, frames) / frame_length)
+
+
+class AudioPreprocessor:
+    """Trim silence, gate noise and normalize gain of a recorded AudioClip.
+
+    Every step works on whole-clip NumPy arrays, so a few seconds of 16 kHz
+    audio take a couple of milliseconds. Steps can be switched off by
+    passing None (``trim_db``, ``noise_gate_db``, ``normalize``).
+    """
+    
+    def __init__(self, trim_db=25.0, min_level_db=-50.0, padding_ms=150,
+                 noise_gate_db=-50.0, gate_floor_db=-30.0, normalize='peak',
+                 target_db=None, max_gain_db=30.0, frame_ms=20):
+        if normalize is not None and normalize not in NORMALIZE_MODES:
+            raise ValueError(f"Unknown normalize mode: {normalize} (expected one of {NORMALIZE_MODES})")
+        self.trim_db = trim_db
+        self.min_level_db = min_level_db
+        self.padding_ms = padding_ms
+        self.noise_gate_db = noise_gate_db
+        self.gate_floor_db = gate_floor_db
+        self.normalize = normalize
+        if target_db is None:
+            target_db = -1.0 if normalize == 'peak' else -20.0
+        self.target_db = target_db
+        self.max_gain_db = max_gain_db
+        self.frame_ms = frame_ms
+    
+    def process(self, clip):
+        """Return the cleaned mono clip and a report of what was changed."""
+        start = time.perf_counter()
+        clip = clip.to_mono()
+        samples = np.asarray(clip.samples[:, 0], dtype=np.float32)
+        frame_length = max(1, int(clip.sample_rate * self.frame_ms / 1000))
+        levels = frame_rms(samples, frame_length) if len(samples) else np.zeros(0)
+        
+        if self.trim_db is not None:
+            samples, levels = self._trim(samples, levels, frame_length)
+        if self.noise_gate_db is not None and len(samples):
+            samples = self._gate(samples, levels, frame_length)
+        gain_db = 0.0
+        if self.normalize is not None and len(samples):
+            samples, gain_db = self._normalize(samples)
+            
+        processed = AudioClip(samples, clip.sample_rate, 1)
+        report = {
+            'original_duration': clip.duration,
+            'trimmed_duration': processed.duration,
+            'trimmed_seconds': clip.duration - processed.duration,
+            'gain_db': gain_db,
+            'elapsed_ms': (time.perf_counter() - start) * 1000
+        }
+        return processed, report
+    
+    def _trim(self, samples, levels, frame_length):
+        """Cut leading and trailing frames far below the loudest frame."""
+        if not len(levels):
+            return samples, levels
+        threshold = max(levels.max() * db_to_amplitude(-self.trim_db),
+                        db_to_amplitude(self.min_level_db))
+        active = np.flatnonzero(levels > threshold)
+        if not len(active):
+            # Nothing louder than the absolute floor: no speech at all
+            return samples[:0], levels[:0]
+            
+        padding = int(np.ceil(self.padding_ms / self.frame_ms))
+        first = max(0, active[0] - padding)
+        last = min(len(levels), active[-1] + 1 + padding)
+        return samples[first * frame_length:last * frame_length], levels[first:last]
+    
+    def _gate(self, samples, levels, frame_length):
+        """Attenuate frames below the gate level, interpolating gain to avoid clicks."""
+        frame_gain = np.where(levels < db_to_amplitude(self.noise_gate_db),
+                              db_to_amplitude(self.gate_floor_db), 1.0)
+        if frame_gain.min() == 1.0:
+            return samples
+        centers = (np.arange(len(frame_gain)) + 0.5) * frame_length
+        gain = np.interp(np.arange(len(samples)), centers, frame_gain)
+        return (samples * gain).astype(np.float32)
+    
+    def _normalize(self, samples):
+        """Scale to the target peak or RMS level without clipping."""
+        peak = float(np.max(np.abs(samples)))
+        if peak == 0.0:
+            return samples, 0.0
+        if self.normalize == 'peak':
+            level = peak
+        else:
+            level = float(np.sqrt(np.mean(np.square(samples))))
+            
+        gain_db = min(self.target_db - amplitude_to_db(level), self.max_gain_db)
+        # Never push the peak over full scale
+        gain_db = min(gain_db, -amplitude_to_db(peak) - 0.1)
+        return (samples * db_to_amplitude(gain_db)).astype(np.float32), gain_db
@@ -0,0 +1,236 @@
+"""
+Audio sources that drive VoiceRecorder: microphone, file replay and synthetic speech
+"""
+import os
+import time
+import wave
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable
+
+import numpy as np
+
+try:
+    import sounddevice as sd
+except (ImportError, OSError):  # OSError: PortAudio missing (headless machines)
+    sd = None
+
+logger = logging.getLogger(__name__)
+
+AUDIO_SOURCES = ('microphone', 'file', 'synthetic')
+
+
+class AudioSource(ABC):
+    """Delivers float32 blocks of shape (frames, channels) to a callback.
+
+    The callback has the sounddevice signature ``callback(indata, frames,
+    time, status)``, so VoiceRecorder consumes every source through the
+    same code path. ``finished_callback`` is called when a finite source
+    runs out of audio.
+    """
+    
+    def __init__(self, sample_rate, channels=1):
+        self.sample_rate = sample_rate
+        self.channels = channels
+    
+    @abstractmethod
+    def start(self, callback: Callable, finished_callback: Callable = None):
+        """Begin delivering blocks to ``callback``."""
+    
+    @abstractmethod
+    def stop(self):
+        """Stop delivering blocks; safe to call when not started."""
+
+
+class MicrophoneSource(AudioSource):
+    """Live capture through ``sounddevice.InputStream``."""
+
+    def __init__(self, sample_rate=44100, channels=1, blocksize=0, device=None):
+        super().__init__(sample_rate, channels)
+        self.blocksize = blocksize
+        self.device = device
+        self.stream = None
+    
+    def start(self, callback, finished_callback=None):
+        if sd is None:
+            raise RuntimeError("sounddevice with PortAudio is required for microphone input")
+        self.stream = sd.InputStream(
+            samplerate=self.sample_rate,
+            channels=self.channels,
+            blocksize=self.blocksize,
+            device=self.device,
+            callback=callback
+        )
+        self.stream.start()
+    
+    def stop(self):
+        if self.stream is not None:
+            self.stream.stop()
+            self.stream.close()
+            self.stream = None
+
+
+class ReplaySource(AudioSource):
+    """Feeds precomputed or generated blocks from a background thread.
+
+    ``speed`` sets the pace: 1.0 is real time, 4.0 four times faster and
+    0 (or None) as fast as the callback can take them. Pacing is against
+    the total frames delivered, so sleep jitter does not accumulate.
+    """
+    
+    def __init__(self, sample_rate, channels=1, blocksize=512, speed=1.0):
+        super().__init__(sample_rate, channels)
+        self.blocksize = blocksize
+        self.speed = speed
+        self.frames_delivered = 0
+        self._stop = threading.Event()
+        self._thread = None
+    
+    @abstractmethod
+    def blocks(self):
+        """Yield float32 blocks of shape (frames, channels)."""
+    
+    def start(self, callback, finished_callback=None):
+        self.stop()
+        self._stop.clear()
+        self.frames_delivered = 0
+        self._thread = threading.Thread(target=self._run, args=(callback, finished_callback),
+                                        name=f"{type(self).__name__}", daemon=True)
+        self._thread.start()
+    
+    def _run(self, callback, finished_callback):
+        start = time.perf_counter()
+        try:
+            for block in self.blocks():
+                if self._stop.is_set():
+                    return
+                if self.speed:
+                    due = start + self.frames_delivered / (self.sample_rate * self.speed)
+                    delay = due - time.perf_counter()
+                    if delay > 0 and self._stop.wait(delay):
+                        return
+                callback(block, len(block), None, None)
+                self.frames_delivered += len(block)
+        except Exception as e:
+            logger.error(f"Audio source failed: {e}")
+        if finished_callback is not None and not self._stop.is_set():
+            finished_callback()
+    
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+    
+    def wait(self, timeout=None):
+        """Block until all audio has been delivered; False on timeout."""
+        if self._thread is None:
+            return True
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+
+def read_audio_file(path):
+    """Load a WAV or FLAC file as float32 (frames, channels) and its sample rate."""
+    from .audio_encoding import read_flac, soundfile
+    if soundfile is not None:
+        return soundfile.read(path, dtype='float32', always_2d=True)
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.flac':
+        with open(path, 'rb') as f:
+            pcm, sample_rate = read_flac(f.read())
+        return pcm.astype(np.float32) / 32768, sample_rate
+    if extension == '.wav':
+        with wave.open(path, 'rb') as wf:
+            if wf.getsampwidth() != 2:
+                raise ValueError(f"Only 16-bit WAV is supported without soundfile: {path}")
+            pcm = np.frombuffer(wf.readframes(wf.getnframes()), dtype='<i2')
+            return pcm.reshape(-1, wf.getnchannels()).astype(np.float32) / 32768, wf.getframerate()
+    raise ValueError(f"Unsupported audio file: {path} (expected .wav or .flac)")
+
+
+class FileSource(ReplaySource):
+    """Replays a WAV/FLAC recording, optionally looping, as if it were captured live.
+
+    ``tail_silence`` seconds of silence are appended so a VAD can see the
+    speech end, as it would after a real utterance.
+    """
+    
+    def __init__(self, path, blocksize=512, speed=1.0, loop=False, tail_silence=1.0):
+        samples, sample_rate = read_audio_file(path)
+        super().__init__(sample_rate, samples.shape[1], blocksize, speed)
+        self.path = path
+        self.loop = loop
+        silence = np.zeros((int(tail_silence * sample_rate), samples.shape[1]), dtype=np.float32)
+        self.samples = np.concatenate((samples, silence))
+    
+    @property
+    def duration(self):
+        return len(self.samples) / self.sample_rate
+    
+    def blocks(self):
+        while True:
+            for offset in range(0, len(self.samples), self.blocksize):
+                yield self.samples[offset:offset + self.blocksize]
+            if not self.loop:
+                return
+
+
+class SyntheticSource(ReplaySource):
+    """Generates speech-like audio: voiced phrases separated by pauses over a noise floor.
+
+    ``phrases`` is a sequence of (seconds, amplitude). Each phrase is a
+    harmonic tone at ``f0`` with a syllable-rate envelope, so energy-based
+    VAD and preprocessing treat it like speech. With ``utterances`` > 1 the
+    pattern repeats, separated by ``tail_silence``.
+    """
+    
+    def __init__(self, sample_rate=16000, channels=1, phrases=((1.5, 0.3),), pause=0.5,
+                 lead_silence=0.3, tail_silence=1.0, noise=0.003, f0=140.0,
+                 utterances=1, blocksize=512, speed=1.0, seed=0):
+        super().__init__(sample_rate, channels, blocksize, speed)
+        self.phrases = phrases
+        self.pause = pause
+        self.lead_silence = lead_silence
+        self.tail_silence = tail_silence
+        self.noise = noise
+        self.f0 = f0
+        self.utterances = utterances
+        self.seed = seed
+    
+    def utterance(self):
+        """One utterance as float32 (frames, channels)."""
+        rng = np.random.default_rng(self.seed)
+        parts = [np.zeros(int(self.lead_silence * self.sample_rate), dtype=np.float32)]
+        for index, (seconds, amplitude) in enumerate(self.phrases):
+            t = np.arange(int(seconds * self.sample_rate)) / self.sample_rate
+            envelope = 0.6 + 0.4 * np.sin(2 * np.pi * 4 * t)
+            voice = sum(np.sin(2 * np.pi * self.f0 * k * t) / k for k in range(1, 6))
+            parts.append((amplitude * envelope * voice / 2.3).astype(np.float32))
+            gap = self.pause if index < len(self.phrases) - 1 else self.tail_silence
+            parts.append(np.zeros(int(gap * self.sample_rate), dtype=np.float32))
+        samples = np.concatenate(parts)
+        samples += (self.noise * rng.standard_normal(len(samples))).astype(np.float32)
+        return np.repeat(samples[:, None], self.channels, axis=1)
+    
+    def blocks(self):
+        samples = self.utterance()
+        for _ in range(self.utterances):
+            for offset in range(0, len(samples), self.blocksize):
+                yield samples[offset:offset + self.blocksize]
+
+
+def create_audio_source(kind='microphone', sample_rate=44100, channels=1, path=None,
+                        speed=1.0) -> AudioSource:
+    """Create the configured recorder input."""
+    kind = (kind or 'microphone').lower()
+    if kind == 'microphone':
+        return MicrophoneSource(sample_rate, channels)
+    if kind == 'file':
+        if not path:
+            raise ValueError("A file path is required for the file audio source")
+        return FileSource(path, speed=speed)
+    if kind == 'synthetic':
+        return SyntheticSource(sample_rate, channels, speed=speed)
+    raise ValueError(f"Unknown audio source: {kind} (expected one of {AUDIO_SOURCES})")
@@ -0,0 +1,130 @@
+"""
+Per-session chat history for the LLM, kept within a prompt token budget
+"""
+import logging
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Chat template tokens around each message (role markers, separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count: about 4 ASCII characters per token, one per Hangul/other character.
+
+    Deliberately on the high side for Korean so the budget is not exceeded;
+    Ollama silently cuts the front of prompts longer than ``num_ctx``.
+    """
+    ascii_chars = sum(1 for char in text if ord(char) < 128)
+    return (ascii_chars + 3) // 4 + len(text) - ascii_chars
+
+
+class ConversationContext:
+    """Chat messages for one session: a fixed system prompt followed by past turns.
+
+    The message list only ever grows at the end, so every request starts
+    with the previous request's prompt and Ollama reuses its cached
+    key/value state for that prefix; only the newest turn is prefilled.
+    When the estimated prompt would exceed ``max_tokens``, the oldest turns
+    are dropped until it fits in ``max_tokens * trim_to`` (at least
+    ``min_turns`` recent turns are kept when they fit). Each trim changes
+    the prefix, so the remaining history is prefilled again; trimming well
+    below the limit makes that happen once every several turns instead of
+    on every turn.
+    
+    With ``summarize(previous_summary, dropped_turns) -> str`` the dropped
+    turns are folded into a summary that follows the system prompt;
+    without it they are simply forgotten.
+    """
+    
+    def __init__(self, system_prompt: str, max_tokens: int = 3072, trim_to: float = 0.5,
+                 min_turns: int = 1, summarize: Callable = None):
+        self.system_prompt = system_prompt
+        self.max_tokens = max_tokens
+        self.trim_to = trim_to
+        self.min_turns = min_turns
+        self.summarize = summarize
+        self.summary = None
+        self.turns = []
+        self.trims = 0
+        self.dropped_turns = 0
+    
+    def _prefix(self) -> List[Dict]:
+        messages = [{'role': 'system', 'content': self.system_prompt}]
+        if self.summary:
+            messages.append({'role': 'system', 'content': f"이전 대화 요약: {self.summary}"})
+        return messages
+    
+    @staticmethod
+    def _tokens(messages) -> int:
+        return sum(estimate_tokens(message['content']) + MESSAGE_OVERHEAD_TOKENS
+                   for message in messages)
+    
+    def _turn_messages(self, turns) -> List[Dict]:
+        messages = []
+        for user_text, response in turns:
+            messages.append({'role': 'user', 'content': user_text})
+            messages.append({'role': 'assistant', 'content': response})
+        return messages
+    
+    def messages(self, user_text: str) -> List[Dict]:
+        """The request for the next turn, trimming old turns first if it would not fit."""
+        request = {'role': 'user', 'content': user_text}
+        if self.tokens() + self._tokens([request]) > self.max_tokens:
+            self._trim(self._tokens([request]))
+        return self._prefix() + self._turn_messages(self.turns) + [request]
+    
+    def add_turn(self, user_text: str, response: str):
+        """Record a completed turn."""
+        self.turns.append((user_text, response))
+    
+    def tokens(self) -> int:
+        """Estimated prompt tokens of the system prompt, summary and history."""
+        return self._tokens(self._prefix() + self._turn_messages(self.turns))
+    
+    def _trim(self, request_tokens):
+        sizes = [self._tokens(self._turn_messages([turn])) for turn in self.turns]
+        total = self._tokens(self._prefix()) + request_tokens + sum(sizes)
+        keep = len(self.turns)
+        # Oldest first down to the target; the newest min_turns only go if they cannot fit at all
+        while keep and total > self.max_tokens * self.trim_to:
+            if keep <= self.min_turns and total <= self.max_tokens:
+                break
+            total -= sizes[len(self.turns) - keep]
+            keep -= 1
+        dropped = self.turns[:len(self.turns) - keep]
+        if not dropped:
+            return
+        self.turns = self.turns[len(dropped):]
+        self.trims += 1
+        self.dropped_turns += len(dropped)
+        if self.summarize is not None:
+            try:
+                self.summary = self.summarize(self.summary, dropped) or self.summary
+            except Exception as e:
+                logger.error(f"Conversation summary failed: {e}")
+        logger.info(f"Dropped {len(dropped)} old turns from the conversation context")
+    
+    def reset(self):
+        """Forget the history (new conversation)."""
+        self.turns = []
+        self.summary = None
+    
+    def stats(self) -> Dict:
+        """Turns kept, estimated tokens and how often history was trimmed."""
+        return {
+            'turns': len(self.turns),
+            'tokens': self.tokens(),
+            'trims': self.trims,
+            'dropped_turns': self.dropped_turns,
+            'summarized': self.summary is not None
+        }
+
+
+def summary_prompt(previous: Optional[str], turns) -> str:
+    """Prompt asking the model to fold ``turns`` into the running summary."""
+    lines = [f"사용자: {user_text}\nAI: {response}" for user_text, response in turns]
+    earlier = f"지금까지의 요약: {previous}\n\n" if previous else ""
+    return (f"{earlier}다음 대화 내용을 사용자에 대해 기억할 점 위주로 "
+            f"한국어 세 문장 이내로 요약해 주세요.\n\n" + "\n\n".join(lines))
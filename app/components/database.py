@@ -3,18 +3,129 @@ Database module for storing conversation history and analysis results.
 """
 import sqlite3
 import json
+import csv
+import io
+import time
+import itertools
+import threading
+import zlib
 import logging
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable, Iterator, Union
 import os
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 logger = logging.getLogger(__name__)
 
+# Values of conversations.ai_response_codec
+CODEC_NONE = 0
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+
+# Columns accepted by import_conversations (``id`` is reassigned on insert)
+IMPORT_COLUMNS = ('session_id', 'timestamp', 'user_input', 'ai_response',
+                  'sentiment', 'mbti', 'confidence_score')
+IMPORT_EXTENSIONS = ('.json', '.jsonl', '.csv')
+
+def format_conversations(conversations: List[Dict], format: str = 'json') -> str:
+    """Serialize exported conversation rows to JSON, JSONL or CSV."""
+    if format.lower() == 'json':
+        return json.dumps(conversations, indent=2, default=str)
+    elif format.lower() == 'jsonl':
+        return ''.join(json.dumps(row, default=str, ensure_ascii=False) + '\n'
+                       for row in conversations)
+    elif format.lower() == 'csv':
+        output = io.StringIO()
+        if conversations:
+            writer = csv.DictWriter(output, fieldnames=conversations[0].keys())
+            writer.writeheader()
+            writer.writerows(conversations)
+        return output.getvalue()
+    raise ValueError(f"Unsupported export format: {format}")
+
+def _looks_like_path(text: str) -> bool:
+    """A single line naming a file ("exports/today.jsonl") rather than exported content."""
+    if '\n' in text or text.lstrip()[:1] in ('[', '{'):
+        return False
+    if os.path.splitext(text.strip())[1].lower() in IMPORT_EXTENSIONS:
+        return True
+    return os.sep in text or bool(os.altsep and os.altsep in text)
+
+def open_import_source(source: Union[str, Iterable], format: str = None):
+    """Resolve an import source to (stream_or_rows, format, handle_to_close).
+
+    Raises FileNotFoundError for a string that looks like a path but names
+    no file, instead of parsing the path itself as CSV.
+    """
+    if isinstance(source, str) and os.path.isfile(source):
+        if format is None:
+            format = os.path.splitext(source)[1].lstrip('.') or None
+        handle = open(source, 'r', encoding='utf-8', newline='')
+        return handle, format, handle
+    if isinstance(source, str):
+        if _looks_like_path(source):
+            raise FileNotFoundError(f"Import file not found: {source}")
+        return io.StringIO(source), format, None
+    return source, format, None
+
+def iter_import_rows(source: Iterable, format: str = None) -> Iterator[Dict]:
+    """Yield row dicts from JSON, JSONL or CSV input."""
+    if not hasattr(source, 'read'):
+        # Already parsed rows, e.g. a list of dicts
+        yield from source
+        return
+        
+    lines = iter(source.readline, '')
+    if format is None:
+        # Sniff the format from the first non-blank line
+        first = next((line for line in lines if line.strip()), '')
+        head = first.lstrip()[:1]
+        format = 'json' if head == '[' else 'jsonl' if head == '{' else 'csv'
+        lines = itertools.chain([first], lines)
+        
+    format = format.lower()
+    if format == 'json':
+        # A JSON array can only be parsed as a whole
+        yield from json.loads(''.join(lines))
+    elif format == 'jsonl':
+        for line in lines:
+            if line.strip():
+                yield json.loads(line)
+    elif format == 'csv':
+        yield from csv.DictReader(lines)
+    else:
+        raise ValueError(f"Unsupported import format: {format}")
+
 class ConversationDB:
     """Database handler for conversation history."""
     
-    def __init__(self, db_path: str = "conversations.db"):
+    def __init__(self, db_path: str = "conversations.db", compress_responses: bool = False,
+                 compression: str = "zlib", compress_min_length: int = 256,
+                 zstd_dict_path: str = None):
         self.db_path = db_path
+        self.compress_responses = compress_responses
+        self.compress_min_length = compress_min_length
+        self.codec = CODEC_ZLIB
+        self.zstd_dict_path = zstd_dict_path
+        # Dictionary new rows are written with, and every dictionary rows can be read with (by id)
+        self._zstd_dict = None
+        self._zstd_dicts = {}
+        self._zstd_lock = threading.Lock()
+        # zstd (de)compressor objects must not be shared between threads
+        self._zstd_local = threading.local()
+        
+        if zstandard is not None:
+            if zstd_dict_path and os.path.exists(zstd_dict_path):
+                self._zstd_dict = self._load_zstd_dictionary(zstd_dict_path)
+            if compression == "zstd":
+                self.codec = CODEC_ZSTD
+        elif compression == "zstd":
+            logger.warning("zstandard is not installed, falling back to zlib compression")
+            
         self.init_database()
     
     def init_database(self):
@@ -33,10 +144,19 @@ class ConversationDB:
                         ai_response TEXT,
                         sentiment TEXT,
                         mbti TEXT,
-                        confidence_score REAL
+                        confidence_score REAL,
+                        ai_response_codec INTEGER DEFAULT 0
                     )
                 ''')
                 
+                # Databases created before response compression lack the flag column
+                cursor.execute("PRAGMA table_info(conversations)")
+                if 'ai_response_codec' not in [row[1] for row in cursor.fetchall()]:
+                    cursor.execute('''
+                        ALTER TABLE conversations
+                        ADD COLUMN ai_response_codec INTEGER DEFAULT 0
+                    ''')
+                    
                 # Sessions table
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS sessions (
@@ -63,16 +183,19 @@ class ConversationDB:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
                 
+                stored_response, codec = self._encode_response(ai_response)
                 cursor.execute('''
                     INSERT INTO conversations 
-                    (session_id, user_input, ai_response, sentiment, mbti, confidence_score)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (session_id, user_input, ai_response, sentiment, mbti, confidence_score))
-                
+                    (session_id, user_input, ai_response, sentiment, mbti, confidence_score,
+                     ai_response_codec)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', (session_id, user_input, stored_response, sentiment, mbti, confidence_score,
+                      codec))
+                      
                 # Update session stats
                 cursor.execute('''
                     INSERT OR IGNORE INTO sessions (session_id, total_messages)
-                    VALUES (?, 1)
+                    VALUES (?, 0)
                 ''', (session_id,))
                 
                 cursor.execute('''
@@ -95,10 +218,11 @@ class ConversationDB:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
-                    SELECT timestamp, user_input, ai_response, sentiment, mbti
+                    SELECT timestamp, user_input, ai_response, sentiment, mbti,
+                           ai_response_codec
                     FROM conversations
                     WHERE session_id = ?
-                    ORDER BY timestamp DESC
+                    ORDER BY timestamp DESC, id DESC
                     LIMIT ?
                 ''', (session_id, limit))
                 
@@ -109,7 +233,7 @@ class ConversationDB:
                     conversations.append({
                         'timestamp': row[0],
                         'user_input': row[1],
-                        'ai_response': row[2],
+                        'ai_response': self._decode_row_response(row[2], row[5]),
                         'sentiment': row[3],
                         'mbti': row[4]
                     })
@@ -205,7 +329,16 @@ class ConversationDB:
             logger.error(f"Failed to cleanup old sessions: {str(e)}")
     
     def export_conversations(self, session_id: str = None, format: str = 'json') -> str:
-        """Export conversations to JSON or CSV format."""
+        """Export conversations to JSON, JSONL or CSV format."""
+        try:
+            return format_conversations(self.get_export_rows(session_id), format)
+            
+        except Exception as e:
+            logger.error(f"Failed to export conversations: {str(e)}")
+            return ""
+    
+    def get_export_rows(self, session_id: str = None) -> List[Dict]:
+        """Get full conversation rows in chronological order for export."""
         try:
             conversations = []
             
@@ -215,31 +348,325 @@ class ConversationDB:
                 if session_id:
                     cursor.execute('''
                         SELECT * FROM conversations WHERE session_id = ?
-                        ORDER BY timestamp
+                        ORDER BY timestamp, id
                     ''', (session_id,))
                 else:
                     cursor.execute('''
-                        SELECT * FROM conversations ORDER BY timestamp
+                        SELECT * FROM conversations ORDER BY timestamp, id
                     ''')
                 
                 columns = [description[0] for description in cursor.description]
                 for row in cursor.fetchall():
-                    conversations.append(dict(zip(columns, row)))
+                    conversation = dict(zip(columns, row))
+                    codec = conversation.pop('ai_response_codec', CODEC_NONE)
+                    conversation['ai_response'] = self._decode_row_response(
+                        conversation['ai_response'], codec)
+                    conversations.append(conversation)
             
-            if format.lower() == 'json':
-                return json.dumps(conversations, indent=2, default=str)
-            elif format.lower() == 'csv':
-                import csv
-                import io
-                
-                output = io.StringIO()
-                if conversations:
-                    writer = csv.DictWriter(output, fieldnames=conversations[0].keys())
-                    writer.writeheader()
-                    writer.writerows(conversations)
-                
-                return output.getvalue()
+            return conversations
             
         except Exception as e:
-            logger.error(f"Failed to export conversations: {str(e)}")
-            return ""
\ No newline at end of file
+            logger.error(f"Failed to get export rows: {str(e)}")
+            return []
+    
+    def get_database_stats(self) -> Dict:
+        """Get totals and sentiment distribution across all sessions."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('SELECT COUNT(*) FROM sessions')
+                total_sessions = cursor.fetchone()[0]
+                
+                cursor.execute('''
+                    SELECT sentiment, COUNT(*) as count
+                    FROM conversations
+                    WHERE sentiment IS NOT NULL
+                    GROUP BY sentiment
+                ''')
+                sentiment_data = dict(cursor.fetchall())
+                
+                cursor.execute('SELECT COUNT(*) FROM conversations')
+                total_conversations = cursor.fetchone()[0]
+                
+                return {
+                    'total_sessions': total_sessions,
+                    'total_conversations': total_conversations,
+                    'sentiment_distribution': sentiment_data
+                }
+                
+        except Exception as e:
+            logger.error(f"Failed to get database stats: {str(e)}")
+            return {'total_sessions': 0, 'total_conversations': 0,
+                    'sentiment_distribution': {}}
+    
+    def import_conversations(self, source: Union[str, Iterable], format: str = None,
+                             batch_size: int = 1000) -> Dict:
+        """Bulk import conversations produced by export_conversations.
+        
+        ``source`` may be a file path, exported text, an open text file or an
+        iterable of row dicts; a missing file raises FileNotFoundError. Rows
+        are inserted in batched transactions with executemany and session
+        counters are recomputed once at the end. If the import stops part
+        way, the batches already committed stay and their sessions' counters
+        are still recomputed.
+        """
+        stats = {'imported': 0, 'skipped': 0, 'sessions': 0,
+                 'elapsed_seconds': 0.0, 'rows_per_sec': 0.0}
+        start = time.perf_counter()
+        source, format, handle = open_import_source(source, format)
+        
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    CREATE TEMP TABLE IF NOT EXISTS import_sessions (
+                        session_id TEXT PRIMARY KEY
+                    )
+                ''')
+                cursor.execute('DELETE FROM import_sessions')
+                conn.commit()
+                
+                try:
+                    batch = []
+                    for row in iter_import_rows(source, format):
+                        values = self._normalize_import_row(row)
+                        if values is None:
+                            stats['skipped'] += 1
+                            continue
+                        batch.append(values)
+                        if len(batch) >= batch_size:
+                            imported = self._insert_import_batch(cursor, batch)
+                            conn.commit()
+                            stats['imported'] += imported
+                            batch = []
+                            
+                    if batch:
+                        stats['imported'] += self._insert_import_batch(cursor, batch)
+                except Exception:
+                    # Drop the unfinished batch; committed batches keep their sessions below
+                    conn.rollback()
+                    raise
+                finally:
+                    stats['sessions'] = self._recompute_session_stats(cursor)
+                    conn.commit()
+                    
+        except Exception as e:
+            logger.error(f"Failed to import conversations: {str(e)}")
+        finally:
+            if handle is not None:
+                handle.close()
+                
+        elapsed = time.perf_counter() - start
+        stats['elapsed_seconds'] = elapsed
+        stats['rows_per_sec'] = stats['imported'] / elapsed if elapsed > 0 else 0.0
+        logger.info(f"Imported {stats['imported']} conversations "
+                    f"({stats['rows_per_sec']:.0f} rows/sec)")
+        return stats
+    
+    def _normalize_import_row(self, row: Dict) -> Optional[tuple]:
+        """Convert an exported row into insert values, or None if invalid."""
+        # CSV exports write NULL as an empty string
+        values = {key: (None if row.get(key) == '' else row.get(key))
+                  for key in IMPORT_COLUMNS}
+                  
+        if not values['session_id'] or values['user_input'] is None:
+            return None
+            
+        try:
+            values['confidence_score'] = float(values['confidence_score'] or 0.0)
+        except (TypeError, ValueError):
+            values['confidence_score'] = 0.0
+            
+        values['ai_response'], codec = self._encode_response(values['ai_response'])
+        return tuple(values[key] for key in IMPORT_COLUMNS) + (codec,)
+    
+    def _insert_import_batch(self, cursor: sqlite3.Cursor, batch: List[tuple]) -> int:
+        """Insert one batch of conversation rows and remember their sessions."""
+        cursor.executemany('''
+            INSERT INTO conversations
+            (session_id, timestamp, user_input, ai_response, sentiment, mbti, confidence_score,
+             ai_response_codec)
+            VALUES (?, COALESCE(?, CURRENT_TIMESTAMP), ?, ?, ?, ?, ?, ?)
+        ''', batch)
+        cursor.executemany('''
+            INSERT OR IGNORE INTO import_sessions (session_id) VALUES (?)
+        ''', {(values[0],) for values in batch})
+        return len(batch)
+    
+    def _recompute_session_stats(self, cursor: sqlite3.Cursor) -> int:
+        """Rebuild session counters for every session touched by an import."""
+        cursor.execute('''
+            INSERT OR IGNORE INTO sessions (session_id, start_time, total_messages)
+            SELECT c.session_id, MIN(c.timestamp), 0
+            FROM conversations c
+            JOIN import_sessions i ON i.session_id = c.session_id
+            GROUP BY c.session_id
+        ''')
+        
+        cursor.execute('''
+            UPDATE sessions
+            SET total_messages = (
+                    SELECT COUNT(*) FROM conversations c
+                    WHERE c.session_id = sessions.session_id
+                ),
+                final_mbti = COALESCE((
+                    SELECT c.mbti FROM conversations c
+                    WHERE c.session_id = sessions.session_id AND c.mbti IS NOT NULL
+                    ORDER BY c.timestamp DESC, c.id DESC
+                    LIMIT 1
+                ), final_mbti)
+            WHERE session_id IN (SELECT session_id FROM import_sessions)
+        ''')
+        
+        cursor.execute('SELECT COUNT(*) FROM import_sessions')
+        return cursor.fetchone()[0]
+    
+    def close(self):
+        """Connections are opened per call, so there is nothing to release."""
+    
+    def _encode_response(self, text: Optional[str]):
+        """Compress a long AI response, returning (stored_value, codec)."""
+        if not self.compress_responses or text is None:
+            return text, CODEC_NONE
+            
+        raw = text.encode('utf-8')
+        if len(raw) < self.compress_min_length:
+            return text, CODEC_NONE
+            
+        if self.codec == CODEC_ZSTD:
+            packed = self._zstd_compressor().compress(raw)
+        else:
+            packed = zlib.compress(raw, 6)
+            
+        # Incompressible text stays readable as plain TEXT
+        if len(packed) >= len(raw):
+            return text, CODEC_NONE
+        return sqlite3.Binary(packed), self.codec
+    
+    def _decode_response(self, value, codec: Optional[int]) -> Optional[str]:
+        """Return the plain text of a stored AI response."""
+        if value is None or not codec:
+            return value
+            
+        if codec == CODEC_ZLIB:
+            return zlib.decompress(value).decode('utf-8')
+        if codec == CODEC_ZSTD:
+            if zstandard is None:
+                raise RuntimeError("zstandard is required to read zstd-compressed responses")
+            return self._zstd_decompress(value).decode('utf-8')
+        raise ValueError(f"Unknown response codec: {codec}")
+    
+    def _decode_row_response(self, value, codec: Optional[int]) -> Optional[str]:
+        """Decode one row's response; an unreadable row reads as None instead of failing the query."""
+        try:
+            return self._decode_response(value, codec)
+        except Exception as e:
+            logger.error(f"Failed to decode stored response: {str(e)}")
+            return None
+    
+    def _zstd_compressor(self):
+        """This thread's compressor for the current dictionary."""
+        compressor = getattr(self._zstd_local, 'compressor', None)
+        if compressor is None:
+            compressor = zstandard.ZstdCompressor(level=10, dict_data=self._zstd_dict)
+            self._zstd_local.compressor = compressor
+        return compressor
+    
+    def _zstd_decompress(self, value) -> bytes:
+        """Decompress with the dictionary named in the frame header (0 = no dictionary)."""
+        dict_id = zstandard.get_frame_parameters(value).dict_id
+        decompressors = getattr(self._zstd_local, 'decompressors', None)
+        if decompressors is None:
+            decompressors = self._zstd_local.decompressors = {}
+        if dict_id not in decompressors:
+            decompressors[dict_id] = zstandard.ZstdDecompressor(
+                dict_data=self._zstd_dictionary(dict_id))
+        return decompressors[dict_id].decompress(value)
+    
+    def _zstd_dictionary(self, dict_id: int):
+        """A loaded dictionary by id, falling back to its archived ``<zstd_dict_path>.<id>`` file."""
+        if not dict_id:
+            return None
+        with self._zstd_lock:
+            dictionary = self._zstd_dicts.get(dict_id)
+        if dictionary is None:
+            path = f"{self.zstd_dict_path}.{dict_id}" if self.zstd_dict_path else None
+            if path is None or not os.path.exists(path):
+                raise ValueError(f"zstd dictionary {dict_id} is not available")
+            dictionary = self._load_zstd_dictionary(path)
+        return dictionary
+    
+    def _load_zstd_dictionary(self, path: str):
+        """Read a dictionary file and make it available for decoding."""
+        with open(path, 'rb') as f:
+            dictionary = zstandard.ZstdCompressionDict(f.read())
+        with self._zstd_lock:
+            self._zstd_dicts[dictionary.dict_id()] = dictionary
+        return dictionary
+    
+    def train_zstd_dictionary(self, dict_path: str, dict_size: int = 16384,
+                              sample_limit: int = 5000) -> bool:
+        """Train a shared zstd dictionary from stored responses and save it.
+        
+        Instances created with the same ``zstd_dict_path`` write new rows
+        with it. Each compressed row names its dictionary by id, and every
+        dictionary is also kept as ``<dict_path>.<id>``, so rows written with
+        an earlier dictionary stay readable after retraining. Training is
+        refused when the dictionary currently at ``dict_path`` cannot be kept.
+        """
+        if zstandard is None:
+            logger.error("zstandard is not installed, cannot train a dictionary")
+            return False
+            
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT ai_response, ai_response_codec FROM conversations
+                    WHERE ai_response IS NOT NULL
+                    ORDER BY id DESC
+                    LIMIT ?
+                ''', (sample_limit,))
+                samples = [text.encode('utf-8') for text in
+                           (self._decode_row_response(value, codec)
+                            for value, codec in cursor.fetchall())
+                           if text is not None]
+                           
+            dictionary = zstandard.train_dictionary(dict_size, samples)
+            
+            # Keep the dictionary being replaced: rows written with it need it to be read
+            if os.path.exists(dict_path):
+                with open(dict_path, 'rb') as f:
+                    current = f.read()
+                self._archive_zstd_dictionary(dict_path, current)
+            data = dictionary.as_bytes()
+            self._archive_zstd_dictionary(dict_path, data)
+            temp_path = f"{dict_path}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, dict_path)
+            with self._zstd_lock:
+                self._zstd_dicts[dictionary.dict_id()] = dictionary
+                
+            logger.info(f"Trained zstd dictionary {dictionary.dict_id()} from "
+                        f"{len(samples)} responses: {dict_path}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to train zstd dictionary: {str(e)}")
+            return False
+    
+    def _archive_zstd_dictionary(self, dict_path: str, data: bytes):
+        """Save ``data`` as ``<dict_path>.<id>``, refusing to replace a different dictionary."""
+        dict_id = zstandard.ZstdCompressionDict(data).dict_id()
+        if not dict_id:
+            raise ValueError(f"{dict_path} is not a zstd dictionary")
+        archive_path = f"{dict_path}.{dict_id}"
+        if os.path.exists(archive_path):
+            with open(archive_path, 'rb') as f:
+                if f.read() != data:
+                    raise ValueError(f"{archive_path} holds a different dictionary with id {dict_id}")
+            return
+        with open(archive_path, 'wb') as f:
+            f.write(data)
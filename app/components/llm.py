@@ -0,0 +1,242 @@
+"""
+Ollama response generation with token streaming and per-turn throughput stats,
+plus a managed client that keeps connections and the model warm
+"""
+import time
+import logging
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+import ollama
+
+from .metrics import LatencyTracker
+
+logger = logging.getLogger(__name__)
+
+
+def build_prompt(text: str, sentiment=None) -> str:
+    """The ENFP persona prompt for one user message."""
+    return f"""당신은 ENFP 성격의 AI 어시스턴트입니다. 사용자의 감정은 {sentiment}입니다.
+다음 질문에 한국어로 친근하고 공감적으로 답변해주세요: {text}
+항상 긍정적이고 열정적인 ENFP의 성격을 반영하여 답변하세요."""
+
+
+# Multi-turn chat keeps the persona in one unchanging system message so that
+# every request shares the same cached prefix
+SYSTEM_PROMPT = """당신은 ENFP 성격의 AI 어시스턴트입니다.
+사용자의 말에 한국어로 친근하고 공감적으로 답변해주세요.
+항상 긍정적이고 열정적인 ENFP의 성격을 반영하여 답변하세요."""
+
+
+def build_user_message(text: str, sentiment=None) -> str:
+    """One chat turn: the user's words with the detected sentiment."""
+    return f"(사용자의 감정: {sentiment}) {text}" if sentiment else text
+
+
+class OllamaGenerator:
+    """Generates a completion, optionally streaming tokens as they arrive.
+
+    ``client`` is anything with Ollama's ``generate(model=, prompt=,
+    options=, stream=)`` (and, for ``chat``, ``chat(model=, messages=,
+    ...)``) signature, the ``ollama`` module by default.
+    With ``streaming`` each text piece is handed to ``on_token(piece)``
+    as soon as Ollama sends it, so the UI can render the answer while the
+    model is still producing it.
+    
+    Every call returns ``(text, stats)`` where stats holds ``ttft_ms``
+    (time to first token), ``total_ms``, ``tokens`` and
+    ``tokens_per_sec``, plus ``prompt_tokens`` and ``prompt_eval_ms`` for
+    the prompt prefill when Ollama reports them. Blocking mode has no
+    earlier first token, so its ``ttft_ms`` equals ``total_ms``. With a
+    LatencyTracker the times are recorded as ``llm.ttft``, ``llm.total``
+    and ``llm.prefill``; a generator for background work (e.g. summaries)
+    passes its own ``metrics_name`` so it does not skew the turn latencies.
+    ``keep_alive`` (e.g.
+    "30m") is sent with every request so Ollama keeps the model loaded
+    that long after the turn.
+    """
+    
+    def __init__(self, model: str, options: Dict = None, streaming: bool = True,
+                 client=None, keep_alive=None, metrics: LatencyTracker = None,
+                 metrics_name: str = 'llm'):
+        self.model = model
+        self.options = options or {}
+        self.streaming = streaming
+        self.client = client or ollama
+        self.keep_alive = keep_alive
+        self.metrics = metrics
+        self.metrics_name = metrics_name
+    
+    def _request(self, prompt, **kwargs):
+        if self.keep_alive is not None:
+            kwargs['keep_alive'] = self.keep_alive
+        return self.client.generate(model=self.model, prompt=prompt, options=self.options, **kwargs)
+    
+    def generate(self, prompt: str, on_token: Callable = None) -> Tuple[str, Dict]:
+        """Run one completion and return its text and timing stats."""
+        return self._complete(lambda **kwargs: self._request(prompt, **kwargs),
+                              lambda chunk: chunk['response'], on_token)
+    
+    def chat(self, messages: List[Dict], on_token: Callable = None) -> Tuple[str, Dict]:
+        """Run one chat completion over ``messages``; same result as ``generate``."""
+        def request(**kwargs):
+            if self.keep_alive is not None:
+                kwargs['keep_alive'] = self.keep_alive
+            return self.client.chat(model=self.model, messages=messages, options=self.options, **kwargs)
+            
+        return self._complete(request, lambda chunk: chunk['message']['content'], on_token)
+    
+    def _complete(self, request, text_of, on_token):
+        start = time.perf_counter()
+        if not self.streaming:
+            result = request()
+            text = text_of(result)
+            if on_token is not None and text:
+                on_token(text)
+            end = time.perf_counter()
+            return text, self._stats(start, end, end, result, 1 if text else 0)
+            
+        parts = []
+        first = None
+        final = None
+        for chunk in request(stream=True):
+            piece = text_of(chunk)
+            if piece:
+                if first is None:
+                    first = time.perf_counter()
+                parts.append(piece)
+                if on_token is not None:
+                    on_token(piece)
+            if chunk.get('done'):
+                final = chunk
+        end = time.perf_counter()
+        return ''.join(parts), self._stats(start, first, end, final, len(parts))
+    
+    def _stats(self, start, first, end, final, pieces):
+        # Ollama reports the generated token count and decode time in its final chunk;
+        # fall back to counted pieces and wall time since the first token
+        tokens = (final.get('eval_count') if final is not None else None) or pieces
+        eval_ns = final.get('eval_duration') if final is not None else None
+        if eval_ns:
+            decode_seconds = eval_ns / 1e9
+        else:
+            decode_seconds = end - (first if first is not None and first < end else start)
+        stats = {
+            'ttft_ms': (first - start) * 1000 if first is not None else None,
+            'total_ms': (end - start) * 1000,
+            'tokens': tokens,
+            'tokens_per_sec': tokens / decode_seconds if decode_seconds > 0 else 0.0,
+            # Prompt tokens Ollama actually evaluated; a cached prefix is not counted
+            'prompt_tokens': final.get('prompt_eval_count') if final is not None else None,
+            'prompt_eval_ms': None
+        }
+        prompt_ns = final.get('prompt_eval_duration') if final is not None else None
+        if prompt_ns:
+            stats['prompt_eval_ms'] = prompt_ns / 1e6
+        if self.metrics is not None:
+            if first is not None:
+                self.metrics.record(f'{self.metrics_name}.ttft', first - start)
+            self.metrics.record(f'{self.metrics_name}.total', end - start)
+            if prompt_ns:
+                self.metrics.record(f'{self.metrics_name}.prefill', prompt_ns / 1e9)
+        return stats
+
+
+class OllamaService:
+    """One shared Ollama client per process, with the model kept loaded.
+
+    The underlying httpx client pools up to ``max_connections`` keep-alive
+    connections, so turns reuse an open socket instead of reconnecting.
+    ``timeout`` bounds each read (a long answer still streams, as long as
+    tokens keep coming) and ``connect_timeout`` fails fast when the server
+    is down. ``start()`` loads the model with an empty request in the
+    background and then re-sends it every ``keep_warm_seconds`` (0 turns
+    this off) so that the first turn after a quiet period does not wait
+    for the model to load again. ``health()`` probes the server and
+    reports whether the model is resident; the warm thread stores its
+    latest result in ``last_health``. Pass the generator's ``options``:
+    a different ``num_ctx`` on the first real request would make Ollama
+    load the model again. With a LatencyTracker preloads are recorded as
+    ``llm.preload``.
+    """
+    
+    def __init__(self, model: str, host: str = None, timeout: float = 120.0,
+                 connect_timeout: float = 3.0, max_connections: int = 4, keep_alive='30m',
+                 keep_warm_seconds: float = 240.0, options: Dict = None,
+                 metrics: LatencyTracker = None):
+        self.model = model
+        self.options = options or {}
+        self.keep_alive = keep_alive
+        self.keep_warm_seconds = keep_warm_seconds
+        self.metrics = metrics
+        # ollama.Client always builds its own httpx.Client, so we own the
+        # connection pool (the transport) instead and close that ourselves
+        self.transport = httpx.HTTPTransport(
+            limits=httpx.Limits(max_connections=max_connections,
+                                max_keepalive_connections=max_connections)
+        )
+        self.client = ollama.Client(
+            host=host,
+            timeout=httpx.Timeout(timeout, connect=connect_timeout),
+            transport=self.transport
+        )
+        self.last_health = None
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def preload(self) -> Optional[float]:
+        """Load the model now; returns the seconds it took, or None on failure."""
+        start = time.perf_counter()
+        try:
+            # An empty prompt only loads the model (no tokens are generated)
+            self.client.generate(model=self.model, prompt='', options=self.options,
+                                 keep_alive=self.keep_alive)
+        except Exception as e:
+            logger.error(f"Ollama preload failed: {e}")
+            return None
+        elapsed = time.perf_counter() - start
+        if self.metrics is not None:
+            self.metrics.record('llm.preload', elapsed)
+        return elapsed
+    
+    def health(self) -> Dict:
+        """Probe the server: ``ok``, ``loaded`` (model resident), ``latency_ms`` and ``error``."""
+        start = time.perf_counter()
+        try:
+            running = self.client.ps()
+        except Exception as e:
+            self.last_health = {'ok': False, 'loaded': False, 'latency_ms': None, 'error': str(e)}
+            return self.last_health
+        names = {name for model in running.models for name in (model.model, model.name) if name}
+        self.last_health = {
+            'ok': True,
+            'loaded': self.model in names,
+            'latency_ms': (time.perf_counter() - start) * 1000,
+            'error': None
+        }
+        return self.last_health
+    
+    def start(self, preload: bool = True):
+        """Preload (optionally) and keep the model warm on a background thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._keep_warm, args=(preload,),
+                                        name="ollama-keep-warm", daemon=True)
+        self._thread.start()
+    
+    def _keep_warm(self, preload):
+        if preload:
+            self.preload()
+        self.health()
+        while self.keep_warm_seconds and not self._stop.wait(self.keep_warm_seconds):
+            # Each warm request restarts Ollama's keep_alive timer (and reloads after a restart)
+            self.preload()
+            self.health()
+    
+    def close(self):
+        """Stop the warm thread and close pooled connections."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        self.transport.close()
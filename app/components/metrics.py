@@ -0,0 +1,72 @@
+"""
+Lightweight in-process latency metrics for pipeline stages and backends
+"""
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict
+
+import numpy as np
+
+
+class LatencyTracker:
+    """Keeps the most recent ``window`` durations per metric name.
+    
+    Durations are recorded in seconds and summarized in milliseconds.
+    Safe to share between the UI thread and worker threads.
+    """
+    
+    def __init__(self, window: int = 500):
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples: Dict[str, deque] = {}
+        self._counts: Dict[str, int] = {}
+    
+    def record(self, name: str, seconds: float):
+        """Add one measurement for ``name``."""
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.window)
+            samples.append(seconds)
+            self._counts[name] = self._counts.get(name, 0) + 1
+    
+    @contextmanager
+    def track(self, name: str):
+        """Time the body of a ``with`` block, including when it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+    
+    def summary(self, name: str) -> Dict:
+        """Count, mean, p50, p95, p99 and max (ms) for one metric; empty dict if unknown."""
+        with self._lock:
+            samples = list(self._samples.get(name, ()))
+            count = self._counts.get(name, 0)
+        if not samples:
+            return {}
+            
+        values = np.array(samples) * 1000
+        return {
+            'count': count,
+            'mean_ms': float(values.mean()),
+            'p50_ms': float(np.percentile(values, 50)),
+            'p95_ms': float(np.percentile(values, 95)),
+            'p99_ms': float(np.percentile(values, 99)),
+            'max_ms': float(values.max())
+        }
+    
+    def summaries(self) -> Dict[str, Dict]:
+        """Summaries of every metric recorded so far."""
+        with self._lock:
+            names = list(self._samples)
+        return {name: self.summary(name) for name in sorted(names)}
+    
+    def reset(self):
+        """Forget all measurements."""
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
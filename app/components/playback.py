@@ -0,0 +1,389 @@
+"""
+Background audio playback: one worker thread per process owns the output device
+"""
+import io
+import time
+import wave
+import queue
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from math import gcd
+from typing import Callable
+
+import numpy as np
+from scipy import signal
+
+try:
+    import sounddevice as sd
+except (ImportError, OSError):  # OSError: PortAudio missing (headless machines)
+    sd = None
+
+from .audio_encoding import soundfile
+from .metrics import LatencyTracker
+
+logger = logging.getLogger(__name__)
+
+AUDIO_PLAYERS = ('pcm', 'pygame')
+
+_CLOSE = object()
+
+
+def decode_audio(data: bytes):
+    """Decode MP3/WAV/FLAC/OGG bytes to float32 (frames, channels) and its sample rate.
+
+    Uses soundfile (libsndfile 1.1+ reads MP3). Without it, 16-bit WAV is
+    read directly and anything else is decoded by an initialized pygame
+    mixer, at the mixer's rate.
+    """
+    if soundfile is not None:
+        return soundfile.read(io.BytesIO(data), dtype='float32', always_2d=True)
+    if data[:4] == b'RIFF':
+        with wave.open(io.BytesIO(data), 'rb') as wf:
+            if wf.getsampwidth() != 2:
+                raise ValueError("Only 16-bit WAV can be decoded without soundfile")
+            pcm = np.frombuffer(wf.readframes(wf.getnframes()), dtype='<i2')
+            return pcm.reshape(-1, wf.getnchannels()).astype(np.float32) / 32768, wf.getframerate()
+    import pygame
+    mixer = pygame.mixer.get_init()
+    if mixer is None:
+        raise RuntimeError("soundfile or an initialized pygame mixer is required to decode MP3")
+    pcm = pygame.sndarray.array(pygame.mixer.Sound(file=io.BytesIO(data)))
+    if pcm.ndim == 1:
+        pcm = pcm[:, None]
+    return pcm.astype(np.float32) / 32768, mixer[0]
+
+
+def convert_pcm(samples: np.ndarray, sample_rate: int, target_rate: int,
+                target_channels: int) -> np.ndarray:
+    """Resample and remap (frames, channels) float32 audio to the output device's format."""
+    if sample_rate != target_rate:
+        # Whole clips, so the C polyphase filter rather than the streaming resampler
+        divisor = gcd(int(sample_rate), int(target_rate))
+        samples = signal.resample_poly(samples, target_rate // divisor, sample_rate // divisor, axis=0)
+    channels = samples.shape[1]
+    if channels == target_channels:
+        pass
+    elif channels == 1:
+        samples = np.repeat(samples, target_channels, axis=1)
+    elif target_channels == 1:
+        samples = samples.mean(axis=1, keepdims=True)
+    else:
+        samples = samples[:, :target_channels]
+    return np.ascontiguousarray(samples, dtype=np.float32)
+
+
+class PygamePlayer:
+    """Plays encoded audio (MP3/OGG/WAV bytes) through ``pygame.mixer.music``.
+
+    Every start loads and decodes the bytes again, resampled to the
+    mixer's format. The load time is recorded as ``playback.start``.
+    """
+    
+    def __init__(self, metrics: LatencyTracker = None):
+        import pygame
+        self._music = pygame.mixer.music
+        self.metrics = metrics
+    
+    def start(self, audio: bytes):
+        start = time.perf_counter()
+        self._music.load(io.BytesIO(audio))
+        self._music.play()
+        if self.metrics is not None:
+            self.metrics.record('playback.start', time.perf_counter() - start)
+    
+    def is_playing(self) -> bool:
+        return self._music.get_busy()
+    
+    def stop(self):
+        self._music.stop()
+
+
+class PCMPlayer:
+    """Plays PCM through one persistent low-latency ``sounddevice.OutputStream``.
+
+    Encoded speech is decoded once, converted to the device's native rate
+    and channel layout and kept in an LRU cache of ``cache_bytes``, so a
+    replay or repeated sentence starts without decoding or resampling.
+    Call ``prepare`` ahead of time (e.g. on the synthesis thread) to move
+    the decode off the playback path; ``start`` also accepts the result.
+    
+    Start latency is measured from ``start`` until the first block is
+    handed to the device, plus the stream's reported output latency, and
+    recorded as ``playback.start``; decode time as ``playback.decode``.
+    """
+    
+    def __init__(self, device=None, sample_rate: int = None, channels: int = None,
+                 latency='low', cache_bytes: int = 64 * 1024 * 1024,
+                 metrics: LatencyTracker = None):
+        if sample_rate is None or channels is None:
+            if sd is None:
+                raise RuntimeError("sounddevice with PortAudio is required for PCM playback")
+            info = sd.query_devices(device, 'output')
+            sample_rate = sample_rate or int(info['default_samplerate'])
+            channels = channels or min(2, int(info['max_output_channels']))
+        self.device = device
+        self.sample_rate = int(sample_rate)
+        self.channels = int(channels)
+        self.latency = latency
+        self.cache_bytes = cache_bytes
+        self.metrics = metrics
+        self.last_start_latency = None
+        self._cache = OrderedDict()
+        self._cache_size = 0
+        self._cache_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._buffer = None
+        self._position = 0
+        self._requested = None
+        self._stream = None
+    
+    def prepare(self, audio) -> np.ndarray:
+        """Decoded, device-format PCM for encoded ``audio`` (cached)."""
+        if isinstance(audio, np.ndarray):
+            return audio
+        key = hashlib.sha1(audio).digest()
+        with self._cache_lock:
+            pcm = self._cache.get(key)
+            if pcm is not None:
+                self._cache.move_to_end(key)
+                return pcm
+                
+        start = time.perf_counter()
+        samples, sample_rate = decode_audio(audio)
+        pcm = convert_pcm(samples, sample_rate, self.sample_rate, self.channels)
+        if self.metrics is not None:
+            self.metrics.record('playback.decode', time.perf_counter() - start)
+            
+        with self._cache_lock:
+            if pcm.nbytes <= self.cache_bytes and key not in self._cache:
+                self._cache[key] = pcm
+                self._cache_size += pcm.nbytes
+                while self._cache_size > self.cache_bytes:
+                    _, dropped = self._cache.popitem(last=False)
+                    self._cache_size -= dropped.nbytes
+        return pcm
+    
+    def start(self, audio):
+        requested = time.perf_counter()
+        pcm = self.prepare(audio)
+        self._open()
+        with self._lock:
+            self._buffer = pcm
+            self._position = 0
+            self._requested = requested
+    
+    def is_playing(self) -> bool:
+        with self._lock:
+            return self._buffer is not None
+    
+    def stop(self):
+        with self._lock:
+            self._buffer = None
+    
+    def close(self):
+        """Close the output stream."""
+        self.stop()
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+    
+    def _open(self):
+        if self._stream is not None:
+            return
+        if sd is None:
+            raise RuntimeError("sounddevice with PortAudio is required for PCM playback")
+        self._stream = sd.OutputStream(
+            samplerate=self.sample_rate,
+            channels=self.channels,
+            dtype='float32',
+            device=self.device,
+            latency=self.latency,
+            callback=self._callback
+        )
+        self._stream.start()
+    
+    def _callback(self, outdata, frames, time_info, status):
+        started = None
+        with self._lock:
+            if self._buffer is None:
+                outdata.fill(0)
+                return
+            chunk = self._buffer[self._position:self._position + frames]
+            outdata[:len(chunk)] = chunk
+            outdata[len(chunk):] = 0
+            if self._position == 0:
+                started = self._requested
+            self._position += len(chunk)
+            if self._position >= len(self._buffer):
+                self._buffer = None
+        if started is not None:
+            output_latency = self._stream.latency if self._stream is not None else 0.0
+            self.last_start_latency = time.perf_counter() - started + output_latency
+            if self.metrics is not None:
+                self.metrics.record('playback.start', self.last_start_latency)
+
+
+def create_player(kind: str = 'pcm', device=None, cache_bytes: int = 64 * 1024 * 1024,
+                  metrics: LatencyTracker = None):
+    """Create the configured audio output."""
+    kind = (kind or 'pcm').lower()
+    if kind == 'pcm':
+        return PCMPlayer(device, cache_bytes=cache_bytes, metrics=metrics)
+    if kind == 'pygame':
+        return PygamePlayer(metrics=metrics)
+    raise ValueError(f"Unknown audio player: {kind} (expected one of {AUDIO_PLAYERS})")
+
+
+class PlaybackItem:
+    """One queued segment. ``status`` ends as played, skipped, stopped or failed."""
+
+    def __init__(self, audio, on_done: Callable = None):
+        self.audio = audio
+        self.on_done = on_done
+        self.status = 'queued'
+        self.generation = 0
+        self.enqueued = time.perf_counter()
+        self.started = None
+        self.ended = None
+        self.done = threading.Event()
+    
+    def wait(self, timeout: float = None) -> bool:
+        """Block until the item has finished one way or another."""
+        return self.done.wait(timeout)
+
+
+class PlaybackWorker:
+    """Plays queued audio on a dedicated thread so callers never wait for the speaker.
+
+    ``enqueue`` returns at once; segments play back to back in order.
+    ``skip`` cuts the current segment short and moves on, ``stop`` also
+    drops everything still queued (barge-in when the user starts talking).
+    ``on_done(item)`` runs on the worker thread when an item finishes,
+    so it must not touch Streamlit. The player needs ``start(audio)``,
+    ``is_playing()`` and ``stop()``; completion is polled every
+    ``poll_interval`` seconds. With a LatencyTracker the wait from enqueue
+    to start is recorded as ``playback.queue``.
+    """
+    
+    def __init__(self, player, poll_interval: float = 0.01, metrics: LatencyTracker = None):
+        self.player = player
+        self.poll_interval = poll_interval
+        self.metrics = metrics
+        self._queue = queue.Queue()
+        self._interrupt = threading.Event()
+        self._interrupt_status = 'skipped'
+        self._lock = threading.Lock()
+        self._current = None
+        self._generation = 0
+        self._thread = threading.Thread(target=self._run, name="playback", daemon=True)
+        self._thread.start()
+    
+    def enqueue(self, audio, on_done: Callable = None) -> PlaybackItem:
+        """Queue ``audio`` for playback and return immediately."""
+        item = PlaybackItem(audio, on_done)
+        with self._lock:
+            item.generation = self._generation
+        self._queue.put(item)
+        return item
+    
+    def play(self, audio, timeout: float = None) -> bool:
+        """Queue ``audio`` and wait for it; False if ``stop`` interrupted it.
+        
+        For producers that already run off the UI thread, such as
+        SpeechPipeline, so they can stop feeding after a barge-in.
+        """
+        item = self.enqueue(audio)
+        item.wait(timeout)
+        return item.status != 'stopped'
+    
+    def skip(self):
+        """End the current segment early and continue with the next one."""
+        with self._lock:
+            if self._current is not None:
+                self._interrupt_status = 'skipped'
+                self._interrupt.set()
+    
+    def stop(self):
+        """End the current segment and drop everything queued."""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _CLOSE:
+                self._queue.put(_CLOSE)
+                break
+            self._finish(item, 'stopped')
+        with self._lock:
+            # Items enqueued before this point never start, even one already dequeued
+            self._generation += 1
+            if self._current is not None:
+                self._interrupt_status = 'stopped'
+                self._interrupt.set()
+    
+    @property
+    def busy(self) -> bool:
+        """True while something is playing or queued."""
+        with self._lock:
+            return self._current is not None or not self._queue.empty()
+    
+    def wait_idle(self, timeout: float = None) -> bool:
+        """Block until the queue has drained; False on timeout."""
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while self.busy:
+            if deadline is not None and time.perf_counter() >= deadline:
+                return False
+            time.sleep(self.poll_interval)
+        return True
+    
+    def close(self):
+        """Stop playback and end the worker thread."""
+        self.stop()
+        self._queue.put(_CLOSE)
+        self._thread.join()
+    
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _CLOSE:
+                break
+            with self._lock:
+                stale = item.generation != self._generation
+                if not stale:
+                    self._current = item
+                    self._interrupt.clear()
+            if stale:
+                self._finish(item, 'stopped')
+                continue
+            status = self._play(item)
+            with self._lock:
+                self._current = None
+            self._finish(item, status)
+    
+    def _play(self, item):
+        try:
+            self.player.start(item.audio)
+        except Exception as e:
+            logger.error(f"Playback failed: {e}")
+            return 'failed'
+        item.started = time.perf_counter()
+        if self.metrics is not None:
+            self.metrics.record('playback.queue', item.started - item.enqueued)
+        while self.player.is_playing():
+            if self._interrupt.wait(self.poll_interval):
+                self.player.stop()
+                return self._interrupt_status
+        return 'played'
+    
+    def _finish(self, item, status):
+        item.status = status
+        item.ended = time.perf_counter()
+        item.done.set()
+        if item.on_done is not None:
+            try:
+                item.on_done(item)
+            except Exception as e:
+                logger.error(f"Playback callback failed: {e}")
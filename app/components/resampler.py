@@ -0,0 +1,139 @@
+"""
+Streaming polyphase resampler for converting captured audio to the ASR sample rate
+"""
+from math import gcd
+
+import numpy as np
+from scipy import signal
+
+
+class StreamingResampler:
+    """Rational-ratio polyphase FIR resampler that keeps state between blocks.
+
+    The input rate is scaled by L/M (reduced by their gcd, e.g. 160/441 for
+    44.1 kHz -> 16 kHz). Only the outputs that are actually kept are
+    computed: each one is a dot product of ``taps_per_phase`` input samples
+    with one phase of the anti-aliasing filter. Feeding a signal in blocks
+    gives the same result as resampling it in one go, delay-compensated so
+    output sample n lines up with input time n / output_rate. All work
+    buffers are sized up front from ``max_block`` (the largest expected
+    callback block).
+    """
+    
+    def __init__(self, input_rate, output_rate, taps_per_phase=96, cutoff=0.9, beta=8.0,
+                 max_block=4096):
+        self.input_rate = int(input_rate)
+        self.output_rate = int(output_rate)
+        divisor = gcd(self.input_rate, self.output_rate)
+        self.up = self.output_rate // divisor
+        self.down = self.input_rate // divisor
+        
+        if self.up == self.down:
+            self.taps_per_phase = 1
+            self._phases = np.ones((1, 1), dtype=np.float32)
+            self._delay = 0
+        else:
+            # Low-pass at ``cutoff`` of the lower Nyquist frequency, gain L
+            num_taps = self.up * taps_per_phase
+            taps = signal.firwin(num_taps, cutoff / max(self.up, self.down),
+                                 window=('kaiser', beta)) * self.up
+            self.taps_per_phase = taps_per_phase
+            # _phases[p, k] = taps[p + k * L], applied to x[base - k]
+            self._phases = taps.reshape(taps_per_phase, self.up).T.astype(np.float32)
+            self._delay = (num_taps - 1) // 2
+        self._offsets = np.arange(self.taps_per_phase)
+        self._inputs = None
+        self._allocate(max_block)
+        self.reset()
+    
+    def _allocate(self, max_block):
+        """Size the work buffers for blocks of up to ``max_block`` samples, keeping the history."""
+        history_length = self.taps_per_phase - 1
+        history = self._inputs[self._current][:history_length].copy() if self._inputs else None
+        # flush() pushes the samples held back by the filter delay through the same buffers
+        self.max_block = max(int(max_block), self._delay // self.up + self.taps_per_phase)
+        max_out = self.max_block * self.up // self.down + 2
+        # Two input buffers take turns so the history moves from one's tail to the other's head
+        self._inputs = [np.zeros(history_length + self.max_block, dtype=np.float32)
+                        for _ in range(2)]
+        self._current = 0
+        if history is not None:
+            self._inputs[0][:history_length] = history
+        # Output n reads input (n * M + delay) // L - k with phase (n * M + delay) % L, a
+        # pattern that repeats every L outputs (shifted by M inputs), so both are tabulated
+        # for every output a block can start at and _compute only slices and offsets them
+        rows = np.arange(self.up + max_out) * self.down + self._delay
+        self._gather_table = (rows // self.up)[:, None] - self._offsets[None, :]
+        self._phase_rows = self._phases[rows % self.up]
+        self._gather = np.empty((max_out, self.taps_per_phase), dtype=self._gather_table.dtype)
+        self._windows = np.empty((max_out, self.taps_per_phase), dtype=np.float32)
+        self._out = np.empty(max_out, dtype=np.float32)
+    
+    def reset(self):
+        """Clear the filter history before a new stream."""
+        self._inputs[self._current][:self.taps_per_phase - 1] = 0
+        self.samples_in = 0
+        self.samples_out = 0
+    
+    def output_length(self, input_length):
+        """Number of output samples for a signal of ``input_length`` samples."""
+        return -(-input_length * self.up // self.down)
+    
+    def process(self, block):
+        """Resample the next mono block; returns the outputs that are now complete.
+        
+        Runs in the audio callback, so nothing is allocated: the result is
+        a view into a buffer that the next call overwrites (copy it to keep
+        it). A block longer than ``max_block`` grows the buffers once.
+        """
+        block = np.asarray(block, dtype=np.float32).reshape(-1)
+        if len(block) > self.max_block:
+            self._allocate(len(block))
+        history_length = self.taps_per_phase - 1
+        extended = self._inputs[self._current][:history_length + len(block)]
+        extended[history_length:] = block
+        self.samples_in += len(block)
+        
+        # Output n needs input sample (n * M + delay) // L, which must have arrived
+        last = (self.samples_in * self.up - self._delay - 1) // self.down
+        count = max(0, last + 1 - self.samples_out)
+        out = self._compute(extended, self.samples_in - len(extended), count)
+        self._current ^= 1
+        self._inputs[self._current][:history_length] = extended[len(block):]
+        return out
+    
+    def flush(self):
+        """Emit the samples still held back by the filter delay and reset."""
+        remaining = self.output_length(self.samples_in) - self.samples_out
+        if remaining <= 0:
+            self.reset()
+            return np.zeros(0, dtype=np.float32)
+            
+        history_length = self.taps_per_phase - 1
+        pad = self._delay // self.up + self.taps_per_phase
+        extended = self._inputs[self._current][:history_length + pad]
+        extended[history_length:] = 0
+        out = self._compute(extended, self.samples_in - history_length, remaining).copy()
+        self.reset()
+        return out
+    
+    def _compute(self, extended, first_index, count):
+        """Compute ``count`` outputs from ``extended`` (input index ``first_index`` at 0)."""
+        cycle, row = divmod(self.samples_out, self.up)
+        gather = np.add(self._gather_table[row:row + count], cycle * self.down - first_index,
+                        out=self._gather[:count])
+        # mode='clip' writes straight into ``out`` (the default mode buffers a copy)
+        windows = np.take(extended, gather, out=self._windows[:count], mode='clip')
+        windows *= self._phase_rows[row:row + count]
+        self.samples_out += count
+        return windows.sum(axis=1, out=self._out[:count])
+
+
+def resample(samples, input_rate, output_rate, **kwargs):
+    """Resample a whole mono signal with the streaming resampler."""
+    samples = np.asarray(samples, dtype=np.float32).reshape(-1)
+    resampler = StreamingResampler(input_rate, output_rate, **kwargs)
+    # Block by block, as in the recorder, so the work buffers stay small
+    parts = [resampler.process(samples[offset:offset + resampler.max_block]).copy()
+             for offset in range(0, len(samples), resampler.max_block)]
+    return np.concatenate(parts + [resampler.flush()])
@@ -0,0 +1,182 @@
+"""
+Deadlines and circuit breakers around network-bound calls (ASR, TTS)
+"""
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict
+
+from .metrics import LatencyTracker
+
+logger = logging.getLogger(__name__)
+
+CIRCUIT_STATES = ('closed', 'open', 'half_open')
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+class DeadlineExceeded(TimeoutError):
+    """The call did not finish within its deadline."""
+
+
+class CircuitOpenError(RuntimeError):
+    """The circuit is open: the call was rejected without reaching the service."""
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="deadline")
+        return _executor
+
+
+def call_with_deadline(func: Callable, *args, timeout: float = None, **kwargs):
+    """Run ``func`` on a shared worker pool and wait at most ``timeout`` seconds.
+
+    Raises DeadlineExceeded when the deadline passes. A running thread cannot
+    be interrupted, so the abandoned call finishes in the background; give
+    the underlying client its own socket timeout as well so the worker is
+    released soon after. With ``timeout=None`` the call runs inline.
+    """
+    if timeout is None:
+        return func(*args, **kwargs)
+    future = _get_executor().submit(func, *args, **kwargs)
+    try:
+        return future.result(timeout=timeout)
+    except TimeoutError:
+        if future.done():
+            raise  # the call itself timed out (e.g. socket.timeout)
+        future.cancel()
+        raise DeadlineExceeded(f"{getattr(func, '__name__', 'call')} did not finish "
+                               f"within {timeout:.1f}s")
+
+
+class CircuitBreaker:
+    """Fail fast after repeated errors from an upstream service.
+
+    After ``failure_threshold`` consecutive failures (errors or missed
+    deadlines) the circuit opens and calls raise CircuitOpenError at once.
+    After ``reset_timeout`` seconds a single trial call is let through
+    (half-open): success closes the circuit, failure opens it again.
+    Exceptions listed in ``ignore`` (e.g. ``sr.UnknownValueError``) mean the
+    service answered and count as success. When a LatencyTracker is given,
+    the time callers waited is recorded under ``breaker.<name>``.
+    """
+    
+    def __init__(self, name: str, failure_threshold: int = 3, reset_timeout: float = 30.0,
+                 timeout: float = None, metrics: LatencyTracker = None, ignore=()):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.timeout = timeout
+        self.metrics = metrics
+        self.ignore = tuple(ignore)
+        self._lock = threading.Lock()
+        self._state = 'closed'
+        self._opened_at = 0.0
+        self._trial_running = False
+        self.failures = 0
+        self.trip_count = 0
+        self.rejected = 0
+        self.timeouts = 0
+    
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+    
+    def _current_state(self) -> str:
+        if self._state == 'open' and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = 'half_open'
+        return self._state
+    
+    def call(self, func: Callable, *args, fallback: Callable = None, **kwargs):
+        """Call ``func`` under the breaker and deadline.
+        
+        On failure (including a rejected call) ``fallback(error)`` is
+        returned when given, otherwise the error is raised.
+        """
+        try:
+            self._acquire()
+        except CircuitOpenError as e:
+            if fallback is None:
+                raise
+            return fallback(e)
+            
+        start = time.perf_counter()
+        try:
+            result = call_with_deadline(func, *args, timeout=self.timeout, **kwargs)
+        except self.ignore:
+            self._on_success()
+            raise
+        except Exception as e:
+            self._on_failure(e)
+            if fallback is None:
+                raise
+            return fallback(e)
+        finally:
+            if self.metrics is not None:
+                self.metrics.record(f"breaker.{self.name}", time.perf_counter() - start)
+        self._on_success()
+        return result
+    
+    def wrap(self, func: Callable, fallback: Callable = None) -> Callable:
+        """Return ``func`` guarded by this breaker."""
+        def guarded(*args, **kwargs):
+            return self.call(func, *args, fallback=fallback, **kwargs)
+        guarded.__name__ = getattr(func, '__name__', 'guarded')
+        return guarded
+    
+    def _acquire(self):
+        with self._lock:
+            state = self._current_state()
+            if state == 'closed':
+                return
+            if state == 'half_open' and not self._trial_running:
+                self._trial_running = True
+                return
+            self.rejected += 1
+        raise CircuitOpenError(f"{self.name} circuit is open; retrying after "
+                               f"{self.reset_timeout:.0f}s")
+    
+    def _on_success(self):
+        with self._lock:
+            if self._state != 'closed':
+                logger.info(f"Circuit '{self.name}' closed")
+            self._state = 'closed'
+            self._trial_running = False
+            self.failures = 0
+    
+    def _on_failure(self, error: Exception):
+        with self._lock:
+            if isinstance(error, DeadlineExceeded):
+                self.timeouts += 1
+            self.failures += 1
+            trial_failed = self._trial_running
+            self._trial_running = False
+            if trial_failed or (self._state == 'closed' and self.failures >= self.failure_threshold):
+                self._state = 'open'
+                self._opened_at = time.monotonic()
+                self.trip_count += 1
+                logger.warning(f"Circuit '{self.name}' opened after {self.failures} failures: {error}")
+    
+    def stats(self) -> Dict:
+        """Current state and counters for display."""
+        with self._lock:
+            return {
+                'state': self._current_state(),
+                'failures': self.failures,
+                'trip_count': self.trip_count,
+                'rejected': self.rejected,
+                'timeouts': self.timeouts
+            }
+    
+    def reset(self):
+        """Close the circuit and clear the counters."""
+        with self._lock:
+            self._state = 'closed'
+            self._trial_running = False
+            self.failures = self.trip_count = self.rejected = self.timeouts = 0
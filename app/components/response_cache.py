@@ -0,0 +1,221 @@
+"""
+Cache of generated answers for repeated or near-identical user messages
+"""
+import re
+import time
+import zlib
+import logging
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+from .metrics import LatencyTracker
+
+logger = logging.getLogger(__name__)
+
+EMBEDDERS = ('ngram', 'ollama')
+PENDING_VECTORS = 32  # embeddings of missed messages kept for the store() that follows
+
+_PUNCTUATION = re.compile(r'[^\w\s]')
+_REPEATS = re.compile(r'(.)\1{2,}')
+
+
+def normalize_text(text: str) -> str:
+    """Case, width, punctuation/emoji, spacing and long repeats folded away ("안녕 !!~" -> "안녕")."""
+    text = unicodedata.normalize('NFKC', text).lower()
+    text = _PUNCTUATION.sub('', text)
+    text = _REPEATS.sub(r'\1\1', text)
+    # Korean spacing is inconsistent ("뭐 했어" / "뭐했어"), so it never distinguishes messages
+    return ''.join(text.split())
+
+
+class NgramEmbedder:
+    """Hashed character 1-3-gram vectors: no model, microseconds per message.
+
+    Matches surface variants of the same message ("오늘 기분 어때?" /
+    "오늘 기분 어때요"), but one changed syllable scores about as high as
+    one added ending ("음식" / "음악"), so keep the threshold high (0.9).
+    For paraphrases use an embedding model (``OllamaEmbedder``).
+    """
+    
+    def __init__(self, dimensions: int = 1024, max_n: int = 3):
+        self.dimensions = dimensions
+        self.max_n = max_n
+    
+    def __call__(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        padded = f"^{text}$"
+        for n in range(1, self.max_n + 1):
+            for start in range(len(padded) - n + 1):
+                gram = padded[start:start + n]
+                vector[zlib.crc32(gram.encode('utf-8')) % self.dimensions] += 1.0
+        return np.sqrt(vector)
+
+
+class OllamaEmbedder:
+    """Sentence embeddings from an Ollama embedding model (e.g. nomic-embed-text, bge-m3)."""
+
+    def __init__(self, client, model: str = 'nomic-embed-text'):
+        self.client = client
+        self.model = model
+    
+    def __call__(self, text: str) -> np.ndarray:
+        return np.asarray(self.client.embed(model=self.model, input=text)['embeddings'][0],
+                          dtype=np.float32)
+
+
+def create_embedder(kind: str = 'ngram', client=None, model: str = None) -> Callable:
+    """Create the configured text embedder."""
+    kind = (kind or 'ngram').lower()
+    if kind == 'ngram':
+        return NgramEmbedder()
+    if kind == 'ollama':
+        return OllamaEmbedder(client, model or 'nomic-embed-text')
+    raise ValueError(f"Unknown embedder: {kind} (expected one of {EMBEDDERS})")
+
+
+class ResponseCache:
+    """Answers keyed by normalized message text and sentiment.
+
+    ``lookup`` first tries the exact normalized text, then the most
+    similar cached message with the same sentiment; a cosine similarity
+    of at least ``threshold`` counts as a hit. Entries expire after
+    ``ttl_seconds`` and the least recently used go first once there are
+    ``max_entries``.
+    
+    An answer that depended on earlier turns is personal to that
+    conversation, so with more than ``max_context_turns`` turns of history
+    the cache is bypassed both ways: nothing is served and nothing is
+    stored. A miss keeps the embedding it computed so the ``store`` of
+    the generated answer does not embed the same message again. With a
+    LatencyTracker every hit is recorded as ``response_cache.hit``.
+    """
+    
+    def __init__(self, embed: Callable = None, threshold: float = 0.9, ttl_seconds: float = 3600,
+                 max_entries: int = 512, max_context_turns: int = 0,
+                 metrics: LatencyTracker = None):
+        self.embed = embed or NgramEmbedder()
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_context_turns = max_context_turns
+        self.metrics = metrics
+        self._lock = threading.Lock()
+        # (normalized text, sentiment) -> (response, unit vector, stored at)
+        self._entries = OrderedDict()
+        # normalized text -> unit vector of a missed lookup awaiting its store()
+        self._pending = OrderedDict()
+        self._counts = {'exact_hits': 0, 'similar_hits': 0, 'misses': 0, 'bypassed': 0}
+    
+    def bypass(self, context_turns: int) -> bool:
+        """True when the conversation is too personal to share answers."""
+        return context_turns > self.max_context_turns
+    
+    def _vector(self, normalized):
+        vector = self.embed(normalized)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+    
+    def _expire(self, now):
+        # Caller holds the lock; entries are in LRU order, not age order
+        expired = [key for key, (_, _, stored) in self._entries.items()
+                   if now - stored > self.ttl_seconds]
+        for key in expired:
+            del self._entries[key]
+    
+    def lookup(self, text: str, sentiment=None, context_turns: int = 0) -> Optional[str]:
+        """A cached answer for ``text``, or None."""
+        if self.bypass(context_turns):
+            with self._lock:
+                self._counts['bypassed'] += 1
+            return None
+        start = time.perf_counter()
+        normalized = normalize_text(text)
+        key = (normalized, sentiment)
+        with self._lock:
+            self._expire(time.time())
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._counts['exact_hits'] += 1
+            candidates = [(other, vector) for other, (_, vector, _) in self._entries.items()
+                          if other[1] == sentiment]
+        if entry is not None:
+            return self._hit(entry[0], start)
+        if not normalized or not candidates:
+            return self._miss()
+        try:
+            vector = self._vector(normalized)
+        except Exception as e:
+            logger.error(f"Response cache embedding failed: {e}")
+            return self._miss()
+        similarities = np.stack([candidate for _, candidate in candidates]) @ vector
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            return self._miss(normalized, vector)
+        with self._lock:
+            entry = self._entries.get(candidates[best][0])
+            if entry is None:
+                # Evicted while we were comparing
+                self._counts['misses'] += 1
+                self._keep_pending(normalized, vector)
+                return None
+            self._entries.move_to_end(candidates[best][0])
+            self._counts['similar_hits'] += 1
+        return self._hit(entry[0], start)
+    
+    def _hit(self, response, start):
+        if self.metrics is not None:
+            self.metrics.record('response_cache.hit', time.perf_counter() - start)
+        return response
+    
+    def _miss(self, normalized=None, vector=None):
+        with self._lock:
+            self._counts['misses'] += 1
+            if vector is not None:
+                self._keep_pending(normalized, vector)
+        return None
+    
+    def _keep_pending(self, normalized, vector):
+        # Caller holds the lock; bounded because not every miss is followed by a store
+        self._pending[normalized] = vector
+        self._pending.move_to_end(normalized)
+        while len(self._pending) > PENDING_VECTORS:
+            self._pending.popitem(last=False)
+    
+    def store(self, text: str, sentiment, response: str, context_turns: int = 0):
+        """Remember ``response`` unless the conversation is personal or the answer empty."""
+        normalized = normalize_text(text)
+        if not normalized or not response or self.bypass(context_turns):
+            return
+        with self._lock:
+            vector = self._pending.pop(normalized, None)
+        if vector is None:
+            try:
+                vector = self._vector(normalized)
+            except Exception as e:
+                logger.error(f"Response cache embedding failed: {e}")
+                return
+        with self._lock:
+            self._entries[(normalized, sentiment)] = (response, vector, time.time())
+            self._entries.move_to_end((normalized, sentiment))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def stats(self) -> Dict:
+        """Entry count, exact/similar hits, misses, bypassed lookups and hit rate."""
+        with self._lock:
+            stats = dict(self._counts)
+            stats['entries'] = len(self._entries)
+        lookups = stats['exact_hits'] + stats['similar_hits'] + stats['misses']
+        stats['hit_rate'] = (stats['exact_hits'] + stats['similar_hits']) / lookups if lookups else 0.0
+        return stats
+    
+    def clear(self):
+        """Drop every cached answer."""
+        with self._lock:
+            self._entries.clear()
+            self._pending.clear()
@@ -0,0 +1,122 @@
+"""
+Split long recordings at pauses and recognize the segments concurrently
+"""
+import math
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from .audio_clip import AudioClip
+from .audio_preprocess import db_to_amplitude, frame_rms
+
+logger = logging.getLogger(__name__)
+
+
+def find_segments(samples, sample_rate, min_pause_ms=300, min_segment_seconds=4.0,
+                  max_segment_seconds=15.0, silence_db=30.0, frame_ms=20) -> List[Tuple[int, int]]:
+    """Return (start, end) sample ranges that cover the signal, cut in the middle of pauses.
+    
+    A pause is a run of at least ``min_pause_ms`` of frames more than
+    ``silence_db`` below the loudest frame. Segments shorter than
+    ``min_segment_seconds`` are merged with the next one; stretches longer
+    than ``max_segment_seconds`` without a pause are cut at their quietest frame.
+    """
+    frame_length = max(1, int(sample_rate * frame_ms / 1000))
+    levels = frame_rms(samples, frame_length) if len(samples) else np.zeros(0)
+    if not len(levels):
+        return []
+        
+    silent = levels < levels.max() * db_to_amplitude(-silence_db)
+    edges = np.diff(np.concatenate(([0], silent.astype(np.int8), [0])))
+    pause_starts = np.flatnonzero(edges == 1)
+    pause_ends = np.flatnonzero(edges == -1)
+    min_pause = math.ceil(min_pause_ms / frame_ms)
+    # Only pauses between speech count; leading/trailing silence stays attached
+    cuts = [(start + end) // 2 for start, end in zip(pause_starts, pause_ends)
+            if end - start >= min_pause and start > 0 and end < len(levels)]
+            
+    min_frames = max(1, int(min_segment_seconds * 1000 / frame_ms))
+    max_frames = max(min_frames + 1, int(max_segment_seconds * 1000 / frame_ms))
+    bounds = []
+    start = 0
+    for cut in cuts + [len(levels)]:
+        while cut - start > max_frames:
+            window = levels[start + min_frames:start + max_frames]
+            forced = start + min_frames + int(np.argmin(window))
+            bounds.append((start, forced))
+            start = forced
+        if cut - start >= min_frames or cut == len(levels):
+            bounds.append((start, cut))
+            start = cut
+            
+    # A short final piece is merged into the previous segment
+    if len(bounds) > 1 and bounds[-1][1] - bounds[-1][0] < min_frames:
+        last_start, last_end = bounds.pop()
+        bounds[-1] = (bounds[-1][0], last_end)
+    return [(first * frame_length, min(last * frame_length, len(samples)))
+            for first, last in bounds if last > first]
+
+
+class SegmentedRecognizer:
+    """Recognize a clip as pause-delimited segments on a bounded thread pool.
+    
+    ``recognize`` is a one-shot backend call taking a speech_recognition
+    AudioData. Segments run concurrently (at most ``max_workers`` at a
+    time across all callers) and the transcripts are joined in order.
+    Segments where nothing was recognized are skipped. With an
+    AudioEncoder each segment is compressed on its worker before upload.
+    """
+    
+    def __init__(self, recognize: Callable, max_workers: int = 4, min_pause_ms: int = 300,
+                 min_segment_seconds: float = 4.0, max_segment_seconds: float = 15.0,
+                 encoder=None):
+        self.recognize = recognize
+        self.encoder = encoder
+        self.min_pause_ms = min_pause_ms
+        self.min_segment_seconds = min_segment_seconds
+        self.max_segment_seconds = max_segment_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="asr-segment")
+    
+    def split(self, clip: AudioClip) -> List[AudioClip]:
+        """Cut a clip into pause-delimited mono segments."""
+        clip = clip.to_mono()
+        ranges = find_segments(clip.samples[:, 0], clip.sample_rate, self.min_pause_ms,
+                               self.min_segment_seconds, self.max_segment_seconds)
+        return [AudioClip(clip.samples[start:end], clip.sample_rate, 1) for start, end in ranges]
+    
+    def transcribe(self, clip: AudioClip) -> str:
+        """Recognize all segments concurrently and stitch the transcripts in order."""
+        import speech_recognition as sr
+        segments = self.split(clip)
+        if len(segments) <= 1:
+            return self.recognize(self._audio_data(clip))
+            
+        logger.info(f"Recognizing {clip.duration:.1f}s clip as {len(segments)} segments")
+        futures = [self.submit(segment) for segment in segments]
+        texts = [text for text in (future.result() for future in futures) if text]
+        if not texts:
+            raise sr.UnknownValueError()
+        return ' '.join(texts)
+    
+    def submit(self, segment: AudioClip) -> Future:
+        """Recognize one segment on the pool; the result is "" when nothing was recognized."""
+        return self._executor.submit(self._recognize_segment, segment)
+    
+    def _recognize_segment(self, segment: AudioClip) -> str:
+        import speech_recognition as sr
+        try:
+            return self.recognize(self._audio_data(segment)).strip()
+        except sr.UnknownValueError:
+            return ""
+    
+    def _audio_data(self, clip: AudioClip):
+        if self.encoder is not None:
+            return self.encoder.to_audio_data(clip)
+        return clip.to_audio_data()
+    
+    def close(self):
+        """Stop the worker threads."""
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,175 @@
+"""
+Sharded SQLite storage that spreads sessions over several database files.
+"""
+import os
+import time
+import zlib
+import heapq
+import queue
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Iterable, Union
+
+from .database import (ConversationDB, format_conversations, iter_import_rows,
+                       open_import_source)
+
+logger = logging.getLogger(__name__)
+
+_END_OF_ROWS = object()
+
+# Rows buffered per shard during an import, in batches
+IMPORT_QUEUE_BATCHES = 4
+
+
+def shard_paths(db_path: str, num_shards: int) -> List[str]:
+    """Return the shard file names derived from the base database path."""
+    if num_shards <= 1:
+        return [db_path]
+    root, ext = os.path.splitext(db_path)
+    return [f"{root}.shard{i}{ext or '.db'}" for i in range(num_shards)]
+
+
+class ShardedConversationDB:
+    """ConversationDB-compatible store routing sessions to N SQLite shards.
+    
+    Each session lives entirely in one shard chosen by a stable hash of its
+    session_id, so writers for different sessions rarely share a file lock.
+    Whole-database reads fan out to every shard in parallel and are merged.
+    """
+    
+    def __init__(self, db_path: str = "conversations.db", num_shards: int = 4, **db_kwargs):
+        self.db_path = db_path
+        self.num_shards = max(1, num_shards)
+        self.shards = [ConversationDB(path, **db_kwargs)
+                       for path in shard_paths(db_path, self.num_shards)]
+        self._executor = ThreadPoolExecutor(max_workers=self.num_shards,
+                                            thread_name_prefix="db-shard")
+    
+    def shard_index(self, session_id: str) -> int:
+        """Map a session_id to its shard number."""
+        return zlib.crc32((session_id or '').encode('utf-8')) % self.num_shards
+    
+    def shard_for(self, session_id: str) -> ConversationDB:
+        """Return the shard that owns a session."""
+        return self.shards[self.shard_index(session_id)]
+    
+    def _fan_out(self, method: str, *args) -> list:
+        """Call a method on every shard in parallel and collect the results."""
+        futures = [self._executor.submit(getattr(shard, method), *args)
+                   for shard in self.shards]
+        return [future.result() for future in futures]
+    
+    def save_conversation(self, session_id: str, user_input: str,
+                         ai_response: str = None, sentiment: str = None,
+                         mbti: str = None, confidence_score: float = 0.0):
+        """Save a conversation turn to the session's shard."""
+        self.shard_for(session_id).save_conversation(
+            session_id, user_input, ai_response, sentiment, mbti, confidence_score)
+    
+    def get_conversation_history(self, session_id: str, limit: int = 50) -> List[Dict]:
+        """Get conversation history for a session."""
+        return self.shard_for(session_id).get_conversation_history(session_id, limit)
+    
+    def get_session_stats(self, session_id: str) -> Optional[Dict]:
+        """Get statistics for a session."""
+        return self.shard_for(session_id).get_session_stats(session_id)
+    
+    def end_session(self, session_id: str):
+        """Mark a session as ended."""
+        self.shard_for(session_id).end_session(session_id)
+    
+    def cleanup_old_sessions(self, days_old: int = 30):
+        """Remove sessions older than specified days from every shard."""
+        self._fan_out('cleanup_old_sessions', days_old)
+    
+    def get_database_stats(self) -> Dict:
+        """Merge totals and sentiment distribution from every shard."""
+        merged = {'total_sessions': 0, 'total_conversations': 0,
+                  'sentiment_distribution': {}}
+        for stats in self._fan_out('get_database_stats'):
+            merged['total_sessions'] += stats['total_sessions']
+            merged['total_conversations'] += stats['total_conversations']
+            for sentiment, count in stats['sentiment_distribution'].items():
+                distribution = merged['sentiment_distribution']
+                distribution[sentiment] = distribution.get(sentiment, 0) + count
+        return merged
+    
+    def get_export_rows(self, session_id: str = None) -> List[Dict]:
+        """Get conversation rows from all shards merged in chronological order."""
+        if session_id:
+            return self.shard_for(session_id).get_export_rows(session_id)
+            
+        # Ids are per shard, so rows with the same timestamp are ordered by session
+        # first; each shard comes back nearly in that order (ORDER BY timestamp, id)
+        def key(row):
+            return (str(row['timestamp']), row['session_id'], row['id'])
+            
+        per_shard = [sorted(rows, key=key) for rows in self._fan_out('get_export_rows')]
+        return list(heapq.merge(*per_shard, key=key))
+    
+    def export_conversations(self, session_id: str = None, format: str = 'json') -> str:
+        """Export conversations to JSON, JSONL or CSV format."""
+        try:
+            return format_conversations(self.get_export_rows(session_id), format)
+            
+        except Exception as e:
+            logger.error(f"Failed to export conversations: {str(e)}")
+            return ""
+    
+    def import_conversations(self, source: Union[str, Iterable], format: str = None,
+                             batch_size: int = 1000) -> Dict:
+        """Bulk import conversations, streaming rows to all shards in parallel.
+        
+        Each shard's queue holds at most ``IMPORT_QUEUE_BATCHES`` batches, so
+        reading the source waits for shards that fall behind instead of
+        pulling the whole source into memory.
+        """
+        start = time.perf_counter()
+        source, format, handle = open_import_source(source, format)
+        queues = [queue.Queue(maxsize=batch_size * IMPORT_QUEUE_BATCHES) for _ in self.shards]
+        
+        def drain(rows: queue.Queue):
+            while True:
+                row = rows.get()
+                if row is _END_OF_ROWS:
+                    return
+                yield row
+                
+        futures = [self._executor.submit(shard.import_conversations, drain(rows), None, batch_size)
+                   for shard, rows in zip(self.shards, queues)]
+                   
+        def put(index: int, row):
+            # A shard whose import failed stops reading; its rows are dropped
+            while not futures[index].done():
+                try:
+                    queues[index].put(row, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+                        
+        try:
+            for row in iter_import_rows(source, format):
+                put(self.shard_index(row.get('session_id')), row)
+                
+        except Exception as e:
+            logger.error(f"Failed to import conversations: {str(e)}")
+        finally:
+            if handle is not None:
+                handle.close()
+            for index in range(len(queues)):
+                put(index, _END_OF_ROWS)
+                
+        stats = {'imported': 0, 'skipped': 0, 'sessions': 0}
+        for future in futures:
+            for key, value in future.result().items():
+                if key in stats:
+                    stats[key] += value
+                    
+        elapsed = time.perf_counter() - start
+        stats['elapsed_seconds'] = elapsed
+        stats['rows_per_sec'] = stats['imported'] / elapsed if elapsed > 0 else 0.0
+        return stats
+    
+    def close(self):
+        """Stop the fan-out worker threads."""
+        self._executor.shutdown(wait=True)
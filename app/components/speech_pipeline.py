@@ -0,0 +1,256 @@
+"""
+Sentence-by-sentence speech output that starts while the answer is still being generated
+"""
+import re
+import time
+import queue
+import logging
+import threading
+from collections import deque
+from typing import Callable, Dict, List
+
+from .metrics import LatencyTracker
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+class SentenceSplitter:
+    """Cuts streamed text into sentences at Korean/Latin sentence endings.
+
+    A boundary is terminal punctuation (``. ! ? … ~`` and full-width
+    forms, optionally followed by closing quotes or brackets) followed by
+    whitespace, or a line break. Requiring the whitespace keeps "3.5" or
+    "!!" from splitting before the next token arrives. Sentences shorter
+    than ``min_chars`` are joined with the next one so that very short
+    fragments ("네!") do not each pay for a synthesis request.
+    """
+    
+    BOUNDARY = re.compile(r'[.!?…~。！？]+["\'”’)\]]*\s+|\n+')
+    
+    def __init__(self, min_chars: int = 10):
+        self.min_chars = min_chars
+        self._buffer = ''
+    
+    def feed(self, text: str) -> List[str]:
+        """Add streamed text and return the sentences it completed."""
+        self._buffer += text
+        sentences = []
+        start = 0
+        for match in self.BOUNDARY.finditer(self._buffer):
+            sentence = self._buffer[start:match.end()].strip()
+            if len(sentence) < self.min_chars:
+                continue
+            sentences.append(sentence)
+            start = match.end()
+        self._buffer = self._buffer[start:]
+        return sentences
+    
+    def flush(self) -> List[str]:
+        """Return whatever is left once the text is complete."""
+        rest = self._buffer.strip()
+        self._buffer = ''
+        return [rest] if rest else []
+
+
+def split_sentences(text: str, min_chars: int = 10) -> List[str]:
+    """Split complete text into speakable sentences."""
+    splitter = SentenceSplitter(min_chars)
+    return splitter.feed(text) + splitter.flush()
+
+
+class SpeechPipeline:
+    """Synthesizes sentence N+1 while sentence N plays.
+
+    Text is fed as it streams from the LLM; each completed sentence goes to
+    a synthesis thread, whose audio segments queue up (at most
+    ``prefetch`` ahead) for a player thread that plays them back to back.
+    ``synthesize(sentence)`` returns audio or None when speech is
+    unavailable; ``play(audio)`` blocks until the segment has played and
+    may return False when playback was interrupted (barge-in), which
+    drops the remaining sentences. Both run on the pipeline's threads,
+    never on the caller's.
+    
+    A queued player is given as ``enqueue(audio)`` instead, returning an
+    item with ``wait()``, ``status``, ``started`` and ``ended`` (see
+    PlaybackWorker). Each segment is then handed over as soon as it is
+    synthesized, so the player starts it the moment the previous one
+    ends; the pipeline only waits once ``lookahead`` segments are queued
+    behind the one playing. A ``stopped`` item counts as a barge-in.
+    
+    Time to first audio is measured from construction, so create the
+    pipeline when the turn starts. With a LatencyTracker it is recorded as
+    ``tts.first_audio`` and each synthesis as ``tts.sentence``.
+    """
+    
+    def __init__(self, synthesize: Callable, play: Callable = None, min_chars: int = 10,
+                 prefetch: int = 2, metrics: LatencyTracker = None, enqueue: Callable = None,
+                 lookahead: int = 1):
+        if (play is None) == (enqueue is None):
+            raise ValueError("SpeechPipeline needs exactly one of play or enqueue")
+        self.synthesize = synthesize
+        self.play = play
+        self.enqueue = enqueue
+        self.lookahead = max(0, lookahead)
+        self.metrics = metrics
+        self.splitter = SentenceSplitter(min_chars)
+        self.started = time.perf_counter()
+        self.fed_chars = 0
+        self._sentences = queue.Queue()
+        self._audio = queue.Queue(maxsize=max(1, prefetch))
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._stats = {
+            'sentences': 0,
+            'spoken': 0,
+            'failed': 0,
+            'first_audio_ms': None,
+            'synth_ms': 0.0,
+            'stall_ms': 0.0,
+            'total_ms': None
+        }
+        self._synth_thread = threading.Thread(target=self._synthesize_loop, name="speech-synth",
+                                              daemon=True)
+        self._play_thread = threading.Thread(
+            target=self._play_loop if enqueue is None else self._enqueue_loop,
+            name="speech-play", daemon=True)
+        self._synth_thread.start()
+        self._play_thread.start()
+    
+    def feed(self, text: str):
+        """Queue every sentence completed by ``text`` for synthesis."""
+        self.fed_chars += len(text)
+        for sentence in self.splitter.feed(text):
+            self._enqueue(sentence)
+    
+    def _enqueue(self, sentence):
+        with self._lock:
+            self._stats['sentences'] += 1
+        self._sentences.put(sentence)
+    
+    def finish(self, wait: bool = True, timeout: float = None) -> Dict:
+        """Speak the remaining text and return the stats.
+        
+        With ``wait`` the call blocks until playback has ended; otherwise it
+        returns at once and the rest plays in the background.
+        """
+        for sentence in self.splitter.flush():
+            self._enqueue(sentence)
+        self._sentences.put(_DONE)
+        if wait:
+            self._play_thread.join(timeout)
+        return self.stats()
+    
+    def cancel(self):
+        """Drop queued sentences and audio; the segment already playing finishes."""
+        self._cancelled.set()
+        self.splitter.flush()
+        self._sentences.put(_DONE)
+    
+    def stats(self) -> Dict:
+        """Sentence counts plus first-audio, synthesis, stall and total times (ms)."""
+        with self._lock:
+            return dict(self._stats)
+    
+    def _synthesize_loop(self):
+        while True:
+            sentence = self._sentences.get()
+            if sentence is _DONE:
+                break
+            if self._cancelled.is_set():
+                continue
+            start = time.perf_counter()
+            try:
+                audio = self.synthesize(sentence)
+            except Exception as e:
+                logger.error(f"Speech synthesis failed: {e}")
+                audio = None
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._stats['synth_ms'] += elapsed * 1000
+                if audio is None:
+                    self._stats['failed'] += 1
+            if self.metrics is not None:
+                self.metrics.record('tts.sentence', elapsed)
+            if audio is not None:
+                self._audio.put(audio)
+        self._audio.put(_DONE)
+    
+    def _play_loop(self):
+        previous_end = None
+        while True:
+            audio = self._audio.get()
+            if audio is _DONE:
+                break
+            if self._cancelled.is_set():
+                continue
+            now = time.perf_counter()
+            with self._lock:
+                if previous_end is None:
+                    self._stats['first_audio_ms'] = (now - self.started) * 1000
+                else:
+                    # Time the speaker sat silent waiting for the next sentence
+                    self._stats['stall_ms'] += (now - previous_end) * 1000
+            if previous_end is None and self.metrics is not None:
+                self.metrics.record('tts.first_audio', now - self.started)
+            try:
+                if self.play(audio) is False:
+                    self.cancel()
+                else:
+                    with self._lock:
+                        self._stats['spoken'] += 1
+            except Exception as e:
+                logger.error(f"Speech playback failed: {e}")
+                with self._lock:
+                    self._stats['failed'] += 1
+            previous_end = time.perf_counter()
+        with self._lock:
+            self._stats['total_ms'] = (time.perf_counter() - self.started) * 1000
+    
+    def _enqueue_loop(self):
+        queued = deque()
+        previous = None
+        first = True
+        while True:
+            audio = self._audio.get()
+            if audio is _DONE:
+                break
+            if self._cancelled.is_set():
+                continue
+            if first:
+                first = False
+                now = time.perf_counter()
+                with self._lock:
+                    self._stats['first_audio_ms'] = (now - self.started) * 1000
+                if self.metrics is not None:
+                    self.metrics.record('tts.first_audio', now - self.started)
+            try:
+                queued.append(self.enqueue(audio))
+            except Exception as e:
+                logger.error(f"Speech playback failed: {e}")
+                with self._lock:
+                    self._stats['failed'] += 1
+                continue
+            # The playing segment plus ``lookahead`` queued behind it
+            while len(queued) > self.lookahead + 1:
+                previous = self._settle(queued.popleft(), previous)
+        while queued:
+            previous = self._settle(queued.popleft(), previous)
+        with self._lock:
+            self._stats['total_ms'] = (time.perf_counter() - self.started) * 1000
+    
+    def _settle(self, item, previous):
+        """Wait for a handed-over segment and account for it; returns it as the new previous."""
+        item.wait()
+        if item.status == 'stopped':
+            self.cancel()
+        with self._lock:
+            if item.status in ('played', 'skipped'):
+                self._stats['spoken'] += 1
+            elif item.status == 'failed':
+                self._stats['failed'] += 1
+            if previous is not None and previous.ended is not None and item.started is not None:
+                # Time the speaker sat silent between the two segments
+                self._stats['stall_ms'] += max(0.0, item.started - previous.ended) * 1000
+        return item if item.started is not None else previous
@@ -0,0 +1,237 @@
+"""
+Storage backend interface and the in-memory conversation store.
+"""
+import time
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Iterable, Union, Protocol
+
+from .database import (ConversationDB, IMPORT_COLUMNS, format_conversations,
+                       iter_import_rows, open_import_source)
+from .sharded_database import ShardedConversationDB
+
+logger = logging.getLogger(__name__)
+
+STORAGE_BACKENDS = ('sqlite', 'memory')
+
+
+class ConversationStore(Protocol):
+    """Operations every conversation storage backend provides."""
+    
+    def save_conversation(self, session_id: str, user_input: str,
+                         ai_response: str = None, sentiment: str = None,
+                         mbti: str = None, confidence_score: float = 0.0): ...
+    
+    def get_conversation_history(self, session_id: str, limit: int = 50) -> List[Dict]: ...
+    
+    def get_session_stats(self, session_id: str) -> Optional[Dict]: ...
+    
+    def get_database_stats(self) -> Dict: ...
+    
+    def end_session(self, session_id: str): ...
+    
+    def cleanup_old_sessions(self, days_old: int = 30): ...
+    
+    def get_export_rows(self, session_id: str = None) -> List[Dict]: ...
+    
+    def export_conversations(self, session_id: str = None, format: str = 'json') -> str: ...
+    
+    def import_conversations(self, source: Union[str, Iterable], format: str = None,
+                             batch_size: int = 1000) -> Dict: ...
+    
+    def close(self): ...
+
+
+def _now() -> str:
+    """Current UTC time in SQLite CURRENT_TIMESTAMP format."""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+
+class MemoryConversationDB:
+    """In-process conversation store built on dicts and lists.
+    
+    Nothing touches the disk, which makes it suitable for tests, benchmarks
+    and throwaway demo deployments. Data is lost when the process exits.
+    """
+    
+    def __init__(self, db_path: str = None, **unused_options):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._next_id = 1
+        self._turns: Dict[str, List[Dict]] = {}
+        self._sessions: Dict[str, Dict] = {}
+    
+    def _append_turn(self, row: Dict):
+        """Store one turn and update its session counters (lock held)."""
+        row['id'] = self._next_id
+        self._next_id += 1
+        session_id = row['session_id']
+        self._turns.setdefault(session_id, []).append(row)
+        
+        session = self._sessions.setdefault(session_id, {
+            'start_time': row['timestamp'], 'end_time': None,
+            'total_messages': 0, 'final_mbti': None
+        })
+        session['total_messages'] += 1
+        if row['mbti'] is not None:
+            session['final_mbti'] = row['mbti']
+    
+    def save_conversation(self, session_id: str, user_input: str,
+                         ai_response: str = None, sentiment: str = None,
+                         mbti: str = None, confidence_score: float = 0.0):
+        """Save a conversation turn in memory."""
+        with self._lock:
+            self._append_turn({
+                'session_id': session_id, 'timestamp': _now(),
+                'user_input': user_input, 'ai_response': ai_response,
+                'sentiment': sentiment, 'mbti': mbti,
+                'confidence_score': confidence_score
+            })
+    
+    def get_conversation_history(self, session_id: str, limit: int = 50) -> List[Dict]:
+        """Get conversation history for a session (the latest ``limit`` turns; all if negative)."""
+        with self._lock:
+            turns = list(self._turns.get(session_id, []))
+        # Same order as SQLite: imported turns may be older than ones saved earlier
+        turns.sort(key=lambda turn: (str(turn['timestamp']), turn['id']))
+        if limit >= 0:
+            turns = turns[len(turns) - limit:] if limit else []
+        return [{key: turn[key] for key in
+                 ('timestamp', 'user_input', 'ai_response', 'sentiment', 'mbti')}
+                for turn in turns]
+    
+    def get_session_stats(self, session_id: str) -> Optional[Dict]:
+        """Get statistics for a session."""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                return None
+                
+            distribution = {}
+            for turn in self._turns.get(session_id, []):
+                if turn['sentiment'] is not None:
+                    distribution[turn['sentiment']] = distribution.get(turn['sentiment'], 0) + 1
+                    
+            return {
+                'session_id': session_id,
+                'start_time': session['start_time'],
+                'total_messages': session['total_messages'],
+                'final_mbti': session['final_mbti'],
+                'sentiment_distribution': distribution
+            }
+    
+    def get_database_stats(self) -> Dict:
+        """Get totals and sentiment distribution across all sessions."""
+        with self._lock:
+            distribution = {}
+            total = 0
+            for turns in self._turns.values():
+                total += len(turns)
+                for turn in turns:
+                    if turn['sentiment'] is not None:
+                        distribution[turn['sentiment']] = distribution.get(turn['sentiment'], 0) + 1
+                        
+            return {
+                'total_sessions': len(self._sessions),
+                'total_conversations': total,
+                'sentiment_distribution': distribution
+            }
+    
+    def end_session(self, session_id: str):
+        """Mark a session as ended."""
+        with self._lock:
+            if session_id in self._sessions:
+                self._sessions[session_id]['end_time'] = _now()
+    
+    def cleanup_old_sessions(self, days_old: int = 30):
+        """Remove sessions older than specified days."""
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=days_old)).strftime('%Y-%m-%d %H:%M:%S')
+        with self._lock:
+            expired = [session_id for session_id, session in self._sessions.items()
+                       if str(session['start_time']) < cutoff]
+            for session_id in expired:
+                del self._sessions[session_id]
+                self._turns.pop(session_id, None)
+        logger.info(f"Cleaned up sessions older than {days_old} days")
+    
+    def get_export_rows(self, session_id: str = None) -> List[Dict]:
+        """Get full conversation rows in chronological order for export."""
+        columns = ('id',) + IMPORT_COLUMNS
+        with self._lock:
+            if session_id:
+                turns = list(self._turns.get(session_id, []))
+            else:
+                turns = [turn for rows in self._turns.values() for turn in rows]
+        turns.sort(key=lambda turn: (str(turn['timestamp']), turn['id']))
+        return [{key: turn[key] for key in columns} for turn in turns]
+    
+    def export_conversations(self, session_id: str = None, format: str = 'json') -> str:
+        """Export conversations to JSON, JSONL or CSV format."""
+        try:
+            return format_conversations(self.get_export_rows(session_id), format)
+            
+        except Exception as e:
+            logger.error(f"Failed to export conversations: {str(e)}")
+            return ""
+    
+    def import_conversations(self, source: Union[str, Iterable], format: str = None,
+                             batch_size: int = 1000) -> Dict:
+        """Bulk import conversations produced by export_conversations."""
+        stats = {'imported': 0, 'skipped': 0, 'sessions': 0}
+        start = time.perf_counter()
+        sessions = set()
+        source, format, handle = open_import_source(source, format)
+        
+        try:
+            for row in iter_import_rows(source, format):
+                values = {key: (None if row.get(key) == '' else row.get(key))
+                          for key in IMPORT_COLUMNS}
+                if not values['session_id'] or values['user_input'] is None:
+                    stats['skipped'] += 1
+                    continue
+                    
+                try:
+                    values['confidence_score'] = float(values['confidence_score'] or 0.0)
+                except (TypeError, ValueError):
+                    values['confidence_score'] = 0.0
+                values['timestamp'] = values['timestamp'] or _now()
+                
+                with self._lock:
+                    self._append_turn(values)
+                    session = self._sessions[values['session_id']]
+                    session['start_time'] = min(str(session['start_time']), str(values['timestamp']))
+                sessions.add(values['session_id'])
+                stats['imported'] += 1
+                
+        except Exception as e:
+            logger.error(f"Failed to import conversations: {str(e)}")
+        finally:
+            if handle is not None:
+                handle.close()
+                
+        elapsed = time.perf_counter() - start
+        stats['sessions'] = len(sessions)
+        stats['elapsed_seconds'] = elapsed
+        stats['rows_per_sec'] = stats['imported'] / elapsed if elapsed > 0 else 0.0
+        return stats
+    
+    def close(self):
+        """Nothing to release for the in-memory store."""
+
+
+def create_conversation_store(backend: str = 'sqlite', db_path: str = "conversations.db",
+                              num_shards: int = 1, **db_options) -> ConversationStore:
+    """Create the configured storage backend.
+    
+    ``sqlite`` uses a single file, or ShardedConversationDB when
+    ``num_shards`` is above one; ``memory`` keeps everything in process.
+    """
+    backend = (backend or 'sqlite').lower()
+    if backend == 'memory':
+        return MemoryConversationDB(db_path, **db_options)
+    if backend == 'sqlite':
+        if num_shards > 1:
+            return ShardedConversationDB(db_path, num_shards=num_shards, **db_options)
+        return ConversationDB(db_path, **db_options)
+    raise ValueError(f"Unknown storage backend: {backend} (expected one of {STORAGE_BACKENDS})")
@@ -0,0 +1,279 @@
+"""
+Speech synthesis backends: gTTS (network), a pooled local engine and a stub for tests
+"""
+import io
+import time
+import wave
+import queue
+import logging
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Callable, Dict
+
+import numpy as np
+
+from .metrics import LatencyTracker
+
+logger = logging.getLogger(__name__)
+
+TTS_BACKENDS = ('gtts', 'local', 'stub')
+
+# MPEG Layer III bitrates (kbps) by bitrate index: MPEG-1, then MPEG-2/2.5
+_MP3_BITRATES = {
+    1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160)
+}
+
+
+def pcm_to_wav(samples: np.ndarray, sample_rate: int) -> bytes:
+    """Encode mono float32 samples as 16-bit WAV bytes."""
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype('<i2')
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(pcm.tobytes())
+    return buffer.getvalue()
+
+
+def audio_duration(data: bytes) -> float:
+    """Length in seconds of WAV or constant-bitrate MP3 bytes (0.0 if unknown)."""
+    if data[:4] == b'RIFF':
+        with wave.open(io.BytesIO(data), 'rb') as wf:
+            return wf.getnframes() / wf.getframerate()
+    offset = 0
+    if data[:3] == b'ID3':
+        # Syncsafe tag size: 7 bits per byte
+        size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        offset = 10 + size
+    for index in range(offset, len(data) - 3):
+        if data[index] == 0xFF and data[index + 1] & 0xE0 == 0xE0:
+            version = 1 if data[index + 1] & 0x18 == 0x18 else 2
+            bitrate = _MP3_BITRATES[version][data[index + 2] >> 4 & 0x0F] if data[index + 2] >> 4 < 15 else 0
+            if bitrate:
+                return (len(data) - index) * 8 / (bitrate * 1000)
+    return 0.0
+
+
+class SynthesizerBackend(ABC):
+    """One-shot synthesizer: ``synthesize(text) -> bytes`` in ``audio_format``.
+
+    Every call is recorded under ``tts.<name>`` when a LatencyTracker is
+    given, and the real-time factor (synthesis time / audio length; below
+    1.0 is faster than playback) is accumulated for ``stats()``.
+    """
+    
+    name = 'base'
+    audio_format = 'wav'
+    voice = None
+    
+    def __init__(self, metrics: LatencyTracker = None):
+        self.metrics = metrics
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._synth_seconds = 0.0
+        self._audio_seconds = 0.0
+        self._last_rtf = None
+    
+    def synthesize(self, text: str) -> bytes:
+        start = time.perf_counter()
+        audio = self._synthesize(text)
+        elapsed = time.perf_counter() - start
+        seconds = audio_duration(audio)
+        with self._lock:
+            self._calls += 1
+            self._synth_seconds += elapsed
+            self._audio_seconds += seconds
+            self._last_rtf = elapsed / seconds if seconds else None
+        if self.metrics is not None:
+            self.metrics.record(f"tts.{self.name}", elapsed)
+        return audio
+    
+    @abstractmethod
+    def _synthesize(self, text: str) -> bytes:
+        """Synthesize one sentence; the timing and stats are handled by ``synthesize``."""
+    
+    def prewarm(self):
+        """Load whatever the backend needs before the first request."""
+    
+    def stats(self) -> Dict:
+        """Call count, total synthesis/audio seconds and real-time factor."""
+        with self._lock:
+            audio_seconds = self._audio_seconds
+            return {
+                'calls': self._calls,
+                'synth_seconds': self._synth_seconds,
+                'audio_seconds': audio_seconds,
+                'rtf': self._synth_seconds / audio_seconds if audio_seconds else None,
+                'last_rtf': self._last_rtf
+            }
+
+
+class GTTSSynthesizer(SynthesizerBackend):
+    """Google Translate TTS through gTTS (network round trip per call, MP3 output)."""
+
+    name = 'gtts'
+    audio_format = 'mp3'
+    
+    def __init__(self, language: str = 'ko', slow: bool = False, timeout: float = None,
+                 metrics: LatencyTracker = None):
+        super().__init__(metrics)
+        self.language = language
+        self.slow = slow
+        self.timeout = timeout
+        self.voice = f"gtts-{language}{'-slow' if slow else ''}"
+    
+    def _synthesize(self, text: str) -> bytes:
+        from gtts import gTTS
+        mp3_fp = io.BytesIO()
+        gTTS(text=text, lang=self.language, slow=self.slow, timeout=self.timeout).write_to_fp(mp3_fp)
+        return mp3_fp.getvalue()
+
+
+class SynthesizerPool:
+    """Keeps ``size`` ready-made engines so no call pays for initialization.
+
+    ``factory()`` builds one engine (e.g. loads a model). ``prewarm``
+    builds them all up front, otherwise they are built on first demand.
+    Each engine serves one call at a time.
+    """
+    
+    def __init__(self, factory: Callable, size: int = 1):
+        self.factory = factory
+        self.size = max(1, size)
+        self._idle = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
+    
+    def prewarm(self):
+        """Create every engine now."""
+        while True:
+            with self._lock:
+                if self._created >= self.size:
+                    return
+                self._created += 1
+            self._idle.put(self._build())
+    
+    def _build(self):
+        start = time.perf_counter()
+        try:
+            engine = self.factory()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+        logger.info(f"TTS engine ready in {time.perf_counter() - start:.1f}s")
+        return engine
+    
+    @contextmanager
+    def engine(self):
+        """Borrow an idle engine, creating one if the pool is not full yet."""
+        try:
+            engine = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                create = self._created < self.size
+                if create:
+                    self._created += 1
+            engine = self._build() if create else self._idle.get()
+        try:
+            yield engine
+        finally:
+            self._idle.put(engine)
+    
+    @property
+    def ready(self) -> int:
+        """Number of idle, initialized engines."""
+        return self._idle.qsize()
+
+
+class LocalSynthesizer(SynthesizerBackend):
+    """Offline synthesis with MeloTTS, models kept warm in a SynthesizerPool.
+
+    Loading a MeloTTS model takes seconds, so ``pool_size`` models are
+    loaded once (``prewarm``) and shared. Output is 16-bit WAV. Requires
+    ``pip install melotts`` (and ``python -m unidic download`` for its
+    Japanese/Korean text frontend).
+    """
+    
+    name = 'local'
+    audio_format = 'wav'
+    
+    # MeloTTS language codes
+    LANGUAGES = {'ko': 'KR', 'en': 'EN', 'ja': 'JP', 'zh': 'ZH', 'es': 'ES', 'fr': 'FR'}
+    
+    def __init__(self, language: str = 'ko', device: str = 'cpu', speed: float = 1.0,
+                 pool_size: int = 1, metrics: LatencyTracker = None):
+        super().__init__(metrics)
+        self.language = self.LANGUAGES.get(language.split('-')[0], language)
+        self.device = device
+        self.speed = speed
+        self.voice = f"melo-{self.language}-{speed:g}"
+        self.pool = SynthesizerPool(self._load, pool_size)
+    
+    def _load(self):
+        # Imported lazily: it pulls in torch and is only needed for this backend
+        try:
+            from melo.api import TTS
+        except ImportError as e:
+            raise RuntimeError("melotts is required for the local TTS backend") from e
+        model = TTS(language=self.language, device=self.device)
+        speaker_id = next(iter(model.hps.data.spk2id.values()))
+        return model, speaker_id
+    
+    def prewarm(self):
+        self.pool.prewarm()
+    
+    def _synthesize(self, text: str) -> bytes:
+        with self.pool.engine() as (model, speaker_id):
+            samples = model.tts_to_file(text, speaker_id, None, speed=self.speed, quiet=True)
+            sample_rate = model.hps.data.sampling_rate
+        return pcm_to_wav(np.asarray(samples, dtype=np.float32), sample_rate)
+
+
+class StubSynthesizer(SynthesizerBackend):
+    """Deterministic backend for tests and benchmarks: a tone whose length follows the text.
+
+    ``latency`` and ``latency_per_char`` simulate synthesis time;
+    ``seconds_per_char`` sets the spoken length (about 0.15 s per Korean
+    syllable at normal speed).
+    """
+    
+    name = 'stub'
+    audio_format = 'wav'
+    voice = 'stub'
+    
+    def __init__(self, latency: float = 0.0, latency_per_char: float = 0.0,
+                 seconds_per_char: float = 0.15, sample_rate: int = 24000,
+                 metrics: LatencyTracker = None):
+        super().__init__(metrics)
+        self.latency = latency
+        self.latency_per_char = latency_per_char
+        self.seconds_per_char = seconds_per_char
+        self.sample_rate = sample_rate
+        self.calls = 0
+    
+    def _synthesize(self, text: str) -> bytes:
+        delay = self.latency + self.latency_per_char * len(text)
+        if delay:
+            time.sleep(delay)
+        self.calls += 1
+        t = np.arange(int(len(text) * self.seconds_per_char * self.sample_rate)) / self.sample_rate
+        return pcm_to_wav((0.2 * np.sin(2 * np.pi * 220 * t)).astype(np.float32), self.sample_rate)
+
+
+def create_synthesizer(backend: str = 'gtts', language: str = 'ko', metrics: LatencyTracker = None,
+                       timeout: float = None, local_device: str = 'cpu', local_speed: float = 1.0,
+                       pool_size: int = 1, stub_latency: float = 0.0) -> SynthesizerBackend:
+    """Create the configured speech synthesis backend."""
+    backend = (backend or 'gtts').lower()
+    if backend == 'gtts':
+        return GTTSSynthesizer(language, timeout=timeout, metrics=metrics)
+    if backend == 'local':
+        return LocalSynthesizer(language, device=local_device, speed=local_speed,
+                                pool_size=pool_size, metrics=metrics)
+    if backend == 'stub':
+        return StubSynthesizer(stub_latency, metrics=metrics)
+    raise ValueError(f"Unknown TTS backend: {backend} (expected one of {TTS_BACKENDS})")
@@ -0,0 +1,217 @@
+"""
+Content-addressed cache for synthesized speech: bounded memory LRU in front of a shared disk directory
+"""
+import os
+import json
+import time
+import hashlib
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from .metrics import LatencyTracker
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(text: str, language: str = 'ko', voice: str = None, speed: float = 1.0) -> str:
+    """SHA-256 of everything that changes the synthesized audio."""
+    payload = json.dumps([text, language, voice, float(speed)], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class TTSCache:
+    """Synthesized audio keyed by (text, language, voice, speed).
+
+    Entries live in ``directory`` as ``<key[:2]>/<key>.<extension>`` and
+    the most recent ones also in memory. Files are written to a temporary
+    name and moved into place with ``os.replace``, so several Streamlit
+    worker processes can share one directory without ever reading a
+    partial file. A disk hit refreshes the file's mtime, and when the
+    directory grows past ``max_bytes`` the least recently used files are
+    removed, whichever process wrote them.
+    """
+    
+    def __init__(self, directory: str, max_bytes: int = 100 * 1024 * 1024,
+                 memory_bytes: int = 16 * 1024 * 1024, extension: str = 'mp3',
+                 metrics: LatencyTracker = None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.memory_bytes = memory_bytes
+        self.extension = extension
+        self.metrics = metrics
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        self._memory_size = 0
+        self._counts = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'writes': 0, 'evictions': 0}
+        os.makedirs(directory, exist_ok=True)
+        self._disk_size = self._scan_size()
+    
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.{self.extension}")
+    
+    def _files(self):
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if name.endswith(f".{self.extension}"):
+                    yield os.path.join(root, name)
+    
+    def _scan_size(self):
+        total = 0
+        for path in self._files():
+            try:
+                total += os.path.getsize(path)
+            except OSError:
+                pass
+        return total
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """Cached audio for ``key``, or None."""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self._counts['memory_hits'] += 1
+        path = self._path(key)
+        if data is not None:
+            # Keep the file recent too, or evict() would delete the hottest entries first
+            try:
+                os.utime(path)
+            except OSError:
+                pass  # Evicted by another process; the memory copy is still good
+            return data
+            
+            
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            data = None
+        except OSError as e:
+            logger.error(f"TTS cache read failed: {e}")
+            data = None
+            
+        with self._lock:
+            if data is None:
+                self._counts['misses'] += 1
+                return None
+            self._counts['disk_hits'] += 1
+            self._remember(key, data)
+        return data
+    
+    def put(self, key: str, data: bytes):
+        """Store ``data`` in memory and atomically on disk."""
+        with self._lock:
+            self._remember(key, data)
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                # Another process may have cached the same sentence already
+                try:
+                    replaced = os.stat(path).st_size
+                except FileNotFoundError:
+                    replaced = 0
+                os.replace(temp_path, path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            logger.error(f"TTS cache write failed: {e}")
+            return
+            
+        with self._lock:
+            self._counts['writes'] += 1
+            self._disk_size += len(data) - replaced
+            over_limit = self._disk_size > self.max_bytes
+        if over_limit:
+            self.evict()
+    
+    def get_or_create(self, text: str, synthesize: Callable, language: str = 'ko',
+                      voice: str = None, speed: float = 1.0) -> Optional[bytes]:
+        """Cached audio for ``text``, calling ``synthesize(text)`` on a miss.
+        
+        A None result (speech unavailable) is returned but not cached.
+        """
+        start = time.perf_counter()
+        key = cache_key(text, language, voice, speed)
+        data = self.get(key)
+        if data is not None:
+            if self.metrics is not None:
+                self.metrics.record('tts_cache.hit', time.perf_counter() - start)
+            return data
+        data = synthesize(text)
+        if data is not None:
+            self.put(key, data)
+        return data
+    
+    def _remember(self, key, data):
+        # Caller holds the lock
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_size -= len(previous)
+        if len(data) > self.memory_bytes:
+            return
+        self._memory[key] = data
+        self._memory_size += len(data)
+        while self._memory_size > self.memory_bytes:
+            _, dropped = self._memory.popitem(last=False)
+            self._memory_size -= len(dropped)
+    
+    def evict(self):
+        """Remove least recently used files until the directory fits ``max_bytes``."""
+        entries = []
+        for path in self._files():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                evicted += 1
+            except FileNotFoundError:
+                pass  # Another process evicted it first
+            except OSError as e:
+                logger.error(f"TTS cache eviction failed: {e}")
+                continue
+            total -= size
+        with self._lock:
+            self._disk_size = total
+            self._counts['evictions'] += evicted
+    
+    def stats(self) -> Dict:
+        """Hit/miss counts, hit rate and current memory/disk usage."""
+        with self._lock:
+            stats = dict(self._counts)
+            stats['memory_bytes'] = self._memory_size
+            stats['memory_entries'] = len(self._memory)
+            stats['disk_bytes'] = self._disk_size
+        lookups = stats['memory_hits'] + stats['disk_hits'] + stats['misses']
+        stats['hit_rate'] = (stats['memory_hits'] + stats['disk_hits']) / lookups if lookups else 0.0
+        return stats
+    
+    def clear(self):
+        """Delete every cached entry from memory and disk."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+        for path in list(self._files()):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        with self._lock:
+            self._disk_size = 0
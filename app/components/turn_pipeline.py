@@ -0,0 +1,104 @@
+"""
+One conversation turn as a small graph of stages, each run exactly once
+"""
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict
+
+from .metrics import LatencyTracker
+
+logger = logging.getLogger(__name__)
+
+
+class TurnPipeline:
+    """Analyze, answer, store and speak one user message.
+
+    Stage dependencies::
+
+        sentiment ──> generate ──> speak
+        mbti ─────────────┴──────> persist
+
+    ``analyze(text)`` runs once and its result is handed to
+    ``generate(text, sentiment)``, so the sentiment model never runs twice
+    per turn. ``estimate(text)`` overlaps with sentiment analysis and
+    generation on a worker thread, and ``persist(session_id, text, response,
+    sentiment, mbti)`` overlaps with ``speak(response)``. Stages that touch the UI
+    (generate, speak, ``on_response``) run on the calling thread.
+    Timings are returned in milliseconds and, with a LatencyTracker,
+    recorded under ``turn.<stage>``.
+    """
+
+    def __init__(self, analyze: Callable, estimate: Callable, generate: Callable = None,
+                 persist: Callable = None, executor: ThreadPoolExecutor = None,
+                 metrics: LatencyTracker = None):
+        self.analyze = analyze
+        self.estimate = estimate
+        self.generate = generate
+        self.persist = persist
+        self.metrics = metrics
+        self._executor = executor or ThreadPoolExecutor(max_workers=2, thread_name_prefix="turn")
+
+    def run(self, text: str, session_id: str = None, speak: Callable = None,
+            on_response: Callable = None, on_token: Callable = None) -> Dict:
+        """Run every stage for ``text`` and return the results with per-stage timings.
+
+        ``on_token`` is passed on as ``generate(text, sentiment, on_token)``
+        so a streaming generator can render the answer while it is produced.
+        ``on_response(result)`` is called as soon as the response exists,
+        before persistence and speech, e.g. to show it in the UI.
+        """
+        start = time.perf_counter()
+        timings = {}
+        mbti_future = self._executor.submit(self._timed, timings, 'mbti', self.estimate, text)
+        sentiment = self._timed(timings, 'sentiment', self.analyze, text)
+
+        response = None
+        if self.generate is not None:
+            args = (text, sentiment) if on_token is None else (text, sentiment, on_token)
+            response = self._timed(timings, 'generate', self.generate, *args)
+        result = {
+            'session_id': session_id,
+            'text': text,
+            'sentiment': sentiment,
+            'mbti': mbti_future.result(),
+            'response': response,
+            'timings': timings
+        }
+        if on_response is not None:
+            on_response(result)
+
+        persist_future = None
+        if self.persist is not None and response is not None:
+            persist_future = self._executor.submit(self._persist, result)
+        if speak is not None and response:
+            self._timed(timings, 'speak', speak, response)
+        if persist_future is not None:
+            persist_future.result()
+
+        timings['total'] = (time.perf_counter() - start) * 1000
+        if self.metrics is not None:
+            self.metrics.record('turn.total', timings['total'] / 1000)
+        return result
+
+    def _persist(self, result):
+        try:
+            self._timed(result['timings'], 'persist', self.persist, result['session_id'],
+                        result['text'], result['response'], result['sentiment'], result['mbti'])
+        except Exception as e:
+            # A failed write must not lose the answer the user already sees
+            logger.error(f"Failed to persist turn: {e}")
+
+    def _timed(self, timings, stage, func, *args):
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            timings[stage] = elapsed * 1000
+            if self.metrics is not None:
+                self.metrics.record(f"turn.{stage}", elapsed)
+
+    def close(self):
+        """Stop the worker threads."""
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,146 @@
+"""
+Streaming energy-based voice activity detection for ending recordings early
+"""
+import math
+
+import numpy as np
+
+
+class EnergyVAD:
+    """Frame-level speech/silence detector fed block by block from the audio callback.
+
+    The first ``calibration_ms`` of audio only seed the noise floor. After
+    that a frame counts as speech when its RMS energy rises well above the
+    adaptive noise floor. High zero-crossing frames (hiss, fan noise) need
+    twice the energy to count, which keeps broadband noise from triggering.
+    Capture is finished after ``silence_ms`` of trailing silence following
+    speech, or once ``max_duration`` seconds have been processed.
+    """
+    
+    def __init__(self, sample_rate, frame_ms=30, threshold_ratio=3.0, min_rms=0.01,
+                 max_zcr=0.35, silence_ms=800, min_speech_ms=120, max_duration=None,
+                 noise_alpha=0.05, calibration_ms=150):
+        self.sample_rate = sample_rate
+        self.frame_ms = frame_ms
+        self.frame_length = max(1, int(sample_rate * frame_ms / 1000))
+        self.threshold_ratio = threshold_ratio
+        self.min_rms = min_rms
+        self.max_zcr = max_zcr
+        self.noise_alpha = noise_alpha
+        self.silence_frames = max(1, math.ceil(silence_ms / frame_ms))
+        self.min_speech_frames = max(1, math.ceil(min_speech_ms / frame_ms))
+        self.calibration_frames = math.ceil(calibration_ms / frame_ms)
+        self.max_frames = int(max_duration * 1000 / frame_ms) if max_duration else None
+        # Partial frame carried over between callback blocks
+        self._pending = np.zeros(self.frame_length, dtype=np.float32)
+        self.reset()
+    
+    def reset(self):
+        """Forget the noise floor and speech state before a new recording."""
+        self._pending_count = 0
+        self.noise_floor = None
+        self.frames_processed = 0
+        self.speech_run = 0
+        self.silence_run = 0
+        self.speech_started = False
+        self.speech_start_frame = None
+        self.finished = False
+        self.stop_reason = None
+    
+    @property
+    def elapsed(self):
+        """Seconds of audio processed so far."""
+        return self.frames_processed * self.frame_length / self.sample_rate
+    
+    @property
+    def speech_start_time(self):
+        """Offset in seconds where speech was first detected, or None."""
+        if self.speech_start_frame is None:
+            return None
+        return self.speech_start_frame * self.frame_length / self.sample_rate
+    
+    def threshold(self):
+        """Current RMS level a frame has to exceed to count as speech."""
+        floor = self.noise_floor if self.noise_floor is not None else 0.0
+        return max(self.min_rms, floor * self.threshold_ratio)
+    
+    def process(self, block):
+        """Feed a block of samples; returns True once capture should stop."""
+        if self.finished:
+            return True
+            
+        block = np.asarray(block, dtype=np.float32)
+        if block.ndim > 1:
+            block = block.mean(axis=1) if block.shape[1] > 1 else block[:, 0]
+            
+        # Complete the frame left over from the previous block first
+        if self._pending_count:
+            take = min(len(block), self.frame_length - self._pending_count)
+            self._pending[self._pending_count:self._pending_count + take] = block[:take]
+            self._pending_count += take
+            block = block[take:]
+            if self._pending_count < self.frame_length:
+                return False
+            self._pending_count = 0
+            self._process_frames(self._pending.reshape(1, -1))
+            if self.finished:
+                return True
+                
+        whole = len(block) // self.frame_length * self.frame_length
+        if whole:
+            self._process_frames(block[:whole].reshape(-1, self.frame_length))
+            
+        rest = len(block) - whole
+        if rest and not self.finished:
+            self._pending[:rest] = block[whole:]
+            self._pending_count = rest
+        return self.finished
+    
+    def _process_frames(self, frames):
+        """Run the speech/silence state machine over whole frames."""
+        rms = np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+        signs = np.signbit(frames)
+        zcr = np.mean(signs[:, 1:] != signs[:, :-1], axis=1)
+        
+        for frame_rms, frame_zcr in zip(rms.tolist(), zcr.tolist()):
+            self.frames_processed += 1
+            if self.frames_processed <= self.calibration_frames or self.noise_floor is None:
+                # Running mean of the leading frames seeds the noise floor
+                floor = self.noise_floor or 0.0
+                self.noise_floor = floor + (frame_rms - floor) / self.frames_processed
+                if self._reached_max_duration():
+                    return
+                continue
+                
+            threshold = self.threshold()
+            if frame_zcr > self.max_zcr:
+                threshold *= 2
+            is_speech = frame_rms > threshold
+            
+            if is_speech:
+                self.speech_run += 1
+                self.silence_run = 0
+                if not self.speech_started and self.speech_run >= self.min_speech_frames:
+                    self.speech_started = True
+                    self.speech_start_frame = self.frames_processed - self.speech_run
+            else:
+                self.speech_run = 0
+                self.silence_run += 1
+                # Only non-speech frames move the noise floor
+                self.noise_floor += self.noise_alpha * (frame_rms - self.noise_floor)
+                
+            if self.speech_started and self.silence_run >= self.silence_frames:
+                self._finish('silence')
+                return
+            if self._reached_max_duration():
+                return
+    
+    def _reached_max_duration(self):
+        if self.max_frames is not None and self.frames_processed >= self.max_frames:
+            self._finish('max_duration')
+            return True
+        return False
+    
+    def _finish(self, reason):
+        self.finished = True
+        self.stop_reason = reason
@@ -1,71 +1,185 @@
 """
 Simple voice recorder for audio capture
 """
-import sounddevice as sd
 import numpy as np
-import wave
 import tempfile
 import os
 import logging
+import threading
+import time
+
+from .audio_buffer import AudioRingBuffer
+from .audio_clip import AudioClip
+from .audio_sources import MicrophoneSource
+from .resampler import StreamingResampler
 
 logger = logging.getLogger(__name__)
 
 class VoiceRecorder:
-    def __init__(self, sample_rate=44100, channels=1):
+    def __init__(self, sample_rate=44100, channels=1, max_duration=30, vad=None,
+                 target_sample_rate=None, source=None):
+        # Any AudioSource (file replay, synthetic) can stand in for the
+        # microphone; its format overrides sample_rate and channels
+        if source is not None:
+            sample_rate = source.sample_rate
+            channels = source.channels
+        self.source = source or MicrophoneSource(sample_rate, channels)
         self.sample_rate = sample_rate
         self.channels = channels
+        self.max_duration = max_duration
         self.recording = False
-        self.recorded_frames = []
+        self.input_overflows = 0
+        
+        # With a target rate the stream is downmixed to mono and resampled
+        # in the callback, so only ASR-sized audio is ever stored
+        self.resampler = None
+        self.output_rate = sample_rate
+        self.output_channels = channels
+        if target_sample_rate:
+            self.resampler = StreamingResampler(sample_rate, target_sample_rate)
+            self.output_rate = target_sample_rate
+            self.output_channels = 1
+            
+        # Sized for the longest recording so the callback never allocates
+        self.buffer = AudioRingBuffer(self.output_rate * max_duration, self.output_channels)
+        # Optional EnergyVAD that ends the capture after trailing silence
+        self.vad = vad
+        self.speech_started = threading.Event()
+        self.capture_done = threading.Event()
 
     def callback(self, indata, frames, time, status):
         """Audio callback function."""
         if status:
             logger.error(f'Recording error: {status}')
-        self.recorded_frames.append(indata.copy())
+            if status.input_overflow:
+                self.input_overflows += 1
+        if self.capture_done.is_set():
+            return
+        self._consume(indata)
+
+    def _consume(self, indata):
+        """Store a block of captured audio and feed it to the VAD."""
+        if self.resampler is not None:
+            mono = indata.mean(axis=1) if indata.shape[1] > 1 else indata[:, 0]
+            indata = self.resampler.process(mono).reshape(-1, 1)
+        self.buffer.write(indata)
+        
+        if self.vad is None:
+            return
+        if self.vad.process(indata):
+            logger.info(f"Capture ended by VAD ({self.vad.stop_reason}) "
+                        f"after {self.vad.elapsed:.2f}s")
+            self.capture_done.set()
+        if self.vad.speech_started and not self.speech_started.is_set():
+            self.speech_started.set()
+
+    @property
+    def overrun_count(self):
+        """Blocks that lost samples, in the device or in the full buffer."""
+        return self.input_overflows + self.buffer.overrun_count
+
+    @property
+    def underrun_count(self):
+        """Reads that asked for more samples than had been captured."""
+        return self.buffer.underrun_count
+
+    def wait_for_speech_end(self, timeout=None):
+        """Block until the VAD ends the capture; False if the timeout expires first."""
+        return self.capture_done.wait(timeout)
+
+    def get_audio(self):
+        """Zero-copy view of the samples captured so far.
+        
+        The view is read-only and only valid until the next start_recording.
+        It is a copy instead if stream_chunks let the buffer wrap around.
+        """
+        return self.buffer.view()
+
+    def stream_chunks(self, chunk_ms=100, max_seconds=None, idle_timeout=1.0, poll_interval=0.01):
+        """Yield captured audio in ``chunk_ms`` pieces while the recording runs.
+        
+        Ends when the VAD finishes the capture, recording stops,
+        ``max_seconds`` of audio have been captured or no audio arrives for
+        ``idle_timeout`` seconds. Each chunk is a float32 copy at output_rate.
+        Chunks are consumed from the ring buffer, so their space is free for
+        the callback again and a capture read this way is not cut off at
+        ``max_duration`` (``get_audio`` then holds only the latest part).
+        """
+        chunk_frames = max(1, int(self.output_rate * chunk_ms / 1000))
+        max_frames = int(self.output_rate * max_seconds) if max_seconds else None
+        last_audio = time.monotonic()
+        
+        while True:
+            done = self.capture_done.is_set() or not self.recording
+            end = self.buffer.write_pos
+            if max_frames is not None and end >= max_frames:
+                end = max_frames
+                done = True
+                
+            pending = end - self.buffer.read_pos
+            if pending >= chunk_frames or (done and pending > 0):
+                last_audio = time.monotonic()
+                yield self.buffer.read(pending)
+                continue
+                
+            if done:
+                return
+            if time.monotonic() - last_audio > idle_timeout:
+                logger.warning(f"No audio received for {idle_timeout}s, ending stream")
+                return
+            time.sleep(poll_interval)
 
     def start_recording(self):
         """Start recording."""
         try:
             self.recording = True
-            self.recorded_frames = []
+            self.input_overflows = 0
+            self.buffer.reset()
+            self.speech_started.clear()
+            self.capture_done.clear()
+            if self.resampler is not None:
+                self.resampler.reset()
+            if self.vad is not None:
+                self.vad.reset()
                     
-            self.stream = sd.InputStream(
-                samplerate=self.sample_rate,
-                channels=self.channels,
-                callback=self.callback
-            )
-            self.stream.start()
+            # A finite source ending counts as the end of the capture
+            self.source.start(self.callback, finished_callback=self.capture_done.set)
             logger.info("Recording started")
         except Exception as e:
             logger.error(f"Failed to start recording: {str(e)}")
             self.recording = False
             raise
 
-    def stop_recording(self):
-        """Stop recording and return file path."""
+    def stop_recording(self, as_file=False):
+        """Stop recording and return the captured AudioClip.
+        
+        With ``as_file=True`` the clip is also written to a temporary WAV
+        file and its path is returned instead (useful for debugging).
+        """
         try:
-            if hasattr(self, 'stream') and self.stream:
-                self.stream.stop()
-                self.stream.close()
+            self.source.stop()
             self.recording = False
-            
-            if not self.recorded_frames:
+            if self.resampler is not None:
+                # Samples still held back by the resampling filter delay
+                self.buffer.write(self.resampler.flush().reshape(-1, 1))
+                
+            samples = self.get_audio()
+            if not len(samples):
                 logger.warning("No audio frames recorded")
                 return None
-            
+            if self.overrun_count:
+                logger.warning(f"Recording lost samples: {self.overrun_count} overruns, "
+                               f"{self.buffer.dropped_frames} frames dropped")
+                
+            clip = AudioClip(samples, self.output_rate, self.output_channels)
+            if not as_file:
+                logger.info(f"Recording captured: {clip.duration:.2f}s")
+                return clip
+                
             # Create WAV file
             with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_wav:
                 temp_path = temp_wav.name
-                
-            with wave.open(temp_path, 'wb') as wf:
-                wf.setnchannels(self.channels)
-                wf.setsampwidth(2)  # 16-bit audio
-                wf.setframerate(self.sample_rate)
-                
-                # Convert and write audio data
-                for frame in self.recorded_frames:
-                    audio_data = (frame * 32767).astype(np.int16)
-                    wf.writeframes(audio_data.tobytes())
+            clip.save_wav(temp_path)
             
             logger.info(f"Recording saved to: {temp_path}")
             return temp_path
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+음성 인식 백엔드 지연 시간 벤치마크
+
+사용법:
+    python benchmarks/bench_asr_backends.py               # stub 백엔드 (오프라인)
+    python benchmarks/bench_asr_backends.py stub google   # 네트워크 필요
+    python benchmarks/bench_asr_backends.py local         # faster-whisper 필요
+"""
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import speech_recognition as sr
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app'))
+
+import config
+from components.asr import create_recognizer
+from components.metrics import LatencyTracker
+
+SAMPLE_RATE = 16000
+TURNS = 20
+CONCURRENCY = 4  # 동시에 요청하는 사용자 수 (부하 테스트)
+STUB_LATENCY = 0.05  # 네트워크 왕복과 비슷한 고정 지연
+
+
+def make_audio():
+    """1.5초 길이의 합성 음성 AudioData"""
+    t = np.arange(int(1.5 * SAMPLE_RATE)) / SAMPLE_RATE
+    pcm = (0.2 * np.sin(2 * np.pi * 220 * t) * 32767).astype('<i2')
+    return sr.AudioData(pcm.tobytes(), SAMPLE_RATE, 2)
+
+
+def run(backend_name, audio, metrics):
+    backend = create_recognizer(backend_name, language=config.ASR_LANGUAGE, metrics=metrics,
+                                local_model=config.ASR_LOCAL_MODEL, stub_latency=STUB_LATENCY)
+    
+    def turn(_):
+        try:
+            backend.recognize(audio)
+            return True
+        except (sr.UnknownValueError, sr.RequestError, RuntimeError):
+            return False
+            
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as executor:
+        results = list(executor.map(turn, range(TURNS)))
+    return time.perf_counter() - start, sum(results)
+
+
+def main():
+    backends = sys.argv[1:] or ['stub']
+    print("🔌 음성 인식 백엔드 벤치마크")
+    print("=" * 60)
+    print(f"📊 {TURNS}턴, 동시 요청 {CONCURRENCY}개\n")
+    
+    audio = make_audio()
+    metrics = LatencyTracker()
+    for backend_name in backends:
+        elapsed, succeeded = run(backend_name, audio, metrics)
+        summary = metrics.summary(f"asr.{backend_name}")
+        print(f"  {backend_name:<8} 평균 {summary['mean_ms']:7.1f} ms  p95 {summary['p95_ms']:7.1f} ms  "
+              f"처리량 {TURNS / elapsed:6.1f} 턴/s  성공 {succeeded}/{TURNS}")
+        
+    print("\n🎉 벤치마크 완료!")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+인식 전송용 오디오 압축 벤치마크 (크기, 인코딩 시간, 느린 업링크 전송 시간)
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app'))
+
+from components.audio_clip import AudioClip
+from components.audio_encoding import AudioEncoder, opus_supported
+from components.resampler import resample
+
+CAPTURE_RATE = 44100
+TARGET_RATE = 16000
+CLIP_SECONDS = 5.0
+UPLINKS_KBPS = (256, 1000)  # 제한된 업링크 속도
+REPEATS = 5
+
+
+def make_speech_like(seconds, sample_rate):
+    """음절처럼 진폭이 변하는 배음 신호 + 약한 잡음"""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    envelope = np.clip(np.sin(2 * np.pi * 2.5 * t), 0, None)
+    voice = sum(np.sin(2 * np.pi * 140 * k * t) / k for k in range(1, 8))
+    samples = 0.25 * envelope * voice + 0.002 * rng.standard_normal(len(t))
+    return samples.astype(np.float32)
+
+
+def timed(func):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        result = func()
+    return result, (time.perf_counter() - start) / REPEATS * 1000
+
+
+def main():
+    print("🗜️ 인식 전송용 오디오 압축 벤치마크")
+    print("=" * 60)
+    print(f"📊 {CLIP_SECONDS:.0f}초 클립, 업링크 {' / '.join(f'{k} kbps' for k in UPLINKS_KBPS)}\n")
+    
+    capture = make_speech_like(CLIP_SECONDS, CAPTURE_RATE)
+    clip = AudioClip(resample(capture, CAPTURE_RATE, TARGET_RATE), TARGET_RATE, 1)
+    rows = [
+        ("PCM 44.1kHz", len(AudioClip(capture, CAPTURE_RATE, 1).to_pcm16_bytes()), 0.0),
+        ("PCM 16kHz", len(clip.to_pcm16_bytes()), 0.0)
+    ]
+    # speech_recognition 기본 경로: WAV를 flac 실행 파일로 파이프
+    flac_data, ms = timed(lambda: clip.to_audio_data().get_flac_data(convert_width=2))
+    rows.append(("FLAC (sr 기본)", len(flac_data), ms))
+    for level in (0, 5, 8):
+        (payload, _), ms = timed(lambda: AudioEncoder('flac', level=level).encode(clip))
+        rows.append((f"FLAC level {level}", len(payload), ms))
+    if opus_supported(TARGET_RATE):
+        (payload, _), ms = timed(lambda: AudioEncoder('opus').encode(clip))
+        rows.append(("Opus", len(payload), ms))
+    else:
+        print("ℹ️ Opus 미지원 환경 (soundfile + libsndfile Opus 필요) - 건너뜀\n")
+        
+    print(f"  {'형식':<16}{'크기':>10}{'인코딩':>11}" + ''.join(f"{f'{k}k 전송':>11}" for k in UPLINKS_KBPS))
+    for label, size, ms in rows:
+        transfers = ''.join(f"{size * 8 / (kbps * 1000) * 1000:9.0f}ms" for kbps in UPLINKS_KBPS)
+        print(f"  {label:<16}{size / 1024:8.1f}KB{ms:9.1f}ms{transfers}")
+        
+    encoder = AudioEncoder('flac', streaming=True)
+    stream = encoder.open_stream(TARGET_RATE)
+    block = TARGET_RATE // 10
+    for start in range(0, clip.num_frames, block):
+        stream.write(clip.samples[start:start + block])
+    _, report = stream.finish()
+    print(f"\n🌊 스트리밍 모드: 녹음 중 인코딩, 말이 끝난 뒤 남은 작업 포함 총 {report['encode_ms']:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
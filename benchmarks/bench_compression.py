@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+AI 응답 압축 저장 벤치마크 - 데이터베이스 크기 및 조회 지연 시간 비교
+"""
+import os
+import sys
+import time
+import random
+import tempfile
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from components.database import ConversationDB, zstandard
+
+SESSIONS = 50
+TURNS_PER_SESSION = 40
+
+PHRASES = [
+    "와, 정말 멋진 생각이에요!", "함께라면 뭐든지 할 수 있어요!",
+    "오늘 하루는 어떠셨나요?", "새로운 가능성이 가득하네요!",
+    "그 기분 충분히 이해해요.", "조금 쉬어가도 괜찮아요.",
+    "우리 같이 계획을 세워볼까요?", "상상만 해도 설레요!",
+]
+
+
+def make_response(rng):
+    """phi4 응답과 비슷한 길이의 한국어 문장 생성"""
+    return " ".join(rng.choice(PHRASES) for _ in range(rng.randint(15, 40)))
+
+
+def run_case(label, temp_dir, responses, **db_kwargs):
+    """한 가지 저장 방식에 대해 크기와 조회 시간 측정"""
+    db_path = os.path.join(temp_dir, f"{label}.db")
+    db = ConversationDB(db_path, **db_kwargs)
+    
+    rows = [{'session_id': f"session-{i % SESSIONS}", 'user_input': "안녕!",
+             'ai_response': response, 'sentiment': "긍정적", 'mbti': "ENFP"}
+            for i, response in enumerate(responses)]
+    db.import_conversations(rows)
+    
+    start = time.perf_counter()
+    for i in range(SESSIONS):
+        db.get_conversation_history(f"session-{i}", limit=TURNS_PER_SESSION)
+    read_ms = (time.perf_counter() - start) * 1000 / SESSIONS
+    
+    size_kb = os.path.getsize(db_path) / 1024
+    print(f"  {label:<12} DB 크기: {size_kb:8.1f} KB   세션 조회: {read_ms:6.2f} ms")
+    return db
+
+
+def main():
+    print("🗜️ AI 응답 압축 저장 벤치마크")
+    print("=" * 60)
+    
+    rng = random.Random(42)
+    responses = [make_response(rng) for _ in range(SESSIONS * TURNS_PER_SESSION)]
+    raw_mb = sum(len(r.encode('utf-8')) for r in responses) / 1024 / 1024
+    print(f"📊 응답 {len(responses)}개, 원본 텍스트 {raw_mb:.2f} MB\n")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        plain = run_case("plain", temp_dir, responses)
+        run_case("zlib", temp_dir, responses, compress_responses=True)
+        
+        if zstandard is not None:
+            run_case("zstd", temp_dir, responses,
+                     compress_responses=True, compression="zstd")
+                     
+            dict_path = os.path.join(temp_dir, "responses.dict")
+            plain.train_zstd_dictionary(dict_path)
+            run_case("zstd+dict", temp_dir, responses, compress_responses=True,
+                     compression="zstd", zstd_dict_path=dict_path)
+        else:
+            print("  ⚠️ zstandard 미설치 - zstd 측정 건너뜀")
+            
+    print("\n🎉 벤치마크 완료!")
+
+
+if __name__ == '__main__':
+    main()
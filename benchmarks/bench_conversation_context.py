@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+멀티턴 대화의 턴당 프롬프트 처리(prefill) 토큰/시간 벤치마크
+
+사용법:
+    python benchmarks/bench_conversation_context.py            # 프롬프트 캐시 시뮬레이션 (Ollama 불필요)
+    python benchmarks/bench_conversation_context.py --ollama   # 로컬 Ollama 서버의 실제 prompt_eval 측정
+"""
+import os
+import sys
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app'))
+
+import config
+from components.conversation import ConversationContext, estimate_tokens
+from components.llm import OllamaGenerator, SYSTEM_PROMPT, build_prompt, build_user_message
+
+TURNS = 40
+OLLAMA_TURNS = 8
+PREFILL_TOKENS_PER_SEC = 60  # CPU에서 phi4 프롬프트 처리 속도 (대략)
+SENTIMENTS = ["긍정", "중립", "부정"]
+
+
+def user_text(index):
+    return f"{index}번째 이야기예요. 오늘 친구랑 새로운 프로젝트 아이디어를 이야기했는데 정말 신났어요!"
+
+
+def answer(index):
+    return (f"와, 정말 멋져요! {index}번째 이야기도 너무 흥미진진해요! 어떤 아이디어였는지 "
+            f"더 자세히 들려줄래요? 저도 같이 상상해 보고 싶어요!")
+
+
+def common_prefix(cached, messages):
+    common = 0
+    while common < min(len(cached), len(messages)) and cached[common] == messages[common]:
+        common += 1
+    return common
+
+
+def simulate(label, build):
+    """턴마다 새로 처리해야 하는 토큰 수 (직전 요청과 같은 앞부분은 캐시 재사용)"""
+    cached = []
+    prefills = []
+    for index in range(TURNS):
+        messages, remember = build(index)
+        common = common_prefix(cached, messages)
+        prefills.append(ConversationContext._tokens(messages[common:]))
+        cached = messages + [{'role': 'assistant', 'content': answer(index)}]
+        remember(answer(index))
+    ordered = sorted(prefills)
+    print(f"  {label:<34} 평균 {sum(prefills) / TURNS:6.0f}  p95 {ordered[int(TURNS * 0.95) - 1]:6.0f}  "
+          f"최대 {max(prefills):6.0f} 토큰  (평균 약 {sum(prefills) / TURNS / PREFILL_TOKENS_PER_SEC:5.1f}초)")
+
+
+def single_turn(index):
+    """기존: 기록 없이 감정이 들어간 단일 프롬프트"""
+    prompt = build_prompt(user_text(index), SENTIMENTS[index % 3])
+    return [{'role': 'user', 'content': prompt}], lambda response: None
+
+
+def naive_history():
+    """기록을 매번 프롬프트 하나로 다시 만듦 (감정이 앞부분에 있어 캐시 재사용 불가)"""
+    history = []
+    
+    def build(index):
+        lines = [f"사용자: {u}\nAI: {a}" for u, a in history[-12:]]
+        prompt = build_prompt("\n".join(lines + [user_text(index)]), SENTIMENTS[index % 3])
+        return [{'role': 'user', 'content': prompt}], lambda response: history.append((user_text(index), response))
+    return build
+
+
+def chat_context(trim_to):
+    context = ConversationContext(SYSTEM_PROMPT, max_tokens=config.LLM_CONTEXT_MAX_TOKENS, trim_to=trim_to)
+    
+    def build(index):
+        message = build_user_message(user_text(index), SENTIMENTS[index % 3])
+        return context.messages(message), lambda response: context.add_turn(message, response)
+    return build
+
+
+def measure_ollama():
+    generator = OllamaGenerator(config.OLLAMA_MODEL, options={"num_ctx": config.LLM_CONTEXT_WINDOW,
+                                                              "num_predict": 60},
+                                keep_alive=config.OLLAMA_KEEP_ALIVE)
+    context = ConversationContext(SYSTEM_PROMPT, max_tokens=config.LLM_CONTEXT_MAX_TOKENS)
+    print(f"  {'턴':>3} {'맥락(추정)':>10} {'처리 토큰':>9} {'처리 시간':>10} {'첫 토큰':>9}")
+    for index in range(OLLAMA_TURNS):
+        message = build_user_message(user_text(index), SENTIMENTS[index % 3])
+        response, stats = generator.chat(context.messages(message))
+        context.add_turn(message, response)
+        prefill = f"{stats['prompt_eval_ms']:.0f} ms" if stats['prompt_eval_ms'] is not None else "N/A"
+        print(f"  {index + 1:>3} {context.tokens():>10} {stats['prompt_tokens'] or 0:>9} {prefill:>10} "
+              f"{stats['ttft_ms'] or 0:>7.0f} ms")
+
+
+def main():
+    print("📜 대화 맥락 프롬프트 처리 벤치마크")
+    print("=" * 60)
+    
+    if '--ollama' in sys.argv:
+        print(f"📊 Ollama {config.OLLAMA_MODEL}, {OLLAMA_TURNS}턴 (chat + 고정 시스템 프롬프트)\n")
+        measure_ollama()
+    else:
+        print(f"📊 {TURNS}턴, 프롬프트 한도 {config.LLM_CONTEXT_MAX_TOKENS} 토큰 "
+              f"(추정: 한글 1글자 = 1토큰), 처리 속도 {PREFILL_TOKENS_PER_SEC} 토큰/초 가정\n")
+        print(f"  시스템 프롬프트 {estimate_tokens(SYSTEM_PROMPT)} 토큰")
+        simulate("단일 턴 (기록 없음, 기존)", single_turn)
+        simulate("최근 12턴을 프롬프트에 다시 작성", naive_history())
+        simulate("chat 기록 + 캐시 재사용 (한도의 90%까지 정리)", chat_context(0.9))
+        simulate(f"chat 기록 + 캐시 재사용 (한도의 {config.LLM_CONTEXT_TRIM_TO:.0%}까지 정리)",
+                 chat_context(config.LLM_CONTEXT_TRIM_TO))
+        
+    print("\n🎉 벤치마크 완료!")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+응답 생성 체감 지연 벤치마크 (완성 후 표시 vs 토큰 스트리밍)
+
+사용법:
+    python benchmarks/bench_llm_streaming.py            # CPU phi4를 흉내 낸 대역 서버
+    python benchmarks/bench_llm_streaming.py --ollama   # 로컬 Ollama 서버 (config.OLLAMA_MODEL)
+"""
+import os
+import sys
+import time
+
+# 프로젝트 경로 추가
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(ROOT, 'app'))
+sys.path.insert(0, ROOT)
+
+import config
+from components.llm import OllamaGenerator, build_prompt
+
+PROMPT_SECONDS = 1.5  # 프롬프트 처리 시간 (첫 토큰까지)
+TOKENS_PER_SEC = 12.0  # CPU에서의 생성 속도
+RESPONSE_TOKENS = 40
+TURNS = 2
+
+
+class SimulatedOllama:
+    """CPU에서 실행되는 Ollama의 generate 응답 시간을 흉내 내는 대역"""
+
+    def _stream(self):
+        time.sleep(PROMPT_SECONDS)
+        for index in range(RESPONSE_TOKENS):
+            time.sleep(1 / TOKENS_PER_SEC)
+            yield {'response': f"토큰{index} ", 'done': False}
+        yield {'response': '', 'done': True, 'eval_count': RESPONSE_TOKENS,
+               'eval_duration': int(RESPONSE_TOKENS / TOKENS_PER_SEC * 1e9)}
+    
+    def generate(self, model, prompt, options=None, stream=False):
+        if stream:
+            return self._stream()
+        chunks = list(self._stream())
+        return dict(chunks[-1], response=''.join(chunk['response'] for chunk in chunks))
+
+
+def main():
+    use_ollama = '--ollama' in sys.argv
+    client = None if use_ollama else SimulatedOllama()
+    print("🤖 응답 생성 체감 지연 벤치마크")
+    print("=" * 60)
+    if use_ollama:
+        print(f"📊 로컬 Ollama: {config.OLLAMA_MODEL}\n")
+    else:
+        print(f"📊 대역 서버: 프롬프트 처리 {PROMPT_SECONDS}s, {TOKENS_PER_SEC:g} 토큰/초, "
+              f"응답 {RESPONSE_TOKENS} 토큰\n")
+        
+    prompt = build_prompt("오늘 날씨가 좋아서 산책하고 왔어!", "POSITIVE")
+    options = {"max_tokens": config.MAX_TOKENS, "temperature": config.TEMPERATURE}
+    for streaming in (False, True):
+        generator = OllamaGenerator(config.OLLAMA_MODEL, options=options, streaming=streaming,
+                                    client=client)
+        results = [generator.generate(prompt)[1] for _ in range(TURNS)]
+        ttft = sum(stats['ttft_ms'] for stats in results) / TURNS
+        total = sum(stats['total_ms'] for stats in results) / TURNS
+        tps = sum(stats['tokens_per_sec'] for stats in results) / TURNS
+        label = "토큰 스트리밍" if streaming else "완성 후 표시"
+        print(f"  {label:<8}: 첫 글자 표시 {ttft:7.0f} ms, 완료 {total:7.0f} ms, {tps:5.1f} 토큰/초")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Ollama 첫 응답 대기 시간 벤치마크 (모델 미리 불러오기 / 유지 요청 / 연결 재사용)
+
+사용법:
+    python benchmarks/bench_ollama_client.py            # 로컬 대역 서버 (Ollama 불필요)
+    python benchmarks/bench_ollama_client.py --ollama   # 로컬 Ollama 서버 (config.OLLAMA_MODEL)
+"""
+import os
+import sys
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import ollama
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app'))
+
+import config
+from components.llm import OllamaGenerator, OllamaService
+
+LOAD_SECONDS = 1.0  # 대역 서버의 모델 로딩 시간 (phi4는 수 초)
+KEEP_ALIVE = 1  # 대역 서버에서 모델을 유지하는 시간 (seconds)
+IDLE_SECONDS = 1.5  # 턴 사이 쉬는 시간 (KEEP_ALIVE보다 길게)
+TURNS = 5
+
+
+class StandInServer:
+    """keep_alive가 지나면 모델을 내리는 최소 Ollama generate/ps 대역 서버"""
+
+    def __init__(self):
+        self.loaded_until = {}
+        self.connections = 0
+        self.lock = threading.Lock()
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True  # 헤더/본문 분할 전송 시 지연 ACK 대기 방지
+            
+            def setup(self):
+                super().setup()
+                with server.lock:
+                    server.connections += 1
+            
+            def log_message(self, *args):
+                pass
+            
+            def reply(self, payload):
+                data = json.dumps(payload).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+            
+            def do_GET(self):
+                now = time.time()
+                with server.lock:
+                    names = [name for name, until in server.loaded_until.items() if until > now]
+                self.reply({'models': [{'name': name, 'model': name} for name in names]})
+            
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                with server.lock:
+                    cold = server.loaded_until.get(body['model'], 0) < time.time()
+                if cold:
+                    time.sleep(LOAD_SECONDS)
+                keep_alive = body.get('keep_alive')
+                with server.lock:
+                    server.loaded_until[body['model']] = time.time() + (
+                        keep_alive if isinstance(keep_alive, (int, float)) else 300)
+                self.reply({'model': body['model'], 'response': '네!' if body.get('prompt') else '',
+                            'done': True, 'eval_count': 1})
+                
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.httpd.daemon_threads = True
+        self.host = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, args=(0.05,), daemon=True).start()
+    
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def run_turns(host, model, preload, keep_warm, keep_alive):
+    """턴마다 IDLE_SECONDS 쉬면서 응답 시간을 측정"""
+    service = OllamaService(model, host=host, keep_alive=keep_alive,
+                            keep_warm_seconds=keep_alive / 2 if keep_warm else 0)
+    if preload:
+        service.preload()
+    if keep_warm:
+        service.start(preload=False)
+    generator = OllamaGenerator(model, options={'num_predict': 8}, streaming=False,
+                                client=service.client, keep_alive=keep_alive)
+    times = []
+    for turn in range(TURNS):
+        if turn:
+            time.sleep(IDLE_SECONDS)
+        _, stats = generator.generate("안녕?")
+        times.append(stats['total_ms'])
+    service.close()
+    return times
+
+
+def per_request_connections(host, model):
+    """턴마다 새 클라이언트 (연결 재사용 없음) 대 공유 클라이언트"""
+    start = time.perf_counter()
+    for _ in range(20):
+        ollama.Client(host=host).generate(model=model, prompt="안녕?", options={'num_predict': 1})
+    fresh = (time.perf_counter() - start) / 20
+    service = OllamaService(model, host=host, keep_warm_seconds=0)
+    start = time.perf_counter()
+    for _ in range(20):
+        service.client.generate(model=model, prompt="안녕?", options={'num_predict': 1})
+    pooled = (time.perf_counter() - start) / 20
+    service.close()
+    return fresh, pooled
+
+
+def main():
+    use_ollama = '--ollama' in sys.argv
+    server = None
+    if use_ollama:
+        host, model = config.OLLAMA_BASE_URL, config.OLLAMA_MODEL
+        keep_alive = 5  # 실제 서버에서도 턴 사이에 모델이 내려가도록 짧게
+        global IDLE_SECONDS
+        IDLE_SECONDS = 7.0
+    else:
+        server = StandInServer()
+        host, model, keep_alive = server.host, "phi4:latest", KEEP_ALIVE
+        
+    print("🧠 Ollama 클라이언트 벤치마크")
+    print("=" * 60)
+    print(f"📊 {'Ollama ' + model if use_ollama else '대역 서버 (로딩 %.1f초)' % LOAD_SECONDS}, "
+          f"{TURNS}턴, 턴 사이 {IDLE_SECONDS:.1f}초 (모델 유지 {keep_alive}초)\n")
+    
+    scenarios = [
+        ("기존 (미리 불러오기/유지 없음)", False, False),
+        ("시작 시 미리 불러오기", True, False),
+        ("미리 불러오기 + 유지 요청", True, True),
+    ]
+    for label, preload, keep_warm in scenarios:
+        if server is not None:
+            server.loaded_until.clear()
+        times = run_turns(host, model, preload, keep_warm, keep_alive)
+        print(f"  {label:<26} 첫 턴 {times[0]:7.0f} ms  이후 평균 {sum(times[1:]) / len(times[1:]):7.0f} ms  "
+              f"최대 {max(times):7.0f} ms")
+        
+    fresh, pooled = per_request_connections(host, model)
+    print(f"\n🔌 요청당 시간: 매번 새 연결 {fresh * 1000:.1f} ms vs 연결 재사용 {pooled * 1000:.1f} ms")
+    
+    if server is not None:
+        server.close()
+    print("\n🎉 벤치마크 완료!")
+
+
+if __name__ == '__main__':
+    main()
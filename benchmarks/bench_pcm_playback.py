@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+재생 시작 지연 벤치마크 (pygame MP3 로드/디코딩 vs PCM 한 번 디코딩 + 캐시)
+
+pygame은 SDL 더미 오디오 드라이버로 실행하므로 스피커가 필요 없습니다.
+"""
+import io
+import os
+import sys
+import time
+import wave
+
+import numpy as np
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app'))
+
+import pygame
+
+from components.playback import PCMPlayer, sd
+
+SOURCE_RATE = 24000  # gTTS 출력 (모노)
+DEVICE_RATE = 48000  # 일반적인 출력 장치 기본 형식
+DEVICE_CHANNELS = 2
+SENTENCE_SECONDS = 3.0
+REPEATS = 10
+
+
+def speech_bytes():
+    """문장 1개 분량의 음성 (WAV; 디코딩 경로는 MP3와 같음)"""
+    t = np.arange(int(SENTENCE_SECONDS * SOURCE_RATE)) / SOURCE_RATE
+    samples = 0.3 * np.sin(2 * np.pi * 180 * t) * (0.6 + 0.4 * np.sin(2 * np.pi * 4 * t))
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(SOURCE_RATE)
+        wf.writeframes((samples * 32767).astype('<i2').tobytes())
+    return buffer.getvalue()
+
+
+def mean_ms(func):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        func()
+    return (time.perf_counter() - start) / REPEATS * 1000
+
+
+def main():
+    print("🎚️ 재생 시작 지연 벤치마크")
+    print("=" * 60)
+    print(f"📊 {SENTENCE_SECONDS:.0f}초 문장, {SOURCE_RATE} Hz 모노 → {DEVICE_RATE} Hz {DEVICE_CHANNELS}채널\n")
+    audio = speech_bytes()
+    
+    # 기존 방식: 재생할 때마다 22050 Hz 스테레오 믹서 형식으로 디코딩/변환
+    # (music.load는 재생 중 오디오 스레드에서 나눠 디코딩하므로 같은 작업을 Sound로 측정)
+    pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=512)
+    pygame.mixer.init()
+    pygame_ms = mean_ms(lambda: pygame.mixer.Sound(file=io.BytesIO(audio)))
+    print(f"  pygame 재생마다 디코딩 : {pygame_ms:7.2f} ms (매 재생, 다시 재생 포함)")
+    
+    player = PCMPlayer(sample_rate=DEVICE_RATE, channels=DEVICE_CHANNELS)
+    cold = mean_ms(lambda: PCMPlayer(sample_rate=DEVICE_RATE, channels=DEVICE_CHANNELS).prepare(audio))
+    player.prepare(audio)
+    warm = mean_ms(lambda: player.prepare(audio))
+    print(f"  PCM 첫 디코딩/변환     : {cold:7.2f} ms (합성 스레드에서 미리 수행)")
+    print(f"  PCM 캐시 (다시 재생)   : {warm:7.3f} ms")
+    
+    if sd is None:
+        print("\nℹ️ PortAudio 없음 - 실제 출력 스트림 시작 지연 측정 건너뜀")
+        return
+    player = PCMPlayer()
+    latencies = []
+    for _ in range(REPEATS):
+        player.start(audio)
+        time.sleep(0.2)
+        player.stop()
+        latencies.append(player.last_start_latency * 1000)
+    player.close()
+    print(f"\n  출력 스트림 시작 지연   : 평균 {np.mean(latencies):6.1f} ms (장치 출력 지연 포함, 첫 회는 스트림 열기 포함)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+음성 재생 중 화면(스크립트 스레드) 대기 시간 및 barge-in 반응 시간 벤치마크
+"""
+import os
+import sys
+import time
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app'))
+
+from components.metrics import LatencyTracker
+from components.playback import PlaybackWorker
+
+SEGMENTS = [0.4, 0.6, 0.5]  # 문장별 재생 시간 (seconds)
+TRIALS = 20
+
+
+class ClockPlayer:
+    """재생 시간만 흘려보내는 가짜 재생기"""
+
+    def __init__(self):
+        self._until = 0.0
+    
+    def start(self, seconds):
+        self._until = time.perf_counter() + seconds
+    
+    def is_playing(self):
+        return time.perf_counter() < self._until
+    
+    def stop(self):
+        self._until = 0.0
+
+
+def blocking_playback(player):
+    """기존 방식: 스크립트 스레드에서 0.1초 간격으로 재생 완료 대기"""
+    for seconds in SEGMENTS:
+        player.start(seconds)
+        while player.is_playing():
+            time.sleep(0.1)
+
+
+def main():
+    print("🔈 음성 재생 비차단 벤치마크")
+    print("=" * 60)
+    print(f"📊 응답 음성 {sum(SEGMENTS):.1f}초 ({len(SEGMENTS)}문장)\n")
+    
+    start = time.perf_counter()
+    blocking_playback(ClockPlayer())
+    print(f"  기존 방식 화면 대기  : {(time.perf_counter() - start) * 1000:7.1f} ms")
+    
+    metrics = LatencyTracker()
+    worker = PlaybackWorker(ClockPlayer(), metrics=metrics)
+    start = time.perf_counter()
+    for seconds in SEGMENTS:
+        worker.enqueue(seconds)
+    print(f"  재생 작업자 화면 대기: {(time.perf_counter() - start) * 1000:7.3f} ms")
+    worker.wait_idle()
+    
+    stop_ms = []
+    for _ in range(TRIALS):
+        item = worker.enqueue(5.0)
+        time.sleep(0.05)
+        start = time.perf_counter()
+        worker.stop()
+        item.wait()
+        stop_ms.append((time.perf_counter() - start) * 1000)
+    worker.close()
+    print(f"  barge-in 정지까지    : 평균 {sum(stop_ms) / TRIALS:5.1f} ms, 최대 {max(stop_ms):5.1f} ms "
+          f"(기존 방식은 응답이 끝날 때까지 녹음 불가)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+녹음 후처리 벤치마크 - 클립당 처리 시간과 제거된 무음 길이
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from components.audio_clip import AudioClip
+from components.audio_preprocess import AudioPreprocessor
+
+REPEAT = 50
+LEAD_SILENCE = 0.8
+TAIL_SILENCE = 0.8  # VAD 후행 무음 설정과 비슷한 값
+
+
+def make_clip(speech_seconds, sample_rate, seed=0):
+    """앞뒤 무음이 붙은 합성 발화 클립"""
+    rng = np.random.default_rng(seed)
+    total = int((LEAD_SILENCE + speech_seconds + TAIL_SILENCE) * sample_rate)
+    samples = rng.standard_normal(total).astype(np.float32) * 0.001  # 약 -60 dBFS 배경 잡음
+    t = np.arange(int(speech_seconds * sample_rate)) / sample_rate
+    voiced = sum(np.sin(2 * np.pi * 150 * k * t) / k for k in range(1, 6))
+    envelope = 0.6 + 0.4 * np.sin(2 * np.pi * 4 * t)
+    start = int(LEAD_SILENCE * sample_rate)
+    samples[start:start + len(t)] += (0.05 * envelope * voiced).astype(np.float32)
+    return AudioClip(samples, sample_rate)
+
+
+def main():
+    print("✂️ 녹음 후처리 벤치마크")
+    print("=" * 60)
+    
+    preprocessor = AudioPreprocessor()
+    print(f"  {'클립':<16} {'원본':>7} {'처리 후':>8} {'증폭':>8} {'처리 시간':>10}")
+    
+    for sample_rate in (16000, 44100):
+        for speech_seconds in (1.0, 4.0, 13.0):
+            clip = make_clip(speech_seconds, sample_rate)
+            start = time.perf_counter()
+            for _ in range(REPEAT):
+                processed, report = preprocessor.process(clip)
+            elapsed_ms = (time.perf_counter() - start) * 1000 / REPEAT
+            
+            label = f"{speech_seconds:.0f}초 @ {sample_rate // 1000}kHz"
+            print(f"  {label:<16} {report['original_duration']:6.2f}s "
+                  f"{report['trimmed_duration']:7.2f}s {report['gain_db']:+6.1f}dB "
+                  f"{elapsed_ms:8.2f}ms")
+            
+    print("\n🎉 벤치마크 완료!")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+녹음 중 리샘플링 벤치마크 - 44.1kHz 저장 vs 16kHz 모노 변환 저장
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from components.audio_buffer import AudioRingBuffer
+from components.audio_clip import AudioClip
+from components.resampler import StreamingResampler
+
+INPUT_RATE = 44100
+TARGET_RATE = 16000
+MAX_DURATION = 30  # 녹음 버퍼 크기 (seconds)
+CLIP_SECONDS = 5
+BLOCK_SIZE = 512  # sounddevice 콜백 블록 크기와 비슷한 값
+
+
+def main():
+    print("🎚️ 녹음 중 리샘플링 벤치마크")
+    print("=" * 60)
+    
+    rng = np.random.default_rng(0)
+    signal = (rng.standard_normal(INPUT_RATE * CLIP_SECONDS) * 0.1).astype(np.float32)
+    
+    # 콜백 블록 단위 변환 비용
+    resampler = StreamingResampler(INPUT_RATE, TARGET_RATE, max_block=BLOCK_SIZE)
+    block_times = []
+    parts = []
+    for offset in range(0, len(signal), BLOCK_SIZE):
+        start = time.perf_counter()
+        out = resampler.process(signal[offset:offset + BLOCK_SIZE])
+        block_times.append(time.perf_counter() - start)
+        parts.append(out.copy())
+    parts.append(resampler.flush())
+    resampled = np.concatenate(parts)
+    
+    block_budget_ms = BLOCK_SIZE / INPUT_RATE * 1000
+    print(f"⏱️ 콜백 블록당 변환: 평균 {np.mean(block_times) * 1000:.3f} ms, "
+          f"최대 {np.max(block_times) * 1000:.3f} ms (블록 길이 {block_budget_ms:.1f} ms)")
+    print(f"   오디오 1초당 CPU {sum(block_times) / CLIP_SECONDS * 1000:.1f} ms\n")
+    
+    before_buffer = AudioRingBuffer(INPUT_RATE * MAX_DURATION)._buffer.nbytes
+    after_buffer = AudioRingBuffer(TARGET_RATE * MAX_DURATION)._buffer.nbytes
+    before_payload = len(AudioClip(signal, INPUT_RATE).to_wav_bytes())
+    after_payload = len(AudioClip(resampled, TARGET_RATE).to_wav_bytes())
+    
+    print(f"  {'':<22} {'44.1kHz':>12} {'16kHz':>12} {'비율':>8}")
+    print(f"  {'녹음 버퍼 (' + str(MAX_DURATION) + '초)':<22} {before_buffer / 1e6:10.2f}MB "
+          f"{after_buffer / 1e6:10.2f}MB {after_buffer / before_buffer:7.1%}")
+    print(f"  {'ASR 전송 WAV (' + str(CLIP_SECONDS) + '초)':<22} {before_payload / 1e3:10.1f}KB "
+          f"{after_payload / 1e3:10.1f}KB {after_payload / before_payload:7.1%}")
+    
+    print("\n🎉 벤치마크 완료!")
+
+
+if __name__ == '__main__':
+    main()
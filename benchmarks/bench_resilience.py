@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+느린 음성 인식 서비스에서 턴당 대기 시간 벤치마크 (보호 없음 vs 시간 제한 + 서킷 브레이커)
+
+지연을 주입하는 로컬 대역 서버에 Google 인식 백엔드를 연결해 측정합니다.
+"""
+import os
+import sys
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import speech_recognition as sr
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app'))
+
+from components.asr import GoogleRecognizer
+from components.metrics import LatencyTracker
+from components.resilience import CircuitBreaker, CircuitOpenError, DeadlineExceeded
+
+SAMPLE_RATE = 16000
+TURNS = 16
+OUTAGE_TURNS = range(4, 10)  # 이 턴 동안 서버 장애 (응답 지연)
+THINK_TIME = 0.2  # 턴 사이 사용자 대기 시간
+FAST_DELAY = 0.05
+SLOW_DELAY = 3.0  # 장애 상황의 서버 응답 지연
+TIMEOUT = 0.5
+RESET_SECONDS = 1.0
+RESPONSE = ('{"result":[]}\n{"result":[{"alternative":[{"transcript":"안녕하세요"}],'
+            '"final":true}],"result_index":0}')
+
+
+def start_server(outage):
+    """outage 이벤트가 설정된 동안 느리게 응답하는 로컬 서버"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get('Content-Length') or 0))
+            time.sleep(SLOW_DELAY if outage.is_set() else FAST_DELAY)
+            payload = RESPONSE.encode('utf-8')
+            try:
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+            except OSError:
+                pass
+        
+        def log_message(self, *args):
+            pass
+            
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd, f"http://127.0.0.1:{httpd.server_address[1]}/"
+
+
+def make_audio():
+    t = np.arange(SAMPLE_RATE) / SAMPLE_RATE
+    pcm = (0.2 * np.sin(2 * np.pi * 220 * t) * 32767).astype('<i2')
+    return sr.AudioData(pcm.tobytes(), SAMPLE_RATE, 2)
+
+
+def run(guarded):
+    outage = threading.Event()
+    httpd, url = start_server(outage)
+    metrics = LatencyTracker()
+    backend = GoogleRecognizer(endpoint=url)
+    recognize = backend.recognize
+    breaker = None
+    if guarded:
+        breaker = CircuitBreaker('asr', failure_threshold=2, reset_timeout=RESET_SECONDS, timeout=TIMEOUT,
+                                 ignore=(sr.UnknownValueError,))
+        recognize = breaker.wrap(backend.recognize)
+        
+    audio = make_audio()
+    failed = 0
+    for turn in range(TURNS):
+        if turn in OUTAGE_TURNS:
+            outage.set()
+        else:
+            outage.clear()
+        start = time.perf_counter()
+        try:
+            recognize(audio)
+        except (DeadlineExceeded, CircuitOpenError, sr.RequestError):
+            failed += 1  # 앱에서는 텍스트 입력 안내로 대체
+        metrics.record('turn', time.perf_counter() - start)
+        time.sleep(THINK_TIME)
+    httpd.shutdown()
+    return metrics.summary('turn'), failed, breaker
+
+
+def main():
+    print("🔌 음성 인식 서비스 장애 시 턴 대기 시간 벤치마크")
+    print("=" * 60)
+    print(f"📊 {TURNS}턴 중 {len(OUTAGE_TURNS)}턴 동안 {SLOW_DELAY:.0f}초 지연, "
+          f"시간 제한 {TIMEOUT}초, 차단 후 {RESET_SECONDS}초 뒤 재시도\n")
+    
+    for label, guarded in (("보호 없음", False), ("시간 제한 + 차단", True)):
+        summary, failed, breaker = run(guarded)
+        print(f"  {label:<12} 평균 {summary['mean_ms']:7.1f} ms  p95 {summary['p95_ms']:7.1f} ms  "
+              f"p99 {summary['p99_ms']:7.1f} ms  최대 {summary['max_ms']:7.1f} ms  실패 {failed}턴")
+        if breaker is not None:
+            stats = breaker.stats()
+            print(f"  {'':<12} 차단 {stats['trip_count']}회, 거부 {stats['rejected']}회, "
+                  f"시간 초과 {stats['timeouts']}회")
+
+
+if __name__ == "__main__":
+    main()
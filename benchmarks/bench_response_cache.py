@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+응답 캐시 적중률과 적중 시 응답 지연 벤치마크
+
+사용법:
+    python benchmarks/bench_response_cache.py            # n-gram 임베딩 (Ollama 불필요)
+    python benchmarks/bench_response_cache.py --ollama   # 로컬 Ollama 임베딩 모델 사용
+"""
+import os
+import sys
+import random
+import time
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app'))
+
+import config
+from components.metrics import LatencyTracker
+from components.response_cache import ResponseCache, create_embedder
+
+SESSIONS = 400
+GENERATION_SECONDS = 4.0  # CPU에서 phi4 응답 하나 생성 시간 (대략)
+
+# 대화 첫 마디로 자주 나오는 말과 표기만 다른 변형
+COMMON = [
+    ["안녕", "안녕!", "안녕~~", "안녕 ㅎㅎ"],
+    ["안녕하세요", "안녕하세요!", "안녕하세요~"],
+    ["오늘 학교에서 있었던 일 들어볼래?", "오늘 학교에서 있었던 일 들어볼래요?"],
+    ["너는 이름이 뭐야?", "너는 이름이 뭐야", "너는 이름이 뭐야??"],
+    ["심심해", "심심해..", "심심해ㅠㅠ"],
+    ["오늘 너무 피곤하다", "오늘 너무 피곤하다..."],
+]
+SENTIMENTS = ["긍정", "중립", "부정"]
+
+
+def first_messages(seed=0):
+    """세션 첫 마디: 60%는 자주 나오는 말(앞쪽일수록 자주), 나머지는 매번 다른 말"""
+    rng = random.Random(seed)
+    messages = []
+    for index in range(SESSIONS):
+        if rng.random() < 0.6:
+            group = COMMON[min(int(rng.expovariate(0.7)), len(COMMON) - 1)]
+            messages.append((rng.choice(group), rng.choice(SENTIMENTS[:2])))
+        else:
+            messages.append((f"{index}번째 세션에서만 하는 특별한 이야기가 있어", rng.choice(SENTIMENTS)))
+    return messages
+
+
+def run(label, embed):
+    metrics = LatencyTracker()
+    cache = ResponseCache(embed, threshold=config.RESPONSE_CACHE_THRESHOLD,
+                          max_entries=config.RESPONSE_CACHE_MAX_ENTRIES, metrics=metrics)
+    total = 0.0
+    for text, sentiment in first_messages():
+        start = time.perf_counter()
+        response = cache.lookup(text, sentiment)
+        if response is None:
+            # 미스: 실제로는 LLM 생성 (시간만 더함)
+            cache.store(text, sentiment, f"'{text}'에 대한 답변")
+            total += GENERATION_SECONDS
+        total += time.perf_counter() - start
+    stats = cache.stats()
+    hit = metrics.summary('response_cache.hit')
+    print(f"  {label:<10} 적중률 {stats['hit_rate']:5.1%} (동일 {stats['exact_hits']}, "
+          f"유사 {stats['similar_hits']}, 미스 {stats['misses']})  "
+          f"적중 지연 평균 {hit['mean_ms']:.3f} ms / p95 {hit['p95_ms']:.3f} ms")
+    print(f"  {'':<10} 첫 응답 평균 {GENERATION_SECONDS:.1f}초 -> {total / SESSIONS:.2f}초")
+
+
+def main():
+    print("💾 응답 캐시 벤치마크")
+    print("=" * 60)
+    print(f"📊 세션 {SESSIONS}개의 첫 마디, 유사도 기준 {config.RESPONSE_CACHE_THRESHOLD}, "
+          f"생성 {GENERATION_SECONDS:.1f}초 가정\n")
+    
+    run("n-gram", create_embedder('ngram'))
+    if '--ollama' in sys.argv:
+        import ollama
+        embed = create_embedder('ollama', client=ollama.Client(host=config.OLLAMA_BASE_URL),
+                                model=config.RESPONSE_CACHE_EMBED_MODEL)
+        try:
+            embed("안녕")
+        except Exception as e:
+            print(f"  ⚠️ Ollama 임베딩 모델 사용 불가: {e}")
+        else:
+            run("ollama", embed)
+            
+    print("\n🎉 벤치마크 완료!")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+분할 병렬 인식 벤치마크 - 긴 녹음을 한 번에 인식 vs 쉼 구간별 병렬 인식
+
+StubRecognizer는 고정 왕복 지연 + 오디오 길이에 비례하는 처리 지연을 흉내 냅니다.
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from components.audio_clip import AudioClip
+from components.asr import StubRecognizer
+from components.segmentation import SegmentedRecognizer
+
+SAMPLE_RATE = 16000
+ROUND_TRIP = 0.15  # 요청당 고정 지연 (seconds)
+PER_SECOND = 0.05  # 오디오 1초당 처리 지연 (seconds)
+WORKERS = 4
+
+
+def make_clip(seconds, seed=0):
+    """2~5초 구절과 0.4~0.8초 쉼이 번갈아 나오는 합성 발화"""
+    rng = np.random.default_rng(seed)
+    parts = []
+    total = 0.0
+    while total < seconds:
+        phrase = rng.uniform(2.0, 5.0)
+        pause = rng.uniform(0.4, 0.8)
+        t = np.arange(int(phrase * SAMPLE_RATE)) / SAMPLE_RATE
+        parts.append((0.2 * np.sin(2 * np.pi * 180 * t)).astype(np.float32))
+        parts.append(np.zeros(int(pause * SAMPLE_RATE), dtype=np.float32))
+        total += phrase + pause
+    samples = np.concatenate(parts)[:int(seconds * SAMPLE_RATE)]
+    return AudioClip(samples, SAMPLE_RATE)
+
+
+def main():
+    print("🧵 분할 병렬 인식 벤치마크")
+    print("=" * 60)
+    print(f"📊 지연 모델: {ROUND_TRIP * 1000:.0f} ms + 오디오 1초당 {PER_SECOND * 1000:.0f} ms, "
+          f"워커 {WORKERS}개\n")
+    print(f"  {'녹음 길이':<8} {'구간 수':>6} {'한 번에':>9} {'병렬 분할':>9} {'단축':>7}")
+    
+    backend = StubRecognizer("구간", latency=ROUND_TRIP, latency_per_second=PER_SECOND)
+    segmenter = SegmentedRecognizer(backend.recognize, max_workers=WORKERS)
+    try:
+        for seconds in (20, 40, 60):
+            clip = make_clip(seconds, seed=seconds)
+            
+            start = time.perf_counter()
+            backend.recognize(clip.to_audio_data())
+            whole = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            segmenter.transcribe(clip)
+            segmented = time.perf_counter() - start
+            
+            segments = len(segmenter.split(clip))
+            print(f"  {seconds:5d}초   {segments:6d} {whole:8.2f}s {segmented:8.2f}s "
+                  f"{whole / segmented:6.1f}배")
+    finally:
+        segmenter.close()
+        
+    print("\n🎉 벤치마크 완료!")
+
+
+if __name__ == '__main__':
+    main()
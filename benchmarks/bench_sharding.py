@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+샤딩 벤치마크 - 멀티 스레드 동시 쓰기 처리량 (샤드 1개 vs N개)
+"""
+import os
+import sys
+import time
+import tempfile
+import threading
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from components.sharded_database import ShardedConversationDB
+
+WRITER_THREADS = 16
+TURNS_PER_THREAD = 50
+SHARD_COUNTS = [1, 4, 8]
+
+
+def run_case(num_shards, temp_dir):
+    """스레드마다 별도 세션으로 동시에 대화를 저장하고 처리량 측정"""
+    db = ShardedConversationDB(os.path.join(temp_dir, f"bench{num_shards}.db"),
+                               num_shards=num_shards)
+    barrier = threading.Barrier(WRITER_THREADS + 1)
+    
+    def writer(thread_id):
+        session_id = f"session-{num_shards}-{thread_id}"
+        barrier.wait()
+        for turn in range(TURNS_PER_THREAD):
+            db.save_conversation(session_id, f"메시지 {turn}", "응답입니다!", "긍정적", "ENFP")
+            
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(WRITER_THREADS)]
+    for thread in threads:
+        thread.start()
+        
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    
+    # 잠금 시간 초과로 저장되지 않은 턴도 함께 보고
+    stored = db.get_database_stats()['total_conversations']
+    db.close()
+    return stored, elapsed
+
+
+def main():
+    print("🗂️ 샤딩 SQLite 동시 쓰기 벤치마크")
+    print("=" * 60)
+    print(f"📊 쓰기 스레드 {WRITER_THREADS}개 × 턴 {TURNS_PER_THREAD}개\n")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        baseline = None
+        for num_shards in SHARD_COUNTS:
+            stored, elapsed = run_case(num_shards, temp_dir)
+            throughput = stored / elapsed
+            baseline = baseline or throughput
+            print(f"  샤드 {num_shards:>2}개: {throughput:8.1f} turns/sec "
+                  f"({stored}/{WRITER_THREADS * TURNS_PER_THREAD} 저장, "
+                  f"{throughput / baseline:.2f}x)")
+                  
+    print("\n🎉 벤치마크 완료!")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+첫 음성까지의 시간 벤치마크 (응답 전체 합성 후 재생 vs 문장 단위 합성/재생 vs 생성 중 재생)
+"""
+import os
+import sys
+import time
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app'))
+
+from components.speech_pipeline import SpeechPipeline
+
+RESPONSE = ("와, 정말 멋진 하루를 보내셨네요! 산책하면서 어떤 풍경을 보셨는지 궁금해요. "
+            "저도 햇살 좋은 날 걷는 걸 정말 좋아하거든요. 다음에는 새로운 길로 가 보는 건 어때요? "
+            "분명 또 다른 즐거움을 발견하실 거예요!")
+PROMPT_SECONDS = 0.5  # 첫 토큰까지
+TOKEN_SECONDS = 0.03  # 토큰(3글자) 간격
+TTS_BASE_SECONDS = 0.3  # 합성 요청 1건의 고정 지연 (네트워크 왕복)
+TTS_CHAR_SECONDS = 0.002  # 글자당 합성 시간
+PLAY_CHAR_SECONDS = 0.01  # 글자당 재생 시간 (10배속으로 축소)
+
+
+def stream_tokens():
+    time.sleep(PROMPT_SECONDS)
+    for index in range(0, len(RESPONSE), 3):
+        time.sleep(TOKEN_SECONDS)
+        yield RESPONSE[index:index + 3]
+
+
+def synthesize(text):
+    time.sleep(TTS_BASE_SECONDS + TTS_CHAR_SECONDS * len(text))
+    return text
+
+
+def play(audio):
+    time.sleep(PLAY_CHAR_SECONDS * len(audio))
+
+
+def whole_response():
+    """기존 방식: 응답 완성 → 전체 한 번에 합성 → 재생"""
+    start = time.perf_counter()
+    text = ''.join(stream_tokens())
+    audio = synthesize(text)
+    first_audio = time.perf_counter() - start
+    play(audio)
+    return first_audio * 1000, (time.perf_counter() - start) * 1000
+
+
+def sentences_after_generation():
+    """응답 완성 후 문장 단위로 합성/재생 겹치기"""
+    speech = SpeechPipeline(synthesize, play)
+    speech.feed(''.join(stream_tokens()))
+    stats = speech.finish()
+    return stats['first_audio_ms'], stats['total_ms']
+
+
+def sentences_while_generating():
+    """생성되는 대로 문장 단위로 합성/재생"""
+    speech = SpeechPipeline(synthesize, play)
+    for token in stream_tokens():
+        speech.feed(token)
+    stats = speech.finish()
+    return stats['first_audio_ms'], stats['total_ms']
+
+
+def main():
+    print("🔊 첫 음성까지의 시간 벤치마크")
+    print("=" * 60)
+    print(f"📊 응답 {len(RESPONSE)}자, 합성 지연 {TTS_BASE_SECONDS * 1000:.0f} ms/요청, "
+          f"재생 {PLAY_CHAR_SECONDS * 1000:.0f} ms/글자\n")
+    
+    for label, run in (("전체 합성 후 재생", whole_response),
+                       ("완성 후 문장 단위", sentences_after_generation),
+                       ("생성 중 문장 단위", sentences_while_generating)):
+        first_audio, total = run()
+        print(f"  {label:<12}: 첫 음성 {first_audio:7.0f} ms, 재생 완료 {total:7.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+저장소 백엔드 벤치마크 - SQLite / 샤딩 SQLite / 인메모리 비교
+"""
+import os
+import sys
+import time
+import tempfile
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from components.storage import create_conversation_store
+
+SESSIONS = 20
+TURNS_PER_SESSION = 25
+
+BACKENDS = [
+    ("sqlite", {}),
+    ("sqlite x4", {'num_shards': 4}),
+    ("memory", {}),
+]
+
+
+def timed(func, repeat=1):
+    """함수를 repeat번 실행하고 1회 평균 시간(ms) 반환"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def run_backend(label, options, temp_dir):
+    backend = label.split()[0]
+    store = create_conversation_store(
+        backend, os.path.join(temp_dir, f"{label.replace(' ', '_')}.db"), **options)
+    
+    def save_all():
+        for turn in range(TURNS_PER_SESSION):
+            for session in range(SESSIONS):
+                store.save_conversation(f"session-{session}", f"메시지 {turn}",
+                                        "좋은 생각이에요!", "긍정적", "ENFP")
+                                        
+    total_turns = SESSIONS * TURNS_PER_SESSION
+    save_ms = timed(save_all) / total_turns
+    history_ms = timed(lambda: store.get_conversation_history("session-0"), repeat=50)
+    stats_ms = timed(lambda: store.get_session_stats("session-0"), repeat=50)
+    export_ms = timed(lambda: store.export_conversations(format='jsonl'), repeat=5)
+    store.close()
+    
+    print(f"  {label:<10} 저장 {save_ms:7.3f} ms/turn   기록 조회 {history_ms:7.3f} ms   "
+          f"세션 통계 {stats_ms:7.3f} ms   전체 내보내기 {export_ms:7.2f} ms")
+
+
+def main():
+    print("🧩 저장소 백엔드 벤치마크")
+    print("=" * 60)
+    print(f"📊 세션 {SESSIONS}개 × 턴 {TURNS_PER_SESSION}개\n")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for label, options in BACKENDS:
+            run_backend(label, options, temp_dir)
+            
+    print("\n🎉 벤치마크 완료!")
+
+
+if __name__ == '__main__':
+    main()
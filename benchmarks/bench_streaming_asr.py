@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+스트리밍 음성 인식 벤치마크 - 녹음 후 일괄 인식 vs 녹음 중 점진 인식
+
+1) 가짜 스트리밍 인식기(FakeStreamingRecognizer)에 오디오 1초당 처리 비용을 주고,
+   말이 끝난 시점부터 최종 인식 결과가 나올 때까지의 시간을 비교합니다.
+2) 실제 경로(BufferedRecognizer + 일괄 인식 백엔드): 녹음 후 한 번에 인식 vs
+   쉼으로 끝난 구간을 녹음 중에 인식(incremental)하는 경우를 비교합니다.
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from components.asr import BufferedRecognizer, FakeStreamingRecognizer, StubRecognizer
+from components.segmentation import SegmentedRecognizer
+
+SAMPLE_RATE = 16000
+CHUNK_MS = 100
+PROCESSING_RTF = 0.2  # 오디오 1초당 0.2초 처리 (로컬 엔진 가정)
+FINALIZE_SECONDS = 0.05
+SPEED = 10  # 녹음을 실시간의 10배 속도로 재생 (결과는 실시간 기준으로 환산)
+BACKEND_LATENCY = 0.3  # 일괄 인식 요청 1건의 고정 지연 (seconds)
+
+
+def make_chunks(seconds):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    signal = (0.2 * np.sin(2 * np.pi * 220 * t)).astype(np.float32).reshape(-1, 1)
+    step = SAMPLE_RATE * CHUNK_MS // 1000
+    return [signal[i:i + step] for i in range(0, len(signal), step)]
+
+
+def new_recognizer():
+    return FakeStreamingRecognizer("오늘 기분이 정말 좋아요", processing_rtf=PROCESSING_RTF,
+                                   finalize_seconds=FINALIZE_SECONDS)
+
+
+def sequential_latency(chunks):
+    """녹음이 끝난 뒤 전체 오디오를 한 번에 인식"""
+    recognizer = new_recognizer()
+    recognizer.start(SAMPLE_RATE)
+    start = time.perf_counter()
+    recognizer.accept_audio(np.concatenate(chunks))
+    recognizer.finish()
+    return time.perf_counter() - start
+
+
+def streaming_latency(chunks):
+    """녹음 중에 청크를 처리해 두고, 말이 끝난 뒤에는 마지막 청크만 처리"""
+    recognizer = new_recognizer()
+    recognizer.start(SAMPLE_RATE)
+    for chunk in chunks[:-1]:
+        recognizer.accept_audio(chunk)  # 녹음과 동시에 진행되는 부분
+    start = time.perf_counter()
+    recognizer.accept_audio(chunks[-1])
+    recognizer.finish()
+    return time.perf_counter() - start
+
+
+def utterance(phrases, pause_seconds=0.5):
+    """쉼으로 나뉜 문장들 + 끝의 무음"""
+    step = SAMPLE_RATE * CHUNK_MS // 1000
+    pause = [np.zeros((step, 1), dtype=np.float32)] * int(pause_seconds * 1000 / CHUNK_MS)
+    chunks = []
+    for seconds in phrases:
+        chunks += make_chunks(seconds) + pause
+    return chunks
+
+
+def buffered_latency(chunks, incremental):
+    """BufferedRecognizer로 녹음을 (빠르게) 재생하고, 마지막 청크 이후 결과까지의 시간"""
+    backend = StubRecognizer(latency=BACKEND_LATENCY / SPEED,
+                             latency_per_second=PROCESSING_RTF / SPEED)
+    segmenter = SegmentedRecognizer(backend.recognize, min_pause_ms=300, min_segment_seconds=4.0)
+    recognizer = BufferedRecognizer(backend.recognize, segmenter=segmenter, incremental=incremental)
+    recognizer.start(SAMPLE_RATE)
+    for chunk in chunks:
+        recognizer.accept_audio(chunk)
+        time.sleep(CHUNK_MS / 1000 / SPEED)
+    start = time.perf_counter()
+    recognizer.finish()
+    elapsed = (time.perf_counter() - start) * SPEED
+    segmenter.close()
+    return elapsed, backend.calls
+
+
+def main():
+    print("📝 스트리밍 음성 인식 벤치마크")
+    print("=" * 60)
+    print(f"📊 처리 비용 RTF {PROCESSING_RTF}, 마무리 {FINALIZE_SECONDS * 1000:.0f} ms, "
+          f"청크 {CHUNK_MS} ms\n")
+    print(f"  {'발화 길이':<10} {'일괄 인식':>10} {'스트리밍':>10}")
+    
+    for seconds in (1.0, 3.0, 6.0):
+        chunks = make_chunks(seconds)
+        before = sequential_latency(chunks)
+        after = streaming_latency(chunks)
+        print(f"  {seconds:6.1f}초   {before * 1000:8.0f}ms {after * 1000:8.0f}ms")
+        
+    print("\n⚡ 스트리밍 경로는 발화 길이와 무관하게 마지막 청크 + 마무리 시간만 남습니다")
+    
+    print(f"\n📊 일괄 인식 백엔드 (요청당 {BACKEND_LATENCY * 1000:.0f} ms + 오디오 1초당 "
+          f"{PROCESSING_RTF * 1000:.0f} ms), 문장 사이 쉼 0.5초\n")
+    print(f"  {'문장 길이':<16} {'녹음 후 인식':>12} {'녹음 중 구간 인식':>18}")
+    for phrases in ((2.0,), (4.5, 2.0), (4.5, 4.5, 2.0)):
+        chunks = utterance(phrases)
+        before, _ = buffered_latency(chunks, incremental=False)
+        after, calls = buffered_latency(chunks, incremental=True)
+        label = ' + '.join(f"{seconds:.1f}" for seconds in phrases) + "초"
+        print(f"  {label:<16} {before * 1000:10.0f}ms {after * 1000:14.0f}ms ({calls}회 요청)")
+        
+    print("\n⚡ 구간 인식은 말하는 동안 앞 문장을 처리해 두고, 말이 끝나면 마지막 문장만 인식합니다")
+    print("   (4초보다 짧은 발화는 구간으로 나누지 않고 한 번에 인식하므로 차이가 없습니다)")
+    print("\n🎉 벤치마크 완료!")
+
+
+if __name__ == '__main__':
+    main()
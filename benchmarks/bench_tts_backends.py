@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+음성 합성 백엔드 지연 시간 및 실시간 계수 벤치마크
+
+사용법:
+    python benchmarks/bench_tts_backends.py               # stub 백엔드 + 엔진 풀 비교 (오프라인)
+    python benchmarks/bench_tts_backends.py stub gtts     # 네트워크 필요
+    python benchmarks/bench_tts_backends.py local         # melotts 필요
+"""
+import os
+import sys
+import time
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app'))
+
+import config
+from components.tts import StubSynthesizer, SynthesizerPool, create_synthesizer
+from components.metrics import LatencyTracker
+
+SENTENCES = [
+    "안녕하세요! 오늘 정말 반가워요.",
+    "새로운 아이디어가 떠오르면 가슴이 두근거리지 않나요?",
+    "우리 같이 재미있는 계획을 세워 봐요!",
+    "힘든 일이 있었다면 천천히 이야기해 주세요.",
+    "당신의 열정이 정말 멋져요, 계속 응원할게요!",
+] * 2
+STUB_LATENCY = 0.05  # 네트워크 왕복과 비슷한 고정 지연
+ENGINE_LOAD_SECONDS = 0.5  # 로컬 모델 로딩 시간 (시뮬레이션)
+
+
+def run(backend_name, metrics):
+    backend = create_synthesizer(backend_name, language=config.TTS_LANGUAGE, metrics=metrics,
+                                 timeout=config.TTS_TIMEOUT, local_device=config.TTS_LOCAL_DEVICE,
+                                 pool_size=1, stub_latency=STUB_LATENCY)
+    start = time.perf_counter()
+    try:
+        backend.prewarm()
+    except RuntimeError as e:
+        print(f"  ⚠️ {backend_name}: {e}")
+        return backend, 0.0, None, len(SENTENCES)
+    prewarm = time.perf_counter() - start
+    
+    failed = 0
+    first = None
+    for sentence in SENTENCES:
+        start = time.perf_counter()
+        try:
+            backend.synthesize(sentence)
+        except Exception as e:
+            failed += 1
+            print(f"  ⚠️ {backend_name}: {e}")
+            continue
+        if first is None:
+            first = time.perf_counter() - start
+    return backend, prewarm, first, failed
+
+
+def compare_pool():
+    """매 요청 엔진 초기화 vs 미리 불러 둔 엔진 풀"""
+    def load_engine():
+        time.sleep(ENGINE_LOAD_SECONDS)
+        return StubSynthesizer(STUB_LATENCY)
+        
+    start = time.perf_counter()
+    for sentence in SENTENCES:
+        load_engine().synthesize(sentence)
+    per_call = time.perf_counter() - start
+    
+    pool = SynthesizerPool(load_engine, size=1)
+    start = time.perf_counter()
+    pool.prewarm()
+    prewarm = time.perf_counter() - start
+    start = time.perf_counter()
+    for sentence in SENTENCES:
+        with pool.engine() as engine:
+            engine.synthesize(sentence)
+    pooled = time.perf_counter() - start
+    
+    print(f"  매 요청 초기화   문장당 {per_call / len(SENTENCES) * 1000:7.1f} ms")
+    print(f"  엔진 풀          문장당 {pooled / len(SENTENCES) * 1000:7.1f} ms  "
+          f"(시작 시 {prewarm * 1000:.0f} ms 1회)")
+
+
+def main():
+    backends = sys.argv[1:] or ['stub']
+    print("🗣️ 음성 합성 백엔드 벤치마크")
+    print("=" * 60)
+    print(f"📊 {len(SENTENCES)}문장, 실시간 계수 = 합성 시간 / 음성 길이\n")
+    
+    metrics = LatencyTracker()
+    for backend_name in backends:
+        backend, prewarm, first, failed = run(backend_name, metrics)
+        summary = metrics.summary(f"tts.{backend_name}")
+        stats = backend.stats()
+        if not stats['calls']:
+            continue
+        rtf = f"{stats['rtf']:.3f}" if stats['rtf'] is not None else "-"
+        print(f"  {backend_name:<6} 준비 {prewarm * 1000:7.1f} ms  첫 문장 {first * 1000:7.1f} ms  "
+              f"평균 {summary['mean_ms']:7.1f} ms  p95 {summary['p95_ms']:7.1f} ms  "
+              f"실시간 계수 {rtf}  실패 {failed}")
+        
+    print(f"\n🔥 엔진 초기화 비용 (로딩 {ENGINE_LOAD_SECONDS * 1000:.0f} ms 가정)")
+    compare_pool()
+    
+    print("\n🎉 벤치마크 완료!")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+합성 음성 캐시 벤치마크 (다시 재생/반복 문장 지연 시간, 적중률)
+"""
+import os
+import sys
+import time
+import random
+import shutil
+import tempfile
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app'))
+
+from components.tts_cache import TTSCache
+
+TTS_SECONDS = 0.3  # gTTS 요청 1건의 지연 (네트워크 왕복 + 합성)
+AUDIO_BYTES = 24 * 1024  # 문장 1개 MP3 크기
+SENTENCES = [f"응답 문장 {index}번이에요!" for index in range(200)]
+GREETINGS = ["안녕하세요! 반가워요!", "오늘 하루는 어땠어요?", "좋은 하루 보내세요!"]
+TURNS = 60
+
+
+def synthesize(text):
+    time.sleep(TTS_SECONDS)
+    return text.encode('utf-8').ljust(AUDIO_BYTES, b'\0')
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    print("💾 합성 음성 캐시 벤치마크")
+    print("=" * 60)
+    print(f"📊 합성 지연 {TTS_SECONDS * 1000:.0f} ms/문장, 문장 {AUDIO_BYTES // 1024} KB\n")
+    
+    directory = tempfile.mkdtemp()
+    try:
+        cache = TTSCache(directory)
+        text = GREETINGS[0]
+        cold = timed(lambda: cache.get_or_create(text, synthesize))
+        memory = timed(lambda: cache.get_or_create(text, synthesize))
+        disk = timed(lambda: TTSCache(directory).get_or_create(text, synthesize))
+        print(f"  🔊 다시 재생: 캐시 없음 {cold:7.1f} ms, 메모리 {memory:6.3f} ms, "
+              f"디스크(다른 워커) {disk:6.3f} ms")
+        
+        # 대화 세션: 턴마다 인사말 1개 + 새 응답 문장 2개, 가끔 다시 재생
+        cache.clear()
+        cache = TTSCache(directory)
+        rng = random.Random(0)
+        uncached_ms = cached_ms = 0.0
+        for turn in range(TURNS):
+            sentences = [rng.choice(GREETINGS), SENTENCES[2 * turn], SENTENCES[2 * turn + 1]]
+            if rng.random() < 0.3:
+                sentences *= 2  # 다시 재생 버튼
+            uncached_ms += len(sentences) * TTS_SECONDS * 1000
+            cached_ms += sum(timed(lambda: cache.get_or_create(s, synthesize)) for s in sentences)
+        stats = cache.stats()
+        print(f"  💬 {TURNS}턴 세션: 합성 대기 {uncached_ms / 1000:5.1f}s → {cached_ms / 1000:5.1f}s, "
+              f"적중률 {stats['hit_rate']:.0%}, 디스크 {stats['disk_bytes'] / 1024 / 1024:.1f} MB")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
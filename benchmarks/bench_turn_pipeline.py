@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+대화 턴 처리 시간 벤치마크 (단계 순차 실행 + 감정 분석 중복 vs 턴 파이프라인)
+"""
+import os
+import sys
+import time
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app'))
+
+from components.metrics import LatencyTracker
+from components.turn_pipeline import TurnPipeline
+
+# 단계별 가상 소요 시간 (초)
+STAGE_SECONDS = {
+    'sentiment': 0.08,
+    'mbti': 0.15,
+    'generate': 0.6,
+    'persist': 0.05,
+    'speak': 0.4
+}
+TURNS = 5
+
+
+def stage(name):
+    def run(*args):
+        time.sleep(STAGE_SECONDS[name])
+        return name
+    return run
+
+
+def sequential_turn(text):
+    """기존 흐름: 응답 생성 안에서 감정 분석을 다시 하고 모든 단계를 차례로 실행"""
+    sentiment = stage('sentiment')(text)
+    stage('sentiment')(text)  # generate_response 내부의 중복 분석
+    response = stage('generate')(text, sentiment)
+    stage('speak')(response)
+    mbti = stage('mbti')(text)
+    stage('persist')(text, response, sentiment, mbti)
+
+
+def main():
+    print("🔀 대화 턴 처리 시간 벤치마크")
+    print("=" * 60)
+    print("📊 단계별 시간: " + ", ".join(f"{k} {v * 1000:.0f}ms" for k, v in STAGE_SECONDS.items()) + "\n")
+    
+    start = time.perf_counter()
+    for _ in range(TURNS):
+        sequential_turn("안녕")
+    sequential_ms = (time.perf_counter() - start) / TURNS * 1000
+    
+    metrics = LatencyTracker()
+    pipeline = TurnPipeline(stage('sentiment'), stage('mbti'), generate=stage('generate'),
+                            persist=stage('persist'), metrics=metrics)
+    for _ in range(TURNS):
+        pipeline.run("안녕", speak=stage('speak'))
+    pipeline.close()
+    pipeline_ms = metrics.summary('turn.total')['mean_ms']
+    
+    print(f"  순차 실행 (감정 분석 2회): 턴당 {sequential_ms:7.1f} ms")
+    print(f"  턴 파이프라인            : 턴당 {pipeline_ms:7.1f} ms ({sequential_ms / pipeline_ms:.2f}배 빠름)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+VAD 조기 종료 벤치마크 - 고정 5초 녹음 vs 후행 무음 감지 종료
+
+사용법:
+    python benchmarks/bench_vad.py                # 합성 발화 픽스처
+    python benchmarks/bench_vad.py a.wav b.wav    # 녹음된 16-bit WAV 파일
+"""
+import os
+import sys
+import time
+import wave
+
+import numpy as np
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app'))
+
+import config
+from components.vad import EnergyVAD
+
+SAMPLE_RATE = 16000
+BLOCK_SIZE = 512  # sounddevice 콜백 블록 크기와 비슷한 값
+LEAD_SILENCE = 0.4  # 버튼을 누른 뒤 말을 시작하기까지의 시간 (seconds)
+
+
+def synthetic_fixture(speech_seconds, noise=0.003, seed=0):
+    """앞뒤 무음 사이에 음성과 비슷한 유성음 구간을 넣은 합성 발화"""
+    rng = np.random.default_rng(seed)
+    total = int((LEAD_SILENCE + speech_seconds + 3.0) * SAMPLE_RATE)
+    signal = rng.standard_normal(total).astype(np.float32) * noise
+    
+    t = np.arange(int(speech_seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    voiced = sum(np.sin(2 * np.pi * 150 * k * t) / k for k in range(1, 6))
+    envelope = 0.6 + 0.4 * np.sin(2 * np.pi * 4 * t)
+    start = int(LEAD_SILENCE * SAMPLE_RATE)
+    signal[start:start + len(t)] += (0.15 * envelope * voiced).astype(np.float32)
+    return f"합성 {speech_seconds:.1f}초 발화", signal, SAMPLE_RATE, LEAD_SILENCE + speech_seconds
+
+
+def load_wav_fixture(path):
+    """16-bit PCM WAV 파일을 float32 모노 신호로 읽기"""
+    with wave.open(path, 'rb') as wf:
+        rate = wf.getframerate()
+        pcm = np.frombuffer(wf.readframes(wf.getnframes()), dtype='<i2')
+        pcm = pcm.reshape(-1, wf.getnchannels()).mean(axis=1)
+    # 녹음 파일은 발화 끝을 모르므로 전체 길이를 사용
+    return os.path.basename(path), (pcm / 32768).astype(np.float32), rate, None
+
+
+def run_vad(signal, rate):
+    """콜백처럼 블록 단위로 흘려 보내고 종료 시점과 처리 시간을 측정"""
+    vad = EnergyVAD(rate, threshold_ratio=config.VAD_THRESHOLD_RATIO,
+                    min_rms=config.VAD_MIN_RMS, silence_ms=config.VAD_SILENCE_MS,
+                    max_duration=config.VAD_MAX_DURATION)
+    cpu = 0.0
+    stopped_at = len(signal) / rate
+    for offset in range(0, len(signal), BLOCK_SIZE):
+        block = signal[offset:offset + BLOCK_SIZE].reshape(-1, 1)
+        start = time.perf_counter()
+        done = vad.process(block)
+        cpu += time.perf_counter() - start
+        if done:
+            stopped_at = (offset + len(block)) / rate
+            break
+    return vad, stopped_at, cpu
+
+
+def main():
+    print("🗣️ VAD 조기 종료 벤치마크")
+    print("=" * 78)
+    
+    if len(sys.argv) > 1:
+        fixtures = [load_wav_fixture(path) for path in sys.argv[1:]]
+    else:
+        fixtures = [synthetic_fixture(seconds, seed=i)
+                    for i, seconds in enumerate((0.8, 1.5, 2.5, 4.0, 6.0))]
+                    
+    fixed = config.VOICE_DURATION
+    print(f"📊 고정 녹음 {fixed}초 vs VAD (무음 {config.VAD_SILENCE_MS}ms, "
+          f"최대 {config.VAD_MAX_DURATION}초), 블록 {BLOCK_SIZE} 샘플\n")
+    print(f"  {'픽스처':<16} {'발화 끝':>7} {'고정 녹음':>9} {'VAD 종료':>9} "
+          f"{'말 끝→종료':>10} {'VAD CPU':>9}")
+    
+    before_total = after_total = 0.0
+    for name, signal, rate, speech_end in fixtures:
+        vad, stopped_at, cpu = run_vad(signal, rate)
+        before_total += fixed
+        after_total += stopped_at
+        
+        end_text = f"{speech_end:6.2f}s" if speech_end else "      -"
+        gap = f"{stopped_at - speech_end:9.2f}s" if speech_end else "        -"
+        note = ""
+        if speech_end and speech_end > fixed:
+            note = "  ⚠️ 고정 녹음은 발화가 잘림"
+        if speech_end and stopped_at < speech_end:
+            note = "  ⚠️ VAD가 발화를 자름"
+        print(f"  {name:<16} {end_text} {fixed:8.2f}s {stopped_at:8.2f}s {gap} "
+              f"{cpu * 1000:7.2f}ms ({vad.stop_reason}){note}")
+        
+    count = len(fixtures)
+    print(f"\n⚡ 평균 녹음 대기: {before_total / count:.2f}초 → {after_total / count:.2f}초 "
+          f"(턴당 {(before_total - after_total) / count:.2f}초 단축)")
+    print("\n🎉 벤치마크 완료!")
+
+
+if __name__ == '__main__':
+    main()
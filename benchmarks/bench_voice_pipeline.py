@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+마이크 없이 음성 입력 경로(녹음 → 16kHz 변환 → VAD → 후처리 → 인식) 부하 테스트
+
+사용법:
+    python benchmarks/bench_voice_pipeline.py              # 합성 음성
+    python benchmarks/bench_voice_pipeline.py sample.wav   # WAV/FLAC 파일 재생
+"""
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'app'))
+
+from components.asr import BufferedRecognizer, StubRecognizer
+from components.audio_preprocess import AudioPreprocessor
+from components.audio_sources import FileSource, SyntheticSource
+from components.metrics import LatencyTracker
+from components.vad import EnergyVAD
+from components.voice_recorder import VoiceRecorder
+
+CAPTURE_RATE = 44100
+TARGET_RATE = 16000
+TURNS_PER_SESSION = 5
+SPEEDS = (1.0, 4.0, 0)  # 실시간, 4배속, 최대 속도
+CONCURRENCY = (1, 4)
+
+
+def make_source(path, speed):
+    if path:
+        return FileSource(path, speed=speed)
+    return SyntheticSource(CAPTURE_RATE, phrases=((1.2, 0.3), (0.8, 0.25)), speed=speed)
+
+
+def session(path, speed, metrics):
+    """한 사용자가 TURNS_PER_SESSION번 말하는 동안의 녹음/인식"""
+    recorder = VoiceRecorder(max_duration=15, vad=EnergyVAD(TARGET_RATE, max_duration=15),
+                             target_sample_rate=TARGET_RATE, source=make_source(path, speed))
+    recognizer = BufferedRecognizer(StubRecognizer().recognize, preprocessor=AudioPreprocessor())
+    audio_seconds = 0.0
+    for _ in range(TURNS_PER_SESSION):
+        start = time.perf_counter()
+        recorder.start_recording()
+        recognizer.start(recorder.output_rate)
+        for chunk in recorder.stream_chunks(chunk_ms=100):
+            recognizer.accept_audio(chunk)
+        clip = recorder.stop_recording()
+        recognizer.finish()
+        metrics.record('turn', time.perf_counter() - start)
+        audio_seconds += clip.duration if clip else 0.0
+    return audio_seconds, recorder.overrun_count
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else None
+    print("🎛️ 음성 입력 경로 부하 테스트 (오디오 장치 불필요)")
+    print("=" * 60)
+    print(f"📊 입력: {path or '합성 음성'}, 세션당 {TURNS_PER_SESSION}턴\n")
+    
+    for speed in SPEEDS:
+        for sessions in CONCURRENCY:
+            metrics = LatencyTracker()
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=sessions) as executor:
+                results = list(executor.map(lambda _: session(path, speed, metrics), range(sessions)))
+            elapsed = time.perf_counter() - start
+            audio_seconds = sum(seconds for seconds, _ in results)
+            overruns = sum(count for _, count in results)
+            summary = metrics.summary('turn')
+            label = f"{speed:g}배속" if speed else "최대 속도"
+            print(f"  {label:<8} 세션 {sessions}개: 오디오 {audio_seconds:6.1f}s / {elapsed:5.2f}s "
+                  f"= {audio_seconds / elapsed:6.1f}x 실시간, 턴 평균 {summary['mean_ms']:7.1f} ms, "
+                  f"오버런 {overruns}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+녹음 결과 인코딩 벤치마크 - 임시 WAV 파일(프레임 단위) vs 메모리 내 벡터화 변환
+"""
+import os
+import sys
+import time
+import wave
+import tempfile
+
+import numpy as np
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from components.audio_clip import AudioClip
+
+SAMPLE_RATE = 44100
+DURATION = 5
+BLOCK_SIZE = 512  # sounddevice 콜백 블록 크기와 비슷한 값
+REPEAT = 20
+
+file_events = {'open': 0, 'os.remove': 0}
+
+
+def audit(event, args):
+    if event in file_events:
+        file_events[event] += 1
+
+
+def legacy_turn(frames):
+    """기존 방식: 임시 파일에 프레임별 변환/기록 후 다시 읽고 삭제"""
+    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_wav:
+        temp_path = temp_wav.name
+    with wave.open(temp_path, 'wb') as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(SAMPLE_RATE)
+        for frame in frames:
+            wf.writeframes((frame * 32767).astype(np.int16).tobytes())
+    with wave.open(temp_path, 'rb') as wf:
+        pcm = wf.readframes(wf.getnframes())
+    os.remove(temp_path)
+    return pcm
+
+
+def in_memory_turn(samples):
+    """새 방식: 전체 배열을 한 번에 변환해 메모리에서 전달"""
+    return AudioClip(samples, SAMPLE_RATE).to_pcm16_bytes()
+
+
+def measure(label, func, arg):
+    for key in file_events:
+        file_events[key] = 0
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        func(arg)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / REPEAT
+    opens = file_events['open'] / REPEAT
+    removes = file_events['os.remove'] / REPEAT
+    print(f"  {label:<10} 변환 {elapsed_ms:7.2f} ms/turn   파일 open {opens:4.1f}회   삭제 {removes:3.1f}회")
+    return elapsed_ms
+
+
+def main():
+    print("💾 녹음 인코딩 벤치마크")
+    print("=" * 60)
+    
+    rng = np.random.default_rng(0)
+    samples = (rng.standard_normal((SAMPLE_RATE * DURATION, 1)) * 0.1).astype(np.float32)
+    frames = [samples[i:i + BLOCK_SIZE] for i in range(0, len(samples), BLOCK_SIZE)]
+    print(f"📊 {DURATION}초 @ {SAMPLE_RATE} Hz, 콜백 블록 {len(frames)}개\n")
+    
+    sys.addaudithook(audit)
+    before = measure("temp file", legacy_turn, frames)
+    after = measure("in-memory", in_memory_turn, samples)
+    
+    print(f"\n⚡ {before / after:.1f}배 빠름, 턴당 디스크 왕복 제거")
+    print("\n🎉 벤치마크 완료!")
+
+
+if __name__ == '__main__':
+    main()
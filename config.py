@@ -9,11 +9,94 @@ MAX_TOKENS = 100
 TEMPERATURE = 0.7
 TOP_K = 50
 TOP_P = 0.95
+LLM_STREAMING = True  # 토큰이 생성되는 대로 화면/터미널에 표시 (False면 완성 후 한 번에 표시)
+LLM_MULTI_TURN = True  # 이전 대화를 기억 (chat API, 고정된 시스템 프롬프트 + 대화 기록으로 이전 턴의 KV 캐시 재사용)
+LLM_CONTEXT_WINDOW = 4096  # Ollama num_ctx (모든 요청에 같은 값을 보내야 모델을 다시 불러오지 않음)
+LLM_CONTEXT_MAX_TOKENS = 3072  # 프롬프트(시스템 + 대화 기록 + 질문) 최대 토큰, 응답 길이만큼 num_ctx보다 작게
+LLM_CONTEXT_TRIM_TO = 0.5  # 한도를 넘으면 오래된 턴을 지워 이 비율까지 줄임 (전체 다시 처리는 여러 턴에 한 번)
+LLM_CONTEXT_SUMMARIZE = False  # 지운 턴을 요약해 시스템 프롬프트 뒤에 유지 (정리할 때마다 요약 요청 1회 추가)
+RESPONSE_CACHE_ENABLED = False  # 같은/거의 같은 메시지("안녕", "오늘 기분 어때?")는 생성 없이 이전 응답 재사용
+RESPONSE_CACHE_EMBEDDER = "ngram"  # 유사도 계산: "ngram" (글자 n-gram, 추가 모델 없음) 또는 "ollama" (임베딩 모델, 다른 표현도 인식)
+RESPONSE_CACHE_EMBED_MODEL = "nomic-embed-text"  # ollama 임베딩 모델 (ollama pull 필요)
+RESPONSE_CACHE_THRESHOLD = 0.9  # 이 코사인 유사도 이상이면 같은 질문으로 간주 (ngram은 0.9 미만이면 다른 질문도 맞음)
+RESPONSE_CACHE_TTL_SECONDS = 3600  # 응답 유지 시간 (seconds)
+RESPONSE_CACHE_MAX_ENTRIES = 512  # 최대 응답 수, 넘으면 가장 오래 사용하지 않은 것부터 삭제
+RESPONSE_CACHE_MAX_CONTEXT_TURNS = 0  # 이전 대화가 이보다 많으면 캐시 사용 안 함 (대화 맥락에 맞춘 개인화 응답 보호)
+OLLAMA_TIMEOUT = 120.0  # 응답 대기 시간 (seconds) - 토큰 사이 간격 기준이라 긴 답변도 스트리밍 가능
+OLLAMA_CONNECT_TIMEOUT = 3.0  # 서버 연결 대기 시간 (seconds), 서버가 꺼져 있으면 빨리 실패
+OLLAMA_MAX_CONNECTIONS = 4  # 재사용하는 HTTP 연결 수 (프로세스 전체)
+OLLAMA_KEEP_ALIVE = "30m"  # 마지막 요청 후 Ollama가 모델을 메모리에 유지하는 시간 (-1이면 무제한)
+OLLAMA_PRELOAD = True  # 시작 시 모델을 미리 불러와 첫 응답의 모델 로딩 대기 제거
+OLLAMA_KEEP_WARM_SECONDS = 240  # 이 간격으로 모델 유지 요청 전송 (0이면 사용 안 함)
 
 # 음성 녹음 설정
 VOICE_DURATION = 5  # seconds
+VOICE_MAX_DURATION = 30  # 녹음 버퍼 최대 길이 (seconds), 미리 할당됨
 VOICE_SAMPLE_RATE = 44100
 VOICE_CHANNELS = 1
+VOICE_TARGET_SAMPLE_RATE = 16000  # 녹음 중 모노 16kHz로 변환 (None이면 원본 유지)
+VOICE_INPUT_SOURCE = "microphone"  # "microphone", "file" (VOICE_INPUT_FILE 재생), "synthetic" (합성 음성, 마이크 없는 데모/부하 테스트)
+VOICE_INPUT_FILE = None  # file 입력에 사용할 WAV/FLAC 경로
+VOICE_INPUT_SPEED = 1.0  # file/synthetic 입력 재생 속도 (1.0 = 실시간, 0 = 최대 속도)
+
+# 음성 구간 검출(VAD) 설정 - 말이 끝나면 녹음 자동 종료
+VAD_ENABLED = True  # False면 VOICE_DURATION 동안 고정 녹음
+VAD_SILENCE_MS = 800  # 말이 끝난 뒤 이만큼 조용하면 녹음 종료 (ms)
+VAD_MAX_DURATION = 15  # 최대 녹음 길이 (seconds), VOICE_MAX_DURATION 이하
+VAD_THRESHOLD_RATIO = 3.0  # 잡음 기준 대비 음성으로 판단할 에너지 배율
+VAD_MIN_RMS = 0.01  # 음성으로 판단할 최소 RMS 에너지
+
+# 녹음 후처리 설정 (음성 인식 전 무음 제거/잡음 게이트/음량 정규화)
+PREPROCESS_ENABLED = True
+PREPROCESS_TRIM_DB = 25.0  # 가장 큰 구간보다 이만큼(dB) 작은 앞뒤 구간 제거, None이면 미사용
+PREPROCESS_PADDING_MS = 150  # 제거 후 앞뒤로 남겨둘 여유 구간 (ms)
+PREPROCESS_NOISE_GATE_DB = -50.0  # 이 레벨(dBFS) 미만 구간 감쇠, None이면 미사용
+PREPROCESS_NORMALIZE = "peak"  # "peak", "rms" 또는 None
+PREPROCESS_TARGET_DB = None  # 정규화 목표 레벨 (dBFS), None이면 peak -1 / rms -20
+PREPROCESS_MAX_GAIN_DB = 30.0  # 최대 증폭량 (dB)
+
+# 음성 인식(ASR) 설정
+ASR_BACKEND = "google"  # "google" (네트워크), "local" (오프라인, faster-whisper 필요), "stub" (벤치마크용)
+ASR_LANGUAGE = "ko-KR"
+ASR_LOCAL_MODEL = "small"  # faster-whisper 모델 크기 (tiny, base, small, medium ...)
+ASR_STUB_TRANSCRIPT = "안녕하세요"  # stub 백엔드가 항상 반환하는 문장
+ASR_STUB_LATENCY = 0.0  # stub 백엔드 응답 지연 (seconds)
+ASR_SEGMENT_LONG_CLIPS = True  # 긴 녹음은 쉼 구간에서 나눠 병렬로 인식
+ASR_SEGMENT_MIN_CLIP_SECONDS = 10.0  # 이 길이 이상인 녹음만 분할 인식
+ASR_SEGMENT_WORKERS = 4  # 동시에 인식할 최대 구간 수 (프로세스 전체)
+ASR_SEGMENT_MIN_PAUSE_MS = 300  # 구간을 나눌 최소 쉼 길이 (ms)
+ASR_SEGMENT_MAX_SECONDS = 15.0  # 쉼이 없어도 이 길이에서 강제로 분할 (seconds)
+ASR_SEGMENT_INCREMENTAL = True  # 녹음 중 쉼으로 끝난 구간은 말하는 동안 바로 인식 (부분 결과 표시, 말이 끝나면 마지막 구간만 인식)
+ASR_AUDIO_CODEC = "flac"  # 인식 서버 전송 전 압축: "flac" (무손실), "opus" (soundfile 필요, google은 FLAC만 지원) 또는 None
+ASR_AUDIO_LEVEL = 5  # 압축 강도 (0: 빠름 ~ 8: 최소 크기)
+ASR_AUDIO_STREAMING = True  # 녹음 중에 바로 인코딩 (후처리를 끈 경우에만 적용)
+ASR_AUDIO_VERIFY = False  # FLAC 결과를 다시 디코딩해 원본과 일치하는지 검증
+LATENCY_METRICS_ENABLED = True  # 백엔드별 지연 시간 측정 및 표시
+TURN_PIPELINE_WORKERS = 4  # 응답 생성/음성 재생과 병행하는 MBTI 추정·DB 저장 작업 스레드 수
+
+# 네트워크 호출 보호 설정 (음성 인식/음성 합성 시간 제한 및 서킷 브레이커)
+ASR_TIMEOUT = 10.0  # 음성 인식 요청 1건의 최대 대기 시간 (seconds), None이면 무제한
+TTS_TIMEOUT = 10.0  # 음성 합성 요청 1건의 최대 대기 시간 (seconds), None이면 무제한
+CIRCUIT_FAILURE_THRESHOLD = 3  # 연속 실패가 이 횟수에 도달하면 호출 차단 (즉시 실패)
+CIRCUIT_RESET_SECONDS = 30.0  # 차단 후 이 시간이 지나면 시험 요청 1건 허용
+
+# 음성 출력(TTS) 설정 - 응답을 문장 단위로 합성해 재생 중에 다음 문장 합성
+TTS_BACKEND = "gtts"  # "gtts" (네트워크), "local" (오프라인, melotts 필요), "stub" (벤치마크용)
+TTS_LANGUAGE = "ko"
+TTS_LOCAL_DEVICE = "cpu"  # local 백엔드 추론 장치 ("cpu", "cuda" ...)
+TTS_LOCAL_SPEED = 1.0  # local 백엔드 말하기 속도
+TTS_POOL_SIZE = 1  # 시작 시 미리 불러 두는 local 합성 엔진 수 (동시에 합성할 수 있는 문장 수)
+TTS_STUB_LATENCY = 0.0  # stub 백엔드 합성 지연 (seconds)
+TTS_SPEAK_WHILE_GENERATING = True  # 응답 생성 중 완성된 문장부터 바로 재생 (False면 응답 완성 후 시작)
+TTS_MIN_SENTENCE_CHARS = 10  # 이보다 짧은 문장은 다음 문장과 합쳐서 합성
+TTS_PREFETCH_SENTENCES = 2  # 재생 대기열에 미리 합성해 둘 최대 문장 수
+TTS_CACHE_ENABLED = True  # 합성된 음성을 (문장, 언어, 음성, 속도) 해시로 캐시 - 다시 재생/반복 문장은 즉시, 오프라인 재생
+TTS_CACHE_DIR = ".tts_cache"  # 캐시 디렉터리 (여러 워커 프로세스가 공유)
+TTS_CACHE_MAX_MB = 100  # 디스크 캐시 최대 크기, 넘으면 가장 오래 사용하지 않은 파일부터 삭제
+TTS_CACHE_MEMORY_MB = 16  # 메모리 캐시 최대 크기
+AUDIO_OUTPUT = "pcm"  # "pcm" (한 번 디코딩한 PCM을 sounddevice 저지연 스트림으로 재생) 또는 "pygame" (재생마다 MP3 디코딩)
+AUDIO_OUTPUT_DEVICE = None  # 출력 장치 번호/이름, None이면 기본 장치 (장치 기본 샘플 레이트/채널로 변환)
+AUDIO_PCM_CACHE_MB = 64  # 디코딩된 PCM 캐시 최대 크기 (다시 재생 시 디코딩 생략)
 
 # 별칭 (호환성을 위해)
 RECORDING_DURATION = VOICE_DURATION
@@ -25,7 +108,13 @@ MODEL_CACHE_SIZE = 128
 SENTIMENT_MODEL = "beomi/KcELECTRA-base-v2022"
 
 # 데이터베이스 설정
+DATABASE_BACKEND = "sqlite"  # "sqlite" 또는 "memory" (테스트/데모용, 디스크 미사용)
 DATABASE_PATH = "conversations.db"
+DB_COMPRESS_RESPONSES = False  # 긴 AI 응답 압축 저장
+DB_COMPRESSION = "zlib"  # "zlib" 또는 "zstd" (zstandard 설치 필요)
+DB_COMPRESS_MIN_LENGTH = 256  # 압축할 최소 응답 크기 (bytes)
+DB_ZSTD_DICT_PATH = None  # 학습된 zstd 공유 사전 경로 (선택)
+DB_SHARDS = 1  # 2 이상이면 session_id 해시로 여러 SQLite 파일에 분산 저장
 
 # 오디오 설정
 AUDIO_CHUNK_SIZE = 1024
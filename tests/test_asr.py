@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+스트리밍 음성 인식 경로 테스트 (오프라인 가짜 인식기 사용)
+"""
+import unittest
+import sys
+import os
+import time
+import threading
+
+import numpy as np
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from components.asr import (BufferedRecognizer, FakeStreamingRecognizer, transcribe_stream,
+                            GoogleRecognizer, LocalWhisperRecognizer, RecognizerBackend,
+                            StubRecognizer, create_recognizer)
+from components.metrics import LatencyTracker
+
+SAMPLE_RATE = 16000
+TRANSCRIPT = "안녕 오늘 날씨 정말 좋다"
+
+
+def speech_chunks(seconds, amplitude=0.2, chunk_frames=1600):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    signal = (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.float32).reshape(-1, 1)
+    return [signal[i:i + chunk_frames] for i in range(0, len(signal), chunk_frames)]
+
+
+class TestFakeStreamingRecognizer(unittest.TestCase):
+    """가짜 스트리밍 인식기 테스트"""
+
+    def test_partials_grow_then_final(self):
+        """부분 인식 결과가 점점 늘어나는지 테스트"""
+        print("📝 부분 인식 결과 테스트...")
+        
+        partials = []
+        final = transcribe_stream(speech_chunks(2.0), FakeStreamingRecognizer(TRANSCRIPT),
+                                  SAMPLE_RATE, on_partial=partials.append)
+        
+        self.assertEqual(final, TRANSCRIPT)
+        self.assertGreater(len(partials), 2)
+        self.assertEqual(len(partials), len(set(partials)), "같은 부분 결과가 반복되었습니다")
+        for shorter, longer in zip(partials, partials[1:]):
+            self.assertTrue(longer.startswith(shorter))
+            
+        print(f"✅ 부분 결과 {len(partials)}개")
+    
+    def test_silence_gives_empty_transcript(self):
+        """무음 입력 시 빈 결과 테스트"""
+        final = transcribe_stream(speech_chunks(1.0, amplitude=0.0),
+                                  FakeStreamingRecognizer(TRANSCRIPT), SAMPLE_RATE)
+        self.assertEqual(final, "")
+
+
+class TestBufferedRecognizer(unittest.TestCase):
+    """일괄 인식기 어댑터 테스트"""
+
+    def test_recognize_called_once_with_all_audio(self):
+        """녹음된 전체 오디오로 한 번만 인식하는지 테스트"""
+        try:
+            import speech_recognition  # noqa: F401
+        except ImportError:
+            self.skipTest("speech_recognition 미설치")
+            
+        calls = []
+        
+        def recognize(audio):
+            calls.append(audio)
+            return TRANSCRIPT
+            
+        final = transcribe_stream(speech_chunks(1.5), BufferedRecognizer(recognize), SAMPLE_RATE)
+        
+        self.assertEqual(final, TRANSCRIPT)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0].sample_rate, SAMPLE_RATE)
+        self.assertEqual(len(calls[0].frame_data), int(1.5 * SAMPLE_RATE) * 2)
+    
+    def test_no_audio_skips_recognition(self):
+        """오디오가 없으면 인식을 호출하지 않는지 테스트"""
+        recognizer = BufferedRecognizer(lambda audio: self.fail("인식기가 호출되었습니다"))
+        self.assertEqual(transcribe_stream([], recognizer, SAMPLE_RATE), "")
+    
+    def test_no_partials_without_incremental(self):
+        """일괄 인식기는 녹음 중 부분 결과를 주지 않는지 테스트"""
+        recognizer = BufferedRecognizer(lambda audio: TRANSCRIPT)
+        recognizer.start(SAMPLE_RATE)
+        self.assertEqual([recognizer.accept_audio(chunk) for chunk in speech_chunks(1.0)],
+                         [None] * 10)
+    
+    def _segmented(self, recognize, **options):
+        try:
+            import speech_recognition  # noqa: F401
+        except ImportError:
+            self.skipTest("speech_recognition 미설치")
+        from components.segmentation import SegmentedRecognizer
+        segmenter = SegmentedRecognizer(recognize, min_pause_ms=300, min_segment_seconds=1.0)
+        self.addCleanup(segmenter.close)
+        return BufferedRecognizer(recognize, segmenter=segmenter, incremental=True, **options)
+    
+    def test_incremental_segments(self):
+        """쉼에서 끝난 구간을 바로 인식하고 마지막 구간만 남기는지 테스트"""
+        lengths = []
+        
+        def recognize(audio):
+            lengths.append(len(audio.frame_data) // 2 / SAMPLE_RATE)
+            return f"구간{len(lengths)}"
+        
+        def wait_for_partial(expected):
+            deadline = time.monotonic() + 2
+            while recognizer.partial() != expected and time.monotonic() < deadline:
+                time.sleep(0.01)
+            return recognizer.partial()
+            
+        recognizer = self._segmented(recognize)
+        pause = [np.zeros((1600, 1), dtype=np.float32)] * 4
+        recognizer.start(SAMPLE_RATE)
+        for chunk in speech_chunks(1.2) + pause:
+            recognizer.accept_audio(chunk)
+        self.assertEqual(wait_for_partial("구간1"), "구간1")
+        self.assertEqual(recognizer.accept_audio(speech_chunks(0.1)[0]), "구간1")
+        for chunk in speech_chunks(1.5) + pause + speech_chunks(0.5):
+            recognizer.accept_audio(chunk)
+        self.assertEqual(wait_for_partial("구간1 구간2"), "구간1 구간2")
+        
+        # 말이 끝나면 마지막 구간(남은 쉼 0.1초 + 0.5초)만 인식
+        self.assertEqual(recognizer.finish(), "구간1 구간2 구간3")
+        self.assertEqual(len(lengths), 3)
+        self.assertAlmostEqual(lengths[2], 0.6, places=2)
+    
+    def test_incremental_short_utterance_is_one_call(self):
+        """쉼이 없는 짧은 발화는 한 번에 인식하는지 테스트"""
+        calls = []
+        recognizer = self._segmented(lambda audio: calls.append(audio) or TRANSCRIPT)
+        final = transcribe_stream(speech_chunks(0.8), recognizer, SAMPLE_RATE)
+        self.assertEqual(final, TRANSCRIPT)
+        self.assertEqual(len(calls), 1)
+    
+    def test_incremental_errors_reach_caller(self):
+        """구간 인식 실패가 finish에서 전달되는지 테스트"""
+        import speech_recognition as sr
+        
+        def recognize(audio):
+            raise sr.RequestError("offline")
+            
+        recognizer = self._segmented(recognize)
+        pause = [np.zeros((1600, 1), dtype=np.float32)] * 4
+        recognizer.start(SAMPLE_RATE)
+        for chunk in speech_chunks(1.2) + pause + speech_chunks(0.5):
+            self.assertIsNone(recognizer.accept_audio(chunk))
+        with self.assertRaises(sr.RequestError):
+            recognizer.finish()
+
+
+def make_audio_data(seconds=0.5):
+    """speech_recognition AudioData (설치되지 않았으면 테스트 건너뜀)"""
+    try:
+        import speech_recognition as sr
+    except ImportError:
+        raise unittest.SkipTest("speech_recognition 미설치")
+    pcm = np.zeros(int(seconds * SAMPLE_RATE), dtype='<i2').tobytes()
+    return sr.AudioData(pcm, SAMPLE_RATE, 2)
+
+
+class TestRecognizerBackends(unittest.TestCase):
+    """음성 인식 백엔드 테스트 (네트워크/모델 불필요)"""
+
+    def test_factory(self):
+        """설정값으로 백엔드 생성 테스트"""
+        print("🔌 ASR 백엔드 팩토리 테스트...")
+        
+        self.assertIsInstance(create_recognizer('stub'), StubRecognizer)
+        self.assertIsInstance(create_recognizer('LOCAL'), LocalWhisperRecognizer)
+        with self.assertRaises(ValueError):
+            create_recognizer('sphinx')
+            
+        print("✅ ASR 백엔드 팩토리 성공")
+    
+    def test_backend_must_implement_recognize(self):
+        """_recognize를 구현하지 않은 백엔드는 만들 때 바로 실패하는지 테스트"""
+        class Incomplete(RecognizerBackend):
+            name = 'incomplete'
+            
+        with self.assertRaises(TypeError):
+            Incomplete()
+    
+    def test_stub_is_deterministic_and_tracked(self):
+        """stub 백엔드 결과와 지연 시간 기록 테스트"""
+        metrics = LatencyTracker()
+        backend = create_recognizer('stub', metrics=metrics, stub_transcript=TRANSCRIPT,
+                                    stub_latency=0.01)
+        audio = make_audio_data()
+        
+        results = {backend.recognize(audio) for _ in range(3)}
+        
+        self.assertEqual(results, {TRANSCRIPT})
+        summary = metrics.summary('asr.stub')
+        self.assertEqual(summary['count'], 3)
+        self.assertGreaterEqual(summary['p50_ms'], 10)
+    
+    def test_google_uses_language(self):
+        """Google 백엔드가 설정된 언어로 호출하는지 테스트"""
+        calls = []
+        
+        class FakeRecognizer:
+            def recognize_google(self, audio, language):
+                calls.append(language)
+                return TRANSCRIPT
+                
+        backend = GoogleRecognizer('ko-KR', recognizer=FakeRecognizer())
+        self.assertEqual(backend.recognize(make_audio_data()), TRANSCRIPT)
+        self.assertEqual(calls, ['ko-KR'])
+    
+    def test_local_engine_reuses_model(self):
+        """로컬 엔진이 모델을 한 번만 불러와 16kHz 배열로 인식하는지 테스트"""
+        import speech_recognition as sr
+        received = []
+        
+        class Segment:
+            text = " 안녕 "
+        
+        class FakeModel:
+            def transcribe(self, samples, language, beam_size):
+                received.append((samples.dtype, len(samples), language))
+                return iter([Segment()]), None
+                
+        backend = LocalWhisperRecognizer(language='ko-KR')
+        backend._model = FakeModel()
+        audio = make_audio_data(0.5)
+        
+        self.assertEqual(backend.recognize(audio), "안녕")
+        self.assertEqual(backend.recognize(audio), "안녕")
+        self.assertEqual(received[0], (np.float32, SAMPLE_RATE // 2, 'ko'))
+        
+        FakeModel.transcribe = lambda self, samples, language, beam_size: (iter([]), None)
+        with self.assertRaises(sr.UnknownValueError):
+            backend.recognize(audio)
+    
+    def test_local_engine_requires_package(self):
+        """faster-whisper 미설치 시 명확한 오류 테스트"""
+        try:
+            import faster_whisper  # noqa: F401
+            self.skipTest("faster-whisper가 설치되어 있습니다")
+        except ImportError:
+            pass
+        with self.assertRaises(RuntimeError):
+            LocalWhisperRecognizer().load()
+    
+    def test_local_engine_prewarm_loads_model(self):
+        """prewarm 시 모델을 미리 불러와 첫 인식에서 불러오지 않는지 테스트"""
+        import types
+        from unittest import mock
+        
+        loaded = []
+        
+        class WhisperModel:
+            def __init__(self, model_size, device, compute_type):
+                loaded.append(model_size)
+                
+        module = types.ModuleType('faster_whisper')
+        module.WhisperModel = WhisperModel
+        with mock.patch.dict(sys.modules, {'faster_whisper': module}):
+            backend = LocalWhisperRecognizer('tiny')
+            backend.prewarm()
+            self.assertEqual(loaded, ['tiny'])
+            backend.load()
+        self.assertEqual(loaded, ['tiny'])
+        StubRecognizer().prewarm()
+
+
+class TestRecorderStreaming(unittest.TestCase):
+    """VoiceRecorder.stream_chunks → 인식기 경로 테스트 (오디오 장치 불필요)"""
+
+    def setUp(self):
+        """테스트 준비"""
+        try:
+            from components.voice_recorder import VoiceRecorder
+            from components.vad import EnergyVAD
+        except OSError as e:
+            self.skipTest(f"오디오 라이브러리를 불러올 수 없습니다: {e}")
+            
+        vad = EnergyVAD(SAMPLE_RATE, silence_ms=300, max_duration=5)
+        self.recorder = VoiceRecorder(sample_rate=SAMPLE_RATE, channels=1, max_duration=5, vad=vad)
+    
+    def _play(self, signal, block=320, speed=4):
+        """오디오 장치 대신 실시간의 speed배 속도로 콜백을 호출"""
+        for offset in range(0, len(signal), block):
+            if self.recorder.capture_done.is_set():
+                return
+            self.recorder.callback(signal[offset:offset + block], block, None, None)
+            time.sleep(block / SAMPLE_RATE / speed)
+    
+    def test_segments_recognized_while_recording(self):
+        """말하는 도중 쉼으로 끝난 구간을 녹음 중에 인식하는지 테스트"""
+        print("⚡ 녹음 중 구간 인식 테스트...")
+        from components.segmentation import SegmentedRecognizer
+        from components.vad import EnergyVAD
+        
+        # 구간 사이 쉼(0.4초)보다 길게 말이 끊겨야 녹음 종료
+        self.recorder.vad = EnergyVAD(SAMPLE_RATE, silence_ms=700, max_duration=5)
+        silence = np.zeros((SAMPLE_RATE // 4, 1), dtype=np.float32)
+        pause = np.zeros((int(0.4 * SAMPLE_RATE), 1), dtype=np.float32)
+        signal = np.concatenate([silence] + speech_chunks(1.5) + [pause] + speech_chunks(1.0)
+                                + [silence] * 6)
+        
+        calls = []
+        
+        def recognize(audio):
+            calls.append(time.monotonic())
+            time.sleep(0.1)
+            return "첫 문장" if len(calls) == 1 else "두 번째 문장"
+            
+        segmenter = SegmentedRecognizer(recognize, min_pause_ms=300, min_segment_seconds=1.0)
+        recognizer = BufferedRecognizer(recognize, segmenter=segmenter, incremental=True)
+        captured_at = []
+        watcher = threading.Thread(
+            target=lambda: self.recorder.capture_done.wait(5) and captured_at.append(time.monotonic()))
+        player = threading.Thread(target=self._play, args=(signal,), kwargs={'speed': 2})
+        self.recorder.recording = True
+        watcher.start()
+        player.start()
+        
+        partials = []
+        final = transcribe_stream(self.recorder.stream_chunks(chunk_ms=50), recognizer,
+                                  SAMPLE_RATE, on_partial=partials.append)
+        player.join()
+        watcher.join()
+        segmenter.close()
+        
+        self.assertEqual(final, "첫 문장 두 번째 문장")
+        self.assertEqual(len(calls), 2)
+        # 첫 구간은 녹음이 끝나기 전에 인식이 시작되어 부분 결과로 표시됨
+        self.assertLess(calls[0], captured_at[0])
+        self.assertIn("첫 문장", partials)
+        
+        print("✅ 녹음 중 구간 인식 성공")
+    
+    def test_stream_stops_at_max_seconds(self):
+        """최대 길이에서 스트림이 끝나는지 테스트"""
+        self.recorder.vad = None
+        self.recorder.recording = True
+        self.recorder.callback(np.full((SAMPLE_RATE * 2, 1), 0.1, dtype=np.float32),
+                               SAMPLE_RATE * 2, None, None)
+        
+        chunks = list(self.recorder.stream_chunks(chunk_ms=100, max_seconds=1.0))
+        self.assertEqual(sum(len(chunk) for chunk in chunks), SAMPLE_RATE)
+    
+    def test_stream_ends_when_idle(self):
+        """오디오가 들어오지 않으면 스트림이 끝나는지 테스트"""
+        self.recorder.recording = True
+        start = time.monotonic()
+        self.assertEqual(list(self.recorder.stream_chunks(idle_timeout=0.1)), [])
+        self.assertLess(time.monotonic() - start, 1.0)
+
+
+if __name__ == '__main__':
+    print("📝 ENFP AI Voice Chatbot - Streaming ASR 기능 테스트 시작")
+    print("=" * 60)
+    
+    unittest.main(verbosity=2, exit=False)
+    
+    print("\n" + "=" * 60)
+    print("🎉 스트리밍 음성 인식 테스트가 완료되었습니다!")
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+인식 전송용 오디오 압축(FLAC/Opus) 기능 테스트
+"""
+import unittest
+import sys
+import os
+
+import numpy as np
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from components.audio_clip import AudioClip
+
+try:
+    import speech_recognition as sr
+    from speech_recognition.audio import get_flac_converter
+    from components.audio_encoding import (AudioEncoder, EncodedAudioData, decode_flac,
+                                           opus_supported, soundfile)
+    ENCODER_AVAILABLE = soundfile is not None or bool(get_flac_converter())
+except (ImportError, OSError):
+    sr = None
+    ENCODER_AVAILABLE = False
+
+SAMPLE_RATE = 16000
+
+
+def make_clip(seconds=2.0, sample_rate=SAMPLE_RATE):
+    """잡음이 섞인 합성 음성 클립"""
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    samples = 0.3 * np.sin(2 * np.pi * 220 * t) * (1 + 0.5 * np.sin(2 * np.pi * 3 * t))
+    samples += 0.005 * rng.standard_normal(len(t))
+    return AudioClip(samples.astype(np.float32), sample_rate, 1)
+
+
+@unittest.skipUnless(ENCODER_AVAILABLE, "soundfile 또는 flac 실행 파일 필요")
+class TestAudioEncoder(unittest.TestCase):
+    """클립 단위 압축 테스트"""
+
+    def setUp(self):
+        self.clip = make_clip()
+        self.encoder = AudioEncoder('flac', level=5, verify=True)
+    
+    def test_flac_is_lossless(self):
+        """FLAC 왕복 무손실 검증 테스트"""
+        print("🗜️ FLAC 무손실 압축 테스트...")
+        payload, report = self.encoder.encode(self.clip)
+        
+        self.assertTrue(report['verified'])
+        np.testing.assert_array_equal(decode_flac(payload),
+                                      np.frombuffer(self.clip.to_pcm16_bytes(), dtype='<i2'))
+        self.assertEqual(report['raw_bytes'], len(self.clip.to_pcm16_bytes()))
+        self.assertEqual(report['encoded_bytes'], len(payload))
+        self.assertGreater(report['bytes_saved'], 0)
+        self.assertGreater(report['encode_ms'], 0)
+        print(f"   {report['raw_bytes']} → {report['encoded_bytes']} bytes "
+              f"({report['ratio']:.0%}), {report['encode_ms']:.1f} ms")
+        print("✅ FLAC 무손실 압축 성공")
+    
+    def test_level_changes_size(self):
+        """압축 강도가 높을수록 작거나 같은지 테스트"""
+        fast, _ = AudioEncoder('flac', level=0).encode(self.clip)
+        best, _ = AudioEncoder('flac', level=8).encode(self.clip)
+        self.assertLessEqual(len(best), len(fast))
+    
+    def test_stereo_clip_is_downmixed(self):
+        """스테레오 클립은 모노로 압축되는지 테스트"""
+        mono = self.clip.samples[:, 0]
+        stereo = AudioClip(np.stack([mono, mono], axis=1), SAMPLE_RATE, 2)
+        payload, report = self.encoder.encode(stereo)
+        self.assertTrue(report['verified'])
+        self.assertEqual(len(decode_flac(payload)), self.clip.num_frames)
+    
+    def test_audio_data_carries_payload(self):
+        """인식기에 넘기는 AudioData가 미리 압축한 FLAC을 쓰는지 테스트"""
+        audio = self.encoder.to_audio_data(self.clip)
+        self.assertIsInstance(audio, EncodedAudioData)
+        self.assertEqual(audio.get_flac_data(convert_width=2), audio.flac_data)
+        self.assertEqual(audio.get_raw_data(), self.clip.to_pcm16_bytes())
+        # 다른 샘플 레이트 요청은 기존 변환 경로 사용
+        self.assertNotEqual(audio.get_flac_data(convert_rate=8000), audio.flac_data)
+    
+    def test_opus_falls_back_to_flac(self):
+        """Opus를 쓸 수 없으면 FLAC으로 대체되는지 테스트"""
+        encoder = AudioEncoder('opus')
+        _, report = encoder.encode(make_clip(sample_rate=44100))
+        self.assertEqual(report['codec'], 'flac')
+        if opus_supported(SAMPLE_RATE):
+            payload, report = encoder.encode(self.clip)
+            self.assertEqual(report['codec'], 'opus')
+            self.assertIsNone(report['verified'])
+            self.assertLess(len(payload), report['raw_bytes'] / 4)
+    
+    def test_invalid_codec(self):
+        """지원하지 않는 코덱 테스트"""
+        with self.assertRaises(ValueError):
+            AudioEncoder('mp3')
+
+
+@unittest.skipUnless(ENCODER_AVAILABLE, "soundfile 또는 flac 실행 파일 필요")
+class TestStreamingEncoder(unittest.TestCase):
+    """녹음 중 스트리밍 압축 테스트"""
+
+    def test_stream_matches_clip(self):
+        """조각 단위 압축 결과가 원본과 일치하는지 테스트"""
+        print("🌊 스트리밍 압축 테스트...")
+        clip = make_clip(3.0)
+        stream = AudioEncoder('flac', streaming=True, verify=True).open_stream(SAMPLE_RATE)
+        for start in range(0, clip.num_frames, 1600):
+            stream.write(clip.samples[start:start + 1600])
+        payload, report = stream.finish()
+        
+        self.assertTrue(report['verified'])
+        np.testing.assert_array_equal(decode_flac(payload),
+                                      np.frombuffer(clip.to_pcm16_bytes(), dtype='<i2'))
+        print(f"   마무리까지 {report['encode_ms']:.1f} ms, {report['bytes_saved']} bytes 절약")
+        print("✅ 스트리밍 압축 성공")
+    
+    def test_buffered_recognizer_uses_stream(self):
+        """BufferedRecognizer가 녹음 중 압축한 결과를 인식기에 넘기는지 테스트"""
+        from components.asr import BufferedRecognizer
+        received = []
+        
+        def recognize(audio):
+            received.append(audio)
+            return "안녕하세요"
+        encoder = AudioEncoder('flac', streaming=True)
+        recognizer = BufferedRecognizer(recognize, encoder=encoder)
+        clip = make_clip(1.0)
+        recognizer.start(SAMPLE_RATE)
+        for start in range(0, clip.num_frames, 1600):
+            recognizer.accept_audio(clip.samples[start:start + 1600])
+            
+        self.assertEqual(recognizer.finish(), "안녕하세요")
+        self.assertIsInstance(received[0], EncodedAudioData)
+        np.testing.assert_array_equal(decode_flac(received[0].flac_data),
+                                      np.frombuffer(clip.to_pcm16_bytes(), dtype='<i2'))
+    
+    def test_abandoned_stream(self):
+        """새 녹음이 시작되면 이전 스트림이 정리되는지 테스트"""
+        from components.asr import BufferedRecognizer
+        recognizer = BufferedRecognizer(lambda audio: "", encoder=AudioEncoder(streaming=True))
+        recognizer.start(SAMPLE_RATE)
+        recognizer.accept_audio(make_clip(0.5).samples)
+        recognizer.start(SAMPLE_RATE)
+        self.assertEqual(recognizer.finish(), "")
+
+
+if __name__ == '__main__':
+    print("🗜️ ENFP AI Voice Chatbot - Audio Encoding 기능 테스트 시작")
+    print("=" * 60)
+    
+    unittest.main(verbosity=2, exit=False)
+    
+    print("\n" + "=" * 60)
+    print("🎉 오디오 압축 테스트가 완료되었습니다!")
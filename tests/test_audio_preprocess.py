@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+녹음 후처리(무음 제거/잡음 게이트/정규화) 기능 테스트
+"""
+import unittest
+import sys
+import os
+
+import numpy as np
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from components.audio_clip import AudioClip
+from components.audio_preprocess import AudioPreprocessor, amplitude_to_db
+
+SAMPLE_RATE = 16000
+
+
+def make_clip(lead=1.0, speech=1.0, tail=1.5, amplitude=0.05, noise=0.001):
+    """앞뒤 무음 사이에 작은 소리의 음성 구간이 있는 클립"""
+    rng = np.random.default_rng(0)
+    total = int((lead + speech + tail) * SAMPLE_RATE)
+    samples = rng.standard_normal(total).astype(np.float32) * noise
+    t = np.arange(int(speech * SAMPLE_RATE)) / SAMPLE_RATE
+    start = int(lead * SAMPLE_RATE)
+    samples[start:start + len(t)] += amplitude * np.sin(2 * np.pi * 220 * t)
+    return AudioClip(samples, SAMPLE_RATE)
+
+
+class TestAudioPreprocessor(unittest.TestCase):
+    """녹음 후처리 테스트"""
+
+    def test_trims_leading_and_trailing_silence(self):
+        """앞뒤 무음 제거 및 길이 보고 테스트"""
+        print("✂️ 무음 제거 테스트...")
+        
+        preprocessor = AudioPreprocessor(padding_ms=100, noise_gate_db=None, normalize=None)
+        clip, report = preprocessor.process(make_clip())
+        
+        self.assertAlmostEqual(report['original_duration'], 3.5)
+        self.assertAlmostEqual(clip.duration, 1.2, delta=0.05)
+        self.assertAlmostEqual(report['trimmed_seconds'], 2.3, delta=0.05)
+        self.assertEqual(report['trimmed_duration'], clip.duration)
+        
+        print(f"✅ {report['trimmed_seconds']:.2f}초 제거")
+    
+    def test_peak_normalization(self):
+        """피크 정규화 테스트"""
+        preprocessor = AudioPreprocessor(trim_db=None, noise_gate_db=None, normalize='peak')
+        clip, report = preprocessor.process(make_clip(amplitude=0.05))
+        
+        peak = np.max(np.abs(clip.samples))
+        self.assertAlmostEqual(amplitude_to_db(peak), -1.0, delta=0.1)
+        self.assertGreater(report['gain_db'], 20)
+    
+    def test_rms_normalization_never_clips(self):
+        """RMS 정규화 시 클리핑 방지 테스트"""
+        preprocessor = AudioPreprocessor(trim_db=None, noise_gate_db=None,
+                                         normalize='rms', target_db=-3.0)
+        clip, _ = preprocessor.process(make_clip(amplitude=0.5))
+        
+        self.assertLess(np.max(np.abs(clip.samples)), 1.0)
+    
+    def test_max_gain_limits_silence(self):
+        """무음에 가까운 클립의 과도한 증폭 제한 테스트"""
+        preprocessor = AudioPreprocessor(trim_db=None, noise_gate_db=None, max_gain_db=12.0)
+        _, report = preprocessor.process(make_clip(amplitude=0.0))
+        
+        self.assertLessEqual(report['gain_db'], 12.0)
+    
+    def test_noise_gate_attenuates_background(self):
+        """잡음 게이트 테스트"""
+        print("🚪 잡음 게이트 테스트...")
+        
+        clip = make_clip(noise=0.002)
+        preprocessor = AudioPreprocessor(trim_db=None, noise_gate_db=-40.0, normalize=None)
+        gated, _ = preprocessor.process(clip)
+        
+        background = slice(0, SAMPLE_RATE // 2)
+        speech = slice(int(1.2 * SAMPLE_RATE), int(1.8 * SAMPLE_RATE))
+        self.assertLess(np.abs(gated.samples[background]).max(),
+                        np.abs(clip.samples[background]).max() * 0.1)
+        np.testing.assert_allclose(gated.samples[speech], clip.samples[speech])
+        
+        print("✅ 잡음 게이트 성공")
+    
+    def test_silent_clip_becomes_empty(self):
+        """음성이 없는 클립 처리 테스트"""
+        clip, report = AudioPreprocessor().process(make_clip(amplitude=0.0, noise=0.0001))
+        
+        self.assertEqual(clip.num_frames, 0)
+        self.assertEqual(report['trimmed_duration'], 0.0)
+    
+    def test_input_clip_not_modified(self):
+        """읽기 전용 녹음 버퍼 뷰를 변경하지 않는지 테스트"""
+        original = make_clip()
+        original.samples.flags.writeable = False
+        before = original.samples.copy()
+        
+        AudioPreprocessor().process(original)
+        np.testing.assert_array_equal(original.samples, before)
+    
+    def test_invalid_mode(self):
+        """잘못된 정규화 방식 테스트"""
+        with self.assertRaises(ValueError):
+            AudioPreprocessor(normalize='loudness')
+
+
+if __name__ == '__main__':
+    print("✂️ ENFP AI Voice Chatbot - Audio Preprocess 기능 테스트 시작")
+    print("=" * 60)
+    
+    unittest.main(verbosity=2, exit=False)
+    
+    print("\n" + "=" * 60)
+    print("🎉 녹음 후처리 테스트가 완료되었습니다!")
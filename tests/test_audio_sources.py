@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+녹음 입력 소스(파일 재생/합성 음성) 기능 테스트 - 오디오 장치 불필요
+"""
+import unittest
+import sys
+import os
+import time
+import tempfile
+
+import numpy as np
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from components.audio_clip import AudioClip
+from components.audio_sources import (AudioSource, FileSource, MicrophoneSource, ReplaySource,
+                                      SyntheticSource, create_audio_source, read_audio_file, sd)
+from components.vad import EnergyVAD
+from components.voice_recorder import VoiceRecorder
+
+SAMPLE_RATE = 16000
+
+
+class TestReplaySources(unittest.TestCase):
+    """재생 소스 속도 및 종료 테스트"""
+
+    def _collect(self, source):
+        blocks = []
+        finished = []
+        source.start(lambda indata, frames, time, status: blocks.append(indata.copy()),
+                     finished_callback=lambda: finished.append(True))
+        self.assertTrue(source.wait(10))
+        return blocks, finished
+    
+    def test_real_time_pace(self):
+        """실시간/가속 재생 속도 테스트"""
+        print("⏱️ 재생 속도 테스트...")
+        for speed, expected in ((1.0, 0.5), (5.0, 0.1)):
+            source = SyntheticSource(SAMPLE_RATE, phrases=((0.2, 0.3),), lead_silence=0.1,
+                                     tail_silence=0.2, speed=speed)
+            start = time.perf_counter()
+            blocks, finished = self._collect(source)
+            elapsed = time.perf_counter() - start
+            
+            self.assertEqual(finished, [True])
+            self.assertEqual(sum(len(block) for block in blocks), source.frames_delivered)
+            # 마지막 블록은 예정 시각에 전달되므로 길이보다 한 블록만큼 짧을 수 있음
+            self.assertGreater(elapsed, expected * 0.8)
+            self.assertLess(elapsed, expected + 0.15)
+            print(f"   {speed}배속: 0.5초 분량 → {elapsed:.2f}s")
+        print("✅ 재생 속도 성공")
+    
+    def test_unpaced_is_fast(self):
+        """speed=0이면 최대 속도로 전달되는지 테스트"""
+        source = SyntheticSource(SAMPLE_RATE, phrases=((5.0, 0.3),), speed=0, utterances=2)
+        start = time.perf_counter()
+        blocks, _ = self._collect(source)
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(sum(len(block) for block in blocks), len(source.utterance()) * 2)
+    
+    def test_stop_interrupts(self):
+        """재생 도중 중지 테스트"""
+        source = SyntheticSource(SAMPLE_RATE, phrases=((10.0, 0.3),), speed=1.0)
+        finished = []
+        source.start(lambda *args: None, finished_callback=lambda: finished.append(True))
+        time.sleep(0.1)
+        source.stop()
+        self.assertLess(source.frames_delivered, SAMPLE_RATE)
+        self.assertEqual(finished, [])
+    
+    def test_synthetic_stereo(self):
+        """채널 수 지정 테스트"""
+        source = SyntheticSource(SAMPLE_RATE, channels=2, speed=0)
+        self.assertEqual(source.utterance().shape[1], 2)
+    
+    def test_factory(self):
+        """입력 소스 생성 함수 테스트"""
+        self.assertIsInstance(create_audio_source('synthetic', 16000), SyntheticSource)
+        self.assertIsInstance(create_audio_source('microphone', 44100), MicrophoneSource)
+        with self.assertRaises(ValueError):
+            create_audio_source('file')
+        with self.assertRaises(ValueError):
+            create_audio_source('line-in')
+    
+    def test_sources_must_implement_interface(self):
+        """start/stop/blocks를 구현하지 않은 소스는 만들 수 없는지 테스트"""
+        with self.assertRaises(TypeError):
+            AudioSource(SAMPLE_RATE)
+        with self.assertRaises(TypeError):
+            ReplaySource(SAMPLE_RATE)
+    
+    @unittest.skipIf(sd is not None, "sounddevice 사용 가능 환경")
+    def test_microphone_without_portaudio(self):
+        """PortAudio가 없으면 마이크 입력이 명확한 오류를 내는지 테스트"""
+        with self.assertRaises(RuntimeError):
+            MicrophoneSource(SAMPLE_RATE).start(lambda *args: None)
+
+
+class TestFileSource(unittest.TestCase):
+    """파일 재생 소스 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        t = np.arange(44100) / 44100
+        self.samples = (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+        self.clip = AudioClip(self.samples, 44100, 1)
+    
+    def tearDown(self):
+        for name in os.listdir(self.temp_dir):
+            os.remove(os.path.join(self.temp_dir, name))
+        os.rmdir(self.temp_dir)
+    
+    def test_read_wav(self):
+        """WAV 파일 읽기 테스트"""
+        path = self.clip.save_wav(os.path.join(self.temp_dir, "clip.wav"))
+        samples, sample_rate = read_audio_file(path)
+        self.assertEqual(sample_rate, 44100)
+        self.assertEqual(samples.shape, (44100, 1))
+        np.testing.assert_allclose(samples[:, 0], self.samples, atol=1e-4)
+    
+    def test_read_flac(self):
+        """FLAC 파일 읽기 테스트"""
+        try:
+            from components.audio_encoding import AudioEncoder
+            payload, _ = AudioEncoder('flac').encode(self.clip)
+        except Exception as e:
+            self.skipTest(f"FLAC 인코더를 사용할 수 없습니다: {e}")
+        path = os.path.join(self.temp_dir, "clip.flac")
+        with open(path, 'wb') as f:
+            f.write(payload)
+            
+        samples, sample_rate = read_audio_file(path)
+        self.assertEqual(sample_rate, 44100)
+        np.testing.assert_allclose(samples[:, 0], self.samples, atol=1e-4)
+    
+    def test_recorder_replays_file(self):
+        """파일 재생 → 녹음기(16kHz 변환) 경로 테스트"""
+        print("📼 파일 재생 녹음 테스트...")
+        path = self.clip.save_wav(os.path.join(self.temp_dir, "clip.wav"))
+        source = FileSource(path, speed=0, tail_silence=0.5)
+        recorder = VoiceRecorder(max_duration=5, target_sample_rate=SAMPLE_RATE, source=source)
+        self.assertEqual(recorder.sample_rate, 44100)
+        
+        recorder.start_recording()
+        self.assertTrue(recorder.wait_for_speech_end(5))
+        clip = recorder.stop_recording()
+        
+        self.assertEqual(clip.sample_rate, SAMPLE_RATE)
+        self.assertAlmostEqual(clip.duration, 1.5, delta=0.01)
+        print(f"   {source.duration:.1f}s 파일 → {clip.duration:.2f}s @ {clip.sample_rate} Hz")
+        print("✅ 파일 재생 녹음 성공")
+
+
+class TestRecorderWithSyntheticSource(unittest.TestCase):
+    """합성 음성 → 녹음기 → VAD 경로 테스트"""
+
+    def test_vad_ends_capture(self):
+        """합성 발화 뒤 무음에서 VAD가 녹음을 끝내는지 테스트"""
+        print("🤖 합성 음성 VAD 테스트...")
+        source = SyntheticSource(SAMPLE_RATE, phrases=((0.8, 0.3), (0.6, 0.25)),
+                                 tail_silence=3.0, speed=0)
+        vad = EnergyVAD(SAMPLE_RATE, silence_ms=500)
+        recorder = VoiceRecorder(max_duration=10, vad=vad, source=source)
+        
+        recorder.start_recording()
+        chunks = list(recorder.stream_chunks(chunk_ms=100))
+        clip = recorder.stop_recording()
+        
+        self.assertEqual(vad.stop_reason, 'silence')
+        self.assertTrue(recorder.speech_started.is_set())
+        self.assertEqual(sum(len(chunk) for chunk in chunks), clip.num_frames)
+        # 발화 약 2.2초 + 무음 0.5초 근처에서 종료 (3초 무음 전체가 아님)
+        self.assertLess(clip.duration, 3.5)
+        print(f"   {clip.duration:.2f}s 녹음 후 VAD 종료")
+        print("✅ 합성 음성 VAD 성공")
+
+
+if __name__ == '__main__':
+    print("🎛️ ENFP AI Voice Chatbot - Audio Sources 기능 테스트 시작")
+    print("=" * 60)
+    
+    unittest.main(verbosity=2, exit=False)
+    
+    print("\n" + "=" * 60)
+    print("🎉 녹음 입력 소스 테스트가 완료되었습니다!")
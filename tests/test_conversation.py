@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+대화 맥락(멀티턴 기록, 토큰 한도 정리, 프롬프트 캐시 재사용) 기능 테스트
+"""
+import unittest
+import sys
+import os
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from components.conversation import ConversationContext, estimate_tokens, summary_prompt
+from components.llm import SYSTEM_PROMPT, build_user_message
+
+
+class PrefixCache:
+    """Ollama처럼 직전 요청과 같은 앞부분은 다시 처리하지 않는 프롬프트 캐시 흉내"""
+
+    def __init__(self):
+        self.cached = []
+    
+    def prefill(self, messages, response):
+        """이번 요청에서 새로 처리해야 하는 토큰 수"""
+        common = 0
+        while (common < len(self.cached) and common < len(messages)
+               and self.cached[common] == messages[common]):
+            common += 1
+        self.cached = list(messages) + [{'role': 'assistant', 'content': response}]
+        return ConversationContext._tokens(messages[common:])
+
+
+def talk(context, turns, cache=None):
+    """turns번 대화하며 턴별 새로 처리한 토큰 수를 반환"""
+    prefills = []
+    for index in range(turns):
+        message = build_user_message(f"{index}번째 이야기인데, 오늘 있었던 일을 자세히 들려줄게요.", "긍정")
+        messages = context.messages(message)
+        response = f"와, {index}번째 이야기 정말 재미있어요! 더 들려주세요, 궁금해요!"
+        if cache is not None:
+            prefills.append(cache.prefill(messages, response))
+        context.add_turn(message, response)
+    return prefills
+
+
+class TestEstimateTokens(unittest.TestCase):
+    """토큰 수 추정 테스트"""
+
+    def test_korean_counts_per_character(self):
+        """한글은 글자당 1토큰, 영문은 4글자당 1토큰"""
+        self.assertEqual(estimate_tokens("안녕하세요"), 5)
+        self.assertEqual(estimate_tokens("abcdefgh"), 2)
+        self.assertEqual(estimate_tokens(""), 0)
+
+
+class TestConversationContext(unittest.TestCase):
+    """대화 맥락 테스트"""
+
+    def test_history_is_append_only(self):
+        """요청마다 직전 요청 + 응답이 그대로 앞부분이 되는지 테스트"""
+        print("📜 대화 기록 앞부분 유지 테스트...")
+        context = ConversationContext(SYSTEM_PROMPT, max_tokens=100000)
+        first = context.messages("안녕?")
+        context.add_turn("안녕?", "안녕하세요!")
+        second = context.messages("뭐 해?")
+        
+        self.assertEqual(first[0], {'role': 'system', 'content': SYSTEM_PROMPT})
+        self.assertEqual(second[:len(first)], first)
+        self.assertEqual(second[len(first)], {'role': 'assistant', 'content': "안녕하세요!"})
+        self.assertEqual(second[-1], {'role': 'user', 'content': "뭐 해?"})
+        print("✅ 이전 요청이 다음 요청의 앞부분")
+    
+    def test_prefix_reuse_saves_prefill(self):
+        """캐시 재사용 시 턴마다 새 질문만 처리하는지 테스트"""
+        print("⚡ 프롬프트 재처리 절감 테스트...")
+        context = ConversationContext(SYSTEM_PROMPT, max_tokens=100000)
+        prefills = talk(context, 10, PrefixCache())
+        # 첫 턴만 시스템 프롬프트까지 처리, 이후는 직전 응답 + 새 질문만
+        self.assertGreater(prefills[0], prefills[1])
+        self.assertEqual(len(set(prefills[1:])), 1)
+        self.assertLess(prefills[-1] * 3, context.tokens())
+        print(f"✅ 10턴째 처리 {prefills[-1]} 토큰 (전체 맥락 {context.tokens()} 토큰)")
+    
+    def test_budget_never_exceeded(self):
+        """프롬프트가 토큰 한도를 넘지 않는지 테스트"""
+        context = ConversationContext(SYSTEM_PROMPT, max_tokens=600)
+        for index in range(40):
+            message = build_user_message(f"{index}번째 질문이에요, 잘 들어 주세요.", "중립")
+            messages = context.messages(message)
+            self.assertLessEqual(ConversationContext._tokens(messages), 600)
+            context.add_turn(message, "네, 잘 듣고 있어요! 계속 이야기해 주세요.")
+        self.assertGreater(context.trims, 0)
+        self.assertGreater(len(context.turns), 1)
+    
+    def test_trimming_is_batched(self):
+        """오래된 턴을 한 번에 여러 개 지워 정리 횟수가 적은지 테스트"""
+        print("✂️ 정리 간격 테스트...")
+        context = ConversationContext(SYSTEM_PROMPT, max_tokens=800, trim_to=0.5)
+        cache = PrefixCache()
+        prefills = talk(context, 40, cache)
+        full = [p for p in prefills[1:] if p > prefills[1]]
+        # 정리한 턴에서만 전체 기록을 다시 처리
+        self.assertEqual(len(full), context.trims)
+        self.assertLess(context.trims, 40 // 3)
+        print(f"✅ 40턴 중 정리 {context.trims}회, 지운 턴 {context.dropped_turns}개")
+    
+    def test_min_turns_kept(self):
+        """최근 턴은 한도 안이면 남기는지 테스트"""
+        context = ConversationContext(SYSTEM_PROMPT, trim_to=0.1, min_turns=1)
+        context.add_turn("첫 번째", "응답 하나")
+        context.add_turn("두 번째", "응답 둘")
+        # 한도를 겨우 넘게 설정: 목표(10%)까지는 못 줄여도 최근 1턴은 남음
+        context.max_tokens = ConversationContext._tokens(context.messages("세 번째")) - 1
+        messages = context.messages("세 번째")
+        self.assertEqual(len(context.turns), 1)
+        self.assertEqual(messages[1]['content'], "두 번째")
+    
+    def test_summarize_dropped_turns(self):
+        """지운 턴이 요약으로 유지되는지 테스트"""
+        calls = []
+        
+        def summarize(previous, turns):
+            calls.append((previous, list(turns)))
+            return f"요약 {len(calls)}"
+            
+        context = ConversationContext(SYSTEM_PROMPT, max_tokens=500, summarize=summarize)
+        talk(context, 20)
+        self.assertEqual(len(calls), context.trims)
+        self.assertIsNone(calls[0][0])
+        if len(calls) > 1:
+            self.assertEqual(calls[1][0], "요약 1")
+        messages = context.messages("다음")
+        self.assertEqual(messages[1], {'role': 'system', 'content': f"이전 대화 요약: 요약 {len(calls)}"})
+        self.assertIn("사용자:", summary_prompt(None, calls[0][1]))
+    
+    def test_summary_failure_keeps_going(self):
+        """요약 실패 시에도 대화가 계속되는지 테스트"""
+        def broken(previous, turns):
+            raise RuntimeError("offline")
+            
+        context = ConversationContext(SYSTEM_PROMPT, max_tokens=500, summarize=broken)
+        talk(context, 20)
+        self.assertGreater(context.trims, 0)
+        self.assertIsNone(context.summary)
+    
+    def test_reset(self):
+        """대화 종료 시 기록 초기화 테스트"""
+        context = ConversationContext(SYSTEM_PROMPT)
+        context.add_turn("안녕?", "안녕하세요!")
+        context.summary = "요약"
+        context.reset()
+        self.assertEqual(context.messages("새 대화"),
+                         [{'role': 'system', 'content': SYSTEM_PROMPT},
+                          {'role': 'user', 'content': "새 대화"}])
+        self.assertEqual(context.stats()['turns'], 0)
+
+
+if __name__ == '__main__':
+    print("📜 ENFP AI Voice Chatbot - Conversation Context 기능 테스트 시작")
+    print("=" * 60)
+    
+    unittest.main(verbosity=2, exit=False)
+    
+    print("\n" + "=" * 60)
+    print("🎉 대화 맥락 테스트가 완료되었습니다!")
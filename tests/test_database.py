@@ -7,6 +7,7 @@ import sys
 import os
 import tempfile
 import sqlite3
+import json
 from datetime import datetime
 
 # 프로젝트 경로 추가
@@ -191,6 +192,290 @@ class TestDatabase(unittest.TestCase):
         print("✅ 데이터베이스 무결성 테스트 성공")
 
 
+class TestConversationImport(unittest.TestCase):
+    """대화 일괄 가져오기 테스트"""
+    
+    def setUp(self):
+        """테스트 준비"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.source = ConversationDB(os.path.join(self.temp_dir, 'source.db'))
+        self.target = ConversationDB(os.path.join(self.temp_dir, 'target.db'))
+        
+        turns = [
+            ('session-a', '안녕하세요', '반가워요!', '긍정적', 'ENFP'),
+            ('session-a', '오늘 좀 피곤해요', '푹 쉬세요!', '부정적', None),
+            ('session-b', '혼자 책 읽는 중이에요', '멋져요!', '중립', 'INFP'),
+        ]
+        for session_id, user_input, ai_response, sentiment, mbti in turns:
+            self.source.save_conversation(session_id, user_input, ai_response, sentiment, mbti)
+    
+    def tearDown(self):
+        """테스트 정리"""
+        for name in os.listdir(self.temp_dir):
+            os.unlink(os.path.join(self.temp_dir, name))
+        os.rmdir(self.temp_dir)
+    
+    def test_round_trip_all_formats(self):
+        """JSON / JSONL / CSV 내보내기 결과 가져오기 테스트"""
+        print("📥 대화 가져오기 형식별 테스트...")
+        
+        for format in ('json', 'jsonl', 'csv'):
+            with self.subTest(format=format):
+                target = ConversationDB(os.path.join(self.temp_dir, f'{format}.db'))
+                exported = self.source.export_conversations(format=format)
+                
+                result = target.import_conversations(exported)
+                
+                self.assertEqual(result['imported'], 3)
+                self.assertEqual(result['skipped'], 0)
+                self.assertEqual(result['sessions'], 2)
+                self.assertIn('rows_per_sec', result)
+                
+                history = target.get_conversation_history('session-a')
+                self.assertEqual([turn['user_input'] for turn in history],
+                                 ['안녕하세요', '오늘 좀 피곤해요'])
+                self.assertIsNone(history[1]['mbti'])
+                
+        print("✅ 형식별 가져오기 성공")
+    
+    def test_session_stats_recomputed(self):
+        """가져오기 후 세션 통계 재계산 테스트"""
+        print("📊 세션 통계 재계산 테스트...")
+        
+        path = os.path.join(self.temp_dir, 'export.jsonl')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.source.export_conversations(format='jsonl'))
+            
+        result = self.target.import_conversations(path, batch_size=1)
+        self.assertEqual(result['imported'], 3)
+        
+        stats = self.target.get_session_stats('session-a')
+        self.assertEqual(stats['total_messages'], 2)
+        self.assertEqual(stats['final_mbti'], 'ENFP')
+        self.assertEqual(stats['sentiment_distribution'], {'긍정적': 1, '부정적': 1})
+        
+        print("✅ 세션 통계 재계산 성공")
+    
+    def test_invalid_rows_skipped(self):
+        """필수 값이 없는 행 건너뛰기 테스트"""
+        rows = [
+            {'session_id': 'session-c', 'user_input': '좋아요'},
+            {'session_id': '', 'user_input': '세션 없음'},
+            {'session_id': 'session-c'},
+        ]
+        
+        result = self.target.import_conversations(rows)
+        
+        self.assertEqual(result['imported'], 1)
+        self.assertEqual(result['skipped'], 2)
+    
+    def test_missing_file_raises(self):
+        """존재하지 않는 파일 경로를 내용으로 가져오지 않는지 테스트"""
+        for path in (os.path.join(self.temp_dir, 'missing.jsonl'), 'exports/typo.csv'):
+            with self.subTest(path=path):
+                with self.assertRaises(FileNotFoundError):
+                    self.target.import_conversations(path)
+        self.assertEqual(self.target.get_database_stats()['total_conversations'], 0)
+    
+    def test_interrupted_import_keeps_session_stats(self):
+        """가져오기가 중간에 실패해도 저장된 배치의 세션 통계가 맞는지 테스트"""
+        def rows():
+            for i in range(5):
+                yield {'session_id': 'session-c', 'user_input': f'메시지 {i}', 'mbti': 'ENFP'}
+            raise ValueError("손상된 입력")
+            
+        result = self.target.import_conversations(rows(), batch_size=2)
+        
+        # 2개씩 커밋된 4개만 남고, 끝나지 않은 배치는 버림
+        self.assertEqual(result['imported'], 4)
+        self.assertEqual(result['sessions'], 1)
+        stats = self.target.get_session_stats('session-c')
+        self.assertEqual(stats['total_messages'], 4)
+        self.assertEqual(stats['final_mbti'], 'ENFP')
+
+
+class TestResponseCompression(unittest.TestCase):
+    """AI 응답 압축 저장 테스트"""
+    
+    def setUp(self):
+        """테스트 준비"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'compressed.db')
+        self.long_response = "정말 멋진 생각이에요! 함께 해봐요! " * 40
+    
+    def tearDown(self):
+        """테스트 정리"""
+        for name in os.listdir(self.temp_dir):
+            os.unlink(os.path.join(self.temp_dir, name))
+        os.rmdir(self.temp_dir)
+    
+    def _stored_rows(self):
+        conn = sqlite3.connect(self.db_path)
+        rows = conn.execute(
+            "SELECT ai_response, ai_response_codec FROM conversations ORDER BY id"
+        ).fetchall()
+        conn.close()
+        return rows
+    
+    def test_long_responses_compressed(self):
+        """긴 응답만 압축되고 조회 시 복원되는지 테스트"""
+        print("🗜️ 응답 압축 저장 테스트...")
+        
+        db = ConversationDB(self.db_path, compress_responses=True, compress_min_length=64)
+        db.save_conversation('session-a', '길게 말해줘', self.long_response)
+        db.save_conversation('session-a', '짧게', '네!')
+        
+        rows = self._stored_rows()
+        self.assertIsInstance(rows[0][0], bytes)
+        self.assertLess(len(rows[0][0]), len(self.long_response.encode('utf-8')))
+        self.assertEqual(rows[0][1], 1)
+        self.assertEqual(rows[1], ('네!', 0))
+        
+        history = db.get_conversation_history('session-a')
+        self.assertEqual([turn['ai_response'] for turn in history],
+                         [self.long_response, '네!'])
+                         
+        print("✅ 응답 압축 저장 성공")
+    
+    def test_export_returns_plain_text(self):
+        """내보내기 결과가 압축 해제된 텍스트인지 테스트"""
+        db = ConversationDB(self.db_path, compress_responses=True, compress_min_length=64)
+        db.save_conversation('session-a', '길게 말해줘', self.long_response)
+        
+        exported = json.loads(db.export_conversations('session-a'))
+        
+        self.assertEqual(exported[0]['ai_response'], self.long_response)
+        self.assertNotIn('ai_response_codec', exported[0])
+    
+    def test_legacy_rows_readable(self):
+        """압축 기능 이전에 만들어진 데이터베이스 호환성 테스트"""
+        print("📜 기존 데이터베이스 호환성 테스트...")
+        
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('''
+            CREATE TABLE conversations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_id TEXT NOT NULL,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                user_input TEXT NOT NULL,
+                ai_response TEXT,
+                sentiment TEXT,
+                mbti TEXT,
+                confidence_score REAL
+            )
+        ''')
+        conn.execute("INSERT INTO conversations (session_id, user_input, ai_response) "
+                     "VALUES ('old', '예전 대화', ?)", (self.long_response,))
+        conn.commit()
+        conn.close()
+        
+        db = ConversationDB(self.db_path, compress_responses=True, compress_min_length=64)
+        db.save_conversation('old', '새 대화', self.long_response)
+        
+        history = db.get_conversation_history('old')
+        self.assertEqual([turn['ai_response'] for turn in history],
+                         [self.long_response, self.long_response])
+        self.assertEqual([codec for _, codec in self._stored_rows()], [0, 1])
+        
+        print("✅ 기존 데이터베이스 호환성 확인")
+    
+    def test_zstd_with_trained_dictionary(self):
+        """zstd 공유 사전 압축 테스트"""
+        try:
+            import zstandard  # noqa: F401
+        except ImportError:
+            self.skipTest("zstandard가 설치되어 있지 않습니다")
+            
+        dict_path = os.path.join(self.temp_dir, 'responses.dict')
+        seed = ConversationDB(self.db_path)
+        for i in range(200):
+            seed.save_conversation('seed', f'질문 {i}', f'{i}번째 답변: {self.long_response[:120]}')
+        self.assertTrue(seed.train_zstd_dictionary(dict_path, dict_size=2048))
+        
+        db = ConversationDB(self.db_path, compress_responses=True, compression='zstd',
+                            compress_min_length=64, zstd_dict_path=dict_path)
+        db.save_conversation('session-z', '길게 말해줘', self.long_response)
+        
+        history = db.get_conversation_history('session-z')
+        self.assertEqual(history[0]['ai_response'], self.long_response)
+        self.assertEqual(self._stored_rows()[-1][1], 2)
+    
+    def test_retrained_dictionary_keeps_old_rows_readable(self):
+        """사전 재학습 후에도 이전 사전으로 압축된 응답을 읽을 수 있는지 테스트"""
+        try:
+            import zstandard  # noqa: F401
+        except ImportError:
+            self.skipTest("zstandard가 설치되어 있지 않습니다")
+            
+        print("📚 사전 재학습 호환성 테스트...")
+        dict_path = os.path.join(self.temp_dir, 'responses.dict')
+        seed = ConversationDB(self.db_path)
+        for i in range(200):
+            seed.save_conversation('seed', f'질문 {i}', f'{i}번째 답변: {self.long_response[:120]}')
+        self.assertTrue(seed.train_zstd_dictionary(dict_path, dict_size=2048))
+        
+        old = ConversationDB(self.db_path, compress_responses=True, compression='zstd',
+                             compress_min_length=64, zstd_dict_path=dict_path)
+        old.save_conversation('session-z', '첫 번째', self.long_response)
+        
+        for i in range(200):
+            seed.save_conversation('seed', f'다른 질문 {i}', f'새로운 {i}번째 이야기: 오늘은 비가 와요 ' * 4)
+        self.assertTrue(seed.train_zstd_dictionary(dict_path, dict_size=2048))
+        
+        new = ConversationDB(self.db_path, compress_responses=True, compression='zstd',
+                             compress_min_length=64, zstd_dict_path=dict_path)
+        new.save_conversation('session-z', '두 번째', self.long_response)
+        
+        for db in (old, new, ConversationDB(self.db_path, zstd_dict_path=dict_path)):
+            history = db.get_conversation_history('session-z')
+            self.assertEqual([turn['ai_response'] for turn in history],
+                             [self.long_response, self.long_response])
+            exported = json.loads(db.export_conversations('session-z'))
+            self.assertEqual(len(exported), 2)
+        # 현재 사전 + 재학습마다 보관된 사전 2개
+        self.assertEqual(len([name for name in os.listdir(self.temp_dir)
+                              if name.startswith('responses.dict.')]), 2)
+                              
+        print("✅ 이전 사전으로 압축된 응답 유지")
+    
+    def test_unreadable_row_does_not_hide_session(self):
+        """읽을 수 없는 행 하나 때문에 세션 전체가 사라지지 않는지 테스트"""
+        db = ConversationDB(self.db_path, compress_responses=True, compress_min_length=64)
+        db.save_conversation('session-a', '길게 말해줘', self.long_response)
+        db.save_conversation('session-a', '짧게', '네!')
+        
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("UPDATE conversations SET ai_response = ? WHERE id = 1",
+                     (sqlite3.Binary(b'not zlib data'),))
+        conn.commit()
+        conn.close()
+        
+        history = db.get_conversation_history('session-a')
+        self.assertEqual([turn['ai_response'] for turn in history], [None, '네!'])
+        self.assertEqual(len(json.loads(db.export_conversations('session-a'))), 2)
+    
+    def test_zstd_from_many_threads(self):
+        """여러 스레드가 한 인스턴스로 동시에 압축/해제하는지 테스트"""
+        try:
+            import zstandard  # noqa: F401
+        except ImportError:
+            self.skipTest("zstandard가 설치되어 있지 않습니다")
+            
+        from concurrent.futures import ThreadPoolExecutor
+        
+        db = ConversationDB(self.db_path, compress_responses=True, compression='zstd',
+                            compress_min_length=64)
+        
+        def worker(index):
+            text = f"{index}번 스레드: {self.long_response}"
+            for _ in range(50):
+                stored, codec = db._encode_response(text)
+                self.assertEqual(db._decode_response(stored, codec), text)
+                
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(worker, range(8)))
+
+
 if __name__ == '__main__':
     print("💾 ENFP AI Voice Chatbot - Database 기능 테스트 시작")
     print("=" * 60)
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Ollama 응답 생성(토큰 스트리밍, 첫 토큰 시간/초당 토큰) 기능 테스트 - Ollama 서버 불필요
+"""
+import unittest
+import sys
+import os
+import time
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from components.llm import (OllamaGenerator, OllamaService, SYSTEM_PROMPT, build_prompt,
+                            build_user_message)
+from components.metrics import LatencyTracker
+from components.turn_pipeline import TurnPipeline
+
+
+class StandInClient:
+    """Ollama generate API를 흉내 내는 대역 (프롬프트 처리 지연 + 토큰별 지연)"""
+
+    def __init__(self, tokens=("안녕", "하세요", "!"), prompt_delay=0.2, token_delay=0.02,
+                 report_counts=True):
+        self.tokens = tokens
+        self.prompt_delay = prompt_delay
+        self.token_delay = token_delay
+        self.report_counts = report_counts
+        self.calls = []
+    
+    def _final(self):
+        final = {'response': '', 'done': True}
+        if self.report_counts:
+            final['eval_count'] = len(self.tokens)
+            final['eval_duration'] = int(len(self.tokens) * self.token_delay * 1e9)
+            final['prompt_eval_count'] = 12
+            final['prompt_eval_duration'] = int(self.prompt_delay * 1e9)
+        return final
+    
+    def _stream(self):
+        time.sleep(self.prompt_delay)
+        for token in self.tokens:
+            yield {'response': token, 'done': False}
+            time.sleep(self.token_delay)
+        yield self._final()
+    
+    def generate(self, model, prompt, options=None, stream=False):
+        self.calls.append({'model': model, 'prompt': prompt, 'options': options, 'stream': stream})
+        if stream:
+            return self._stream()
+        time.sleep(self.prompt_delay + len(self.tokens) * self.token_delay)
+        return dict(self._final(), response=''.join(self.tokens))
+    
+    def chat(self, model, messages, options=None, stream=False, keep_alive=None):
+        """chat API: 같은 토큰을 message 형식으로 전달"""
+        def as_message(chunk):
+            return dict(chunk, message={'role': 'assistant', 'content': chunk.pop('response')})
+            
+        self.calls.append({'model': model, 'messages': messages, 'options': options, 'stream': stream})
+        if stream:
+            return (as_message(chunk) for chunk in self._stream())
+        time.sleep(self.prompt_delay + len(self.tokens) * self.token_delay)
+        return as_message(dict(self._final(), response=''.join(self.tokens)))
+
+
+class TestOllamaGenerator(unittest.TestCase):
+    """응답 생성기 테스트"""
+
+    def test_streaming_delivers_tokens_early(self):
+        """스트리밍 모드에서 토큰이 완성 전에 전달되는지 테스트"""
+        print("🌊 토큰 스트리밍 테스트...")
+        client = StandInClient(token_delay=0.05)
+        generator = OllamaGenerator("phi4:latest", options={'temperature': 0.7}, client=client)
+        received = []
+        start = time.perf_counter()
+        text, stats = generator.generate("프롬프트", on_token=lambda piece: received.append(
+            (piece, time.perf_counter() - start)))
+        
+        self.assertEqual(text, "안녕하세요!")
+        self.assertEqual([piece for piece, _ in received], ["안녕", "하세요", "!"])
+        self.assertTrue(client.calls[0]['stream'])
+        self.assertEqual(client.calls[0]['options'], {'temperature': 0.7})
+        # 첫 토큰은 프롬프트 처리 직후, 전체 완료보다 먼저 도착
+        self.assertLess(received[0][1], stats['total_ms'] / 1000 - 0.1)
+        self.assertAlmostEqual(stats['ttft_ms'], 200, delta=60)
+        print(f"   첫 토큰 {stats['ttft_ms']:.0f} ms / 전체 {stats['total_ms']:.0f} ms")
+        print("✅ 토큰 스트리밍 성공")
+    
+    def test_throughput_from_final_chunk(self):
+        """마지막 청크의 eval_count/eval_duration으로 초당 토큰 계산 테스트"""
+        client = StandInClient(tokens=("a",) * 10, prompt_delay=0, token_delay=0.01)
+        _, stats = OllamaGenerator("m", client=client).generate("p")
+        self.assertEqual(stats['tokens'], 10)
+        self.assertAlmostEqual(stats['tokens_per_sec'], 100.0, places=3)
+    
+    def test_throughput_without_counts(self):
+        """서버가 토큰 수를 주지 않으면 받은 조각 수와 경과 시간으로 계산"""
+        client = StandInClient(tokens=("a",) * 5, prompt_delay=0.1, token_delay=0.02,
+                               report_counts=False)
+        _, stats = OllamaGenerator("m", client=client).generate("p")
+        self.assertEqual(stats['tokens'], 5)
+        # 프롬프트 처리 시간은 제외하고 첫 토큰 이후 시간으로 계산
+        self.assertGreater(stats['tokens_per_sec'], 5 / 0.2)
+    
+    def test_blocking_mode(self):
+        """비스트리밍 모드는 완성 후 한 번에 전달하고 첫 토큰 시간 = 전체 시간"""
+        client = StandInClient()
+        received = []
+        text, stats = OllamaGenerator("m", streaming=False, client=client).generate(
+            "p", on_token=received.append)
+        self.assertEqual(text, "안녕하세요!")
+        self.assertEqual(received, ["안녕하세요!"])
+        self.assertFalse(client.calls[0]['stream'])
+        self.assertAlmostEqual(stats['ttft_ms'], stats['total_ms'], delta=1)
+    
+    def test_metrics_recorded(self):
+        """첫 토큰/전체 시간이 지표에 기록되는지 테스트"""
+        metrics = LatencyTracker()
+        generator = OllamaGenerator("m", client=StandInClient(prompt_delay=0.05), metrics=metrics)
+        generator.generate("p")
+        generator.generate("p")
+        self.assertEqual(metrics.summary('llm.ttft')['count'], 2)
+        self.assertEqual(metrics.summary('llm.total')['count'], 2)
+    
+    def test_background_generator_metrics_kept_apart(self):
+        """요약 같은 부가 생성은 응답 지연 지표에 섞이지 않는지 테스트"""
+        metrics = LatencyTracker()
+        summarizer = OllamaGenerator("m", client=StandInClient(), streaming=False,
+                                     metrics=metrics, metrics_name='llm.summary')
+        summarizer.generate("p")
+        self.assertEqual(metrics.summary('llm.summary.total')['count'], 1)
+        self.assertEqual(metrics.summary('llm.total'), {})
+    
+    def test_chat_streams_and_reports_prefill(self):
+        """chat API 스트리밍 및 프롬프트 처리 토큰/시간 보고 테스트"""
+        print("📜 프롬프트 처리 통계 테스트...")
+        client = StandInClient()
+        metrics = LatencyTracker()
+        generator = OllamaGenerator("phi4:latest", client=client, keep_alive="30m", metrics=metrics)
+        messages = [{'role': 'system', 'content': SYSTEM_PROMPT},
+                    {'role': 'user', 'content': build_user_message("안녕?", "긍정")}]
+        received = []
+        text, stats = generator.chat(messages, on_token=received.append)
+        
+        self.assertEqual(text, "안녕하세요!")
+        self.assertEqual(received, ["안녕", "하세요", "!"])
+        self.assertEqual(client.calls[0]['messages'], messages)
+        self.assertEqual(stats['prompt_tokens'], 12)
+        self.assertAlmostEqual(stats['prompt_eval_ms'], client.prompt_delay * 1000)
+        self.assertEqual(metrics.summary('llm.prefill')['count'], 1)
+        
+        generator.streaming = False
+        text, stats = generator.chat(messages)
+        self.assertEqual(text, "안녕하세요!")
+        self.assertEqual(stats['prompt_tokens'], 12)
+        print(f"✅ 프롬프트 {stats['prompt_tokens']} 토큰, {stats['prompt_eval_ms']:.0f} ms")
+    
+    def test_build_prompt(self):
+        """프롬프트에 사용자 문장과 감정이 들어가는지 테스트"""
+        prompt = build_prompt("오늘 기분 최고!", "POSITIVE")
+        self.assertIn("오늘 기분 최고!", prompt)
+        self.assertIn("POSITIVE", prompt)
+        self.assertIn("ENFP", prompt)
+    
+    def test_pipeline_passes_token_callback(self):
+        """턴 파이프라인이 토큰 콜백을 생성 단계에 전달하는지 테스트"""
+        generator = OllamaGenerator("m", client=StandInClient(prompt_delay=0, token_delay=0))
+        pipeline = TurnPipeline(
+            lambda text: 'POS', lambda text: 'ENFP',
+            generate=lambda text, sentiment, on_token=None: generator.generate(
+                build_prompt(text, sentiment), on_token=on_token)[0]
+        )
+        pieces = []
+        turn = pipeline.run("안녕", on_token=pieces.append)
+        pipeline.close()
+        self.assertEqual(''.join(pieces), turn['response'])
+
+
+
+class StandInOllamaServer:
+    """로컬 HTTP 대역 Ollama 서버 (모델 로딩 지연, keep_alive 기록, 연결/종료 수 집계)"""
+
+    def __init__(self, tokens=("안녕", "하세요", "!"), load_delay=0.3, token_delay=0.01):
+        self.tokens = tokens
+        self.load_delay = load_delay
+        self.token_delay = token_delay
+        self.loaded = set()
+        self.requests = []
+        self.connections = 0
+        self.disconnects = 0
+        self.lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.httpd.daemon_threads = True
+        self.host = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, args=(0.05,), daemon=True).start()
+    
+    def unload(self):
+        """keep_alive 만료로 모델이 내려간 상황"""
+        with self.lock:
+            self.loaded.clear()
+    
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+    
+    def _generate(self, handler, body):
+        with self.lock:
+            self.requests.append(body)
+            cold = body['model'] not in self.loaded
+        if cold:
+            time.sleep(self.load_delay)
+            with self.lock:
+                self.loaded.add(body['model'])
+        final = {'model': body['model'], 'response': '', 'done': True,
+                 'eval_count': len(self.tokens) if body.get('prompt') else 0}
+        if not body.get('stream'):
+            handler.send_json(dict(final, response=''.join(self.tokens) if body.get('prompt') else ''))
+            return
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'application/x-ndjson')
+        handler.send_header('Transfer-Encoding', 'chunked')
+        handler.end_headers()
+        lines = [{'model': body['model'], 'response': token, 'done': False} for token in self.tokens]
+        for line in lines + [final]:
+            data = (json.dumps(line) + '\n').encode('utf-8')
+            handler.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+            handler.wfile.flush()
+            time.sleep(self.token_delay)
+        handler.wfile.write(b"0\r\n\r\n")
+    
+    def _handler(self):
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # 연결 유지
+            disable_nagle_algorithm = True  # 헤더/본문 분할 전송 시 지연 ACK 대기 방지
+            
+            def setup(self):
+                super().setup()
+                with server.lock:
+                    server.connections += 1
+            
+            def finish(self):
+                super().finish()
+                with server.lock:
+                    server.disconnects += 1
+            
+            def log_message(self, *args):
+                pass
+            
+            def send_json(self, payload):
+                data = json.dumps(payload).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+            
+            def do_GET(self):
+                if self.path == '/api/ps':
+                    with server.lock:
+                        models = [{'name': name, 'model': name} for name in server.loaded]
+                    self.send_json({'models': models})
+                else:
+                    self.send_error(404)
+            
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                if self.path == '/api/generate':
+                    server._generate(self, body)
+                else:
+                    self.send_error(404)
+                    
+        return Handler
+
+
+def unused_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class TestOllamaService(unittest.TestCase):
+    """관리형 Ollama 클라이언트 테스트 (로컬 대역 서버)"""
+
+    def setUp(self):
+        self.server = StandInOllamaServer()
+        self.service = OllamaService("phi4:latest", host=self.server.host, keep_alive="30m",
+                                     keep_warm_seconds=0, metrics=LatencyTracker())
+    
+    def tearDown(self):
+        self.service.close()
+        self.server.close()
+    
+    def generator(self):
+        return OllamaGenerator("phi4:latest", client=self.service.client, keep_alive="30m")
+    
+    def test_preload_removes_first_turn_load(self):
+        """미리 불러오면 첫 응답에 모델 로딩 대기가 없는지 테스트"""
+        print("🔥 모델 미리 불러오기 테스트...")
+        seconds = self.service.preload()
+        self.assertGreaterEqual(seconds, self.server.load_delay)
+        self.assertEqual(self.service.metrics.summary('llm.preload')['count'], 1)
+        
+        text, stats = self.generator().generate("안녕?")
+        self.assertEqual(text, "안녕하세요!")
+        self.assertLess(stats['ttft_ms'], self.server.load_delay * 1000 / 2)
+        print(f"✅ 불러오기 {seconds * 1000:.0f} ms, 첫 토큰 {stats['ttft_ms']:.0f} ms")
+    
+    def test_keep_alive_sent(self):
+        """모든 요청에 keep_alive가 전달되는지 테스트"""
+        self.service.preload()
+        self.generator().generate("안녕?")
+        self.assertEqual([request.get('keep_alive') for request in self.server.requests],
+                         ["30m", "30m"])
+        self.assertEqual(self.server.requests[0]['prompt'], '')
+    
+    def test_connections_reused(self):
+        """여러 턴이 HTTP 연결 하나를 재사용하는지 테스트"""
+        print("🔌 연결 재사용 테스트...")
+        generator = self.generator()
+        for _ in range(5):
+            generator.generate("안녕?")
+        self.assertEqual(len(self.server.requests), 5)
+        self.assertEqual(self.server.connections, 1)
+        print("✅ 5턴, 연결 1개")
+    
+    def test_close_releases_connections(self):
+        """종료하면 열어 둔 연결을 닫는지 테스트"""
+        self.generator().generate("안녕?")
+        self.assertEqual(self.server.disconnects, 0)
+        
+        self.service.close()
+        deadline = time.time() + 2
+        while time.time() < deadline and not self.server.disconnects:
+            time.sleep(0.01)
+        self.assertEqual(self.server.disconnects, 1)
+    
+    def test_health_reports_loaded_model(self):
+        """상태 확인이 모델 로드 여부를 알려 주는지 테스트"""
+        health = self.service.health()
+        self.assertTrue(health['ok'])
+        self.assertFalse(health['loaded'])
+        self.service.preload()
+        self.assertTrue(self.service.health()['loaded'])
+        self.assertIs(self.service.last_health['loaded'], True)
+    
+    def test_health_when_server_down(self):
+        """서버가 꺼져 있으면 빠르게 실패를 알려 주는지 테스트"""
+        service = OllamaService("phi4:latest", host=f"http://127.0.0.1:{unused_port()}",
+                                connect_timeout=0.5)
+        start = time.perf_counter()
+        health = service.health()
+        self.assertFalse(health['ok'])
+        self.assertIsNotNone(health['error'])
+        self.assertIsNone(service.preload())
+        self.assertLess(time.perf_counter() - start, 2.0)
+        service.close()
+    
+    def test_keep_warm_reloads_after_expiry(self):
+        """유지 스레드가 내려간 모델을 다시 불러오는지 테스트"""
+        self.server.load_delay = 0.01
+        service = OllamaService("phi4:latest", host=self.server.host, keep_warm_seconds=0.05)
+        service.start()
+        deadline = time.time() + 2
+        while time.time() < deadline and not (service.last_health or {}).get('loaded'):
+            time.sleep(0.01)
+        self.assertTrue(service.last_health['loaded'])
+        
+        self.server.unload()
+        time.sleep(0.3)
+        self.assertIn("phi4:latest", self.server.loaded)
+        service.close()
+        self.assertFalse(service._thread.is_alive())
+
+
+if __name__ == '__main__':
+    print("🤖 ENFP AI Voice Chatbot - LLM Streaming 기능 테스트 시작")
+    print("=" * 60)
+    
+    unittest.main(verbosity=2, exit=False)
+    
+    print("\n" + "=" * 60)
+    print("🎉 응답 생성 스트리밍 테스트가 완료되었습니다!")
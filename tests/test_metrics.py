@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+지연 시간 측정(LatencyTracker) 기능 테스트
+"""
+import unittest
+import sys
+import os
+import threading
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from components.metrics import LatencyTracker
+
+
+class TestLatencyTracker(unittest.TestCase):
+    """지연 시간 통계 테스트"""
+
+    def setUp(self):
+        """테스트 준비"""
+        self.metrics = LatencyTracker(window=100)
+    
+    def test_summary(self):
+        """통계 계산 테스트"""
+        print("⏱️ 지연 시간 통계 테스트...")
+        
+        for ms in range(1, 101):
+            self.metrics.record('asr.stub', ms / 1000)
+            
+        summary = self.metrics.summary('asr.stub')
+        self.assertEqual(summary['count'], 100)
+        self.assertAlmostEqual(summary['mean_ms'], 50.5)
+        self.assertAlmostEqual(summary['p50_ms'], 50.5)
+        self.assertAlmostEqual(summary['p95_ms'], 95.05)
+        self.assertAlmostEqual(summary['p99_ms'], 99.01)
+        self.assertAlmostEqual(summary['max_ms'], 100)
+        self.assertEqual(self.metrics.summary('unknown'), {})
+        
+        print("✅ 지연 시간 통계 성공")
+    
+    def test_window_keeps_recent_samples(self):
+        """최근 측정값만 유지하는지 테스트"""
+        for _ in range(150):
+            self.metrics.record('tts', 1.0)
+        for _ in range(100):
+            self.metrics.record('tts', 0.001)
+            
+        summary = self.metrics.summary('tts')
+        self.assertEqual(summary['count'], 250)
+        self.assertAlmostEqual(summary['max_ms'], 1.0)
+    
+    def test_track_records_on_error(self):
+        """예외가 발생해도 측정되는지 테스트"""
+        with self.assertRaises(RuntimeError):
+            with self.metrics.track('llm'):
+                raise RuntimeError("boom")
+        self.assertEqual(self.metrics.summary('llm')['count'], 1)
+    
+    def test_thread_safe(self):
+        """여러 스레드에서 동시에 기록 테스트"""
+        def worker():
+            for _ in range(1000):
+                self.metrics.record('asr.google', 0.01)
+                
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+            
+        self.assertEqual(self.metrics.summary('asr.google')['count'], 4000)
+        self.assertEqual(list(self.metrics.summaries()), ['asr.google'])
+        
+        self.metrics.reset()
+        self.assertEqual(self.metrics.summaries(), {})
+
+
+if __name__ == '__main__':
+    print("⏱️ ENFP AI Voice Chatbot - Latency Metrics 기능 테스트 시작")
+    print("=" * 60)
+    
+    unittest.main(verbosity=2, exit=False)
+    
+    print("\n" + "=" * 60)
+    print("🎉 지연 시간 측정 테스트가 완료되었습니다!")
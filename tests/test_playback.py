@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+백그라운드 음성 재생 작업자(대기열, 건너뛰기, 정지/barge-in) 기능 테스트 - 오디오 장치 불필요
+"""
+import unittest
+import sys
+import os
+import io
+import time
+import wave
+import threading
+
+import numpy as np
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from components.metrics import LatencyTracker
+from components.playback import PCMPlayer, PlaybackWorker, convert_pcm, create_player, decode_audio, sd
+from components.speech_pipeline import SpeechPipeline
+
+
+class ClockPlayer:
+    """오디오 대신 재생 시간(초)을 받아 시간만 흘려보내는 가짜 재생기"""
+
+    def __init__(self):
+        self.started = []
+        self.stopped = 0
+        self._until = 0.0
+        self.lock = threading.Lock()
+    
+    def start(self, audio):
+        if audio == 'broken':
+            raise RuntimeError("디코딩 오류")
+        with self.lock:
+            self.started.append(audio)
+            self._until = time.perf_counter() + audio
+    
+    def is_playing(self):
+        with self.lock:
+            return time.perf_counter() < self._until
+    
+    def stop(self):
+        with self.lock:
+            self.stopped += 1
+            self._until = 0.0
+
+
+class TestPlaybackWorker(unittest.TestCase):
+    """재생 작업자 테스트"""
+
+    def setUp(self):
+        self.player = ClockPlayer()
+        self.worker = PlaybackWorker(self.player, poll_interval=0.005)
+    
+    def tearDown(self):
+        self.worker.close()
+    
+    def test_enqueue_returns_immediately(self):
+        """재생 요청이 재생 완료를 기다리지 않는지 테스트"""
+        print("⚡ 비차단 재생 요청 테스트...")
+        start = time.perf_counter()
+        items = [self.worker.enqueue(0.1) for _ in range(3)]
+        elapsed = time.perf_counter() - start
+        
+        self.assertLess(elapsed, 0.01)
+        self.assertTrue(self.worker.busy)
+        self.assertTrue(self.worker.wait_idle(2))
+        self.assertEqual([item.status for item in items], ['played'] * 3)
+        # 대기열 순서대로 이어서 재생
+        for previous, current in zip(items, items[1:]):
+            self.assertLess(current.started - previous.ended, 0.03)
+        print(f"   요청 {elapsed * 1000:.2f} ms, 재생 3개 연속")
+        print("✅ 비차단 재생 요청 성공")
+    
+    def test_completion_callback(self):
+        """재생 완료 콜백이 작업자 스레드에서 호출되는지 테스트"""
+        done = []
+        item = self.worker.enqueue(0.02, on_done=lambda item: done.append(
+            (item.status, threading.current_thread().name)))
+        self.assertTrue(item.wait(1))
+        self.worker.wait_idle(1)
+        self.assertEqual(done, [('played', 'playback')])
+    
+    def test_skip(self):
+        """건너뛰기는 현재 문장만 끊고 다음 문장을 재생"""
+        first = self.worker.enqueue(5.0)
+        second = self.worker.enqueue(0.02)
+        time.sleep(0.05)
+        self.worker.skip()
+        self.assertTrue(second.wait(1))
+        self.assertEqual((first.status, second.status), ('skipped', 'played'))
+    
+    def test_stop_drops_queue(self):
+        """정지(barge-in)는 현재 재생과 대기열을 모두 취소"""
+        print("✋ barge-in 정지 테스트...")
+        items = [self.worker.enqueue(5.0) for _ in range(3)]
+        time.sleep(0.05)
+        start = time.perf_counter()
+        self.worker.stop()
+        self.assertTrue(self.worker.wait_idle(1))
+        
+        self.assertLess(time.perf_counter() - start, 0.1)
+        self.assertEqual([item.status for item in items], ['stopped'] * 3)
+        self.assertEqual(self.player.started, [5.0])
+        # 정지 후 새 요청은 정상 재생
+        self.assertTrue(self.worker.play(0.01))
+        print("✅ barge-in 정지 성공")
+    
+    def test_play_reports_stop(self):
+        """다른 스레드가 정지하면 play()가 False를 반환"""
+        threading.Timer(0.05, self.worker.stop).start()
+        self.assertFalse(self.worker.play(5.0))
+    
+    def test_failed_start(self):
+        """재생 시작 실패 후에도 다음 항목을 재생"""
+        broken = self.worker.enqueue('broken')
+        good = self.worker.enqueue(0.01)
+        self.assertTrue(good.wait(1))
+        self.assertEqual((broken.status, good.status), ('failed', 'played'))
+    
+    def test_queue_metric(self):
+        """대기 시간이 지표에 기록되는지 테스트"""
+        metrics = LatencyTracker()
+        worker = PlaybackWorker(ClockPlayer(), poll_interval=0.005, metrics=metrics)
+        worker.play(0.01)
+        worker.close()
+        self.assertEqual(metrics.summary('playback.queue')['count'], 1)
+    
+    def test_barge_in_cancels_speech_pipeline(self):
+        """재생 중 정지하면 문장 파이프라인의 남은 문장도 취소"""
+        speech = SpeechPipeline(lambda sentence: 0.2, self.worker.play, min_chars=0)
+        speech.feed("첫 문장. 둘째 문장. 셋째 문장. 넷째 문장.")
+        speech.finish(wait=False)
+        time.sleep(0.1)
+        self.worker.stop()
+        stats = speech.finish(timeout=2)
+        self.assertEqual(stats['spoken'], 0)
+        self.assertEqual(len(self.player.started), 1)
+    
+    def test_speech_pipeline_queues_segments_back_to_back(self):
+        """합성된 문장이 앞 문장 재생 중에 대기열에 들어가 끊김 없이 이어지는지 테스트"""
+        print("🔗 문장 연속 재생 테스트...")
+        items = []
+        
+        def enqueue(audio):
+            item = self.worker.enqueue(audio)
+            items.append(item)
+            return item
+            
+        speech = SpeechPipeline(lambda sentence: 0.1, enqueue=enqueue, min_chars=0)
+        speech.feed("첫 문장. 둘째 문장. 셋째 문장. 넷째 문장.")
+        stats = speech.finish(timeout=2)
+        
+        self.assertEqual((stats['spoken'], stats['failed']), (4, 0))
+        gaps = []
+        for previous, item in zip(items, items[1:]):
+            # 다음 문장은 앞 문장이 끝나기 전에 이미 대기 중
+            self.assertLess(item.enqueued, previous.ended)
+            gaps.append(item.started - previous.ended)
+        # 문장 사이 공백은 재생 완료 확인 주기(5 ms) 정도
+        self.assertLess(max(gaps), 0.02)
+        self.assertLess(stats['stall_ms'], 60)
+        print(f"✅ 문장 사이 최대 {max(gaps) * 1000:.1f} ms")
+    
+    def test_barge_in_cancels_queued_speech_pipeline(self):
+        """대기열로 넘긴 문장도 정지하면 남은 문장까지 취소"""
+        speech = SpeechPipeline(lambda sentence: 0.2, enqueue=self.worker.enqueue, min_chars=0)
+        speech.feed("첫 문장. 둘째 문장. 셋째 문장. 넷째 문장.")
+        speech.finish(wait=False)
+        time.sleep(0.1)
+        self.worker.stop()
+        stats = speech.finish(timeout=2)
+        self.assertEqual(stats['spoken'], 0)
+        self.assertEqual(len(self.player.started), 1)
+
+
+
+def wav_bytes(samples, sample_rate):
+    """모노 float32 → 16-bit WAV 바이트"""
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes((samples * 32767).astype('<i2').tobytes())
+    return buffer.getvalue()
+
+
+class TestPCMPlayer(unittest.TestCase):
+    """PCM 직접 재생 경로 테스트"""
+
+    def setUp(self):
+        t = np.arange(24000) / 24000
+        self.samples = (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+        self.audio = wav_bytes(self.samples, 24000)
+    
+    def test_decode(self):
+        """인코딩된 음성을 float32 PCM으로 디코딩"""
+        samples, sample_rate = decode_audio(self.audio)
+        self.assertEqual(sample_rate, 24000)
+        self.assertEqual(samples.shape, (24000, 1))
+        np.testing.assert_allclose(samples[:, 0], self.samples, atol=1e-3)
+    
+    def test_convert_to_device_format(self):
+        """모노 24kHz → 장치 기본 형식(48kHz 스테레오/모노) 변환"""
+        stereo = convert_pcm(self.samples[:, None], 24000, 48000, 2)
+        self.assertEqual(stereo.shape, (48000, 2))
+        self.assertEqual(stereo.dtype, np.float32)
+        self.assertTrue(stereo.flags['C_CONTIGUOUS'])
+        np.testing.assert_array_equal(stereo[:, 0], stereo[:, 1])
+        # 440Hz 톤이 유지되는지 (진폭 비교)
+        self.assertAlmostEqual(float(np.abs(stereo[1000:-1000, 0]).max()), 0.5, delta=0.02)
+        
+        mono = convert_pcm(np.repeat(self.samples[:, None], 2, axis=1), 24000, 24000, 1)
+        np.testing.assert_allclose(mono[:, 0], self.samples, atol=1e-6)
+    
+    def test_prepare_decodes_once(self):
+        """같은 음성은 한 번만 디코딩/변환하는지 테스트"""
+        print("🎚️ PCM 캐시 테스트...")
+        metrics = LatencyTracker()
+        player = PCMPlayer(sample_rate=48000, channels=2, metrics=metrics)
+        first = player.prepare(self.audio)
+        second = player.prepare(self.audio)
+        
+        self.assertIs(first, second)
+        self.assertEqual(first.shape, (48000, 2))
+        self.assertEqual(metrics.summary('playback.decode')['count'], 1)
+        print(f"   디코딩 {metrics.summary('playback.decode')['mean_ms']:.1f} ms, 다시 재생 시 0회")
+        print("✅ PCM 캐시 성공")
+    
+    def test_cache_bound(self):
+        """PCM 캐시 크기 제한 테스트"""
+        player = PCMPlayer(sample_rate=24000, channels=1, cache_bytes=24000 * 4 * 2)
+        for frequency in (220, 330, 440):
+            t = np.arange(24000) / 24000
+            player.prepare(wav_bytes((0.3 * np.sin(2 * np.pi * frequency * t)).astype(np.float32), 24000))
+        self.assertEqual(len(player._cache), 2)
+    
+    def test_callback_plays_buffer(self):
+        """출력 콜백이 PCM을 블록 단위로 내보내고 시작 지연을 기록하는지 테스트"""
+        metrics = LatencyTracker()
+        player = PCMPlayer(sample_rate=24000, channels=1, metrics=metrics)
+        player._open = lambda: None  # 출력 장치 대신 콜백을 직접 호출
+        player.start(self.audio)
+        self.assertTrue(player.is_playing())
+        
+        blocks = []
+        while player.is_playing():
+            outdata = np.ones((1000, 1), dtype=np.float32)
+            player._callback(outdata, 1000, None, None)
+            blocks.append(outdata.copy())
+        played = np.concatenate(blocks)
+        np.testing.assert_allclose(played[:24000, 0], self.samples, atol=1e-3)
+        self.assertFalse(played[24000:].any())  # 마지막 블록 나머지는 무음
+        self.assertEqual(metrics.summary('playback.start')['count'], 1)
+        
+        # 재생이 끝나면 무음 출력
+        outdata = np.ones((256, 1), dtype=np.float32)
+        player._callback(outdata, 256, None, None)
+        self.assertFalse(outdata.any())
+    
+    def test_stop(self):
+        """정지 시 바로 무음 출력"""
+        player = PCMPlayer(sample_rate=24000, channels=1)
+        player._open = lambda: None
+        player.start(self.audio)
+        player.stop()
+        outdata = np.ones((256, 1), dtype=np.float32)
+        player._callback(outdata, 256, None, None)
+        self.assertFalse(player.is_playing())
+        self.assertFalse(outdata.any())
+    
+    def test_factory(self):
+        """재생기 생성 함수 테스트"""
+        with self.assertRaises(ValueError):
+            create_player('speaker')
+        if sd is None:
+            with self.assertRaises(RuntimeError):
+                create_player('pcm')
+
+
+if __name__ == '__main__':
+    print("🔈 ENFP AI Voice Chatbot - Playback Worker 기능 테스트 시작")
+    print("=" * 60)
+    
+    unittest.main(verbosity=2, exit=False)
+    
+    print("\n" + "=" * 60)
+    print("🎉 백그라운드 재생 테스트가 완료되었습니다!")
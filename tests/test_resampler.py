@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+스트리밍 리샘플러 기능 테스트
+"""
+import unittest
+import tracemalloc
+import sys
+import os
+
+import numpy as np
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from components.resampler import StreamingResampler, resample
+
+INPUT_RATE = 44100
+OUTPUT_RATE = 16000
+
+
+def tones(freqs_amps, seconds=1.0, rate=INPUT_RATE):
+    t = np.arange(int(seconds * rate)) / rate
+    return sum(amp * np.sin(2 * np.pi * freq * t) for freq, amp in freqs_amps).astype(np.float32)
+
+
+def level_db(samples, freq, rate=OUTPUT_RATE):
+    """해닝 창을 씌운 스펙트럼에서 특정 주파수의 진폭(dB)"""
+    spectrum = np.abs(np.fft.rfft(samples * np.hanning(len(samples)))) / (len(samples) / 4)
+    bin_index = int(round(freq * len(samples) / rate))
+    return 20 * np.log10(spectrum[bin_index - 3:bin_index + 4].max() + 1e-12)
+
+
+class TestStreamingResampler(unittest.TestCase):
+    """폴리페이즈 리샘플러 테스트"""
+
+    def test_spectral_error_bounded(self):
+        """통과 대역 오차와 앨리어싱 억제 테스트"""
+        print("📉 스펙트럼 오차 테스트...")
+        
+        passband = [(300, 0.3), (1000, 0.2), (3400, 0.2), (6000, 0.1)]
+        signal = tones(passband + [(12000, 0.3)], seconds=2.0)
+        output = resample(signal, INPUT_RATE, OUTPUT_RATE)
+        
+        for freq, amp in passband:
+            error = abs(level_db(output, freq) - 20 * np.log10(amp))
+            self.assertLess(error, 0.5, f"{freq} Hz 오차 {error:.2f} dB")
+        # 12 kHz 성분은 16 - 12 = 4 kHz로 접혀 들어오지 않아야 함
+        self.assertLess(level_db(output, 4000), -60)
+        
+        # 시간 영역에서도 원 신호의 16 kHz 샘플과 일치 (지연 보정 확인)
+        expected = tones(passband, seconds=2.0, rate=OUTPUT_RATE)
+        interior = slice(1000, -1000)
+        rms_error = np.sqrt(np.mean((output[interior] - expected[interior]) ** 2))
+        self.assertLess(rms_error / np.sqrt(np.mean(expected ** 2)), 0.05)
+        
+        print("✅ 스펙트럼 오차 범위 내")
+    
+    def test_streaming_matches_one_shot(self):
+        """블록 단위 처리와 한 번에 처리한 결과 일치 테스트"""
+        signal = tones([(440, 0.5)], seconds=0.5) + \
+            np.random.default_rng(0).standard_normal(INPUT_RATE // 2).astype(np.float32) * 0.01
+        expected = resample(signal, INPUT_RATE, OUTPUT_RATE)
+        
+        for block_size in (1, 100, 512, 4410):
+            resampler = StreamingResampler(INPUT_RATE, OUTPUT_RATE)
+            parts = [resampler.process(signal[i:i + block_size]).copy()
+                     for i in range(0, len(signal), block_size)]
+            output = np.concatenate(parts + [resampler.flush()])
+            np.testing.assert_allclose(output, expected, atol=1e-6)
+    
+    def test_process_does_not_allocate(self):
+        """콜백에서 호출하는 블록 변환이 새 배열을 만들지 않는지 테스트"""
+        signal = tones([(440, 0.5)], seconds=1.0)
+        resampler = StreamingResampler(INPUT_RATE, OUTPUT_RATE, max_block=512)
+        # 처음 몇 번은 numpy 내부 캐시가 잡힐 수 있으므로 미리 실행
+        for offset in range(0, 4 * 512, 512):
+            resampler.process(signal[offset:offset + 512])
+            
+        tracemalloc.start()
+        try:
+            for offset in range(4 * 512, len(signal), 512):
+                resampler.process(signal[offset:offset + 512])
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        # 블록마다 계산 창을 새로 만들면 약 140KB씩 할당됨
+        self.assertLess(peak, 16 * 1024)
+    
+    def test_larger_block_grows_buffers(self):
+        """max_block보다 큰 블록도 같은 결과를 내는지 테스트"""
+        signal = tones([(440, 0.5)], seconds=0.5)
+        expected = resample(signal, INPUT_RATE, OUTPUT_RATE)
+        
+        resampler = StreamingResampler(INPUT_RATE, OUTPUT_RATE, max_block=256)
+        parts = [resampler.process(signal[:1000]).copy(), resampler.process(signal[1000:]).copy()]
+        output = np.concatenate(parts + [resampler.flush()])
+        np.testing.assert_allclose(output, expected, atol=1e-6)
+        self.assertEqual(resampler.max_block, len(signal) - 1000)
+    
+    def test_output_length(self):
+        """출력 길이 테스트"""
+        resampler = StreamingResampler(INPUT_RATE, OUTPUT_RATE)
+        
+        self.assertEqual((resampler.up, resampler.down), (160, 441))
+        self.assertEqual(len(resample(np.zeros(44100, np.float32), INPUT_RATE, OUTPUT_RATE)), 16000)
+        self.assertEqual(len(resample(np.zeros(1000, np.float32), INPUT_RATE, OUTPUT_RATE)), 363)
+    
+    def test_same_rate_passthrough(self):
+        """같은 샘플 레이트는 그대로 통과하는지 테스트"""
+        signal = np.random.default_rng(1).standard_normal(1000).astype(np.float32)
+        np.testing.assert_array_equal(resample(signal, 16000, 16000), signal)
+
+
+class TestVoiceRecorderResampling(unittest.TestCase):
+    """VoiceRecorder 녹음 중 변환 테스트 (오디오 장치 불필요)"""
+
+    def setUp(self):
+        """테스트 준비"""
+        try:
+            from components.voice_recorder import VoiceRecorder
+        except OSError as e:
+            self.skipTest(f"오디오 라이브러리를 불러올 수 없습니다: {e}")
+        self.VoiceRecorder = VoiceRecorder
+    
+    def test_capture_stores_16k_mono(self):
+        """스테레오 44.1kHz 입력이 16kHz 모노로 저장되는지 테스트"""
+        print("🎚️ 녹음 중 다운믹스/리샘플 테스트...")
+        
+        recorder = self.VoiceRecorder(sample_rate=INPUT_RATE, channels=2, max_duration=2,
+                                      target_sample_rate=OUTPUT_RATE)
+        self.assertEqual(recorder.buffer.capacity, OUTPUT_RATE * 2)
+        self.assertEqual(recorder.buffer._buffer.shape[1], 1)
+        
+        mono = tones([(440, 0.5)])
+        stereo = np.stack([mono, mono], axis=1)
+        for offset in range(0, len(stereo), 512):
+            block = stereo[offset:offset + 512]
+            recorder.callback(block, len(block), None, None)
+            
+        clip = recorder.stop_recording()
+        self.assertEqual(clip.sample_rate, OUTPUT_RATE)
+        self.assertEqual(clip.channels, 1)
+        self.assertEqual(clip.num_frames, OUTPUT_RATE)
+        self.assertLess(len(clip.to_wav_bytes()), 0.37 * len(mono) * 2 * 2)
+        
+        print("✅ 16kHz 모노 저장 성공")
+    
+    def test_recorder_reuses_resampler_across_captures(self):
+        """다시 녹음해도 필터와 작업 버퍼를 새로 만들지 않고 같은 결과를 내는지 테스트"""
+        from components.audio_sources import SyntheticSource
+        
+        recorder = self.VoiceRecorder(max_duration=2, target_sample_rate=OUTPUT_RATE,
+                                      source=SyntheticSource(INPUT_RATE, channels=2,
+                                                             phrases=((0.3, 0.3),), speed=0))
+        resampler = recorder.resampler
+        buffers = (resampler._phases, resampler._windows, *resampler._inputs)
+        
+        captures = []
+        for _ in range(2):
+            recorder.start_recording()
+            self.assertTrue(recorder.source.wait(10))
+            captures.append(recorder.stop_recording().samples.copy())
+            
+        self.assertIs(recorder.resampler, resampler)
+        for before, after in zip(buffers, (resampler._phases, resampler._windows, *resampler._inputs)):
+            self.assertIs(after, before, "리샘플러 버퍼가 다시 할당되었습니다")
+        np.testing.assert_array_equal(captures[1], captures[0])
+
+
+if __name__ == '__main__':
+    print("🎚️ ENFP AI Voice Chatbot - Resampler 기능 테스트 시작")
+    print("=" * 60)
+    
+    unittest.main(verbosity=2, exit=False)
+    
+    print("\n" + "=" * 60)
+    print("🎉 리샘플러 테스트가 완료되었습니다!")
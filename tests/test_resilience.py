@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+시간 제한(deadline) 및 서킷 브레이커 기능 테스트 - 지연을 주입하는 로컬 대역 서버 사용
+"""
+import unittest
+import sys
+import os
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.request import urlopen
+
+import numpy as np
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from components.metrics import LatencyTracker
+from components.resilience import (CircuitBreaker, CircuitOpenError, DeadlineExceeded,
+                                   call_with_deadline)
+
+try:
+    import speech_recognition as sr
+except ImportError:
+    sr = None
+
+GOOGLE_RESPONSE = ('{"result":[]}\n'
+                   + json.dumps({"result": [{"alternative": [{"transcript": "안녕하세요",
+                                                              "confidence": 0.9}],
+                                             "final": True}], "result_index": 0}))
+
+
+class StandInServer:
+    """요청마다 delay초 기다린 뒤 status로 응답하는 로컬 HTTP 서버"""
+
+    def __init__(self):
+        self.delay = 0.0
+        self.status = 200
+        self.body = "ok"
+        self.requests = 0
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def _respond(self):
+                server.requests += 1
+                length = int(self.headers.get('Content-Length') or 0)
+                if length:
+                    self.rfile.read(length)
+                time.sleep(server.delay)
+                payload = server.body.encode('utf-8')
+                try:
+                    self.send_response(server.status)
+                    self.send_header('Content-Length', str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+                except OSError:
+                    pass  # 클라이언트가 먼저 끊은 경우
+                    
+            do_GET = _respond
+            do_POST = _respond
+            
+            def log_message(self, *args):
+                pass
+                
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+    
+    def fetch(self):
+        with urlopen(self.url, timeout=5) as response:
+            return response.read().decode('utf-8')
+    
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class TestDeadline(unittest.TestCase):
+    """호출 시간 제한 테스트"""
+
+    def setUp(self):
+        self.server = StandInServer()
+    
+    def tearDown(self):
+        self.server.close()
+    
+    def test_fast_call_returns(self):
+        """제한 시간 안에 끝나면 결과 반환 테스트"""
+        self.assertEqual(call_with_deadline(self.server.fetch, timeout=1.0), "ok")
+    
+    def test_slow_call_is_abandoned(self):
+        """느린 서버 응답은 제한 시간에 끊기는지 테스트"""
+        print("⏳ 시간 제한 테스트...")
+        self.server.delay = 1.0
+        
+        start = time.perf_counter()
+        with self.assertRaises(DeadlineExceeded):
+            call_with_deadline(self.server.fetch, timeout=0.2)
+        elapsed = time.perf_counter() - start
+        
+        print(f"   1초 지연 서버 → {elapsed * 1000:.0f} ms 만에 실패")
+        self.assertLess(elapsed, 0.5)
+        print("✅ 시간 제한 성공")
+    
+    def test_call_errors_propagate(self):
+        """호출 자체의 예외는 그대로 전달되는지 테스트"""
+        self.server.status = 500
+        with self.assertRaises(OSError):
+            call_with_deadline(self.server.fetch, timeout=1.0)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """서킷 브레이커 테스트"""
+
+    def setUp(self):
+        self.server = StandInServer()
+        self.metrics = LatencyTracker()
+        self.breaker = CircuitBreaker('tts', failure_threshold=2, reset_timeout=0.3,
+                                      timeout=0.2, metrics=self.metrics)
+    
+    def tearDown(self):
+        self.server.close()
+    
+    def test_trips_after_repeated_failures(self):
+        """연속 실패 후 서버에 요청하지 않고 즉시 실패하는지 테스트"""
+        print("🔌 회로 차단 테스트...")
+        self.server.delay = 0.5
+        for _ in range(2):
+            with self.assertRaises(DeadlineExceeded):
+                self.breaker.call(self.server.fetch)
+        self.assertEqual(self.breaker.state, 'open')
+        
+        requests = self.server.requests
+        start = time.perf_counter()
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.call(self.server.fetch)
+        elapsed = time.perf_counter() - start
+        
+        self.assertLess(elapsed, 0.05)
+        self.assertEqual(self.server.requests, requests)
+        stats = self.breaker.stats()
+        self.assertEqual(stats['trip_count'], 1)
+        self.assertEqual(stats['timeouts'], 2)
+        self.assertEqual(stats['rejected'], 1)
+        print(f"   차단 후 호출 {elapsed * 1000:.2f} ms 만에 거부")
+        print("✅ 회로 차단 성공")
+    
+    def test_half_open_recovery(self):
+        """대기 시간 후 시험 요청 성공 시 회로가 닫히는지 테스트"""
+        self.server.status = 503
+        for _ in range(2):
+            with self.assertRaises(OSError):
+                self.breaker.call(self.server.fetch)
+        self.assertEqual(self.breaker.state, 'open')
+        
+        time.sleep(0.35)
+        self.assertEqual(self.breaker.state, 'half_open')
+        self.server.status = 200
+        self.assertEqual(self.breaker.call(self.server.fetch), "ok")
+        self.assertEqual(self.breaker.state, 'closed')
+        self.assertEqual(self.breaker.stats()['failures'], 0)
+    
+    def test_failed_trial_reopens(self):
+        """시험 요청이 실패하면 다시 차단되는지 테스트"""
+        self.server.status = 503
+        for _ in range(2):
+            with self.assertRaises(OSError):
+                self.breaker.call(self.server.fetch)
+        time.sleep(0.35)
+        
+        with self.assertRaises(OSError):
+            self.breaker.call(self.server.fetch)
+        self.assertEqual(self.breaker.state, 'open')
+        self.assertEqual(self.breaker.stats()['trip_count'], 2)
+    
+    def test_fallback(self):
+        """실패 및 차단 시 대체 결과(텍스트 전용 출력) 테스트"""
+        self.server.delay = 0.5
+        fallback = lambda error: "text-only"
+        results = [self.breaker.call(self.server.fetch, fallback=fallback) for _ in range(3)]
+        self.assertEqual(results, ["text-only"] * 3)
+        self.assertEqual(self.breaker.stats()['rejected'], 1)
+    
+    def test_ignored_errors_do_not_trip(self):
+        """무시할 예외는 장애로 세지 않는지 테스트"""
+        breaker = CircuitBreaker('asr', failure_threshold=1, ignore=(ValueError,))
+        
+        def unintelligible():
+            raise ValueError("no speech")
+        for _ in range(3):
+            with self.assertRaises(ValueError):
+                breaker.call(unintelligible)
+        self.assertEqual(breaker.state, 'closed')
+    
+    def test_tail_latency_metrics(self):
+        """호출 대기 시간이 기록되고 제한 시간으로 꼬리 지연이 묶이는지 테스트"""
+        wrapped = self.breaker.wrap(self.server.fetch, fallback=lambda error: None)
+        for delay in (0.0, 0.0, 0.0, 1.0):
+            self.server.delay = delay
+            wrapped()
+            
+        summary = self.metrics.summary('breaker.tts')
+        self.assertEqual(summary['count'], 4)
+        self.assertLess(summary['p99_ms'], 400)
+        self.assertGreater(summary['max_ms'], 150)
+
+
+@unittest.skipIf(sr is None, "speech_recognition 미설치")
+class TestGoogleRecognizerStandIn(unittest.TestCase):
+    """로컬 대역 서버를 이용한 Google 인식 백엔드 테스트"""
+
+    def setUp(self):
+        from components.asr import GoogleRecognizer
+        self.server = StandInServer()
+        self.server.body = GOOGLE_RESPONSE
+        self.backend = GoogleRecognizer(timeout=0.5, endpoint=self.server.url)
+        pcm = (np.sin(np.arange(16000) / 10) * 8000).astype('<i2').tobytes()
+        self.audio = sr.AudioData(pcm, 16000, 2)
+    
+    def tearDown(self):
+        self.server.close()
+    
+    def test_recognize(self):
+        """정상 응답 인식 테스트"""
+        self.assertEqual(self.backend.recognize(self.audio), "안녕하세요")
+        self.assertEqual(self.backend.recognizer.operation_timeout, 0.5)
+    
+    def test_slow_service_trips_breaker(self):
+        """응답 없는 인식 서비스에 대한 시간 제한 및 차단 테스트"""
+        print("🎤 음성 인식 대역 서버 지연 테스트...")
+        self.server.delay = 2.0
+        breaker = CircuitBreaker('asr', failure_threshold=2, timeout=0.3,
+                                 ignore=(sr.UnknownValueError,))
+        recognize = breaker.wrap(self.backend.recognize)
+        
+        start = time.perf_counter()
+        for _ in range(2):
+            with self.assertRaises(DeadlineExceeded):
+                recognize(self.audio)
+        with self.assertRaises(CircuitOpenError):
+            recognize(self.audio)
+        elapsed = time.perf_counter() - start
+        
+        print(f"   2초 지연 서버, 3회 호출 총 {elapsed:.2f}s")
+        self.assertLess(elapsed, 1.5)
+        self.assertEqual(breaker.stats()['trip_count'], 1)
+        print("✅ 음성 인식 보호 성공")
+
+
+if __name__ == '__main__':
+    print("🔌 ENFP AI Voice Chatbot - Resilience 기능 테스트 시작")
+    print("=" * 60)
+    
+    unittest.main(verbosity=2, exit=False)
+    
+    print("\n" + "=" * 60)
+    print("🎉 시간 제한 및 서킷 브레이커 테스트가 완료되었습니다!")
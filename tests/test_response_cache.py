@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+응답 캐시(정규화/유사도 조회, TTL/LRU 삭제, 개인화 대화 건너뛰기) 기능 테스트
+"""
+import unittest
+import sys
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from components.metrics import LatencyTracker
+from components.response_cache import (NgramEmbedder, OllamaEmbedder, ResponseCache,
+                                       create_embedder, normalize_text)
+
+
+class StandInEmbedClient:
+    """Ollama embed API 대역: 미리 정한 문장별 벡터 (다른 표현도 같은 뜻이면 가까운 벡터)"""
+
+    MEANINGS = {
+        '오늘기분어때': [1.0, 0.0, 0.0],
+        '요즘기분은좀어때요': [0.95, 0.31, 0.0],
+        '좋아하는음식이뭐야': [0.0, 0.0, 1.0],
+    }
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def embed(self, model, input):
+        self.calls += 1
+        return {'embeddings': [self.MEANINGS.get(input, [0.0, 1.0, 0.0])]}
+
+
+class TestNormalize(unittest.TestCase):
+    """메시지 정규화 테스트"""
+
+    def test_folds_surface_variants(self):
+        """문장 부호, 띄어쓰기, 대소문자, 반복 글자 무시 테스트"""
+        self.assertEqual(normalize_text("안녕!!"), normalize_text("안녕"))
+        self.assertEqual(normalize_text("오늘 뭐 했어?"), normalize_text("오늘 뭐했어"))
+        self.assertEqual(normalize_text("Hello~~ 😀"), "hello")
+        self.assertEqual(normalize_text("ㅋㅋㅋㅋㅋ"), normalize_text("ㅋㅋㅋ"))
+        self.assertNotEqual(normalize_text("안녕"), normalize_text("안녕하세요"))
+
+
+class TestResponseCache(unittest.TestCase):
+    """응답 캐시 테스트"""
+
+    def test_exact_hit_after_normalization(self):
+        """같은 메시지(표기만 다름)는 바로 적중하는지 테스트"""
+        print("💬 동일 메시지 적중 테스트...")
+        metrics = LatencyTracker()
+        cache = ResponseCache(metrics=metrics)
+        self.assertIsNone(cache.lookup("안녕", "긍정"))
+        cache.store("안녕", "긍정", "안녕하세요! 반가워요!")
+        
+        self.assertEqual(cache.lookup("안녕!!", "긍정"), "안녕하세요! 반가워요!")
+        self.assertEqual(cache.lookup(" 안녕 ", "긍정"), "안녕하세요! 반가워요!")
+        stats = cache.stats()
+        self.assertEqual(stats['exact_hits'], 2)
+        self.assertEqual(stats['misses'], 1)
+        self.assertAlmostEqual(stats['hit_rate'], 2 / 3)
+        self.assertEqual(metrics.summary('response_cache.hit')['count'], 2)
+        print(f"✅ 적중 지연 평균 {metrics.summary('response_cache.hit')['mean_ms']:.3f} ms")
+    
+    def test_sentiment_is_part_of_key(self):
+        """감정이 다르면 다른 응답을 쓰는지 테스트"""
+        cache = ResponseCache()
+        cache.store("오늘 기분 어때?", "긍정", "최고예요!")
+        self.assertIsNone(cache.lookup("오늘 기분 어때?", "부정"))
+        self.assertEqual(cache.lookup("오늘 기분 어때?", "긍정"), "최고예요!")
+    
+    def test_ngram_similarity(self):
+        """n-gram 유사도: 어미만 다르면 적중, 단어가 바뀌면 미스 (기본 기준 0.9)"""
+        cache = ResponseCache()
+        cache.store("오늘 학교에서 있었던 일 들어볼래?", "중립", "당연하죠! 얼른 들려주세요!")
+        self.assertEqual(cache.lookup("오늘 학교에서 있었던 일 들어볼래요?", "중립"),
+                         "당연하죠! 얼른 들려주세요!")
+        self.assertIsNone(cache.lookup("오늘 회사에서 있었던 일 들어볼래?", "중립"))
+        self.assertEqual(cache.stats()['similar_hits'], 1)
+    
+    def test_embedding_similarity(self):
+        """임베딩 모델로 다른 표현의 같은 질문을 찾는지 테스트"""
+        print("🧭 임베딩 유사도 테스트...")
+        client = StandInEmbedClient()
+        cache = ResponseCache(create_embedder('ollama', client=client), threshold=0.9)
+        cache.store("오늘 기분 어때?", "긍정", "최고예요!")
+        cache.store("좋아하는 음식이 뭐야?", "긍정", "떡볶이요!")
+        
+        self.assertEqual(cache.lookup("요즘 기분은 좀 어때요?", "긍정"), "최고예요!")
+        self.assertIsNone(cache.lookup("주말에 뭐 해?", "긍정"))
+        # 정확히 같은 메시지는 임베딩 요청 없이 적중
+        calls = client.calls
+        self.assertEqual(cache.lookup("오늘 기분 어때", "긍정"), "최고예요!")
+        self.assertEqual(client.calls, calls)
+        print("✅ 다른 표현도 적중")
+    
+    def test_miss_embeds_once(self):
+        """미스 후 저장할 때 같은 메시지를 다시 임베딩하지 않는지 테스트"""
+        client = StandInEmbedClient()
+        cache = ResponseCache(create_embedder('ollama', client=client), threshold=0.9)
+        cache.store("오늘 기분 어때?", "긍정", "최고예요!")
+        calls = client.calls
+        
+        self.assertIsNone(cache.lookup("주말에 뭐 해?", "긍정"))
+        cache.store("주말에 뭐 해?", "긍정", "친구랑 놀러 가요!")
+        
+        self.assertEqual(client.calls, calls + 1)
+        self.assertEqual(cache.lookup("주말에 뭐 해", "긍정"), "친구랑 놀러 가요!")
+    
+    def test_embedding_failure_is_a_miss(self):
+        """임베딩 실패 시 미스로 처리하는지 테스트"""
+        def broken(text):
+            raise ConnectionError("ollama down")
+            
+        cache = ResponseCache(broken)
+        cache.store("안녕", "긍정", "안녕하세요!")
+        self.assertIsNone(cache.lookup("안녕", "긍정"))
+        self.assertEqual(cache.stats()['entries'], 0)
+    
+    def test_ttl_expiry(self):
+        """유지 시간이 지나면 응답을 버리는지 테스트"""
+        cache = ResponseCache(ttl_seconds=0.05)
+        cache.store("안녕", "긍정", "안녕하세요!")
+        self.assertEqual(cache.lookup("안녕", "긍정"), "안녕하세요!")
+        time.sleep(0.1)
+        self.assertIsNone(cache.lookup("안녕", "긍정"))
+        self.assertEqual(cache.stats()['entries'], 0)
+    
+    def test_lru_eviction(self):
+        """최대 개수를 넘으면 가장 오래 사용하지 않은 응답부터 삭제"""
+        cache = ResponseCache(max_entries=2)
+        cache.store("첫째", "중립", "1")
+        cache.store("둘째", "중립", "2")
+        cache.lookup("첫째", "중립")
+        cache.store("셋째", "중립", "3")
+        self.assertEqual(cache.lookup("첫째", "중립"), "1")
+        self.assertIsNone(cache.lookup("둘째", "중립"))
+        self.assertEqual(cache.stats()['entries'], 2)
+    
+    def test_bypass_for_personal_context(self):
+        """이전 대화가 있으면 조회/저장을 모두 건너뛰는지 테스트"""
+        print("🔒 개인화 대화 건너뛰기 테스트...")
+        cache = ResponseCache(max_context_turns=0)
+        cache.store("그거 어땠어?", "긍정", "어제 말한 여행 정말 좋았겠어요!", context_turns=3)
+        self.assertEqual(cache.stats()['entries'], 0)
+        
+        cache.store("안녕", "긍정", "안녕하세요!")
+        self.assertIsNone(cache.lookup("안녕", "긍정", context_turns=1))
+        self.assertEqual(cache.lookup("안녕", "긍정", context_turns=0), "안녕하세요!")
+        stats = cache.stats()
+        self.assertEqual(stats['bypassed'], 1)
+        self.assertEqual(stats['hit_rate'], 1.0)
+        print("✅ 개인화 응답은 공유하지 않음")
+    
+    def test_concurrent_sessions(self):
+        """여러 세션이 동시에 조회/저장해도 안전한지 테스트"""
+        cache = ResponseCache(max_entries=20)
+        
+        def session(index):
+            for turn in range(50):
+                text = f"질문 {(index + turn) % 30}"
+                if cache.lookup(text, "중립") is None:
+                    cache.store(text, "중립", f"답 {text}")
+                    
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(session, range(8)))
+        stats = cache.stats()
+        self.assertLessEqual(stats['entries'], 20)
+        self.assertEqual(stats['exact_hits'] + stats['similar_hits'] + stats['misses'], 400)
+    
+    def test_embedders(self):
+        """임베딩 생성 함수 테스트"""
+        vector = NgramEmbedder()(normalize_text("안녕하세요"))
+        self.assertEqual(vector.shape, (1024,))
+        self.assertGreater(np.linalg.norm(vector), 0)
+        self.assertIsInstance(create_embedder('ngram'), NgramEmbedder)
+        self.assertIsInstance(create_embedder('OLLAMA', client=StandInEmbedClient()), OllamaEmbedder)
+        with self.assertRaises(ValueError):
+            create_embedder('bert')
+
+
+if __name__ == '__main__':
+    print("💬 ENFP AI Voice Chatbot - Response Cache 기능 테스트 시작")
+    print("=" * 60)
+    
+    unittest.main(verbosity=2, exit=False)
+    
+    print("\n" + "=" * 60)
+    print("🎉 응답 캐시 테스트가 완료되었습니다!")
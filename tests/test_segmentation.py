@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+쉼 구간 분할 및 병렬 인식 기능 테스트
+"""
+import unittest
+import sys
+import os
+import time
+import threading
+
+import numpy as np
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from components.audio_clip import AudioClip
+from components.segmentation import SegmentedRecognizer, find_segments
+
+try:
+    import speech_recognition as sr
+except ImportError:
+    sr = None
+
+SAMPLE_RATE = 16000
+
+
+def make_speech(phrases, pause=0.6, freq=220):
+    """(길이, 진폭) 구절 사이에 쉼이 있는 신호"""
+    parts = []
+    for seconds, amplitude in phrases:
+        t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+        parts.append((amplitude * np.sin(2 * np.pi * freq * t)).astype(np.float32))
+        parts.append(np.zeros(int(pause * SAMPLE_RATE), dtype=np.float32))
+    return np.concatenate(parts[:-1])
+
+
+class TestFindSegments(unittest.TestCase):
+    """쉼 구간 분할 테스트"""
+
+    def test_cuts_in_pauses(self):
+        """쉼 구간 가운데에서 나누는지 테스트"""
+        print("✂️ 쉼 구간 분할 테스트...")
+        
+        samples = make_speech([(5.0, 0.2), (5.0, 0.2), (5.0, 0.2)])
+        ranges = find_segments(samples, SAMPLE_RATE, min_segment_seconds=4.0)
+        
+        self.assertEqual(len(ranges), 3)
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], len(samples))
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, start, "구간 사이에 빠진 샘플이 있습니다")
+        # 첫 번째 분할점은 5.0 ~ 5.6초 쉼 구간 안
+        self.assertTrue(5.0 * SAMPLE_RATE < ranges[0][1] < 5.6 * SAMPLE_RATE)
+        
+        print(f"✅ {len(ranges)}개 구간으로 분할")
+    
+    def test_short_phrases_merged(self):
+        """짧은 구절은 최소 길이까지 합쳐지는지 테스트"""
+        samples = make_speech([(1.0, 0.2)] * 6)
+        ranges = find_segments(samples, SAMPLE_RATE, min_segment_seconds=4.0)
+        
+        self.assertEqual(len(ranges), 2)
+        for start, end in ranges:
+            self.assertGreaterEqual(end - start, 4.0 * SAMPLE_RATE)
+    
+    def test_long_speech_without_pause_forced(self):
+        """쉼 없는 긴 발화는 최대 길이에서 강제 분할되는지 테스트"""
+        samples = make_speech([(40.0, 0.2)])
+        ranges = find_segments(samples, SAMPLE_RATE, max_segment_seconds=15.0)
+        
+        self.assertGreaterEqual(len(ranges), 3)
+        for start, end in ranges:
+            self.assertLessEqual(end - start, 15.0 * SAMPLE_RATE)
+    
+    def test_empty(self):
+        """빈 입력 테스트"""
+        self.assertEqual(find_segments(np.zeros(0, np.float32), SAMPLE_RATE), [])
+
+
+@unittest.skipIf(sr is None, "speech_recognition 미설치")
+class TestSegmentedRecognizer(unittest.TestCase):
+    """구간별 병렬 인식 테스트"""
+
+    def setUp(self):
+        """테스트 준비"""
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+    
+    def recognize(self, audio):
+        """구간 길이(초)를 글자로 돌려주는 가짜 인식기, 짧은 구간일수록 늦게 끝남"""
+        seconds = len(audio.frame_data) / (audio.sample_rate * audio.sample_width)
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.2 / seconds)
+        with self.lock:
+            self.active -= 1
+        if seconds < 0.5:
+            raise sr.UnknownValueError()
+        return f"{seconds:.0f}초"
+    
+    def test_transcripts_stitched_in_order(self):
+        """완료 순서와 무관하게 원래 순서로 이어 붙이는지 테스트"""
+        print("🧵 병렬 인식 순서 테스트...")
+        
+        samples = make_speech([(9.0, 0.2), (5.0, 0.2), (7.0, 0.2), (6.0, 0.2), (8.0, 0.2)])
+        segmenter = SegmentedRecognizer(self.recognize, max_workers=2)
+        try:
+            text = segmenter.transcribe(AudioClip(samples, SAMPLE_RATE))
+        finally:
+            segmenter.close()
+            
+        words = text.split()
+        self.assertEqual(len(words), 5)
+        self.assertEqual([int(word[:-1]) >= 5 for word in words], [True] * 5)
+        self.assertEqual(words[0], "9초")
+        self.assertEqual(words[1], "6초")
+        self.assertLessEqual(self.max_active, 2, "스레드 풀 크기를 넘었습니다")
+        
+        print(f"✅ 인식 결과: {text}")
+    
+    def test_short_clip_single_call(self):
+        """분할할 필요 없는 짧은 녹음은 한 번에 인식하는지 테스트"""
+        segmenter = SegmentedRecognizer(self.recognize)
+        try:
+            text = segmenter.transcribe(AudioClip(make_speech([(3.0, 0.2)]), SAMPLE_RATE))
+        finally:
+            segmenter.close()
+        self.assertEqual(text, "3초")
+    
+    def test_buffered_recognizer_per_call(self):
+        """BufferedRecognizer에서 호출마다 분할 여부를 고르는지 테스트"""
+        from components.asr import BufferedRecognizer
+        
+        samples = make_speech([(5.0, 0.2), (5.0, 0.2)]).reshape(-1, 1)
+        segmenter = SegmentedRecognizer(self.recognize)
+        recognizer = BufferedRecognizer(self.recognize, segmenter=segmenter)
+        try:
+            for segmented, expected in ((False, ["11초"]), (True, ["5초", "5초"])):
+                recognizer.start(SAMPLE_RATE)
+                recognizer.accept_audio(samples)
+                self.assertEqual(recognizer.finish(segmented=segmented).split(), expected)
+        finally:
+            segmenter.close()
+
+
+if __name__ == '__main__':
+    print("✂️ ENFP AI Voice Chatbot - Segmented ASR 기능 테스트 시작")
+    print("=" * 60)
+    
+    unittest.main(verbosity=2, exit=False)
+    
+    print("\n" + "=" * 60)
+    print("🎉 분할 병렬 인식 테스트가 완료되었습니다!")
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+샤딩 데이터베이스 기능 테스트
+"""
+import unittest
+import sys
+import os
+import json
+import tempfile
+import threading
+import time
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from components.sharded_database import IMPORT_QUEUE_BATCHES, ShardedConversationDB, shard_paths
+
+
+class TestShardedDatabase(unittest.TestCase):
+    """샤딩 데이터베이스 기능 테스트"""
+    
+    def setUp(self):
+        """테스트 준비"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'conversations.db')
+        self.db = ShardedConversationDB(self.db_path, num_shards=4)
+        self.session_ids = [f'session-{i}' for i in range(12)]
+    
+    def tearDown(self):
+        """테스트 정리"""
+        self.db.close()
+        for name in os.listdir(self.temp_dir):
+            os.unlink(os.path.join(self.temp_dir, name))
+        os.rmdir(self.temp_dir)
+    
+    def test_shard_files_created(self):
+        """샤드 파일 생성 테스트"""
+        print("🗂️ 샤드 파일 생성 테스트...")
+        
+        paths = shard_paths(self.db_path, 4)
+        self.assertEqual(len(set(paths)), 4)
+        for path in paths:
+            self.assertTrue(os.path.exists(path), f"샤드 파일이 없습니다: {path}")
+            
+        # 샤드 1개는 기존 파일 경로를 그대로 사용
+        self.assertEqual(shard_paths(self.db_path, 1), [self.db_path])
+        
+        print("✅ 샤드 파일 생성 성공")
+    
+    def test_session_routing_is_stable(self):
+        """세션별 샤드 라우팅 테스트"""
+        print("🧭 세션 라우팅 테스트...")
+        
+        for session_id in self.session_ids:
+            self.db.save_conversation(session_id, f'{session_id} 첫 메시지', '응답', '긍정적', 'ENFP')
+            self.db.save_conversation(session_id, f'{session_id} 두 번째', '응답', '중립', None)
+            
+        used_shards = {self.db.shard_index(session_id) for session_id in self.session_ids}
+        self.assertGreater(len(used_shards), 1, "세션이 여러 샤드로 분산되지 않았습니다")
+        
+        for session_id in self.session_ids:
+            history = self.db.get_conversation_history(session_id)
+            self.assertEqual(len(history), 2)
+            self.assertEqual(history[0]['user_input'], f'{session_id} 첫 메시지')
+            
+            stats = self.db.get_session_stats(session_id)
+            self.assertEqual(stats['final_mbti'], 'ENFP')
+            
+            # 다른 샤드에는 해당 세션이 없어야 함
+            owner = self.db.shard_for(session_id)
+            for shard in self.db.shards:
+                if shard is not owner:
+                    self.assertEqual(shard.get_conversation_history(session_id), [])
+                    
+        print(f"✅ {len(used_shards)}개 샤드로 라우팅 성공")
+    
+    def test_fan_out_export_and_stats(self):
+        """전체 내보내기 및 통계 병합 테스트"""
+        print("📤 샤드 병합 내보내기 테스트...")
+        
+        for session_id in self.session_ids:
+            self.db.save_conversation(session_id, '안녕', '반가워요', '긍정적', 'ENFP')
+            
+        exported = json.loads(self.db.export_conversations())
+        self.assertEqual(len(exported), len(self.session_ids))
+        timestamps = [row['timestamp'] for row in exported]
+        self.assertEqual(timestamps, sorted(timestamps))
+        
+        stats = self.db.get_database_stats()
+        self.assertEqual(stats['total_sessions'], len(self.session_ids))
+        self.assertEqual(stats['total_conversations'], len(self.session_ids))
+        self.assertEqual(stats['sentiment_distribution'], {'긍정적': len(self.session_ids)})
+        
+        print("✅ 샤드 병합 내보내기 성공")
+    
+    def test_export_order_with_equal_timestamps(self):
+        """같은 시각의 대화는 샤드 처리 순서와 상관없이 세션 순으로 내보내는지 테스트"""
+        rows = [{'session_id': session_id, 'timestamp': '2024-05-01 12:00:00',
+                 'user_input': f'{session_id} 대화 {i}'}
+                for session_id in reversed(self.session_ids) for i in range(2)]
+        self.db.import_conversations(rows)
+        
+        exported = json.loads(self.db.export_conversations())
+        
+        self.assertEqual([row['user_input'] for row in exported],
+                         [f'{session_id} 대화 {i}' for session_id in sorted(self.session_ids)
+                          for i in range(2)])
+    
+    def test_import_routes_rows(self):
+        """가져오기 시 샤드별 분배 테스트"""
+        rows = [{'session_id': session_id, 'user_input': '가져온 대화', 'mbti': 'INFP'}
+                for session_id in self.session_ids]
+                
+        result = self.db.import_conversations(rows)
+        
+        self.assertEqual(result['imported'], len(self.session_ids))
+        self.assertEqual(result['sessions'], len(self.session_ids))
+        for session_id in self.session_ids:
+            self.assertEqual(self.db.get_session_stats(session_id)['total_messages'], 1)
+    
+    def test_import_reads_source_at_shard_pace(self):
+        """샤드 저장이 느리면 원본 읽기가 기다리는지 (메모리에 쌓지 않는지) 테스트"""
+        print("🚰 가져오기 역압 테스트...")
+        batch_size = 20
+        inserted = [0]
+        ahead = [0]
+        lock = threading.Lock()
+        
+        for shard in self.db.shards:
+            def slow_insert(cursor, batch, insert=shard._insert_import_batch):
+                time.sleep(0.005)
+                with lock:
+                    inserted[0] += len(batch)
+                return insert(cursor, batch)
+            shard._insert_import_batch = slow_insert
+        
+        def rows():
+            for i in range(3000):
+                with lock:
+                    ahead[0] = max(ahead[0], i - inserted[0])
+                yield {'session_id': self.session_ids[i % len(self.session_ids)],
+                       'user_input': f'메시지 {i}'}
+                
+        result = self.db.import_conversations(rows(), batch_size=batch_size)
+        
+        self.assertEqual(result['imported'], 3000)
+        # 샤드마다 대기열 + 만드는 중인 배치 + 저장 중인 배치까지만 앞서 읽음
+        limit = len(self.db.shards) * batch_size * (IMPORT_QUEUE_BATCHES + 2)
+        self.assertLessEqual(ahead[0], limit)
+        print(f"✅ 최대 {ahead[0]}행 앞서 읽음 (한도 {limit})")
+    
+    def test_import_survives_failed_shard(self):
+        """한 샤드가 실패해도 가져오기가 멈추지 않는지 테스트"""
+        broken = self.db.shards[0]
+        
+        def failing_insert(cursor, batch):
+            raise RuntimeError("disk full")
+        broken._insert_import_batch = failing_insert
+        
+        rows = [{'session_id': self.session_ids[i % len(self.session_ids)], 'user_input': '대화'}
+                for i in range(2000)]
+        result = self.db.import_conversations(rows, batch_size=10)
+        
+        expected = sum(1 for row in rows if self.db.shard_for(row['session_id']) is not broken)
+        self.assertEqual(result['imported'], expected)
+    
+    def test_concurrent_writers(self):
+        """여러 스레드 동시 저장 테스트"""
+        print("🧵 동시 저장 테스트...")
+        
+        def writer(session_id):
+            for i in range(5):
+                self.db.save_conversation(session_id, f'메시지 {i}', '응답')
+                
+        threads = [threading.Thread(target=writer, args=(session_id,))
+                   for session_id in self.session_ids]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+            
+        stats = self.db.get_database_stats()
+        self.assertEqual(stats['total_conversations'], len(self.session_ids) * 5)
+        
+        print("✅ 동시 저장 성공")
+
+
+if __name__ == '__main__':
+    print("🗂️ ENFP AI Voice Chatbot - Sharded Database 기능 테스트 시작")
+    print("=" * 60)
+    
+    unittest.main(verbosity=2, exit=False)
+    
+    print("\n" + "=" * 60)
+    print("🎉 샤딩 데이터베이스 테스트가 완료되었습니다!")
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+문장 단위 음성 출력 파이프라인(문장 분할, 합성/재생 겹치기) 기능 테스트 - 오디오 장치 불필요
+"""
+import unittest
+import sys
+import os
+import time
+import threading
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from components.metrics import LatencyTracker
+from components.speech_pipeline import SentenceSplitter, SpeechPipeline, split_sentences
+
+
+class TestSentenceSplitter(unittest.TestCase):
+    """한국어 문장 분할 테스트"""
+
+    def test_split_korean(self):
+        """한국어 문장 끝 문장부호로 분할 테스트"""
+        text = "안녕하세요, 반가워요! 오늘 기분은 어떠세요? 저는 정말 신나요~ 같이 이야기해요."
+        self.assertEqual(split_sentences(text, min_chars=0), [
+            "안녕하세요, 반가워요!",
+            "오늘 기분은 어떠세요?",
+            "저는 정말 신나요~",
+            "같이 이야기해요."
+        ])
+    
+    def test_streamed_tokens(self):
+        """토큰 단위로 들어와도 같은 문장이 나오는지 테스트"""
+        print("✂️ 스트리밍 문장 분할 테스트...")
+        text = "정말 멋진 생각이에요! 저도 산책을 좋아해요. 3.5km나 걸으셨다니 대단해요!!"
+        splitter = SentenceSplitter(min_chars=0)
+        sentences = []
+        for index in range(0, len(text), 3):
+            sentences.extend(splitter.feed(text[index:index + 3]))
+        sentences.extend(splitter.flush())
+        
+        self.assertEqual(sentences, split_sentences(text, min_chars=0))
+        # 숫자 안의 마침표에서는 나누지 않음
+        self.assertEqual(sentences[2], "3.5km나 걸으셨다니 대단해요!!")
+        print(f"   {len(sentences)}문장: {sentences}")
+        print("✅ 스트리밍 문장 분할 성공")
+    
+    def test_sentence_waits_for_boundary(self):
+        """문장부호 뒤 공백이 오기 전에는 문장을 내보내지 않는지 테스트"""
+        splitter = SentenceSplitter(min_chars=0)
+        self.assertEqual(splitter.feed("좋아요!"), [])
+        self.assertEqual(splitter.feed(" 다음"), ["좋아요!"])
+        self.assertEqual(splitter.flush(), ["다음"])
+    
+    def test_short_fragments_merged(self):
+        """짧은 문장은 다음 문장과 합쳐지는지 테스트"""
+        self.assertEqual(split_sentences("네! 정말 좋은 질문이에요. 응!", min_chars=8),
+                         ["네! 정말 좋은 질문이에요.", "응!"])
+    
+    def test_line_breaks(self):
+        """줄바꿈도 문장 경계로 처리"""
+        self.assertEqual(split_sentences("첫째 줄입니다\n둘째 줄입니다", min_chars=0),
+                         ["첫째 줄입니다", "둘째 줄입니다"])
+
+
+class TestSpeechPipeline(unittest.TestCase):
+    """합성/재생 파이프라인 테스트"""
+
+    def setUp(self):
+        self.events = []
+        self.lock = threading.Lock()
+    
+    def _log(self, kind, sentence, start):
+        with self.lock:
+            self.events.append((kind, sentence, start, time.perf_counter()))
+    
+    def _synthesize(self, delay):
+        def synthesize(sentence):
+            start = time.perf_counter()
+            time.sleep(delay)
+            self._log('synth', sentence, start)
+            return sentence
+        return synthesize
+    
+    def _play(self, delay):
+        def play(audio):
+            start = time.perf_counter()
+            time.sleep(delay)
+            self._log('play', audio, start)
+        return play
+    
+    def test_synthesis_overlaps_playback(self):
+        """문장 N 재생 중에 문장 N+1이 합성되는지 테스트"""
+        print("🔊 합성/재생 겹치기 테스트...")
+        speech = SpeechPipeline(self._synthesize(0.1), self._play(0.2), min_chars=0)
+        speech.feed("첫 번째 문장입니다. 두 번째 문장입니다. 세 번째 문장입니다.")
+        stats = speech.finish()
+        
+        synth = {sentence: (start, end) for kind, sentence, start, end in self.events if kind == 'synth'}
+        plays = [(sentence, start, end) for kind, sentence, start, end in self.events if kind == 'play']
+        self.assertEqual([sentence for sentence, _, _ in plays],
+                         ["첫 번째 문장입니다.", "두 번째 문장입니다.", "세 번째 문장입니다."])
+        # 두 번째 문장 합성은 첫 문장 재생이 끝나기 전에 완료
+        self.assertLess(synth["두 번째 문장입니다."][1], plays[0][2])
+        # 대기열에서 바로 이어서 재생 (끊김 없음)
+        self.assertLess(stats['stall_ms'], 30)
+        self.assertEqual((stats['sentences'], stats['spoken'], stats['failed']), (3, 3, 0))
+        # 순차 처리(3 x 0.3s)보다 빠름
+        self.assertLess(stats['total_ms'], 850)
+        print(f"   첫 음성 {stats['first_audio_ms']:.0f} ms, 전체 {stats['total_ms']:.0f} ms "
+              f"(순차 처리 약 900 ms)")
+        print("✅ 합성/재생 겹치기 성공")
+    
+    def test_speaks_while_generating(self):
+        """응답 생성이 끝나기 전에 첫 문장 재생이 시작되는지 테스트"""
+        speech = SpeechPipeline(self._synthesize(0.02), self._play(0.05), min_chars=0)
+        tokens = ["안녕하세요! ", "오늘은 ", "정말 ", "좋은 ", "날이에요."]
+        for token in tokens:
+            speech.feed(token)
+            time.sleep(0.1)
+        generation_end = time.perf_counter()
+        stats = speech.finish()
+        
+        first_play = min(start for kind, _, start, _ in self.events if kind == 'play')
+        self.assertLess(first_play, generation_end)
+        self.assertLess(stats['first_audio_ms'], 250)
+        self.assertEqual(stats['spoken'], 2)
+    
+    def test_failed_sentence_skipped(self):
+        """합성 실패 문장은 건너뛰고 나머지는 재생하는지 테스트"""
+        played = []
+        
+        def synthesize(sentence):
+            if "실패" in sentence:
+                raise RuntimeError("TTS 오류")
+            return None if "없음" in sentence else sentence
+            
+        speech = SpeechPipeline(synthesize, played.append, min_chars=0)
+        speech.feed("첫 문장. 실패 문장. 없음 문장. 마지막 문장.")
+        stats = speech.finish()
+        self.assertEqual(played, ["첫 문장.", "마지막 문장."])
+        self.assertEqual((stats['spoken'], stats['failed']), (2, 2))
+    
+    def test_cancel(self):
+        """취소 시 대기 중인 문장을 재생하지 않는지 테스트"""
+        played = []
+        speech = SpeechPipeline(lambda sentence: sentence,
+                                lambda audio: (played.append(audio), time.sleep(0.1)), min_chars=0)
+        speech.feed("하나. 둘. 셋. 넷. 다섯. ")
+        time.sleep(0.05)
+        speech.cancel()
+        speech.finish(timeout=1)
+        self.assertLess(len(played), 5)
+    
+    def test_metrics_recorded(self):
+        """첫 음성 시간과 문장별 합성 시간이 지표에 기록되는지 테스트"""
+        metrics = LatencyTracker()
+        speech = SpeechPipeline(lambda sentence: sentence, lambda audio: None,
+                                min_chars=0, metrics=metrics)
+        speech.feed("하나. 둘.")
+        speech.finish()
+        self.assertEqual(metrics.summary('tts.first_audio')['count'], 1)
+        self.assertEqual(metrics.summary('tts.sentence')['count'], 2)
+
+
+if __name__ == '__main__':
+    print("🔊 ENFP AI Voice Chatbot - Speech Pipeline 기능 테스트 시작")
+    print("=" * 60)
+    
+    unittest.main(verbosity=2, exit=False)
+    
+    print("\n" + "=" * 60)
+    print("🎉 문장 단위 음성 출력 테스트가 완료되었습니다!")
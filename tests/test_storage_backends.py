@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+저장소 백엔드 공통 동작(Conformance) 테스트
+
+같은 테스트를 SQLite, 샤딩 SQLite, 인메모리 백엔드에 모두 실행합니다.
+"""
+import unittest
+import sys
+import os
+import csv
+import io
+import json
+import shutil
+import tempfile
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from components.storage import create_conversation_store
+
+
+class ConversationStoreContract:
+    """모든 저장소 백엔드가 만족해야 하는 동작"""
+    
+    backend = None
+    options = {}
+    
+    def setUp(self):
+        """테스트 준비"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.store = create_conversation_store(
+            self.backend, os.path.join(self.temp_dir, 'conversations.db'), **self.options)
+    
+    def tearDown(self):
+        """테스트 정리"""
+        self.store.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _save_turns(self, session_id, count, mbti='ENFP'):
+        for i in range(count):
+            self.store.save_conversation(session_id, f'메시지 {i}', f'응답 {i}',
+                                         '긍정적' if i % 2 == 0 else '부정적', mbti)
+    
+    def test_history_order_and_limit(self):
+        """대화 기록 순서 및 개수 제한"""
+        self._save_turns('session-a', 5)
+        
+        history = self.store.get_conversation_history('session-a', limit=3)
+        
+        self.assertEqual([turn['user_input'] for turn in history],
+                         ['메시지 2', '메시지 3', '메시지 4'])
+        self.assertEqual(set(history[0]), {'timestamp', 'user_input', 'ai_response',
+                                           'sentiment', 'mbti'})
+        self.assertEqual(self.store.get_conversation_history('unknown'), [])
+    
+    def test_history_limit_edges(self):
+        """개수 제한 0은 빈 목록, 음수는 전체 (SQLite LIMIT과 동일)"""
+        self._save_turns('session-a', 4)
+        
+        self.assertEqual(self.store.get_conversation_history('session-a', limit=0), [])
+        self.assertEqual(len(self.store.get_conversation_history('session-a', limit=-1)), 4)
+    
+    def test_history_orders_imported_turns_by_timestamp(self):
+        """나중에 가져온 예전 대화도 시간순으로 조회"""
+        self.store.save_conversation('session-a', '오늘 대화', '응답')
+        self.store.import_conversations([
+            {'session_id': 'session-a', 'timestamp': '2020-01-01 09:00:00', 'user_input': '예전 대화 1'},
+            {'session_id': 'session-a', 'timestamp': '2020-01-01 09:00:00', 'user_input': '예전 대화 2'},
+        ])
+        
+        history = self.store.get_conversation_history('session-a')
+        
+        self.assertEqual([turn['user_input'] for turn in history],
+                         ['예전 대화 1', '예전 대화 2', '오늘 대화'])
+        self.assertEqual([turn['user_input'] for turn in
+                          self.store.get_conversation_history('session-a', limit=1)], ['오늘 대화'])
+    
+    def test_session_stats(self):
+        """세션 통계"""
+        self._save_turns('session-a', 3)
+        self.store.save_conversation('session-a', '마지막', '응답', None, None)
+        
+        stats = self.store.get_session_stats('session-a')
+        
+        self.assertEqual(stats['session_id'], 'session-a')
+        self.assertEqual(stats['total_messages'], 4)
+        self.assertEqual(stats['final_mbti'], 'ENFP')
+        self.assertEqual(stats['sentiment_distribution'], {'긍정적': 2, '부정적': 1})
+        self.assertIsNotNone(stats['start_time'])
+        self.assertIsNone(self.store.get_session_stats('unknown'))
+    
+    def test_database_stats(self):
+        """전체 통계"""
+        self._save_turns('session-a', 2)
+        self._save_turns('session-b', 3)
+        
+        stats = self.store.get_database_stats()
+        
+        self.assertEqual(stats['total_sessions'], 2)
+        self.assertEqual(stats['total_conversations'], 5)
+        self.assertEqual(stats['sentiment_distribution'], {'긍정적': 3, '부정적': 2})
+    
+    def test_end_session_keeps_data(self):
+        """세션 종료 후에도 기록 유지"""
+        self._save_turns('session-a', 2)
+        
+        self.store.end_session('session-a')
+        self.store.end_session('unknown')
+        
+        self.assertEqual(len(self.store.get_conversation_history('session-a')), 2)
+    
+    def test_cleanup_old_sessions(self):
+        """오래된 세션 정리"""
+        self.store.import_conversations([
+            {'session_id': 'old', 'timestamp': '2000-01-01 00:00:00', 'user_input': '옛날 대화'}
+        ])
+        self._save_turns('recent', 1)
+        
+        self.store.cleanup_old_sessions(days_old=30)
+        
+        self.assertIsNone(self.store.get_session_stats('old'))
+        self.assertEqual(self.store.get_conversation_history('old'), [])
+        self.assertEqual(len(self.store.get_conversation_history('recent')), 1)
+    
+    def test_export_formats(self):
+        """JSON / JSONL / CSV 내보내기"""
+        self._save_turns('session-a', 2)
+        self._save_turns('session-b', 1)
+        
+        rows = json.loads(self.store.export_conversations())
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(set(rows[0]), {'id', 'session_id', 'timestamp', 'user_input',
+                                        'ai_response', 'sentiment', 'mbti', 'confidence_score'})
+                                        
+        session_rows = json.loads(self.store.export_conversations('session-a'))
+        self.assertEqual([row['user_input'] for row in session_rows], ['메시지 0', '메시지 1'])
+        
+        jsonl = self.store.export_conversations(format='jsonl').splitlines()
+        self.assertEqual(len(jsonl), 3)
+        
+        csv_rows = list(csv.DictReader(io.StringIO(self.store.export_conversations(format='csv'))))
+        self.assertEqual(len(csv_rows), 3)
+    
+    def test_import_round_trip(self):
+        """내보내기 결과를 다른 인스턴스로 가져오기"""
+        self._save_turns('session-a', 3)
+        exported = self.store.export_conversations(format='jsonl')
+        
+        target = create_conversation_store(
+            self.backend, os.path.join(self.temp_dir, 'target.db'), **self.options)
+        try:
+            result = target.import_conversations(exported)
+            
+            self.assertEqual(result['imported'], 3)
+            self.assertEqual(result['sessions'], 1)
+            self.assertIn('rows_per_sec', result)
+            self.assertEqual(target.get_session_stats('session-a')['total_messages'], 3)
+            self.assertEqual(
+                [turn['ai_response'] for turn in target.get_conversation_history('session-a')],
+                ['응답 0', '응답 1', '응답 2'])
+        finally:
+            target.close()
+
+
+class TestSQLiteStore(ConversationStoreContract, unittest.TestCase):
+    """SQLite 단일 파일 백엔드"""
+    backend = 'sqlite'
+
+
+class TestCompressedSQLiteStore(ConversationStoreContract, unittest.TestCase):
+    """응답 압축을 켠 SQLite 백엔드"""
+    backend = 'sqlite'
+    options = {'compress_responses': True, 'compress_min_length': 1}
+
+
+class TestShardedSQLiteStore(ConversationStoreContract, unittest.TestCase):
+    """샤딩 SQLite 백엔드"""
+    backend = 'sqlite'
+    options = {'num_shards': 3}
+
+
+class TestMemoryStore(ConversationStoreContract, unittest.TestCase):
+    """인메모리 백엔드"""
+    backend = 'memory'
+
+
+class TestStoreFactory(unittest.TestCase):
+    """백엔드 선택 테스트"""
+    
+    def test_unknown_backend(self):
+        """알 수 없는 백엔드 이름"""
+        with self.assertRaises(ValueError):
+            create_conversation_store('postgres')
+
+
+if __name__ == '__main__':
+    print("🧩 ENFP AI Voice Chatbot - 저장소 백엔드 공통 동작 테스트 시작")
+    print("=" * 60)
+    
+    unittest.main(verbosity=2, exit=False)
+    
+    print("\n" + "=" * 60)
+    print("🎉 저장소 백엔드 테스트가 완료되었습니다!")
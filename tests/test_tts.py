@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+음성 합성 백엔드(gTTS/로컬/stub), 엔진 풀 및 실시간 계수 테스트
+"""
+import unittest
+import sys
+import os
+import time
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+import numpy as np
+
+from components.metrics import LatencyTracker
+from components.tts import (GTTSSynthesizer, LocalSynthesizer, StubSynthesizer, SynthesizerBackend,
+                            SynthesizerPool, audio_duration, create_synthesizer, pcm_to_wav)
+
+
+def fake_mp3(seconds, bitrate_kbps=32):
+    """MPEG-2 Layer III 24kHz 프레임 헤더로 시작하는 고정 비트레이트 바이트 (gTTS 출력 형식)"""
+    header = bytes([0xFF, 0xF3, 4 << 4, 0xC4])  # 비트레이트 인덱스 4 = 32kbps
+    size = int(seconds * bitrate_kbps * 1000 / 8)
+    return header + bytes(size - len(header))
+
+
+class TestAudioDuration(unittest.TestCase):
+    """음성 길이 계산 테스트"""
+
+    def test_wav_duration(self):
+        """WAV 길이 계산 테스트"""
+        wav = pcm_to_wav(np.zeros(24000 * 2, dtype=np.float32), 24000)
+        self.assertAlmostEqual(audio_duration(wav), 2.0)
+    
+    def test_mp3_duration_with_id3_tag(self):
+        """ID3 태그가 붙은 MP3 길이 계산 테스트"""
+        tag = b'ID3' + bytes([4, 0, 0]) + struct.pack('>4B', 0, 0, 0, 20) + bytes(20)
+        self.assertAlmostEqual(audio_duration(tag + fake_mp3(3.0)), 3.0, places=2)
+    
+    def test_unknown_format(self):
+        """알 수 없는 형식은 0초"""
+        self.assertEqual(audio_duration(b'not audio'), 0.0)
+
+
+class TestSynthesizerPool(unittest.TestCase):
+    """합성 엔진 풀 테스트"""
+
+    def setUp(self):
+        self.created = []
+        self.lock = threading.Lock()
+    
+    def factory(self):
+        time.sleep(0.05)  # 모델 로딩
+        with self.lock:
+            self.created.append(object())
+            return self.created[-1]
+    
+    def test_prewarm_creates_all_engines(self):
+        """미리 불러 두면 요청 시 초기화하지 않는지 테스트"""
+        print("🔥 엔진 미리 불러오기 테스트...")
+        pool = SynthesizerPool(self.factory, size=2)
+        pool.prewarm()
+        self.assertEqual(len(self.created), 2)
+        self.assertEqual(pool.ready, 2)
+        
+        start = time.perf_counter()
+        for _ in range(10):
+            with pool.engine() as engine:
+                self.assertIn(engine, self.created)
+        self.assertLess(time.perf_counter() - start, 0.05)
+        self.assertEqual(len(self.created), 2)
+        print("✅ 미리 불러온 엔진 재사용")
+    
+    def test_concurrent_use_bounded_by_size(self):
+        """동시 요청이 풀 크기를 넘어 엔진을 만들지 않는지 테스트"""
+        pool = SynthesizerPool(self.factory, size=2)
+        active = []
+        peak = []
+        
+        def use(_):
+            with pool.engine() as engine:
+                with self.lock:
+                    self.assertNotIn(engine, active)
+                    active.append(engine)
+                    peak.append(len(active))
+                time.sleep(0.02)
+                with self.lock:
+                    active.remove(engine)
+                    
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            list(executor.map(use, range(12)))
+        self.assertEqual(len(self.created), 2)
+        self.assertEqual(max(peak), 2)
+        self.assertEqual(pool.ready, 2)
+    
+    def test_failed_load_can_retry(self):
+        """엔진 생성 실패 후 다시 시도할 수 있는지 테스트"""
+        attempts = []
+        
+        def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("model missing")
+            return 'engine'
+            
+        pool = SynthesizerPool(flaky, size=1)
+        with self.assertRaises(RuntimeError):
+            pool.prewarm()
+        with pool.engine() as engine:
+            self.assertEqual(engine, 'engine')
+
+
+class TestSynthesizers(unittest.TestCase):
+    """합성 백엔드 테스트"""
+
+    def test_stub_rtf(self):
+        """stub 합성 실시간 계수 계산 테스트"""
+        print("⏱️ 실시간 계수 테스트...")
+        metrics = LatencyTracker()
+        backend = StubSynthesizer(latency=0.05, seconds_per_char=0.1, metrics=metrics)
+        audio = backend.synthesize("안녕하세요 반가워요")  # 10글자 = 1초
+        
+        self.assertAlmostEqual(audio_duration(audio), 1.0, places=2)
+        stats = backend.stats()
+        self.assertEqual(stats['calls'], 1)
+        self.assertAlmostEqual(stats['audio_seconds'], 1.0, places=2)
+        self.assertGreaterEqual(stats['rtf'], 0.05)
+        self.assertLess(stats['rtf'], 0.5)
+        self.assertEqual(metrics.summary('tts.stub')['count'], 1)
+        print(f"✅ 실시간 계수 {stats['rtf']:.3f}")
+    
+    def test_backend_must_implement_synthesize(self):
+        """_synthesize를 구현하지 않은 백엔드는 만들 때 바로 실패하는지 테스트"""
+        class Incomplete(SynthesizerBackend):
+            name = 'incomplete'
+            
+        with self.assertRaises(TypeError):
+            Incomplete()
+    
+    def test_gtts_rtf_from_mp3(self):
+        """gTTS MP3 출력으로 실시간 계수 계산 테스트 (네트워크 없이)"""
+        class OfflineGTTS(GTTSSynthesizer):
+            def _synthesize(self, text):
+                time.sleep(0.03)
+                return fake_mp3(1.5)
+                
+        backend = OfflineGTTS('ko')
+        backend.synthesize("안녕하세요")
+        stats = backend.stats()
+        self.assertAlmostEqual(stats['audio_seconds'], 1.5, places=2)
+        self.assertAlmostEqual(stats['rtf'], stats['synth_seconds'] / 1.5)
+    
+    def test_local_missing_engine(self):
+        """melotts가 없으면 로컬 백엔드가 RuntimeError를 내는지 테스트"""
+        try:
+            import melo  # noqa: F401
+            self.skipTest("melotts가 설치되어 있음")
+        except ImportError:
+            pass
+        backend = LocalSynthesizer('ko')
+        self.assertEqual(backend.language, 'KR')
+        with self.assertRaises(RuntimeError):
+            backend.synthesize("안녕하세요")
+    
+    def test_voice_keys_differ(self):
+        """백엔드마다 캐시 키에 쓰는 음성 이름이 다른지 테스트"""
+        voices = {GTTSSynthesizer('ko').voice, LocalSynthesizer('ko').voice, StubSynthesizer().voice}
+        self.assertEqual(len(voices), 3)
+    
+    def test_factory(self):
+        """백엔드 생성 함수 테스트"""
+        self.assertIsInstance(create_synthesizer('gtts'), GTTSSynthesizer)
+        self.assertIsInstance(create_synthesizer('LOCAL', pool_size=2), LocalSynthesizer)
+        self.assertIsInstance(create_synthesizer('stub'), StubSynthesizer)
+        with self.assertRaises(ValueError):
+            create_synthesizer('espeak')
+
+
+if __name__ == '__main__':
+    print("🗣️ ENFP AI Voice Chatbot - TTS Backend 기능 테스트 시작")
+    print("=" * 60)
+    
+    unittest.main(verbosity=2, exit=False)
+    
+    print("\n" + "=" * 60)
+    print("🎉 음성 합성 백엔드 테스트가 완료되었습니다!")
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+합성 음성 캐시(내용 주소, LRU 삭제, 프로세스 간 공유) 기능 테스트
+"""
+import unittest
+import sys
+import os
+import time
+import shutil
+import tempfile
+import multiprocessing
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from components.metrics import LatencyTracker
+from components.tts_cache import TTSCache, cache_key
+
+
+def fake_audio(text, size=1000):
+    """문장마다 다른 가짜 MP3 바이트"""
+    seed = text.encode('utf-8')
+    return (seed * (size // len(seed) + 1))[:size]
+
+
+def write_entries(directory, worker, count):
+    """다른 프로세스에서 같은 캐시 디렉터리에 쓰기"""
+    cache = TTSCache(directory)
+    for index in range(count):
+        text = f"공유 문장 {index % 5}"
+        cache.put(cache_key(text), fake_audio(text, 20000 + worker))
+
+
+class TestTTSCache(unittest.TestCase):
+    """합성 음성 캐시 테스트"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.calls = []
+    
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def synthesize(self, text):
+        self.calls.append(text)
+        return fake_audio(text)
+    
+    def test_replay_hits_cache(self):
+        """같은 문장을 다시 재생하면 합성하지 않는지 테스트"""
+        print("💾 캐시 적중 테스트...")
+        cache = TTSCache(self.temp_dir)
+        first = cache.get_or_create("안녕하세요!", self.synthesize)
+        second = cache.get_or_create("안녕하세요!", self.synthesize)
+        
+        self.assertEqual(first, second)
+        self.assertEqual(self.calls, ["안녕하세요!"])
+        stats = cache.stats()
+        self.assertEqual((stats['misses'], stats['memory_hits']), (1, 1))
+        self.assertEqual(stats['hit_rate'], 0.5)
+        print("✅ 캐시 적중 성공")
+    
+    def test_key_includes_voice_settings(self):
+        """언어/음성/속도가 다르면 다른 항목인지 테스트"""
+        keys = {cache_key("안녕"), cache_key("안녕", language='en'),
+                cache_key("안녕", voice='other'), cache_key("안녕", speed=1.25)}
+        self.assertEqual(len(keys), 4)
+        self.assertEqual(cache_key("안녕", speed=1), cache_key("안녕", speed=1.0))
+    
+    def test_disk_survives_restart(self):
+        """새 캐시 인스턴스(재시작/다른 워커)가 디스크 항목을 읽는지 테스트"""
+        TTSCache(self.temp_dir).get_or_create("다시 만나요", self.synthesize)
+        cache = TTSCache(self.temp_dir)
+        
+        def offline(text):
+            raise AssertionError("네트워크 합성이 호출되면 안 됩니다")
+            
+        self.assertEqual(cache.get_or_create("다시 만나요", offline), fake_audio("다시 만나요"))
+        self.assertEqual(cache.stats()['disk_hits'], 1)
+    
+    def test_unavailable_not_cached(self):
+        """합성 실패(None)는 캐시하지 않는지 테스트"""
+        cache = TTSCache(self.temp_dir)
+        self.assertIsNone(cache.get_or_create("실패", lambda text: None))
+        self.assertEqual(cache.get_or_create("실패", self.synthesize), fake_audio("실패"))
+    
+    def test_disk_lru_eviction(self):
+        """디스크 크기 제한 시 가장 오래 사용하지 않은 항목부터 삭제"""
+        print("🧹 LRU 삭제 테스트...")
+        cache = TTSCache(self.temp_dir, max_bytes=3500, memory_bytes=0)
+        for text in ("하나", "둘", "셋"):
+            cache.get_or_create(text, self.synthesize)
+            time.sleep(0.01)
+        cache.get_or_create("하나", self.synthesize)  # 최근 사용으로 갱신
+        time.sleep(0.01)
+        cache.get_or_create("넷", self.synthesize)
+        
+        stats = cache.stats()
+        self.assertEqual(stats['evictions'], 1)
+        self.assertLessEqual(stats['disk_bytes'], 3500)
+        self.assertIsNotNone(cache.get(cache_key("하나")))
+        self.assertIsNone(cache.get(cache_key("둘")))
+        print(f"   디스크 {stats['disk_bytes']} bytes, 삭제 {stats['evictions']}개")
+        print("✅ LRU 삭제 성공")
+    
+    def test_memory_hits_keep_file_recent(self):
+        """메모리에서만 적중한 항목도 디스크 정리 때 최근 항목으로 남는지 테스트"""
+        cache = TTSCache(self.temp_dir, max_bytes=3500)
+        for text in ("하나", "둘", "셋"):
+            cache.get_or_create(text, self.synthesize)
+            time.sleep(0.01)
+        cache.get_or_create("하나", self.synthesize)  # 메모리 적중
+        time.sleep(0.01)
+        cache.get_or_create("넷", self.synthesize)
+        
+        self.assertEqual(cache.stats()['memory_hits'], 1)
+        self.assertTrue(os.path.exists(cache._path(cache_key("하나"))))
+        self.assertFalse(os.path.exists(cache._path(cache_key("둘"))))
+    
+    def test_rewrite_counts_size_once(self):
+        """같은 항목을 다시 저장해도 디스크 크기를 두 번 세지 않는지 테스트"""
+        cache = TTSCache(self.temp_dir)
+        cache.put(cache_key("안녕"), fake_audio("안녕"))
+        cache.put(cache_key("안녕"), fake_audio("안녕"))
+        # 다른 프로세스가 같은 문장을 다시 저장
+        other = TTSCache(self.temp_dir)
+        other.put(cache_key("안녕"), fake_audio("안녕"))
+        
+        self.assertEqual(cache.stats()['disk_bytes'], len(fake_audio("안녕")))
+        self.assertEqual(other.stats()['disk_bytes'], len(fake_audio("안녕")))
+    
+    def test_memory_bound(self):
+        """메모리 캐시 크기 제한 테스트"""
+        cache = TTSCache(self.temp_dir, memory_bytes=2500)
+        for text in ("하나", "둘", "셋", "넷"):
+            cache.get_or_create(text, self.synthesize)
+        stats = cache.stats()
+        self.assertEqual(stats['memory_entries'], 2)
+        self.assertLessEqual(stats['memory_bytes'], 2500)
+        # 메모리에서 밀려난 항목은 디스크에서 읽음
+        cache.get(cache_key("하나"))
+        self.assertEqual(cache.stats()['disk_hits'], 1)
+    
+    def test_metrics_recorded(self):
+        """캐시 적중 조회 시간이 지표에 기록되는지 테스트"""
+        metrics = LatencyTracker()
+        cache = TTSCache(self.temp_dir, metrics=metrics)
+        cache.get_or_create("안녕", self.synthesize)
+        cache.get_or_create("안녕", self.synthesize)
+        self.assertEqual(metrics.summary('tts_cache.hit')['count'], 1)
+    
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), "fork 미지원 환경")
+    def test_concurrent_processes(self):
+        """여러 프로세스가 같은 디렉터리에 동시에 써도 완전한 파일만 보이는지 테스트"""
+        print("🔀 프로세스 간 공유 테스트...")
+        # spawn은 components 패키지(감정 분석 모델)를 다시 불러오므로 fork 사용
+        context = multiprocessing.get_context('fork')
+        workers = [context.Process(target=write_entries, args=(self.temp_dir, worker, 40))
+                   for worker in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(30)
+            self.assertEqual(worker.exitcode, 0)
+            
+        cache = TTSCache(self.temp_dir)
+        for index in range(5):
+            text = f"공유 문장 {index}"
+            data = cache.get(cache_key(text))
+            # 어느 프로세스가 마지막에 썼든 잘리지 않은 완전한 내용
+            self.assertIn(len(data), range(20000, 20004))
+            self.assertEqual(data, fake_audio(text, len(data)))
+        leftovers = [name for _, _, names in os.walk(self.temp_dir) for name in names
+                     if name.endswith('.tmp')]
+        self.assertEqual(leftovers, [])
+        print("✅ 프로세스 간 공유 성공")
+
+
+if __name__ == '__main__':
+    print("💾 ENFP AI Voice Chatbot - TTS Cache 기능 테스트 시작")
+    print("=" * 60)
+    
+    unittest.main(verbosity=2, exit=False)
+    
+    print("\n" + "=" * 60)
+    print("🎉 합성 음성 캐시 테스트가 완료되었습니다!")
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+대화 턴 파이프라인(단계 1회 실행, 단계 겹치기) 기능 테스트
+"""
+import unittest
+import sys
+import os
+import time
+import threading
+
+# 프로젝트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
+
+from components.metrics import LatencyTracker
+from components.turn_pipeline import TurnPipeline
+
+
+class Recorder:
+    """단계 호출 횟수와 실행 구간을 기록하는 가짜 단계 모음"""
+
+    def __init__(self, delay=0.1):
+        self.delay = delay
+        self.calls = {}
+        self.spans = {}
+        self.threads = {}
+        self.lock = threading.Lock()
+    
+    def stage(self, name, result=None, error=None):
+        def run(*args):
+            start = time.perf_counter()
+            time.sleep(self.delay)
+            with self.lock:
+                self.calls[name] = self.calls.get(name, 0) + 1
+                self.spans[name] = (start, time.perf_counter())
+                self.threads[name] = threading.current_thread()
+            if error is not None:
+                raise error
+            return result if result is not None else args
+        return run
+    
+    def overlaps(self, first, second):
+        a, b = self.spans[first], self.spans[second]
+        return a[0] < b[1] and b[0] < a[1]
+
+
+class TestTurnPipeline(unittest.TestCase):
+    """턴 파이프라인 테스트"""
+
+    def setUp(self):
+        self.stages = Recorder()
+        self.metrics = LatencyTracker()
+        self.pipeline = TurnPipeline(
+            self.stages.stage('sentiment', {'label': 'POSITIVE', 'score': 0.9}),
+            self.stages.stage('mbti', 'ENFP'),
+            generate=self.stages.stage('generate', "좋아요!"),
+            persist=self.stages.stage('persist', True),
+            metrics=self.metrics
+        )
+    
+    def tearDown(self):
+        self.pipeline.close()
+    
+    def test_each_stage_runs_once(self):
+        """감정 분석 등 각 단계가 한 번만 실행되는지 테스트"""
+        print("🔁 단계 1회 실행 테스트...")
+        spoken = []
+        shown = []
+        turn = self.pipeline.run("안녕", session_id="s1", speak=spoken.append,
+                                 on_response=shown.append)
+        
+        self.assertEqual(self.stages.calls, {'sentiment': 1, 'mbti': 1, 'generate': 1, 'persist': 1})
+        self.assertEqual(turn['sentiment'], {'label': 'POSITIVE', 'score': 0.9})
+        self.assertEqual(turn['mbti'], 'ENFP')
+        self.assertEqual(turn['response'], "좋아요!")
+        self.assertEqual(spoken, ["좋아요!"])
+        self.assertEqual(shown, [turn])
+        print("✅ 단계 1회 실행 성공")
+    
+    def test_generate_receives_sentiment(self):
+        """생성 단계가 이미 계산된 감정 결과를 받는지 테스트"""
+        received = []
+        pipeline = TurnPipeline(lambda text: 'NEG', lambda text: 'INTJ',
+                                generate=lambda text, sentiment: received.append(sentiment) or "응답")
+        pipeline.run("힘들어")
+        pipeline.close()
+        self.assertEqual(received, ['NEG'])
+    
+    def test_stages_overlap(self):
+        """MBTI 추정이 생성과, 저장이 음성 출력과 겹치는지 테스트"""
+        print("⚡ 단계 겹치기 테스트...")
+        turn = self.pipeline.run("안녕", session_id="s1", speak=self.stages.stage('speak'))
+        
+        self.assertTrue(self.stages.overlaps('mbti', 'sentiment'))
+        self.assertTrue(self.stages.overlaps('persist', 'speak'))
+        # UI를 다루는 단계는 호출한 스레드에서 실행
+        for name in ('sentiment', 'generate', 'speak'):
+            self.assertIs(self.stages.threads[name], threading.current_thread())
+        # 순차 실행(5 x 0.1s)보다 짧아야 함
+        self.assertLess(turn['timings']['total'], 400)
+        print(f"   총 {turn['timings']['total']:.0f} ms (순차 실행 약 500 ms)")
+        print("✅ 단계 겹치기 성공")
+    
+    def test_timings_recorded(self):
+        """단계별 시간이 결과와 지표에 기록되는지 테스트"""
+        turn = self.pipeline.run("안녕", speak=lambda response: None)
+        for stage in ('sentiment', 'mbti', 'generate', 'persist', 'speak', 'total'):
+            self.assertIn(stage, turn['timings'])
+            self.assertEqual(self.metrics.summary(f"turn.{stage}")['count'], 1)
+        self.assertGreaterEqual(turn['timings']['generate'], 100)
+    
+    def test_persist_failure_keeps_response(self):
+        """저장 실패가 응답을 잃게 하지 않는지 테스트"""
+        pipeline = TurnPipeline(lambda text: None, lambda text: None,
+                                generate=lambda text, sentiment: "응답",
+                                persist=self.stages.stage('persist', error=RuntimeError("DB 잠김")))
+        turn = pipeline.run("안녕")
+        pipeline.close()
+        self.assertEqual(turn['response'], "응답")
+        self.assertEqual(self.stages.calls['persist'], 1)
+    
+    def test_analysis_only(self):
+        """생성 단계 없이 분석만 하는 경우 테스트 (터미널 모드)"""
+        persisted = []
+        pipeline = TurnPipeline(lambda text: 'POS', lambda text: 'ENFP',
+                                persist=lambda *args: persisted.append(args))
+        turn = pipeline.run("안녕", speak=self.fail)
+        pipeline.close()
+        self.assertIsNone(turn['response'])
+        self.assertEqual((turn['sentiment'], turn['mbti']), ('POS', 'ENFP'))
+        self.assertEqual(persisted, [])
+
+
+if __name__ == '__main__':
+    print("🔀 ENFP AI Voice Chatbot - Turn Pipeline 기능 테스트 시작")
+    print("=" * 60)
+    
+    unittest.main(verbosity=2, exit=False)
+    
+    print("\n" + "=" * 60)
+    print("🎉 턴 파이프라인 테스트가 완료되었습니다!")